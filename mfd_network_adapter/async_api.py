@@ -0,0 +1,235 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio API of owner, interfaces and their features."""
+
+import asyncio
+import contextvars
+import functools
+import weakref
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, List
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+
+    from .network_adapter_owner.base import NetworkAdapterOwner
+    from .network_interface.base import NetworkInterface
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class AsyncRunner:
+    """
+    Execution path of blocking calls for asyncio, calls are run in executor with bounded concurrency.
+
+    Runner can be shared by owners of many hosts to bound number of remote calls in flight across all of them,
+    or created per owner to bound calls to single host.
+    Runner can be used by many event loops (e.g. consecutive `asyncio.run`), concurrency is bounded per event loop.
+
+    Calls are not serialized per owner - calls of one owner and its interfaces run concurrently on the same connection,
+    so connection has to support concurrent commands. Owner state changed by context managers
+    (`owner.batch()`, `CommandCache`, profiling) is not thread-safe, don't use them while calls of owner are in flight.
+    Use runner with max_concurrency=1 per owner to serialize its calls.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, executor: Executor | None = None) -> None:
+        """
+        Initialize AsyncRunner.
+
+        :param max_concurrency: Maximum number of calls run at the same time
+        :param executor: Executor running calls, default executor of event loop if not given
+        """
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.in_flight = 0
+
+    async def run(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Run blocking function in executor, waiting for free slot if maximum concurrency is reached.
+
+        :param function: Blocking function, e.g. method of feature
+        :param args: Positional arguments of function
+        :param kwargs: Keyword arguments of function
+        :return: Result of function
+        """
+        loop = asyncio.get_running_loop()
+        # asyncio.Semaphore is bound to event loop of first waiter, so each loop gets its own
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(loop, asyncio.Semaphore(self.max_concurrency))
+        async with semaphore:
+            self.in_flight += 1
+            try:
+                context = contextvars.copy_context()
+                call = functools.partial(context.run, function, *args, **kwargs)
+                return await loop.run_in_executor(self._executor, call)
+            finally:
+                self.in_flight -= 1
+
+
+class AsyncCall:
+    """
+    Attribute path of wrapped object, resolved and called in executor, e.g. `await call.stats.get_stats()`.
+
+    Attributes are resolved in executor as well, because lazy initialization of features may execute commands.
+    """
+
+    def __init__(self, runner: AsyncRunner, target: Any, path: tuple[str, ...] = ()) -> None:
+        """
+        Initialize AsyncCall.
+
+        :param runner: Runner of blocking calls
+        :param target: Wrapped object
+        :param path: Names of attributes of target leading to called method
+        """
+        self._runner = runner
+        self._target = target
+        self._path = path
+
+    def __getattr__(self, item: str) -> "AsyncCall":
+        """Extend attribute path, e.g. feature and its method."""
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return AsyncCall(self._runner, self._target, (*self._path, item))
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """
+        Call method at attribute path in executor.
+
+        :param args: Positional arguments of method
+        :param kwargs: Keyword arguments of method
+        :return: Coroutine returning result of method
+        """
+        return self._runner.run(self._call, *args, **kwargs)
+
+    def _call(self, *args, **kwargs) -> Any:
+        """Resolve attribute path and call method, run in executor."""
+        return functools.reduce(getattr, self._path, self._target)(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        """Get attribute path of call."""
+        return f"{self.__class__.__name__}({'.'.join((type(self._target).__name__, *self._path))})"
+
+
+class AsyncNetworkInterface(AsyncCall):
+    """
+    Asyncio API of network interface, methods of interface and its features return coroutines.
+
+    Usage::
+
+        stats = await ainterface.stats.get_stats()
+        link = await ainterface.link.get_link()
+    """
+
+    def __init__(self, interface: "NetworkInterface", runner: AsyncRunner) -> None:
+        """
+        Initialize AsyncNetworkInterface.
+
+        :param interface: Network interface
+        :param runner: Runner of blocking calls
+        """
+        super().__init__(runner, interface)
+        self.interface = interface
+
+    @property
+    def name(self) -> str:
+        """Name of interface."""
+        return self.interface.name
+
+
+class AsyncNetworkAdapterOwner(AsyncCall):
+    """
+    Asyncio API of network adapter owner, methods of owner and its features return coroutines.
+
+    Blocking calls are run in executor of runner, so many hosts and interfaces share one event loop.
+
+    Usage::
+
+        runner = AsyncRunner(max_concurrency=64)
+        owner = await AsyncNetworkAdapterOwner.create(connection, runner=runner)
+        interfaces = await owner.get_interfaces()
+        stats = await asyncio.gather(*(interface.stats.get_stats() for interface in interfaces))
+        arp_table = await owner.arp.get_arp_table()
+    """
+
+    def __init__(
+        self,
+        owner: "NetworkAdapterOwner",
+        runner: AsyncRunner | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Initialize AsyncNetworkAdapterOwner.
+
+        :param owner: Network adapter owner
+        :param runner: Runner of blocking calls, shared e.g. by owners of many hosts, created if not given
+        :param max_concurrency: Maximum number of calls run at the same time, used when runner is not given
+        """
+        runner = runner if runner is not None else AsyncRunner(max_concurrency=max_concurrency)
+        super().__init__(runner, owner)
+        self.owner = owner
+
+    @classmethod
+    async def create(
+        cls,
+        connection: "Connection",
+        runner: AsyncRunner | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs,
+    ) -> "AsyncNetworkAdapterOwner":
+        """
+        Create owner of connected OS in executor.
+
+        :param connection: Object of mfd-connect
+        :param runner: Runner of blocking calls, created if not given
+        :param max_concurrency: Maximum number of calls run at the same time, used when runner is not given
+        :param kwargs: Other parameters of NetworkAdapterOwner
+        :return: AsyncNetworkAdapterOwner object
+        """
+        from .network_adapter_owner import NetworkAdapterOwner
+
+        runner = runner if runner is not None else AsyncRunner(max_concurrency=max_concurrency)
+        owner = await runner.run(functools.partial(NetworkAdapterOwner, connection=connection, **kwargs))
+        return cls(owner, runner=runner)
+
+    def wrap_interface(self, interface: "NetworkInterface") -> AsyncNetworkInterface:
+        """
+        Get asyncio API of interface.
+
+        :param interface: Network interface
+        :return: AsyncNetworkInterface sharing runner of owner
+        """
+        return AsyncNetworkInterface(interface, self._runner)
+
+    async def get_interfaces(self, **kwargs) -> List[AsyncNetworkInterface]:
+        """
+        Get asyncio API of Network Interfaces.
+
+        :param kwargs: Filters of NetworkAdapterOwner.get_interfaces
+        :return: List of AsyncNetworkInterface objects
+        """
+        interfaces = await self._runner.run(self.owner.get_interfaces, **kwargs)
+        return [self.wrap_interface(interface) for interface in interfaces]
+
+    async def get_interface(self, **kwargs) -> AsyncNetworkInterface:
+        """
+        Get asyncio API of single Network Interface.
+
+        :param kwargs: Filters of NetworkAdapterOwner.get_interface
+        :return: AsyncNetworkInterface object
+        """
+        return self.wrap_interface(await self._runner.run(self.owner.get_interface, **kwargs))
+
+    async def execute_command(self, command: str, **kwargs) -> "ConnectionCompletedProcess":
+        """
+        Execute command on owner connection in executor.
+
+        :param command: string with command
+        :param kwargs: parameters
+        :return: result of command
+        """
+        return await self._runner.run(self.owner.execute_command, command, **kwargs)
@@ -0,0 +1,407 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for memoization of read-only remote calls within consistent view of the host."""
+
+import logging
+import re
+import shlex
+from collections import Counter
+from subprocess import CalledProcessError
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Type
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect.exceptions import ConnectionCalledProcessError
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+CACHED_METHODS = ("execute_command", "execute_powershell")
+
+SHELL_OPERATORS = {"|", "||", "&&", ";", "\n"}
+PUNCTUATION_CHARS = set("();<>|&")
+# redirections allowed in read-only commands, e.g. '2>/dev/null', '2>&1'
+ALLOWED_REDIRECTIONS = {(">", "/dev/null"), (">&", "1"), (">&", "2")}
+READ_ONLY_PROGRAMS = {
+    "cat",
+    "grep",
+    "egrep",
+    "head",
+    "ls",
+    "readlink",
+    "realpath",
+    "basename",
+    "dirname",
+    "wc",
+    "uniq",
+    "cut",
+    "tr",
+    "lspci",
+    "lsmod",
+    "modinfo",
+    "uname",
+    "nproc",
+    "lscpu",
+    "dmidecode",
+    "stat",
+    "which",
+    "findstr",
+}
+# programs, which are read-only only with given options, e.g. 'esxcfg-nics -l', but not 'esxcfg-nics -s 1000 vmnic0'
+READ_ONLY_OPTIONS = {
+    "hostname": {"-f", "-s", "-i", "-I", "-d", "--fqdn", "--short"},
+    "esxcfg-nics": {"-l", "-e", "--list"},
+    "esxcfg-vmknic": {"-l", "--list"},
+    "vmkchdev": {"-l"},
+    "ipconfig": {"/all"},
+    "sysctl": {"-a", "-n", "-e", "-N", "--all", "--values"},
+}
+# programs with 'object action' syntax, e.g. 'ip -j link show dev eth0'
+OBJECT_ACTION_PROGRAMS = {"ip", "tc", "devlink", "bridge"}
+READ_ONLY_ACTIONS = {"show", "list", "ls", "lst", "get", "identify", "pids"}
+# options of OBJECT_ACTION_PROGRAMS followed by argument
+OPTIONS_WITH_ARGUMENT = {"-n", "-netns", "-rc", "-rcvbuf"}
+ETHTOOL_READ_ONLY_OPTIONS = {
+    "-i",
+    "-S",
+    "-k",
+    "-g",
+    "-l",
+    "-a",
+    "-c",
+    "-x",
+    "-n",
+    "-u",
+    "-m",
+    "-T",
+    "-P",
+    "-d",
+    "-e",
+    "--driver",
+    "--statistics",
+    "--show-features",
+    "--show-offload",
+    "--show-ring",
+    "--show-channels",
+    "--show-pause",
+    "--show-coalesce",
+    "--show-rxfh-indir",
+    "--show-rxfh",
+    "--show-nfc",
+    "--show-ntuple",
+    "--module-info",
+    "--dump-module-eeprom",
+    "--show-time-stamping",
+    "--show-permaddr",
+    "--show-priv-flags",
+    "--show-fec",
+    "--show-eee",
+    "--phy-statistics",
+    "--version",
+}
+ETHTOOL_GLOBAL_OPTIONS = {"--json", "--debug", "-I", "--include-statistics"}
+ETHTOOL_SET_OPTIONS = {"-s", "-K", "-G", "-L", "-A", "-C", "--change", "--features", "--offload"}
+POWERSHELL_READ_ONLY_REGEX = re.compile(
+    r"^\(?\s*(Get-\w+|Select-Object|Where-Object|Sort-Object|Format-List|Format-Table|ConvertTo-Json|Out-String"
+    r"|Measure-Object|Select-String|select|where|fl|ft|\?)(\s|\)|$)",
+    re.IGNORECASE,
+)
+POWERSHELL_SET_REGEX = re.compile(r"^(Set|Enable|Disable)-\w+(\s[^|;\n]*)?$", re.IGNORECASE)
+
+
+def _split_shell_segments(command: str) -> list[list[str]] | None:
+    """
+    Split shell command into tokens of simple commands, separated by pipes and lists.
+
+    :param command: Shell command
+    :return: Tokens of simple commands, None when command can't be analyzed (substitutions, unbalanced quotes,
+        subshells) or contains redirection to file
+    """
+    if "$(" in command or "`" in command:
+        return None
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace = " \t\r"
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        return None
+
+    segments: list[list[str]] = [[]]
+    iterator = iter(tokens)
+    for token in iterator:
+        if token in SHELL_OPERATORS:
+            segments.append([])
+        elif set(token) <= PUNCTUATION_CHARS:
+            if (token, next(iterator, None)) not in ALLOWED_REDIRECTIONS:
+                return None
+            # file descriptor of redirection, e.g. '2' of '2>/dev/null'
+            if segments[-1] and segments[-1][-1].isdigit():
+                segments[-1].pop()
+        else:
+            segments[-1].append(token)
+    return [segment for segment in segments if segment]
+
+
+def _get_object_and_action(arguments: list[str]) -> tuple[str | None, str | None]:
+    """
+    Get object and action of 'object action' command, e.g. ('link', 'show') of 'ip -j link show dev eth0'.
+
+    :param arguments: Arguments of command
+    :return: Tuple (object, action), None if missing
+    """
+    words = []
+    iterator = iter(arguments)
+    for argument in iterator:
+        if argument.startswith("-"):
+            if argument in OPTIONS_WITH_ARGUMENT:
+                next(iterator, None)
+            continue
+        words.append(argument)
+    words.extend([None, None])
+    return words[0], words[1]
+
+
+def _is_read_only_segment(tokens: list[str]) -> bool:
+    """
+    Check whether simple command only reads state of the host.
+
+    :param tokens: Tokens of simple command
+    :return: True if command is known to be read-only
+    """
+    program, arguments = tokens[0], tokens[1:]
+    if tokens[:3] == ["ip", "netns", "exec"]:
+        return len(tokens) > 4 and _is_read_only_segment(tokens[4:])
+    if program in READ_ONLY_PROGRAMS:
+        return True
+    if program in READ_ONLY_OPTIONS:
+        options = [argument for argument in arguments if argument.startswith(("-", "/"))]
+        if program == "hostname" and len(options) < len(arguments):
+            # 'hostname <name>' sets hostname
+            return False
+        return set(options) <= READ_ONLY_OPTIONS[program] and not any("=" in argument for argument in arguments)
+    if program in OBJECT_ACTION_PROGRAMS:
+        obj, action = _get_object_and_action(arguments)
+        if obj is None or obj == "monitor" or "-batch" in arguments:
+            return False
+        return action is None or action in READ_ONLY_ACTIONS
+    if program == "ethtool":
+        options = [argument for argument in arguments if argument not in ETHTOOL_GLOBAL_OPTIONS]
+        return bool(options) and (not options[0].startswith("-") or options[0] in ETHTOOL_READ_ONLY_OPTIONS)
+    if program in ("esxcli", "localcli"):
+        return "get" in arguments or "list" in arguments
+    if program == "vsish":
+        return any(argument in ("get", "ls", "cat") for argument in arguments)
+    if program == "netsh":
+        return "show" in arguments
+    if program == "reg":
+        return arguments[:1] == ["query"]
+    return False
+
+
+def is_read_only_command(command: str, api: str = "execute_command") -> bool:
+    """
+    Check whether command only reads state of the host, so its result can be reused within consistent view.
+
+    Commands not recognized as read-only are treated as mutating.
+
+    :param command: Command
+    :param api: Connection method used to execute command, 'execute_command' or 'execute_powershell'
+    :return: True if command is known to be read-only
+    """
+    if api == "execute_powershell":
+        if "$(" in command or "=" in command:
+            return False
+        segments = [segment.strip() for segment in re.split(r"[|;\n]", command) if segment.strip()]
+        return bool(segments) and all(POWERSHELL_READ_ONLY_REGEX.match(segment) for segment in segments)
+
+    segments = _split_shell_segments(command)
+    return bool(segments) and all(_is_read_only_segment(segment) for segment in segments)
+
+
+def is_idempotent_command(command: str, api: str = "execute_command") -> bool:
+    """
+    Check whether command sets state of the host, so repeating it does not change what was read after it.
+
+    E.g. 'ip link set dev eth0 up' executed before each read of /proc/interrupts.
+
+    :param command: Command
+    :param api: Connection method used to execute command, 'execute_command' or 'execute_powershell'
+    :return: True if command is known to set state
+    """
+    if api == "execute_powershell":
+        return bool(POWERSHELL_SET_REGEX.match(command.strip()))
+    segments = _split_shell_segments(command)
+    if not segments or len(segments) > 1:
+        return False
+    tokens = segments[0]
+    if tokens[:3] == ["ip", "netns", "exec"]:
+        tokens = tokens[4:]
+    if not tokens:
+        return False
+    program, arguments = tokens[0], tokens[1:]
+    if program == "ip":
+        return _get_object_and_action(arguments) in (("link", "set"), ("l", "set"))
+    if program == "ethtool":
+        return bool(arguments) and arguments[0] in ETHTOOL_SET_OPTIONS
+    if program == "sysctl":
+        return "-w" in arguments
+    return False
+
+
+class CommandCache:
+    """
+    Memoization of identical read-only commands, installed on connection shared by owner, interfaces and features.
+
+    While started, execute_command/execute_powershell of connection object are replaced with wrappers, which
+    reuse result of read-only command (:func:`is_read_only_command`) executed with the same parameters.
+    Return codes are validated for each call, so results are shared also by calls expecting different ones.
+    Any other command is executed and invalidates the cache, except repetition of the last idempotent command
+    setting state (:func:`is_idempotent_command`), which can't change what was read after it.
+
+    Deduplicated calls are counted in hits (total and per command), executed read-only calls in misses.
+
+    Usage::
+
+        with owner.consistent_view() as cache:
+            interface.rss.get_rx_tx_queues(is_10g_adapter=False)
+        print(cache.hits, cache.hits_per_command)
+    """
+
+    def __init__(self, connection: "Connection") -> None:
+        """
+        Initialize CommandCache.
+
+        :param connection: Object of mfd-connect
+        """
+        self._connection = connection
+        self._originals: dict[str, Callable] = {}
+        self._results: dict[tuple, "ConnectionCompletedProcess"] = {}
+        self._last_mutation: tuple[str, str] | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.hits_per_command: Counter[str] = Counter()
+
+    def __enter__(self) -> "CommandCache":
+        """Start caching."""
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop caching."""
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        """Check whether cache is installed on connection."""
+        return bool(self._originals)
+
+    def start(self) -> None:
+        """Install caching wrappers on connection."""
+        if self.active:
+            return
+        for name in CACHED_METHODS:
+            original = getattr(self._connection, name, None)
+            if original is not None:
+                self._originals[name] = original
+                setattr(self._connection, name, self._wrap(name, original))
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Consistent view of commands started.")
+
+    def stop(self) -> None:
+        """Restore original methods of connection and drop cached results."""
+        for name, original in self._originals.items():
+            setattr(self._connection, name, original)
+        self._originals = {}
+        self.clear()
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Consistent view of commands stopped, {self.hits} deduplicated calls, {self.misses} executed.",
+        )
+
+    def clear(self) -> None:
+        """Drop cached results."""
+        self._results.clear()
+        self._last_mutation = None
+
+    def _wrap(self, api: str, original: Callable) -> Callable:
+        """
+        Get caching wrapper of connection method.
+
+        :param api: Name of wrapped method
+        :param original: Wrapped method
+        :return: Wrapper
+        """
+
+        def wrapper(command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+            if not is_read_only_command(command, api):
+                return self._execute_mutation(api, original, command, *args, **kwargs)
+
+            expected_return_codes = kwargs.pop("expected_return_codes", frozenset({0}))
+            custom_exception = kwargs.pop("custom_exception", None)
+            key = (api, command, repr(args), tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+            result = self._results.get(key)
+            if result is None:
+                result = original(command, *args, expected_return_codes=None, **kwargs)
+                self._results[key] = result
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.hits_per_command[command] += 1
+            return _check_return_code(result, command, expected_return_codes, custom_exception)
+
+        return wrapper
+
+    def _execute_mutation(self, api: str, original: Callable, command: str, *args, **kwargs) -> Any:
+        """
+        Execute command changing state of the host and invalidate cache.
+
+        :param api: Name of wrapped method
+        :param original: Wrapped method
+        :param command: Command to execute
+        :param args: Positional parameters of method
+        :param kwargs: Parameters of method
+        :return: Result of command
+        """
+        mutation = (api, command)
+        if mutation == self._last_mutation and is_idempotent_command(command, api):
+            return original(command, *args, **kwargs)
+
+        self._results.clear()
+        self._last_mutation = mutation
+        self.invalidations += 1
+        try:
+            return original(command, *args, **kwargs)
+        except CalledProcessError:
+            # state after failed command is unknown, it is not treated as repeatable
+            self._last_mutation = None
+            raise
+
+
+def _check_return_code(
+    result: "ConnectionCompletedProcess",
+    command: str,
+    expected_return_codes: Iterable[int] | None,
+    custom_exception: Type[CalledProcessError] | None,
+) -> "ConnectionCompletedProcess":
+    """
+    Validate return code of cached result as mfd-connect does.
+
+    :param result: Result of command
+    :param command: Executed command
+    :param expected_return_codes: Return codes to be considered acceptable, if None - any return code is accepted
+    :param custom_exception: Exception raised on unexpected return code instead of ConnectionCalledProcessError
+    :return: Result of command
+    :raises custom_exception or ConnectionCalledProcessError: on unexpected return code
+    """
+    if not expected_return_codes or result.return_code in expected_return_codes:
+        return result
+    try:
+        stderr = result.stderr
+    except NotImplementedError:
+        stderr = None
+    raise (custom_exception or ConnectionCalledProcessError)(
+        returncode=result.return_code, cmd=command, output=result.stdout, stderr=stderr
+    )
@@ -17,3 +17,7 @@ class NetworkInterfaceIncomparableObject(Exception):
 
 class VirtualFunctionCreationException(Exception):
     """Exception raised when VF creation process fails."""
+
+
+class CommandNotRecordedException(Exception):
+    """Exception raised when replayed command is not found in recorded transcript."""
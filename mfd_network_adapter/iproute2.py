@@ -0,0 +1,80 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for detection of iproute2 JSON output support and parsers of iproute2 output shared by features."""
+
+import json
+import logging
+import re
+from typing import TYPE_CHECKING, Dict
+from weakref import WeakKeyDictionary
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_typing.network_interface import VlanInterfaceInfo
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+LINK_HEADER_REGEX = re.compile(r"^\d+:\s+", re.MULTILINE)
+VLAN_LINK_REGEX = re.compile(
+    r"^(?P<name>[^@:\s]+)@(?P<parent>[^:\s]+):.*?\svlan\s+protocol\s+802\.1(Q|ad)\s+id\s+(?P<vlan_id>\d+)", re.DOTALL
+)
+
+# detection result per host (connection), iproute2 is not expected to change during connection lifetime
+_json_support: "WeakKeyDictionary[Connection, bool]" = WeakKeyDictionary()
+
+
+def is_json_supported(connection: "Connection") -> bool:
+    """
+    Check whether `ip` on the host supports JSON output (`ip -j`), result is cached per connection.
+
+    :param connection: Object of mfd-connect
+    :return: True if JSON output is supported, False otherwise
+    """
+    # local import, batch modules belong to owner package, which imports interfaces
+    from .network_adapter_owner.batch import BatchConnection
+    from .network_adapter_owner.namespace_parallel import PrefetchedConnection
+
+    if isinstance(connection, (BatchConnection, PrefetchedConnection)):
+        connection = connection._connection
+    supported = _json_support.get(connection)
+    if supported is None:
+        result = connection.execute_command("ip -j link show dev lo", expected_return_codes=None)
+        supported = not result.return_code and result.stdout.lstrip().startswith("[")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"JSON output of iproute2 supported: {supported}")
+        _json_support[connection] = supported
+    return supported
+
+
+def parse_vlans_json(output: str) -> Dict[str, VlanInterfaceInfo]:
+    """
+    Get VLAN ID & parent interface name of all VLANs from JSON output.
+
+    Parent from other namespace is named 'if<index>', as in not JSON output of `ip`.
+
+    :param output: output from "ip -d -j link show type vlan"
+    :return: Dictionary {VLAN interface name: VlanInterfaceInfo}
+    """
+    vlans = {}
+    for link in json.loads(output or "[]"):
+        info_data = link.get("linkinfo", {}).get("info_data", {})
+        parent = link.get("link") or f"if{link.get('link_index')}"
+        vlans[link["ifname"]] = VlanInterfaceInfo(vlan_id=int(info_data["id"]), parent=parent)
+    return vlans
+
+
+def parse_vlans_text(output: str) -> Dict[str, VlanInterfaceInfo]:
+    """
+    Get VLAN ID & parent interface name of all VLANs from text output, for `ip` without JSON support.
+
+    :param output: output from "ip -d link show type vlan"
+    :return: Dictionary {VLAN interface name: VlanInterfaceInfo}
+    """
+    vlans = {}
+    for link in LINK_HEADER_REGEX.split(output)[1:]:
+        match = VLAN_LINK_REGEX.match(link)
+        if match:
+            vlans[match["name"]] = VlanInterfaceInfo(vlan_id=int(match["vlan_id"]), parent=match["parent"])
+    return vlans
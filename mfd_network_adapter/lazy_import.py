@@ -0,0 +1,59 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for lazy import of OS-specific modules of features."""
+
+import importlib
+import sys
+from typing import Any, Callable, Union
+
+
+def lazy_import(
+    module_name: str, attributes: dict[str, str], feature_types: dict[str, tuple[str, ...]] | None = None
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Get module-level __getattr__ and __dir__ (PEP 562), importing OS-specific modules on first access of their names.
+
+    Resolved attributes are stored in module, so each module is imported once and next accesses are direct.
+
+    :param module_name: Name of package, __name__ of its __init__
+    :param attributes: Dictionary {attribute name: relative name of module defining it, e.g. '.linux'}
+    :param feature_types: Dictionary {name of Union alias: names of its members}, resolved after members
+    :return: Tuple (__getattr__, __dir__) to be assigned in package
+    """
+    feature_types = feature_types or {}
+
+    def __getattr__(name: str) -> Any:
+        module = sys.modules[module_name]
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], module_name), name)
+        elif name in feature_types:
+            value = Union[tuple(getattr(module, member) for member in feature_types[name])]
+        else:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[module_name]), *attributes, *feature_types})
+
+    return __getattr__, __dir__
+
+
+def import_os_module(cls: type, os_name: str) -> bool:
+    """
+    Import OS-specific module of feature, placed next to module of feature class, e.g. stats.linux for stats.base.
+
+    :param cls: Feature class
+    :param os_name: Name of OS module, e.g. 'linux', 'esxi'
+    :return: True if module was imported by the call, False if already imported or feature has no module for OS
+    """
+    module_name = f"{cls.__module__.rpartition('.')[0]}.{os_name}"
+    if module_name in sys.modules:
+        return False
+    try:
+        importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            raise
+        return False
+    return True
@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: MIT
 """Module for adapter owner."""
 
+import importlib
 import logging
 import random
 import re
 import typing
+from contextlib import contextmanager
 from ipaddress import IPv4Interface
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 from mfd_common_libs import log_levels, add_logging_level
 from mfd_const import SPEED_IDS, DEVICE_IDS, MANAGEMENT_NETWORK, Family, Speed
@@ -45,6 +47,12 @@ if typing.TYPE_CHECKING:
     from .feature.cpu import CPUFeatureType
     from .feature.mac import MACFeatureType
     from .feature.geneve import GeneveFeatureType
+    from .feature.events import EventsFeatureType
+    from .feature.network_state import NetworkStateFeatureType
+    from .feature.tunnel import TunnelFeatureType
+    from .batch import BatchConnection
+    from ..command_cache import CommandCache
+    from ..profiling import CommandProfiler
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -65,25 +73,23 @@ class NetworkAdapterOwner:
         if cls != NetworkAdapterOwner:
             return super().__new__(cls)
 
-        from .linux import LinuxNetworkAdapterOwner
-        from .linux_ipu import IPULinuxNetworkAdapterOwner
-        from .windows import WindowsNetworkAdapterOwner
-        from .esxi import ESXiNetworkAdapterOwner
-        from .freebsd import FreeBSDNetworkAdapterOwner
-
         os_name = connection.get_os_name()
         is_ipu = bool(kwargs.get("cli_client"))
+        # only module of connected OS is imported
         os_name_to_class = {
-            OSName.WINDOWS: WindowsNetworkAdapterOwner,
-            OSName.LINUX: IPULinuxNetworkAdapterOwner if is_ipu else LinuxNetworkAdapterOwner,
-            OSName.ESXI: ESXiNetworkAdapterOwner,
-            OSName.FREEBSD: FreeBSDNetworkAdapterOwner,
+            OSName.WINDOWS: (".windows", "WindowsNetworkAdapterOwner"),
+            OSName.LINUX: (
+                (".linux_ipu", "IPULinuxNetworkAdapterOwner") if is_ipu else (".linux", "LinuxNetworkAdapterOwner")
+            ),
+            OSName.ESXI: (".esxi", "ESXiNetworkAdapterOwner"),
+            OSName.FREEBSD: (".freebsd", "FreeBSDNetworkAdapterOwner"),
         }
 
         if os_name not in os_name_to_class.keys():
             raise NetworkAdapterConnectedOSNotSupported(f"Not supported OS for NetworkAdapterOwner: {os_name}")
 
-        owner_class = os_name_to_class.get(os_name)
+        module_name, class_name = os_name_to_class.get(os_name)
+        owner_class = getattr(importlib.import_module(module_name, __package__), class_name)
         return super().__new__(owner_class)
 
     def __init__(self, *, connection: "Connection", **kwargs):
@@ -93,6 +99,10 @@ class NetworkAdapterOwner:
         :param connection: Object of mfd-connect
         """
         self._connection = connection
+        # commands of features are queued, when batch is active (see batch())
+        self._batch: "BatchConnection | None" = None
+        # results of read-only commands are reused, when consistent view is active (see consistent_view())
+        self._command_cache: "CommandCache | None" = None
 
         # features of owner to be lazy initialized
         self._arp: "ARPFeatureType | None" = None
@@ -117,6 +127,9 @@ class NetworkAdapterOwner:
         self._cpu: "CPUFeatureType | None" = None
         self._mac: "MACFeatureType | None" = None
         self._geneve: "GeneveFeatureType | None" = None
+        self._events: "EventsFeatureType | None" = None
+        self._network_state: "NetworkStateFeatureType | None" = None
+        self._tunnel: "TunnelFeatureType | None" = None
 
     @property
     def arp(self) -> "ARPFeatureType":
@@ -338,6 +351,36 @@ class NetworkAdapterOwner:
 
         return self._geneve
 
+    @property
+    def events(self) -> "EventsFeatureType":
+        """Events feature."""
+        if self._events is None:
+            from .feature.events import BaseEventsFeature
+
+            self._events = BaseEventsFeature(connection=self._connection, owner=self)
+
+        return self._events
+
+    @property
+    def network_state(self) -> "NetworkStateFeatureType":
+        """Network State feature."""
+        if self._network_state is None:
+            from .feature.network_state import BaseNetworkStateFeature
+
+            self._network_state = BaseNetworkStateFeature(connection=self._connection, owner=self)
+
+        return self._network_state
+
+    @property
+    def tunnel(self) -> "TunnelFeatureType":
+        """Tunnel fleet feature."""
+        if self._tunnel is None:
+            from .feature.tunnel import BaseTunnelFeature
+
+            self._tunnel = BaseTunnelFeature(connection=self._connection, owner=self)
+
+        return self._tunnel
+
     def execute_command(self, command: str, **kwargs) -> "ConnectionCompletedProcess":
         """
         Shortcut for execute command.
@@ -348,6 +391,42 @@ class NetworkAdapterOwner:
         """
         return self._connection.execute_command(command=command, **kwargs)
 
+    def profile(self) -> "CommandProfiler":
+        """
+        Get profiler of remote calls of owner, its features and interfaces sharing its connection.
+
+        Usage: `with owner.profile() as profiler: ...`, then profiler.get_summary(), to_flame(), to_json(), to_spans().
+
+        :return: CommandProfiler object, not started
+        """
+        from ..profiling import CommandProfiler
+
+        return CommandProfiler(self._connection)
+
+    @contextmanager
+    def consistent_view(self) -> Iterator["CommandCache"]:
+        """
+        Reuse results of identical read-only commands of owner, its features and interfaces within the block.
+
+        Commands not recognized as read-only are executed and invalidate cached results.
+        Results are snapshots, so counters read twice within the block (e.g. deltas of statistics) do not change.
+        Nested blocks share the outer cache.
+
+        :return: CommandCache object with counters of deduplicated calls
+        """
+        if self._command_cache is not None:
+            yield self._command_cache
+            return
+
+        from ..command_cache import CommandCache
+
+        self._command_cache = CommandCache(self._connection)
+        try:
+            with self._command_cache:
+                yield self._command_cache
+        finally:
+            self._command_cache = None
+
     def get_interfaces(
         self,
         *,
@@ -0,0 +1,304 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for batched execution of owner feature commands."""
+
+import logging
+import re
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect.base import ConnectionCompletedProcess
+
+from .exceptions import BatchExecutionError
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+BATCH_MARKER = "@@MFD_BATCH@@"
+HEREDOC_DELIMITER = "MFD_BATCH_EOF"
+# single argument passed to 'sh -c' is limited by kernel (MAX_ARG_STRLEN = 128KiB)
+MAX_SCRIPT_SIZE = 100_000
+
+NAMESPACE_PREFIX_REGEX = re.compile(r"^ip netns exec (?P<namespace>\S+) (?P<command>.+)$", re.DOTALL)
+IP_BATCHABLE_REGEX = re.compile(r"^ip (?P<args>[a-z][^|;&<>$`\\\n'\"]*)$")
+IP_BATCH_FAILURE_REGEX = re.compile(r"^Command failed -:(?P<line>\d+)$")
+MARKER_REGEX = re.compile(rf"^{BATCH_MARKER} (?P<first>\d+)(-(?P<last>\d+))? (?P<return_code>\d+)$")
+
+# batch of owner active on connection, interface features using the same connection queue their commands in it
+_active_batches: "weakref.WeakKeyDictionary[Connection, BatchConnection]" = weakref.WeakKeyDictionary()
+
+
+def activate_batch(connection: "Connection", batch: "BatchConnection | None") -> None:
+    """
+    Set batch active on connection, commands of features using connection are queued in it.
+
+    :param connection: Object of mfd-connect
+    :param batch: BatchConnection, None to deactivate batch
+    """
+    if batch is None:
+        _active_batches.pop(connection, None)
+    else:
+        _active_batches[connection] = batch
+
+
+def get_active_batch(connection: "Connection") -> "BatchConnection | None":
+    """
+    Get batch active on connection.
+
+    :param connection: Object of mfd-connect
+    :return: BatchConnection, None if there is no active batch
+    """
+    return _active_batches.get(connection) if _active_batches else None
+
+
+def build_ip_batch_command(commands: Iterable[str], namespace: str | None = None) -> str:
+    """
+    Build shell command executing `ip` commands (without leading 'ip') in one `ip -batch` call.
+
+    Execution is continued after failure of single command, failures are reported as 'Command failed -:<line>'.
+
+    :param commands: `ip` commands without leading 'ip', e.g. 'link set dev eth0 up'
+    :param namespace: Name of network namespace
+    :return: Shell command to be executed with shell=True
+    """
+    ip = f"ip -n {namespace}" if namespace else "ip"
+    lines = "\n".join(commands)
+    return f"{ip} -force -batch - <<'{HEREDOC_DELIMITER}'\n{lines}\n{HEREDOC_DELIMITER}"
+
+
+@dataclass
+class BatchCall:
+    """Single command queued in batch and its result, available after batch execution."""
+
+    index: int
+    command: str
+    expected_return_codes: Iterable[int] | None = frozenset({0})
+    return_code: int | None = None
+    output: str = ""
+
+    @property
+    def failed(self) -> bool:
+        """Check whether command returned unexpected return code or was not executed (no result)."""
+        if self.return_code is None:
+            return True
+        return bool(self.expected_return_codes) and self.return_code not in self.expected_return_codes
+
+
+class BatchConnection:
+    """
+    Connection proxy, which queues executed commands instead of running them.
+
+    Queued commands are executed at once in :meth:`execute` - consecutive `ip` commands of the same namespace
+    are sent as one `ip -batch`, remaining ones as lines of the same shell script.
+    All other connection methods are passed to the wrapped connection.
+    """
+
+    def __init__(self, connection: "Connection") -> None:
+        """
+        Initialize BatchConnection.
+
+        :param connection: Object of mfd-connect
+        """
+        self._connection = connection
+        self.calls: list[BatchCall] = []
+
+    def __getattr__(self, item: str) -> Any:
+        """Pass not overridden attributes to wrapped connection."""
+        return getattr(self._connection, item)
+
+    def execute_command(
+        self, command: str, *, expected_return_codes: Iterable[int] | None = frozenset({0}), **kwargs
+    ) -> ConnectionCompletedProcess:
+        """
+        Queue command for batch execution.
+
+        :param command: Command to queue
+        :param expected_return_codes: Return codes to be considered acceptable, if None - any return code is accepted
+        :param kwargs: Other execute_command parameters, ignored - all queued commands are run in shell
+        :return: Placeholder of result with return code 0 and empty output, real result is stored in BatchCall
+        """
+        self.calls.append(
+            BatchCall(index=len(self.calls), command=command, expected_return_codes=expected_return_codes)
+        )
+        return ConnectionCompletedProcess(args=command, stdout="", stderr="", return_code=0)
+
+    @staticmethod
+    def _split_ip_command(command: str) -> tuple[str | None, str] | None:
+        """
+        Get namespace and `ip -batch` line of command if it can be batched.
+
+        :param command: Queued command
+        :return: Tuple (namespace, line without leading 'ip') or None if command is not batchable
+        """
+        namespace = None
+        match = NAMESPACE_PREFIX_REGEX.match(command)
+        if match:
+            namespace, command = match["namespace"], match["command"]
+        match = IP_BATCHABLE_REGEX.match(command.strip())
+        if not match:
+            return None
+        return namespace, match["args"].strip()
+
+    def _build_script(self, calls: list[BatchCall]) -> str:
+        """
+        Build shell script executing calls, each group of calls is followed by marker with return code.
+
+        :param calls: Calls to execute
+        :return: Shell script
+        """
+        parts = []
+        group: list[BatchCall] = []
+        group_namespace = None
+
+        def close_group() -> None:
+            if group:
+                lines = [self._split_ip_command(call.command)[1] for call in group]
+                parts.append(f"{{ {build_ip_batch_command(lines, group_namespace)}\n}} 2>&1")
+                parts.append(f'echo "{BATCH_MARKER} {group[0].index}-{group[-1].index} $?"')
+                group.clear()
+
+        for call in calls:
+            ip_command = self._split_ip_command(call.command)
+            if ip_command is not None:
+                namespace, _ = ip_command
+                if group and namespace != group_namespace:
+                    close_group()
+                group_namespace = namespace
+                group.append(call)
+                continue
+            close_group()
+            parts.append(f"{{ {call.command}\n}} </dev/null 2>&1")
+            parts.append(f'echo "{BATCH_MARKER} {call.index} $?"')
+        close_group()
+        return "\n".join(parts)
+
+    def _split_into_chunks(self) -> list[list[BatchCall]]:
+        """
+        Split queued calls into chunks, each fitting into single script.
+
+        :return: List of chunks
+        """
+        chunks: list[list[BatchCall]] = [[]]
+        size = 0
+        for call in self.calls:
+            ip_command = self._split_ip_command(call.command)
+            # lines of ip -batch share single marker
+            call_size = len(ip_command[1]) + 1 if ip_command else len(call.command) + len(BATCH_MARKER) + 32
+            if chunks[-1] and size + call_size > MAX_SCRIPT_SIZE:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(call)
+            size += call_size
+        return chunks
+
+    def _assign_results(self, output: str) -> None:
+        """
+        Assign return codes and outputs from script output to calls.
+
+        :param output: Output of executed script
+        """
+        calls = {call.index: call for call in self.calls}
+        buffer: list[str] = []
+        for line in output.splitlines():
+            match = MARKER_REGEX.match(line)
+            if not match:
+                buffer.append(line)
+                continue
+
+            first = int(match["first"])
+            if match["last"] is None:
+                calls[first].return_code = int(match["return_code"])
+                calls[first].output = "\n".join(buffer)
+            else:
+                last = int(match["last"])
+                self._assign_ip_batch_results(
+                    [call for call in self.calls if first <= call.index <= last], buffer, int(match["return_code"])
+                )
+            buffer = []
+
+    @staticmethod
+    def _assign_ip_batch_results(calls: list[BatchCall], output_lines: list[str], return_code: int = 0) -> None:
+        """
+        Assign results of `ip -batch` to calls, based on 'Command failed -:<line>' messages.
+
+        When `ip -batch` failed without reporting any line, e.g. namespace does not exist, all calls are failed.
+
+        :param calls: Calls sent in the batch
+        :param output_lines: Output of `ip -batch`
+        :param return_code: Return code of `ip -batch`
+        """
+        for call in calls:
+            call.return_code = 0
+        error_lines: list[str] = []
+        for line in output_lines:
+            match = IP_BATCH_FAILURE_REGEX.match(line)
+            if not match:
+                error_lines.append(line)
+                continue
+            call = calls[int(match["line"]) - 1]
+            call.return_code = 1
+            call.output = "\n".join(error_lines)
+            error_lines = []
+        if return_code and not any(call.return_code for call in calls):
+            for call in calls:
+                call.return_code = return_code
+                call.output = "\n".join(output_lines)
+
+    def execute(self, raise_on_error: bool = True) -> list[BatchCall]:
+        """
+        Execute all queued commands.
+
+        :param raise_on_error: Raise exception if any command returned unexpected return code
+        :return: List of executed calls with results
+        :raises BatchExecutionError: When any of commands failed and raise_on_error is set
+        """
+        if not self.calls:
+            return []
+        chunks = self._split_into_chunks()
+        logger.log(
+            level=log_levels.MODULE_DEBUG, msg=f"Executing {len(self.calls)} batched commands in {len(chunks)} call(s)."
+        )
+        for chunk in chunks:
+            result = self._connection.execute_command(
+                self._build_script(chunk), shell=True, expected_return_codes=None, stderr_to_stdout=True
+            )
+            self._assign_results(result.stdout)
+
+        if self.unchecked_failures:
+            logger.log(
+                level=log_levels.MODULE_DEBUG,
+                msg=f"{len(self.unchecked_failures)} batched commands with unchecked return code returned non-zero.",
+            )
+        if raise_on_error:
+            self._raise_on_failures()
+        return self.calls
+
+    @property
+    def unchecked_failures(self) -> list[BatchCall]:
+        """
+        Calls queued without expected return codes (None or empty), which returned non-zero return code.
+
+        Such results are verified by features themselves (e.g. add_route accepts already existing route),
+        which got placeholder within the block, so they are not failures of batch and have to be checked by caller.
+        """
+        return [call for call in self.calls if not call.expected_return_codes and call.return_code]
+
+    def _raise_on_failures(self) -> None:
+        """
+        Raise exception if any of executed commands returned unexpected return code.
+
+        :raises BatchExecutionError: When any of commands failed
+        """
+        failed = [call for call in self.calls if call.failed]
+        if failed:
+            details = "\n".join(
+                f"'{call.command}' "
+                + ("was not executed" if call.return_code is None else f"returned {call.return_code}: {call.output}")
+                for call in failed
+            )
+            raise BatchExecutionError(f"{len(failed)} of {len(self.calls)} batched commands failed:\n{details}")
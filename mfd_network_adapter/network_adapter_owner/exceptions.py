@@ -118,3 +118,23 @@ class AnsFeatureProcessException(CalledProcessError):
 
 class AnsFeatureException(NetworkAdapterModuleException):
     """Handle Ans feature exceptions."""
+
+
+class EventsFeatureException(NetworkAdapterModuleException):
+    """Handle Events feature exceptions."""
+
+
+class NetworkStateFeatureException(NetworkAdapterModuleException):
+    """Handle Network State feature exceptions."""
+
+
+class BatchExecutionError(NetworkAdapterModuleException):
+    """Handle failures of batched commands."""
+
+
+class TunnelFeatureException(NetworkAdapterModuleException):
+    """Handle Tunnel fleet feature exceptions."""
+
+
+class IPTablesFeatureException(NetworkAdapterModuleException):
+    """Handle IPTables feature exceptions."""
@@ -2,7 +2,18 @@
 # SPDX-License-Identifier: MIT
 """Module for ANS NICTeam feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureAns
-from .windows import WindowsAnsFeature
 
-AnsFeatureType = BaseFeatureAns | WindowsAnsFeature
+if TYPE_CHECKING:
+    from .windows import WindowsAnsFeature
+
+    AnsFeatureType = BaseFeatureAns | WindowsAnsFeature
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"WindowsAnsFeature": ".windows"}, {"AnsFeatureType": ("BaseFeatureAns", "WindowsAnsFeature")}
+)
@@ -2,12 +2,29 @@
 # SPDX-License-Identifier: MIT
 """Module for ARP feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseARPFeature
-from .esxi import ESXiARPFeature
-from .freebsd import FreeBSDARPFeature
-from .linux import LinuxARPFeature
-from .windows import WindowsARPFeature
+from .data_structures import NeighborEntry, NeighborTable
+
+if TYPE_CHECKING:
+    from .esxi import ESXiARPFeature
+    from .freebsd import FreeBSDARPFeature
+    from .linux import LinuxARPFeature
+    from .windows import WindowsARPFeature
+
+    ARPFeatureType = Union[LinuxARPFeature, WindowsARPFeature, FreeBSDARPFeature, ESXiARPFeature]
 
-ARPFeatureType = Union[LinuxARPFeature, WindowsARPFeature, FreeBSDARPFeature, ESXiARPFeature]
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "ESXiARPFeature": ".esxi",
+        "FreeBSDARPFeature": ".freebsd",
+        "LinuxARPFeature": ".linux",
+        "WindowsARPFeature": ".windows",
+    },
+    {"ARPFeatureType": ("LinuxARPFeature", "WindowsARPFeature", "FreeBSDARPFeature", "ESXiARPFeature")},
+)
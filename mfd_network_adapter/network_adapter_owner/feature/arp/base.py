@@ -3,15 +3,52 @@
 """Module for ARP feature."""
 
 import logging
+import re
 from abc import ABC
 
 from mfd_common_libs import log_levels, add_logging_level
 
+from .data_structures import NeighborEntry
 from ..base import BaseFeature
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+NEIGHBOR_MARKER = "@@MFD_NEIGHBOR@@"
+NEIGHBOR_MARKER_REGEX = re.compile(rf"^{NEIGHBOR_MARKER} (?P<index>\d+) (?P<return_code>-?\d+)\s*$")
+
 
 class BaseARPFeature(BaseFeature, ABC):
-    """Base class for ARP feature."""
+    """
+    Base class for ARP feature.
+
+    Neighbor table of each OS is available as NeighborTable snapshot (get_neighbor_table),
+    entries are added/replaced/deleted in bulk (add_neighbors, delete_neighbors) in one remote call,
+    failures are reported per entry.
+    """
+
+    @staticmethod
+    def _get_bulk_failures(entries: list[NeighborEntry], output: str) -> list[tuple[NeighborEntry, str]]:
+        """
+        Get failed entries from output of bulk script, each command followed by NEIGHBOR_MARKER line.
+
+        :param entries: Entries in order of commands in script
+        :param output: Output of script
+        :return: List of tuples (entry, error message)
+        """
+        failures = []
+        executed = set()
+        buffer: list[str] = []
+        for line in output.splitlines():
+            match = NEIGHBOR_MARKER_REGEX.match(line)
+            if not match:
+                buffer.append(line)
+                continue
+            index = int(match["index"])
+            executed.add(index)
+            if int(match["return_code"]):
+                message = "\n".join(buffer).strip() or f"returned {match['return_code']}"
+                failures.append((entries[index], message))
+            buffer = []
+        failures.extend((entry, "not executed") for index, entry in enumerate(entries) if index not in executed)
+        return failures
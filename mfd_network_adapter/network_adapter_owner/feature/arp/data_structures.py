@@ -0,0 +1,97 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for ARP feature data structures."""
+
+from dataclasses import dataclass, field
+from ipaddress import IPv4Interface, IPv6Interface
+from typing import Iterable, Iterator
+
+from mfd_typing import MACAddress
+
+
+@dataclass
+class NeighborEntry:
+    """Entry of neighbor (ARP/NDP) table."""
+
+    ip: IPv4Interface | IPv6Interface
+    mac: MACAddress | None = None
+    device: str | None = None
+    states: list[str] = field(default_factory=list)
+
+
+class NeighborTable:
+    """
+    Snapshot of neighbor (ARP/NDP) table, indexed by IP address, MAC address and device.
+
+    Indexes are built once, when snapshot is created, lookups do not scan the entries.
+    """
+
+    def __init__(self, entries: Iterable[NeighborEntry] = ()) -> None:
+        """
+        Initialize NeighborTable.
+
+        :param entries: Entries of neighbor table
+        """
+        self.entries: list[NeighborEntry] = []
+        self._by_ip: dict[IPv4Interface | IPv6Interface, list[NeighborEntry]] = {}
+        self._by_mac: dict[MACAddress, list[NeighborEntry]] = {}
+        self._by_device: dict[str, list[NeighborEntry]] = {}
+        for entry in entries:
+            self.entries.append(entry)
+            self._by_ip.setdefault(entry.ip, []).append(entry)
+            if entry.mac is not None:
+                self._by_mac.setdefault(entry.mac, []).append(entry)
+            if entry.device is not None:
+                self._by_device.setdefault(entry.device, []).append(entry)
+
+    def __len__(self) -> int:
+        """Get number of entries."""
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[NeighborEntry]:
+        """Iterate over entries."""
+        return iter(self.entries)
+
+    def __contains__(self, ip: IPv4Interface | IPv6Interface) -> bool:
+        """Check whether table contains entry of IP address."""
+        return ip in self._by_ip
+
+    def get_by_ip(self, ip: IPv4Interface | IPv6Interface) -> list[NeighborEntry]:
+        """
+        Get entries of IP address, one per device.
+
+        :param ip: IP address of neighbor
+        :return: List of entries, empty if not found
+        """
+        return list(self._by_ip.get(ip, []))
+
+    def get_by_mac(self, mac: MACAddress) -> list[NeighborEntry]:
+        """
+        Get entries with MAC address.
+
+        :param mac: MAC address of neighbor
+        :return: List of entries, empty if not found
+        """
+        return list(self._by_mac.get(mac, []))
+
+    def get_by_device(self, device: str) -> list[NeighborEntry]:
+        """
+        Get entries of device.
+
+        :param device: Name of interface
+        :return: List of entries, empty if not found
+        """
+        return list(self._by_device.get(device, []))
+
+    @property
+    def devices(self) -> list[str]:
+        """Names of devices with neighbor entries."""
+        return list(self._by_device)
+
+    def to_dict(self) -> dict[IPv4Interface | IPv6Interface, MACAddress]:
+        """
+        Get table in format of get_arp_table, entries without MAC address are skipped.
+
+        :return: Dictionary {ip address: mac address}
+        """
+        return {entry.ip: entry.mac for entry in self.entries if entry.mac is not None}
@@ -6,13 +6,14 @@ import json
 import logging
 import re
 from ipaddress import IPv4Interface, IPv6Interface
-from typing import Union, Dict, TYPE_CHECKING
+from typing import Iterable, Optional, Union, Dict, TYPE_CHECKING
 
 from mfd_common_libs import log_levels, add_logging_level
 from mfd_typing import MACAddress
 
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
-from .base import BaseARPFeature
+from .base import NEIGHBOR_MARKER, BaseARPFeature
+from .data_structures import NeighborEntry, NeighborTable
 
 if TYPE_CHECKING:
     from mfd_connect.base import ConnectionCompletedProcess
@@ -21,6 +22,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+NDP_ENTRY_REGEX = re.compile(
+    r"^(?P<ip>[a-fA-F\d:.]+)(%\S+)?\s+(?P<mac>\S+)\s+(?P<netif>\S+)\s+(?P<expire>\S+)\s+(?P<state>\S)\b"
+)
+
 
 class FreeBSDARPFeature(BaseARPFeature):
     """FreeBSD class for ARP feature."""
@@ -44,6 +49,104 @@ class FreeBSDARPFeature(BaseARPFeature):
                 for match in arp6_regexp.finditer(output)
             }
 
+    def get_neighbor_table(
+        self, ip_ver: IPVersion = IPVersion.V4, allowed_states: Optional[Iterable[str]] = None
+    ) -> NeighborTable:
+        """
+        Get snapshot of neighbor table, indexed by IP address, MAC address and device.
+
+        States of IPv4 entries are 'permanent' or 'dynamic', of IPv6 entries state letter of `ndp -a` (e.g. R, S),
+        with 'permanent' for entries which do not expire.
+
+        :param ip_ver: IPVersion field
+        :param allowed_states: States to accept entries from, all entries when not given
+        :return: NeighborTable
+        """
+        entries = []
+        if ip_ver is IPVersion.V4:
+            output = self._connection.execute_command("arp -a --libxo=json").stdout
+            for entry in json.loads(output)["arp"]["arp-cache"]:
+                mac = entry.get("mac-address")
+                entries.append(
+                    NeighborEntry(
+                        ip=IPv4Interface(entry["ip-address"]),
+                        mac=MACAddress(mac) if mac and mac != "(incomplete)" else None,
+                        device=entry.get("interface"),
+                        states=["permanent" if entry.get("permanent") else "dynamic"],
+                    )
+                )
+        else:
+            output = self._connection.execute_command("ndp -an").stdout
+            for line in output.splitlines():
+                match = NDP_ENTRY_REGEX.match(line)
+                if not match:
+                    continue
+                states = [match["state"]] + (["permanent"] if match["expire"] == "permanent" else [])
+                entries.append(
+                    NeighborEntry(
+                        ip=IPv6Interface(match["ip"]),
+                        mac=MACAddress(match["mac"]) if match["mac"] != "(incomplete)" else None,
+                        device=match["netif"],
+                        states=states,
+                    )
+                )
+        allowed_states = None if allowed_states is None else set(allowed_states)
+        return NeighborTable(
+            entry for entry in entries if allowed_states is None or not allowed_states.isdisjoint(entry.states)
+        )
+
+    def _execute_neighbor_commands(self, commands: list[tuple[NeighborEntry, str]]) -> list[tuple[NeighborEntry, str]]:
+        """
+        Execute arp/ndp commands in one shell call.
+
+        :param commands: List of tuples (entry, command)
+        :return: List of tuples (failed entry, error message)
+        """
+        if not commands:
+            return []
+        script = "\n".join(
+            f'{command} 2>&1; echo "{NEIGHBOR_MARKER} {index} $?"' for index, (_, command) in enumerate(commands)
+        )
+        output = self._connection.execute_command(script, shell=True, expected_return_codes=None).stdout
+        failures = self._get_bulk_failures([entry for entry, _ in commands], output)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Executed {len(commands)} neighbor commands, {len(failures)} failed.",
+        )
+        return failures
+
+    def add_neighbors(self, entries: Iterable[NeighborEntry], replace: bool = False) -> list[tuple[NeighborEntry, str]]:
+        """
+        Add (or replace) arp entries / ndp neighbours in one shell call.
+
+        :param entries: Entries to add, with MAC address
+        :param replace: Replace existing entries instead of failing on them
+        :return: List of tuples (failed entry, error message), empty when all entries were added
+        """
+        commands = []
+        failures = []
+        for entry in entries:
+            if entry.mac is None:
+                failures.append((entry, "MAC address is required"))
+            elif entry.ip.version == 6:
+                command = f"ndp -s {entry.ip.ip} {entry.mac}"
+                commands.append((entry, f"{{ ndp -d {entry.ip.ip} >/dev/null; {command}; }}" if replace else command))
+            else:
+                commands.append((entry, f"arp -{'S' if replace else 's'} {entry.ip.ip} {entry.mac}"))
+        return failures + self._execute_neighbor_commands(commands)
+
+    def delete_neighbors(self, entries: Iterable[NeighborEntry]) -> list[tuple[NeighborEntry, str]]:
+        """
+        Delete arp entries / ndp neighbours in one shell call.
+
+        :param entries: Entries to delete
+        :return: List of tuples (failed entry, error message), empty when all entries were deleted
+        """
+        commands = [
+            (entry, f"ndp -d {entry.ip.ip}" if entry.ip.version == 6 else f"arp -d {entry.ip.ip}") for entry in entries
+        ]
+        return self._execute_neighbor_commands(commands)
+
     def add_arp_entry(self, ip: Union[IPv4Interface, IPv6Interface], mac: MACAddress) -> "ConnectionCompletedProcess":
         """
         Add an entry to arp table, for ipv6 add ndp neighbour.
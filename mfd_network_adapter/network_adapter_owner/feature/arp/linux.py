@@ -3,18 +3,22 @@
 """Module for ARP feature for Linux."""
 
 import ipaddress
+import json
 import logging
 import re
 from ipaddress import IPv4Interface, IPv6Interface
-from typing import List, Union, TYPE_CHECKING, Dict, Optional
+from typing import Any, Iterable, Iterator, List, Union, TYPE_CHECKING, Dict, Optional
 
 from mfd_common_libs import log_levels, add_logging_level
 from mfd_kernel_namespace import add_namespace_call_command
 from mfd_typing import MACAddress
 
 from mfd_network_adapter.data_structures import State
+from mfd_network_adapter.iproute2 import is_json_supported
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 from .base import BaseARPFeature
+from .data_structures import NeighborEntry, NeighborTable
+from ...batch import BatchConnection
 
 if TYPE_CHECKING:
     from mfd_connect.base import ConnectionCompletedProcess
@@ -41,19 +45,226 @@ class LinuxARPFeature(BaseARPFeature):
         if allowed_states is None:
             allowed_states = ["REACHABLE", "DELAY"]
 
-        command = f"ip -{ip_ver} neigh show"
+        if is_json_supported(self._connection):
+            output = self._connection.execute_command(f"ip -j -{ip_ver.value} neigh show").stdout
+            return self._get_arp_table_from_json(output, allowed_states)
+
+        command = f"ip -{ip_ver.value} neigh show"
         output = self._connection.execute_command(command).stdout
         if not output:
             return {}
 
+        allowed_states = set(allowed_states)
         output_dict = {}
         for line in output.splitlines():
             split_line = line.split()
-            if any(msg in line for msg in allowed_states) and len(split_line) > line_minimum_length:
+            if len(split_line) > line_minimum_length and not allowed_states.isdisjoint(split_line[5:]):
                 output_dict[ipaddress.ip_interface(split_line[0])] = MACAddress(split_line[4].lower())
 
         return output_dict
 
+    @staticmethod
+    def _get_arp_table_from_json(
+        output: str, allowed_states: List[str]
+    ) -> Dict[Union[IPv4Interface, IPv6Interface], MACAddress]:
+        """
+        Get ARP table dictionary from JSON output.
+
+        :param output: Output of `ip -j neigh show`
+        :param allowed_states: list of states to accept entries from
+        :return: Dictionary {ip address: mac address}
+        """
+        return {
+            ipaddress.ip_interface(neighbor["dst"]): MACAddress(neighbor["lladdr"].lower())
+            for neighbor in json.loads(output or "[]")
+            if "lladdr" in neighbor and not set(allowed_states).isdisjoint(neighbor.get("state", []))
+        }
+
+    @staticmethod
+    def parse_neighbor_line(line: str, device: str | None = None) -> NeighborEntry | None:
+        """
+        Parse single line of `ip neigh show` output.
+
+        :param line: Line of output, e.g. '10.0.0.2 dev eth0 lladdr 00:00:00:00:00:02 router REACHABLE'
+        :param device: Name of device, for output filtered by device (without 'dev' field)
+        :return: NeighborEntry, None if line is not neighbor entry
+        """
+        tokens = line.split()
+        if not tokens:
+            return None
+        try:
+            ip = ipaddress.ip_interface(tokens[0])
+        except ValueError:
+            return None
+        fields = {}
+        states = []
+        index = 1
+        while index < len(tokens):
+            if tokens[index] in ("dev", "lladdr", "proto", "vrf") and index + 1 < len(tokens):
+                fields[tokens[index]] = tokens[index + 1]
+                index += 2
+                continue
+            if tokens[index].isupper():
+                states.append(tokens[index])
+            index += 1
+        mac = fields.get("lladdr")
+        return NeighborEntry(
+            ip=ip, mac=MACAddress(mac.lower()) if mac else None, device=fields.get("dev", device), states=states
+        )
+
+    @staticmethod
+    def _get_neighbor_from_json(neighbor: Dict[str, Any]) -> NeighborEntry:
+        """
+        Get neighbor entry from JSON object of `ip -j neigh show`.
+
+        :param neighbor: JSON object of single neighbor
+        :return: NeighborEntry
+        """
+        mac = neighbor.get("lladdr")
+        return NeighborEntry(
+            ip=ipaddress.ip_interface(neighbor["dst"]),
+            mac=MACAddress(mac.lower()) if mac else None,
+            device=neighbor.get("dev"),
+            states=list(neighbor.get("state", [])),
+        )
+
+    @staticmethod
+    def _get_neighbor_show_command(ip_ver: IPVersion | None, namespace: str | None, json_output: bool = False) -> str:
+        """
+        Get `ip neigh show` command.
+
+        :param ip_ver: IPVersion field, both versions when not given
+        :param namespace: Name of network namespace
+        :param json_output: Request JSON output
+        :return: Command
+        """
+        options = ("-j " if json_output else "") + (f"-{ip_ver.value} " if ip_ver is not None else "")
+        return add_namespace_call_command(f"ip {options}neigh show", namespace=namespace)
+
+    def iter_neighbors(
+        self,
+        ip_ver: IPVersion | None = None,
+        allowed_states: Optional[Iterable[str]] = None,
+        namespace: str | None = None,
+    ) -> Iterator[NeighborEntry]:
+        """
+        Stream entries of neighbor table, line by line, without reading whole output of `ip neigh show` into memory.
+
+        :param ip_ver: IPVersion field, both versions when not given
+        :param allowed_states: States to accept entries from, all entries when not given
+        :param namespace: Name of network namespace
+        :return: Iterator of entries
+        """
+        allowed_states = None if allowed_states is None else set(allowed_states)
+        process = self._connection.start_process(self._get_neighbor_show_command(ip_ver, namespace))
+        for line in process.get_stdout_iter():
+            entry = self.parse_neighbor_line(line)
+            if entry is not None and (allowed_states is None or not allowed_states.isdisjoint(entry.states)):
+                yield entry
+
+    def get_neighbor_table(
+        self,
+        ip_ver: IPVersion | None = None,
+        allowed_states: Optional[Iterable[str]] = None,
+        namespace: str | None = None,
+        stream: bool = False,
+    ) -> NeighborTable:
+        """
+        Get snapshot of neighbor table, indexed by IP address, MAC address and device.
+
+        :param ip_ver: IPVersion field, both versions when not given
+        :param allowed_states: States to accept entries from, all entries when not given
+        :param namespace: Name of network namespace
+        :param stream: Read output line by line (see iter_neighbors), for very large tables
+        :return: NeighborTable
+        """
+        if stream:
+            return NeighborTable(self.iter_neighbors(ip_ver, allowed_states, namespace))
+
+        allowed_states = None if allowed_states is None else set(allowed_states)
+        if is_json_supported(self._connection):
+            command = self._get_neighbor_show_command(ip_ver, namespace, json_output=True)
+            output = self._connection.execute_command(command).stdout
+            entries = (self._get_neighbor_from_json(neighbor) for neighbor in json.loads(output or "[]"))
+        else:
+            output = self._connection.execute_command(self._get_neighbor_show_command(ip_ver, namespace)).stdout
+            entries = (self.parse_neighbor_line(line) for line in output.splitlines())
+        table = NeighborTable(
+            entry
+            for entry in entries
+            if entry is not None and (allowed_states is None or not allowed_states.isdisjoint(entry.states))
+        )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Neighbor table read, {len(table)} entries.")
+        return table
+
+    def _execute_neighbor_commands(
+        self, commands: list[tuple[NeighborEntry, str]], namespace: str | None
+    ) -> list[tuple[NeighborEntry, str]]:
+        """
+        Execute `ip neigh` commands in one `ip -batch` call.
+
+        :param commands: List of tuples (entry, command)
+        :param namespace: Name of network namespace
+        :return: List of tuples (failed entry, error message)
+        """
+        batch = BatchConnection(self._owner()._connection)
+        for _, command in commands:
+            batch.execute_command(add_namespace_call_command(command, namespace=namespace))
+        calls = batch.execute(raise_on_error=False)
+        failures = [
+            (entry, call.output or f"returned {call.return_code}")
+            for (entry, _), call in zip(commands, calls)
+            if call.failed
+        ]
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Executed {len(commands)} neighbor commands, {len(failures)} failed.",
+        )
+        return failures
+
+    def add_neighbors(
+        self, entries: Iterable[NeighborEntry], replace: bool = False, namespace: str | None = None
+    ) -> list[tuple[NeighborEntry, str]]:
+        """
+        Add (or replace) neighbor entries in one `ip -batch` call.
+
+        First state of entry, if given, is used as NUD state of added entry (e.g. PERMANENT, REACHABLE, STALE).
+
+        :param entries: Entries to add, with MAC address and device
+        :param replace: Replace existing entries instead of failing on them (`ip neigh replace`)
+        :param namespace: Name of network namespace
+        :return: List of tuples (failed entry, error message), empty when all entries were added
+        """
+        commands = []
+        failures = []
+        for entry in entries:
+            if entry.mac is None or entry.device is None:
+                failures.append((entry, "MAC address and device are required"))
+                continue
+            nud = f" nud {entry.states[0].lower()}" if entry.states else ""
+            operation = "replace" if replace else "add"
+            commands.append((entry, f"ip neigh {operation} {entry.ip.ip} lladdr {entry.mac} dev {entry.device}{nud}"))
+        return failures + self._execute_neighbor_commands(commands, namespace)
+
+    def delete_neighbors(
+        self, entries: Iterable[NeighborEntry], namespace: str | None = None
+    ) -> list[tuple[NeighborEntry, str]]:
+        """
+        Delete neighbor entries in one `ip -batch` call, e.g. filtered entries of get_neighbor_table snapshot.
+
+        :param entries: Entries to delete, with device
+        :param namespace: Name of network namespace
+        :return: List of tuples (failed entry, error message), empty when all entries were deleted
+        """
+        commands = []
+        failures = []
+        for entry in entries:
+            if entry.device is None:
+                failures.append((entry, "device is required"))
+                continue
+            commands.append((entry, f"ip neigh del {entry.ip.ip} dev {entry.device}"))
+        return failures + self._execute_neighbor_commands(commands, namespace)
+
     def send_arp(
         self, interface: "LinuxNetworkInterface", destination: IPv4Interface, count: int = 1
     ) -> "ConnectionCompletedProcess":
@@ -7,14 +7,15 @@ import logging
 import re
 from ipaddress import IPv4Interface, IPv6Interface
 from pathlib import Path
-from typing import List, Union, TYPE_CHECKING, Optional, Dict
+from typing import Iterable, List, Union, TYPE_CHECKING, Optional, Dict
 
 from mfd_common_libs import log_levels, add_logging_level
 from mfd_typing import MACAddress
 from netaddr import mac_eui48
 
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
-from .base import BaseARPFeature
+from .base import NEIGHBOR_MARKER, BaseARPFeature
+from .data_structures import NeighborEntry, NeighborTable
 from ...exceptions import ARPFeatureException
 
 if TYPE_CHECKING:
@@ -24,6 +25,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+NETSH_INTERFACE_REGEX = re.compile(r"^Interface \d+: (?P<name>.+?)\s*$")
+NETSH_IP_VERSION = {6: "ipv6", 4: "ip"}
+
 
 class WindowsARPFeature(BaseARPFeature):
     """Windows class for ARP feature."""
@@ -60,6 +64,116 @@ class WindowsARPFeature(BaseARPFeature):
 
         return output_dict
 
+    @staticmethod
+    def parse_neighbors_output(output: str) -> list[NeighborEntry]:
+        """
+        Parse output of `netsh interface ipvX show neighbors`.
+
+        :param output: Output of command
+        :return: List of entries, entries without physical address (e.g. multicast) have no MAC address
+        """
+        entries = []
+        device = None
+        for line in output.splitlines():
+            match = NETSH_INTERFACE_REGEX.match(line)
+            if match:
+                device = match["name"]
+                continue
+            tokens = line.split()
+            if len(tokens) < 2:
+                continue
+            try:
+                ip = ipaddress.ip_interface(tokens[0])
+            except ValueError:
+                continue
+            if len(tokens) == 2:
+                entries.append(NeighborEntry(ip=ip, device=device, states=[tokens[1]]))
+            else:
+                entries.append(
+                    NeighborEntry(ip=ip, mac=MACAddress(tokens[1]), device=device, states=[" ".join(tokens[2:])])
+                )
+        return entries
+
+    def get_neighbor_table(
+        self, ip_ver: IPVersion = IPVersion.V4, allowed_states: Optional[Iterable[str]] = None
+    ) -> NeighborTable:
+        """
+        Get snapshot of neighbor table, indexed by IP address, MAC address and device (interface name).
+
+        :param ip_ver: IPVersion field
+        :param allowed_states: States to accept entries from, e.g. Reachable, Stale, all entries when not given
+        :return: NeighborTable
+        """
+        allowed_states = None if allowed_states is None else set(allowed_states)
+        output = self._connection.execute_powershell(f"netsh interface ipv{ip_ver.value} show neighbors").stdout
+        return NeighborTable(
+            entry
+            for entry in self.parse_neighbors_output(output)
+            if allowed_states is None or not allowed_states.isdisjoint(entry.states)
+        )
+
+    def _execute_neighbor_commands(self, commands: list[tuple[NeighborEntry, str]]) -> list[tuple[NeighborEntry, str]]:
+        """
+        Execute netsh commands in one PowerShell call.
+
+        :param commands: List of tuples (entry, command)
+        :return: List of tuples (failed entry, error message)
+        """
+        if not commands:
+            return []
+        script = "\n".join(
+            f'{command}; echo "{NEIGHBOR_MARKER} {index} $LASTEXITCODE"' for index, (_, command) in enumerate(commands)
+        )
+        output = self._connection.execute_powershell(script, expected_return_codes=None).stdout
+        failures = self._get_bulk_failures([entry for entry, _ in commands], output)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Executed {len(commands)} neighbor commands, {len(failures)} failed.",
+        )
+        return failures
+
+    def add_neighbors(self, entries: Iterable[NeighborEntry], replace: bool = False) -> list[tuple[NeighborEntry, str]]:
+        """
+        Add (or replace) neighbor entries in one PowerShell call.
+
+        :param entries: Entries to add, with MAC address and device (interface name)
+        :param replace: Delete existing entries before adding
+        :return: List of tuples (failed entry, error message), empty when all entries were added
+        """
+        commands = []
+        failures = []
+        for entry in entries:
+            if entry.mac is None or entry.device is None:
+                failures.append((entry, "MAC address and device are required"))
+                continue
+            ip_ver = NETSH_IP_VERSION[entry.ip.version]
+            command = (
+                f"netsh int {ip_ver} add neigh '{entry.device}' {entry.ip.ip} "
+                f"{entry.mac.format(dialect=mac_eui48).lower()}"
+            )
+            if replace:
+                command = f"netsh int {ip_ver} del neigh '{entry.device}' {entry.ip.ip} | Out-Null; {command}"
+            commands.append((entry, command))
+        return failures + self._execute_neighbor_commands(commands)
+
+    def delete_neighbors(self, entries: Iterable[NeighborEntry]) -> list[tuple[NeighborEntry, str]]:
+        """
+        Delete neighbor entries in one PowerShell call.
+
+        :param entries: Entries to delete, with device (interface name)
+        :return: List of tuples (failed entry, error message), empty when all entries were deleted
+        """
+        commands = []
+        failures = []
+        for entry in entries:
+            if entry.device is None:
+                failures.append((entry, "device is required"))
+                continue
+            commands.append(
+                (entry, f"netsh int {NETSH_IP_VERSION[entry.ip.version]} del neigh '{entry.device}' {entry.ip.ip}")
+            )
+        return failures + self._execute_neighbor_commands(commands)
+
     def send_arp(
         self,
         interface: "WindowsNetworkInterface",
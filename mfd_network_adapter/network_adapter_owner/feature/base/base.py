@@ -11,6 +11,9 @@ from typing import Dict, Any, Set
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_typing import OSName
 
+from mfd_network_adapter.lazy_import import import_os_module
+from ...batch import BatchConnection
+
 if typing.TYPE_CHECKING:
     from mfd_connect import Connection
     from mfd_network_adapter.network_adapter_owner.base import NetworkAdapterOwner
@@ -27,8 +30,13 @@ class BaseFeature:
         os_name = kwargs["connection"].get_os_name()
         os_name = "esxi" if os_name == OSName.ESXI else os_name.value.lower()
 
-        all_subclasses = _get_all_subclasses(cls)
-        requested_class = all_subclasses.get(os_name)
+        import_os_module(cls, os_name)
+        requested_class = _get_all_subclasses(cls).get(os_name)
+        if requested_class is None:
+            # OS-specific modules are imported lazily (here or by any other import), registered subclasses may be new
+            _subclasses.cache_clear()
+            _get_all_subclasses.cache_clear()
+            requested_class = _get_all_subclasses(cls).get(os_name)
 
         if requested_class is None:
             return super().__new__(cls)
@@ -41,8 +49,20 @@ class BaseFeature:
         :param connection: Object of mfd-connect
         :param owner: Owner object, parent of feature
         """
-        self._connection = connection
         self._owner: weakref.ReferenceType["NetworkAdapterOwner"] = weakref.ref(owner)
+        self._connection = connection
+
+    @property
+    def _connection(self) -> "Connection":
+        """Connection of the feature, BatchConnection of owner when batch is active."""
+        batch = getattr(self._owner(), "_batch", None)
+        if isinstance(batch, BatchConnection):
+            return batch
+        return self.__connection
+
+    @_connection.setter
+    def _connection(self, connection: "Connection") -> None:
+        self.__connection = connection
 
 
 @lru_cache()
@@ -2,7 +2,19 @@
 # SPDX-License-Identifier: MIT
 """Module for bonding feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureBonding
-from .linux import LinuxBonding
+from .data_structures import BondingParams, BondSpec, FailoverResult
+
+if TYPE_CHECKING:
+    from .linux import LinuxBonding
+
+    BondingFeatureType = BaseFeatureBonding | LinuxBonding
 
-BondingFeatureType = BaseFeatureBonding | LinuxBonding
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"LinuxBonding": ".linux"}, {"BondingFeatureType": ("BaseFeatureBonding", "LinuxBonding")}
+)
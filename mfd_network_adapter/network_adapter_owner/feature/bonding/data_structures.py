@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Module for bonding feature data structures."""
 
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 
@@ -12,3 +13,24 @@ class BondingParams(Enum):
     MODE = auto()
     UPDELAY = auto()
     DOWNDELAY = auto()
+
+
+@dataclass
+class BondSpec:
+    """Specification of bond interface created in bulk."""
+
+    name: str
+    children: list[str] = field(default_factory=list)
+    mode: str | None = "active-backup"
+    miimon: int | None = 100
+    params: dict[BondingParams, str | int] = field(default_factory=dict)
+
+
+@dataclass
+class FailoverResult:
+    """Result of failover measurement, times are in milliseconds since the failed child was set down."""
+
+    failed_child: str
+    new_active_child: str
+    latency_ms: float
+    samples: list[tuple[float, str]] = field(default_factory=list)
@@ -3,20 +3,31 @@
 """Module for bonding feature for Linux."""
 
 import logging
+import re
+from contextlib import contextmanager
+from typing import Iterable, Iterator
 
 from mfd_common_libs import add_logging_level, log_levels, add_logging_group, LevelGroup
 
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 from mfd_network_adapter.network_adapter_owner.feature.bonding.data_structures import (
     BondingParams,
+    BondSpec,
+    FailoverResult,
 )
 from .base import BaseFeatureBonding
-from ...exceptions import BondingFeatureException
+from ...exceptions import BatchExecutionError, BondingFeatureException
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 add_logging_group(LevelGroup.MFD)
 
+BONDING_ATTRIBUTE_REGEX = re.compile(
+    r"^/sys/class/net/(?P<bond>[^/]+)/bonding/(?P<attribute>[^:/]+):(?P<value>.*)$", re.MULTILINE
+)
+FAILOVER_MARKER = "@@MFD_FAILOVER@@"
+FAILOVER_LINE_REGEX = re.compile(rf"^{FAILOVER_MARKER} (?P<event>\S+)(?: (?P<value>.*))?$", re.MULTILINE)
+
 
 class LinuxBonding(BaseFeatureBonding):
     """Linux class for bonding feature."""
@@ -292,16 +303,225 @@ class LinuxBonding(BaseFeatureBonding):
             msg=f"Delete bond interface: {bonding_interface_name}",
         )
 
-        commands = []
-        for child_interface in child_interfaces:
-            child_interface_name = self._get_interface_name(child_interface)
-            commands.append(f"ip link set {child_interface_name} down")
-            commands.append(f"ip link set {child_interface_name} nomaster")
-            commands.append(f"ip link set {child_interface_name} up")
-        commands.append(f"ip link delete {bonding_interface_name}")
+        with self._batch_bond_operation("delete"):
+            self._queue_bond_deletion(bonding_interface_name, [self._get_interface_name(i) for i in child_interfaces])
+
+    def _queue_bond_deletion(self, bonding_interface_name: str, child_interface_names: Iterable[str]) -> None:
+        """
+        Execute commands detaching children and deleting bond interface.
+
+        :param bonding_interface_name: name of bonding interface
+        :param child_interface_names: names of child interfaces connected to bonding interface
+        """
+        for child_interface_name in child_interface_names:
+            self._connection.execute_command(f"ip link set {child_interface_name} down")
+            self._connection.execute_command(f"ip link set {child_interface_name} nomaster")
+            self._connection.execute_command(f"ip link set {child_interface_name} up")
+        self._connection.execute_command(f"ip link delete {bonding_interface_name}")
+
+    @contextmanager
+    def _batch_bond_operation(self, operation: str) -> Iterator[None]:
+        """
+        Execute bonding commands called within the block as one batch of owner.
+
+        :param operation: Name of operation used in error message
+        :raises BondingFeatureException: When any of batched commands failed
+        """
+        try:
+            with self._owner().batch():
+                yield
+        except BatchExecutionError as e:
+            raise BondingFeatureException(f"Cannot {operation} bond interfaces: {e}") from e
+
+    def create_bonds(self, specs: Iterable[BondSpec]) -> list[LinuxNetworkInterface]:
+        """
+        Create bond interfaces and attach their children in one `ip -batch` call.
 
-        for command in commands:
-            self._connection.execute_command(command)
+        Children are set down before attaching, as required by bonding driver.
+
+        :param specs: specifications of bond interfaces
+        :return: created bond interfaces, in order of specs
+        :raises BondingFeatureException: when any of bonding commands failed or bond interface is not created properly
+        """
+        specs = list(specs)
+        logger.log(
+            level=log_levels.MFD_INFO, msg=f"Create bond interfaces: {', '.join(spec.name for spec in specs)}."
+        )
+        with self._batch_bond_operation("create"):
+            for spec in specs:
+                params = {}
+                if spec.mode is not None:
+                    params[BondingParams.MODE] = spec.mode
+                if spec.miimon is not None:
+                    params[BondingParams.MIIMON] = spec.miimon
+                params.update(spec.params)
+                options = "".join(f" {param.name.lower()} {value}" for param, value in params.items())
+                self._connection.execute_command(f"ip link add {spec.name} type bond{options}")
+                for child_interface_name in spec.children:
+                    self._connection.execute_command(f"ip link set {child_interface_name} down")
+                    self._connection.execute_command(f"ip link set {child_interface_name} master {spec.name}")
+                self._connection.execute_command(f"ip link set {spec.name} up")
+
+        interfaces = {interface.name: interface for interface in self._owner().get_interfaces()}
+        missing = [spec.name for spec in specs if spec.name not in interfaces]
+        if missing:
+            raise BondingFeatureException(f"{', '.join(missing)} was not created properly!")
+        return [interfaces[spec.name] for spec in specs]
+
+    def delete_bonds(self, bonding_interfaces: Iterable[str | LinuxNetworkInterface] | None = None) -> list[str]:
+        """
+        Detach children and delete bond interfaces in one `ip -batch` call.
+
+        Children of bonds are read with get_bonds_attributes.
+
+        :param bonding_interfaces: bonding interfaces to delete, all bond interfaces of host when not given
+        :return: names of deleted bond interfaces
+        :raises BondingFeatureException: when any of bonding commands failed
+        """
+        names = None if bonding_interfaces is None else [self._get_interface_name(i) for i in bonding_interfaces]
+        attributes = self.get_bonds_attributes(names)
+        names = list(attributes) if names is None else names
+        if not names:
+            return []
+        logger.log(level=log_levels.MFD_INFO, msg=f"Delete bond interfaces: {', '.join(names)}.")
+        with self._batch_bond_operation("delete"):
+            for name in names:
+                self._queue_bond_deletion(name, attributes.get(name, {}).get("slaves", "").split())
+        return names
+
+    def get_bonds_attributes(
+        self, bonding_interfaces: Iterable[str | LinuxNetworkInterface] | None = None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Read all attributes from /sys/class/net/<bond>/bonding of bond interfaces in one call.
+
+        Attributes not readable in current bonding mode are skipped, empty attributes are returned as empty strings.
+
+        :param bonding_interfaces: bonding interfaces, all bond interfaces of host when not given
+        :return: dictionary {bond name: {attribute name: value}}, e.g. {"bond0": {"mode": "active-backup 1"}}
+        """
+        if bonding_interfaces is None:
+            paths = "/sys/class/net/*/bonding/*"
+        else:
+            paths = " ".join(f"/sys/class/net/{self._get_interface_name(i)}/bonding/*" for i in bonding_interfaces)
+        logger.log(level=log_levels.MFD_INFO, msg="Get attributes of bond interfaces.")
+        output = self._connection.execute_command(
+            f"grep -H ^ {paths} 2>/dev/null", shell=True, expected_return_codes=None
+        ).stdout
+
+        attributes: dict[str, dict[str, str]] = {}
+        for match in BONDING_ATTRIBUTE_REGEX.finditer(output):
+            bond_attributes = attributes.setdefault(match["bond"], {})
+            value = match["value"].strip()
+            if match["attribute"] in bond_attributes:
+                # multi-line attributes
+                value = f"{bond_attributes[match['attribute']]}\n{value}"
+            bond_attributes[match["attribute"]] = value
+        return attributes
+
+    @staticmethod
+    def _get_failover_script(
+        bonding_interface_name: str, network_interface_name: str | None, timeout: float, restore_link: bool
+    ) -> str:
+        """
+        Get shell script forcing failover and sampling active_slave attribute.
+
+        Script prints marker lines: 'start <active child>', '<ns since link down> <active child>' on each change
+        of active_slave and 'timeout' when active child was not changed in time.
+
+        :param bonding_interface_name: name of bonding interface
+        :param network_interface_name: name of child to fail, active child when None
+        :param timeout: maximum time of sampling in seconds
+        :param restore_link: bring link of failed child up after measurement
+        :return: shell script
+        """
+        child = network_interface_name or "$old"
+        restore = '\n  ip link set dev "$child" up' if restore_link else ""
+        return "\n".join(
+            [
+                f"f=/sys/class/net/{bonding_interface_name}/bonding/active_slave",
+                'read -r old < "$f"',
+                f'child="{child}"',
+                f'echo "{FAILOVER_MARKER} start $old"',
+                'if [ -n "$old" ] && [ "$old" = "$child" ]; then',
+                "  prev=$old",
+                "  start=$(date +%s%N)",
+                '  ip link set dev "$child" down',
+                f"  end=$((start + {int(timeout * 1e9)}))",
+                "  while :; do",
+                '    read -r cur < "$f"',
+                "    now=$(date +%s%N)",
+                '    if [ "$cur" != "$prev" ]; then',
+                f'      echo "{FAILOVER_MARKER} $((now - start)) $cur"',
+                "      prev=$cur",
+                "    fi",
+                '    if [ -n "$cur" ] && [ "$cur" != "$child" ]; then break; fi',
+                f'    if [ "$now" -gt "$end" ]; then echo "{FAILOVER_MARKER} timeout"; break; fi',
+                "    sleep 0.001",
+                f"  done{restore}",
+                "fi",
+            ]
+        )
+
+    def measure_failover(
+        self,
+        bonding_interface: str | LinuxNetworkInterface,
+        network_interface: str | LinuxNetworkInterface | None = None,
+        timeout: float = 5,
+        restore_link: bool = True,
+    ) -> FailoverResult:
+        """
+        Measure failover latency of bond interface.
+
+        Active child link is set down and active_slave attribute is sampled on the host every millisecond,
+        so the measurement is not affected by latency of connection.
+
+        :param bonding_interface: bonding interface
+        :param network_interface: active child to fail, current active child when not given
+        :param timeout: maximum time of waiting for new active child in seconds
+        :param restore_link: bring link of failed child up after measurement
+        :return: FailoverResult
+        :raises BondingFeatureException: when network interface is not active child or failover did not happen
+        """
+        bonding_interface_name = self._get_interface_name(bonding_interface)
+        network_interface_name = self._get_interface_name(network_interface) if network_interface else None
+        logger.log(level=log_levels.MFD_INFO, msg=f"Measure failover of bond interface: {bonding_interface_name}.")
+        output = self._connection.execute_command(
+            self._get_failover_script(bonding_interface_name, network_interface_name, timeout, restore_link),
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        ).stdout
+
+        active_child = None
+        samples = []
+        for match in FAILOVER_LINE_REGEX.finditer(output):
+            if match["event"] == "start":
+                active_child = (match["value"] or "").strip()
+            elif match["event"] == "timeout":
+                raise BondingFeatureException(
+                    f"Failover of {bonding_interface_name} not finished within {timeout}s, samples: {samples}"
+                )
+            else:
+                samples.append((int(match["event"]) / 1e6, (match["value"] or "").strip()))
+
+        failed_child = network_interface_name or active_child
+        if not active_child or active_child != failed_child:
+            raise BondingFeatureException(
+                f"Cannot measure failover, {failed_child} is not active child of {bonding_interface_name}: "
+                f"{active_child or output.strip()}"
+            )
+        if not samples or not samples[-1][1] or samples[-1][1] == failed_child:
+            raise BondingFeatureException(f"Failover of {bonding_interface_name} not detected: {output.strip()}")
+
+        latency_ms, new_active_child = samples[-1]
+        logger.log(
+            level=log_levels.MFD_INFO,
+            msg=f"Failover {failed_child} -> {new_active_child} took {latency_ms:.3f} ms.",
+        )
+        return FailoverResult(
+            failed_child=failed_child, new_active_child=new_active_child, latency_ms=latency_ms, samples=samples
+        )
 
     def verify_active_child(
         self,
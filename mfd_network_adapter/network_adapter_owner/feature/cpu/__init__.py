@@ -2,7 +2,18 @@
 # SPDX-License-Identifier: MIT
 """Module for CPU feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseCPUFeature
-from .esxi import ESXiCPUFeature
 
-CPUFeatureType = BaseCPUFeature | ESXiCPUFeature
+if TYPE_CHECKING:
+    from .esxi import ESXiCPUFeature
+
+    CPUFeatureType = BaseCPUFeature | ESXiCPUFeature
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"ESXiCPUFeature": ".esxi"}, {"CPUFeatureType": ("BaseCPUFeature", "ESXiCPUFeature")}
+)
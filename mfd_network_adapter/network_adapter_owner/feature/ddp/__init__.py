@@ -2,7 +2,16 @@
 # SPDX-License-Identifier: MIT
 """Module for DDP feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseDDPFeature
-from .esxi import ESXiDDP
 
-DDPFeatureType = BaseDDPFeature | ESXiDDP
+if TYPE_CHECKING:
+    from .esxi import ESXiDDP
+
+    DDPFeatureType = BaseDDPFeature | ESXiDDP
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(__name__, {"ESXiDDP": ".esxi"}, {"DDPFeatureType": ("BaseDDPFeature", "ESXiDDP")})
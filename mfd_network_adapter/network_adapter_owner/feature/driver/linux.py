@@ -11,6 +11,7 @@ from mfd_common_libs import log_levels, add_logging_level
 from mfd_package_manager import LinuxPackageManager
 
 from . import BaseDriverFeature
+from ....network_interface.capabilities import notify_driver_reload
 
 if TYPE_CHECKING:
     from mfd_network_adapter import NetworkAdapterOwner
@@ -42,6 +43,7 @@ class LinuxDriver(BaseDriverFeature):
         :param params: Optional parameters for loading process.
         :return: Result of operation
         """
+        notify_driver_reload(self._connection)
         return self._package_manager.load_module(module_name=module_name, params=params)
 
     def load_module_file(
@@ -54,6 +56,7 @@ class LinuxDriver(BaseDriverFeature):
         :param params: Optional parameters for loading process.
         :return: Result of operation
         """
+        notify_driver_reload(self._connection)
         return self._package_manager.insert_module(module_path=module_filepath, params=params)
 
     def unload_module(
@@ -67,6 +70,7 @@ class LinuxDriver(BaseDriverFeature):
         :param with_dependencies: If true modprobe -r will be used, otherwise rmmod
         :return: Result of unloading
         """
+        notify_driver_reload(self._connection)
         return self._package_manager.unload_module(
             module_name=module_name, options=params, with_dependencies=with_dependencies
         )
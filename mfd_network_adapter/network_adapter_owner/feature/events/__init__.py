@@ -0,0 +1,19 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Events feature."""
+
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
+from .base import BaseEventsFeature
+
+if TYPE_CHECKING:
+    from .linux import LinuxEvents
+
+    EventsFeatureType = BaseEventsFeature | LinuxEvents
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"LinuxEvents": ".linux"}, {"EventsFeatureType": ("BaseEventsFeature", "LinuxEvents")}
+)
@@ -0,0 +1,11 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Events feature."""
+
+from abc import ABC
+
+from ..base import BaseFeature
+
+
+class BaseEventsFeature(BaseFeature, ABC):
+    """Base class for Events feature."""
@@ -0,0 +1,40 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Events feature data structures."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from ipaddress import IPv4Interface, IPv6Interface
+
+
+class EventType(Enum):
+    """Types of network events reported by the host."""
+
+    LINK_UP = "link_up"
+    LINK_DOWN = "link_down"
+    LINK_DELETED = "link_deleted"
+    ADDRESS_ADDED = "address_added"
+    ADDRESS_DELETED = "address_deleted"
+    NEIGHBOR_ADDED = "neighbor_added"
+    NEIGHBOR_DELETED = "neighbor_deleted"
+
+
+class MonitorObject(Enum):
+    """Objects which can be monitored with `ip monitor`."""
+
+    LINK = "link"
+    ADDRESS = "address"
+    NEIGHBOR = "neigh"
+
+
+@dataclass(frozen=True)
+class NetworkEvent:
+    """Single network event with the timestamp reported by the host."""
+
+    event_type: EventType
+    interface_name: str
+    timestamp: datetime
+    ip: IPv4Interface | IPv6Interface | None = None
+    flags: tuple[str, ...] = field(default_factory=tuple)
+    raw: str = ""
@@ -0,0 +1,244 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Events feature for Linux systems."""
+
+import logging
+import re
+from datetime import datetime
+from ipaddress import ip_interface
+from queue import Queue, Empty
+from threading import Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_kernel_namespace import add_namespace_call_command
+
+from .base import BaseEventsFeature
+from .data_structures import EventType, MonitorObject, NetworkEvent
+from ...exceptions import EventsFeatureException
+
+if TYPE_CHECKING:
+    from ipaddress import IPv4Interface, IPv6Interface
+
+    from mfd_connect.process import RemoteProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+MONITOR_LINE_REGEX = re.compile(
+    r"^\[(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+)\]\s*(?P<deleted>Deleted\s+)?(?P<body>.*)$"
+)
+LINK_REGEX = re.compile(r"^\d+:\s+(?P<name>[^:@\s]+)(@\S+)?:\s+<(?P<flags>[^>]*)>")
+ADDRESS_REGEX = re.compile(r"^\d+:\s+(?P<name>[^:@\s]+)(@\S+)?\s+inet6?\s+(?P<ip>\S+)(?P<rest>.*)$")
+NEIGHBOR_REGEX = re.compile(r"^(?P<ip>[0-9a-fA-F.:]+)\s+dev\s+(?P<name>\S+)(?P<rest>.*)$")
+
+
+def parse_monitor_line(line: str) -> NetworkEvent | None:
+    """
+    Parse single line of `ip -ts monitor` output.
+
+    Continuation lines (without timestamp) and unsupported objects are skipped.
+
+    :param line: Line of monitor output
+    :return: NetworkEvent or None if line does not describe supported event
+    """
+    match = MONITOR_LINE_REGEX.match(line.strip())
+    if not match:
+        return None
+
+    timestamp = datetime.strptime(match["timestamp"], "%Y-%m-%dT%H:%M:%S.%f")
+    deleted = bool(match["deleted"])
+    body = match["body"]
+
+    address_match = ADDRESS_REGEX.match(body)
+    if address_match:
+        return NetworkEvent(
+            event_type=EventType.ADDRESS_DELETED if deleted else EventType.ADDRESS_ADDED,
+            interface_name=address_match["name"],
+            timestamp=timestamp,
+            ip=ip_interface(address_match["ip"]),
+            flags=tuple(address_match["rest"].split()),
+            raw=line,
+        )
+
+    link_match = LINK_REGEX.match(body)
+    if link_match:
+        flags = tuple(link_match["flags"].split(","))
+        if deleted:
+            event_type = EventType.LINK_DELETED
+        elif "UP" in flags and "LOWER_UP" in flags:
+            event_type = EventType.LINK_UP
+        else:
+            event_type = EventType.LINK_DOWN
+        return NetworkEvent(
+            event_type=event_type, interface_name=link_match["name"], timestamp=timestamp, flags=flags, raw=line
+        )
+
+    neighbor_match = NEIGHBOR_REGEX.match(body)
+    if neighbor_match:
+        return NetworkEvent(
+            event_type=EventType.NEIGHBOR_DELETED if deleted else EventType.NEIGHBOR_ADDED,
+            interface_name=neighbor_match["name"],
+            timestamp=timestamp,
+            ip=ip_interface(neighbor_match["ip"]),
+            flags=tuple(neighbor_match["rest"].split()),
+            raw=line,
+        )
+    return None
+
+
+class EventSubscription:
+    """Subscription to network events, backed by long-lived `ip monitor` process on the host."""
+
+    def __init__(self, process: "RemoteProcess") -> None:
+        """
+        Initialize subscription and start reading events in background.
+
+        :param process: Running `ip -ts monitor` process
+        """
+        self._process = process
+        self._events: "Queue[NetworkEvent]" = Queue()
+        self.history: list[NetworkEvent] = []
+        # received events not matched by wait_for yet, checked by next wait_for calls
+        self._pending: list[NetworkEvent] = []
+        self._reader = Thread(target=self._read_events, daemon=True)
+        self._reader.start()
+
+    def __enter__(self) -> "EventSubscription":
+        """Use subscription as context manager, monitor process is stopped on exit."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop monitor process."""
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Check whether monitor process is still running."""
+        return self._process.running
+
+    def _read_events(self) -> None:
+        """Read monitor output and put parsed events into queue."""
+        for line in self._process.get_stdout_iter():
+            event = parse_monitor_line(line)
+            if event is not None:
+                self._events.put(event)
+
+    def get_events(self) -> list[NetworkEvent]:
+        """
+        Get all events received since last call, without blocking.
+
+        :return: List of events
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except Empty:
+                break
+        self.history.extend(events)
+        self._pending.extend(events)
+        return events
+
+    @staticmethod
+    def _matches(
+        event: NetworkEvent,
+        event_type: EventType,
+        interface_name: str | None,
+        ip: "IPv4Interface | IPv6Interface | None",
+        predicate: Callable[[NetworkEvent], bool] | None,
+    ) -> bool:
+        """
+        Check whether event matches conditions of wait_for.
+
+        :param event: Received event
+        :param event_type: Expected type of event
+        :param interface_name: Name of interface, which event should concern
+        :param ip: IP address, which event should concern
+        :param predicate: Additional condition for event
+        :return: True if event matches all conditions
+        """
+        return (
+            event.event_type is event_type
+            and (interface_name is None or event.interface_name == interface_name)
+            and (ip is None or event.ip == ip)
+            and (predicate is None or predicate(event))
+        )
+
+    def wait_for(
+        self,
+        event_type: EventType,
+        interface_name: str | None = None,
+        ip: "IPv4Interface | IPv6Interface | None" = None,
+        predicate: Callable[[NetworkEvent], bool] | None = None,
+        timeout: float = 15,
+    ) -> NetworkEvent:
+        """
+        Block until matching event is received.
+
+        Events received before the call (since subscription start) are also taken into account, including events
+        already returned by get_events or skipped by previous wait_for calls, so it is safe to subscribe,
+        trigger the change and then wait for events in any order. Matching event is consumed.
+
+        :param event_type: Expected type of event
+        :param interface_name: Name of interface, which event should concern
+        :param ip: IP address, which event should concern
+        :param predicate: Additional condition for event
+        :param timeout: Time to wait for event in seconds
+        :return: Matching event
+        :raises EventsFeatureException: When event not received within timeout
+        """
+        for event in self._pending:
+            if self._matches(event, event_type, interface_name, ip, predicate):
+                self._pending.remove(event)
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Received event: {event.raw}")
+                return event
+
+        deadline = monotonic() + timeout
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                event = self._events.get(timeout=remaining)
+            except Empty:
+                break
+            self.history.append(event)
+            if not self._matches(event, event_type, interface_name, ip, predicate):
+                self._pending.append(event)
+                continue
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Received event: {event.raw}")
+            return event
+
+        raise EventsFeatureException(
+            f"Event {event_type.value} for {interface_name or 'any interface'} not received after {timeout}s."
+        )
+
+    def stop(self) -> None:
+        """Stop monitor process."""
+        if self._process.running:
+            self._process.kill()
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Events subscription stopped.")
+
+
+class LinuxEvents(BaseEventsFeature):
+    """Linux class for Events feature."""
+
+    def subscribe(
+        self, objects: Iterable[MonitorObject] | None = None, namespace: str | None = None
+    ) -> EventSubscription:
+        """
+        Start monitoring network events on the host.
+
+        Subscription should be created before triggering the change to not miss any event.
+
+        :param objects: Objects to monitor, all supported by default
+        :param namespace: Name of network namespace
+        :return: EventSubscription object
+        """
+        objects = list(objects) if objects else list(MonitorObject)
+        cmd = f"ip -ts monitor {' '.join(obj.value for obj in objects)}"
+        process = self._connection.start_process(add_namespace_call_command(cmd, namespace=namespace))
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Events subscription started: {cmd}")
+        return EventSubscription(process)
@@ -2,12 +2,42 @@
 # SPDX-License-Identifier: MIT
 """Module for Firewall feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFirewallFeature
-from .esxi import ESXiFirewallFeature
-from .freebsd import FreeBSDFirewallFeature
-from .linux import LinuxFirewallFeature
-from .windows import WindowsFirewallFeature
 
-FirewallFeatureType = (
-    BaseFirewallFeature | LinuxFirewallFeature | WindowsFirewallFeature | FreeBSDFirewallFeature | ESXiFirewallFeature
+if TYPE_CHECKING:
+    from .esxi import ESXiFirewallFeature
+    from .freebsd import FreeBSDFirewallFeature
+    from .linux import LinuxFirewallFeature
+    from .windows import WindowsFirewallFeature
+
+    FirewallFeatureType = (
+        BaseFirewallFeature
+        | LinuxFirewallFeature
+        | WindowsFirewallFeature
+        | FreeBSDFirewallFeature
+        | ESXiFirewallFeature
+    )
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "ESXiFirewallFeature": ".esxi",
+        "FreeBSDFirewallFeature": ".freebsd",
+        "LinuxFirewallFeature": ".linux",
+        "WindowsFirewallFeature": ".windows",
+    },
+    {
+        "FirewallFeatureType": (
+            "BaseFirewallFeature",
+            "LinuxFirewallFeature",
+            "WindowsFirewallFeature",
+            "FreeBSDFirewallFeature",
+            "ESXiFirewallFeature",
+        )
+    },
 )
@@ -2,12 +2,38 @@
 # SPDX-License-Identifier: MIT
 """Module for Geneve Tunnel feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from mfd_network_adapter.network_adapter_owner.feature.geneve.base import BaseGeneveTunnelFeature
-from mfd_network_adapter.network_adapter_owner.feature.geneve.esxi import ESXiGeneveTunnel
-from mfd_network_adapter.network_adapter_owner.feature.geneve.freebsd import FreeBSDGeneveTunnel
-from mfd_network_adapter.network_adapter_owner.feature.geneve.linux import LinuxGeneveTunnel
-from mfd_network_adapter.network_adapter_owner.feature.geneve.windows import WindowsGeneveTunnel
 
-GeneveTunnelFeatureType = (
-    BaseGeneveTunnelFeature | ESXiGeneveTunnel | FreeBSDGeneveTunnel | LinuxGeneveTunnel | WindowsGeneveTunnel
+if TYPE_CHECKING:
+    from mfd_network_adapter.network_adapter_owner.feature.geneve.esxi import ESXiGeneveTunnel
+    from mfd_network_adapter.network_adapter_owner.feature.geneve.freebsd import FreeBSDGeneveTunnel
+    from mfd_network_adapter.network_adapter_owner.feature.geneve.linux import LinuxGeneveTunnel
+    from mfd_network_adapter.network_adapter_owner.feature.geneve.windows import WindowsGeneveTunnel
+
+    GeneveTunnelFeatureType = (
+        BaseGeneveTunnelFeature | ESXiGeneveTunnel | FreeBSDGeneveTunnel | LinuxGeneveTunnel | WindowsGeneveTunnel
+    )
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "ESXiGeneveTunnel": ".esxi",
+        "FreeBSDGeneveTunnel": ".freebsd",
+        "LinuxGeneveTunnel": ".linux",
+        "WindowsGeneveTunnel": ".windows",
+    },
+    {
+        "GeneveTunnelFeatureType": (
+            "BaseGeneveTunnelFeature",
+            "ESXiGeneveTunnel",
+            "FreeBSDGeneveTunnel",
+            "LinuxGeneveTunnel",
+            "WindowsGeneveTunnel",
+        )
+    },
 )
@@ -2,9 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for GRE feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseGREFeature
-from .freebsd import FreeBSDGRE
-from .linux import LinuxGRE
-from .windows import WindowsGRE
 
-GREFeatureType = BaseGREFeature | FreeBSDGRE | LinuxGRE | WindowsGRE
+if TYPE_CHECKING:
+    from .freebsd import FreeBSDGRE
+    from .linux import LinuxGRE
+    from .windows import WindowsGRE
+
+    GREFeatureType = BaseGREFeature | FreeBSDGRE | LinuxGRE | WindowsGRE
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBSDGRE": ".freebsd", "LinuxGRE": ".linux", "WindowsGRE": ".windows"},
+    {"GREFeatureType": ("BaseGREFeature", "FreeBSDGRE", "LinuxGRE", "WindowsGRE")},
+)
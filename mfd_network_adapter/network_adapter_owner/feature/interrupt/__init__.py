@@ -2,9 +2,20 @@
 # SPDX-License-Identifier: MIT
 """Module for Interrupt feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseInterruptFeature
-from .esxi import ESXiInterruptFeature
 
-InterruptFeatureType = Union[BaseInterruptFeature, ESXiInterruptFeature]
+if TYPE_CHECKING:
+    from .esxi import ESXiInterruptFeature
+
+    InterruptFeatureType = Union[BaseInterruptFeature, ESXiInterruptFeature]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiInterruptFeature": ".esxi"},
+    {"InterruptFeatureType": ("BaseInterruptFeature", "ESXiInterruptFeature")},
+)
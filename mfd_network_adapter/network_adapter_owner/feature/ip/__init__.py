@@ -2,12 +2,24 @@
 # SPDX-License-Identifier: MIT
 """Module for IP feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseIPFeature
-from .esxi import EsxiIP
-from .freebsd import FreeBsdIP
-from .linux import LinuxIP
-from .windows import WindowsIP
+from .data_structures import NamespaceTeardownResult
+
+if TYPE_CHECKING:
+    from .esxi import EsxiIP
+    from .freebsd import FreeBsdIP
+    from .linux import LinuxIP
+    from .windows import WindowsIP
+
+    IPFeatureType = Union[BaseIPFeature, EsxiIP, FreeBsdIP, LinuxIP, WindowsIP]
 
-IPFeatureType = Union[BaseIPFeature, EsxiIP, FreeBsdIP, LinuxIP, WindowsIP]
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiIP": ".esxi", "FreeBsdIP": ".freebsd", "LinuxIP": ".linux", "WindowsIP": ".windows"},
+    {"IPFeatureType": ("BaseIPFeature", "EsxiIP", "FreeBsdIP", "LinuxIP", "WindowsIP")},
+)
@@ -0,0 +1,22 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for IP feature data structures."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class NamespaceTeardownResult:
+    """
+    Result of bulk namespace teardown.
+
+    :param deleted: Names of deleted namespaces
+    :param killed_pids: Dictionary {namespace: PIDs of killed processes}
+    :param moved_interfaces: Dictionary {namespace: physical interfaces moved back to root namespace}
+    :param failures: Dictionary {namespace: reason of failed deletion}
+    """
+
+    deleted: list[str] = field(default_factory=list)
+    killed_pids: dict[str, list[int]] = field(default_factory=dict)
+    moved_interfaces: dict[str, list[str]] = field(default_factory=dict)
+    failures: dict[str, str] = field(default_factory=dict)
@@ -3,17 +3,27 @@
 """Module for IP feature for Linux."""
 
 import logging
-from typing import Optional
+import re
+import shlex
+from typing import Iterable, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
 from .base import BaseIPFeature
+from .data_structures import NamespaceTeardownResult
 from ...exceptions import IPFeatureException
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+TEARDOWN_MARKER = "@@MFD_NS_TEARDOWN@@"
+TEARDOWN_LINE_REGEX = re.compile(
+    rf"^{TEARDOWN_MARKER} (?P<event>killed|moved|deleted|failed) (?P<namespace>\S+)(?: (?P<value>.*))?$", re.MULTILINE
+)
+# physical (PCI/VMBus) interfaces have 'device' link, /sys is mounted for namespace by 'ip netns exec'
+PHYSICAL_INTERFACES_SCRIPT = 'for d in /sys/class/net/*/device; do [ -e "$d" ] && basename "$(dirname "$d")"; done'
+
 
 class LinuxIP(BaseIPFeature):
     """Linux class for IP feature."""
@@ -139,10 +149,83 @@ class LinuxIP(BaseIPFeature):
         """
         return self._owner()._get_network_namespaces()
 
-    def delete_all_namespaces(self) -> None:
-        """Delete all network namespaces."""
-        for ns in self.get_namespaces():
-            self.delete_namespace(ns)
+    @staticmethod
+    def _get_teardown_script(namespaces: Iterable[str] | None, pattern: str | None, kill_signal: str) -> str:
+        """
+        Get shell script tearing down namespaces.
+
+        For each namespace processes are killed, physical interfaces are moved to root namespace
+        and namespace is deleted. Each step is reported with marker line.
+
+        :param namespaces: Names of namespaces, all namespaces of host when None
+        :param pattern: Shell pattern of namespace names to tear down
+        :param kill_signal: Signal sent to processes of namespace
+        :return: Shell script
+        """
+        if namespaces is None:
+            names = "$(ip netns list | awk '{print $1}')"
+        else:
+            names = " ".join(shlex.quote(namespace) for namespace in namespaces)
+        lines = [f"for ns in {names}; do"]
+        if pattern is not None:
+            lines.append(f'  case "$ns" in {pattern}) ;; *) continue ;; esac')
+        lines.extend(
+            [
+                '  pids=$(ip netns pids "$ns" 2>/dev/null | tr "\\n" " ")',
+                '  if [ -n "$pids" ]; then',
+                f"    kill -{kill_signal} $pids 2>/dev/null",
+                f'    echo "{TEARDOWN_MARKER} killed $ns $pids"',
+                "  fi",
+                f'  for dev in $(ip netns exec "$ns" sh -c {shlex.quote(PHYSICAL_INTERFACES_SCRIPT)} 2>/dev/null); do',
+                f'    ip -n "$ns" link set dev "$dev" netns 1 && echo "{TEARDOWN_MARKER} moved $ns $dev"',
+                "  done",
+                '  if err=$(ip netns delete "$ns" 2>&1); then',
+                f'    echo "{TEARDOWN_MARKER} deleted $ns"',
+                "  else",
+                f'    echo "{TEARDOWN_MARKER} failed $ns $(echo "$err" | tr "\\n" " ")"',
+                "  fi",
+                "done",
+            ]
+        )
+        return "\n".join(lines)
+
+    def delete_all_namespaces(
+        self, namespaces: Iterable[str] | None = None, pattern: str | None = None, kill_signal: str = "KILL"
+    ) -> NamespaceTeardownResult:
+        """
+        Delete network namespaces in one remote call.
+
+        Processes of each namespace are killed and physical interfaces (PFs/VFs) are moved back to root namespace
+        before deletion, so they are not stranded in namespace kept alive by remaining references.
+
+        :param namespaces: Names of namespaces to delete, all namespaces of host when not given
+        :param pattern: Shell pattern (e.g. 'test_ns*') filtering namespaces to delete
+        :param kill_signal: Signal sent to processes of namespace
+        :return: NamespaceTeardownResult with deleted namespaces, killed PIDs, moved interfaces and failures
+        """
+        script = self._get_teardown_script(namespaces, pattern, kill_signal)
+        output = self._connection.execute_command(
+            script, shell=True, expected_return_codes=None, stderr_to_stdout=True
+        ).stdout
+
+        result = NamespaceTeardownResult()
+        for match in TEARDOWN_LINE_REGEX.finditer(output):
+            namespace, value = match["namespace"], (match["value"] or "").strip()
+            if match["event"] == "killed":
+                result.killed_pids[namespace] = [int(pid) for pid in value.split()]
+            elif match["event"] == "moved":
+                result.moved_interfaces.setdefault(namespace, []).append(value)
+            elif match["event"] == "deleted":
+                result.deleted.append(namespace)
+            else:
+                result.failures[namespace] = value
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Deleted {len(result.deleted)} namespaces, killed {sum(map(len, result.killed_pids.values()))} "
+            f"processes, moved interfaces back to root namespace: {result.moved_interfaces}, "
+            f"failures: {result.failures}",
+        )
+        return result
 
     def rename_interface(self, current_name: str, new_name: str, namespace: str | None = None) -> None:
         """
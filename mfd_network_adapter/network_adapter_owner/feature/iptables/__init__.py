@@ -2,12 +2,32 @@
 # SPDX-License-Identifier: MIT
 """Module for IPTables feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseIPTablesFeature
-from .esxi import ESXiIPTables
-from .freebsd import FreeBSDIPTables
-from .linux import LinuxIPTables
-from .windows import WindowsIPTables
+from .data_structures import IPTablesBackend, IPTablesCounter, IPTablesRule, IPTablesRuleRate, IPTablesRuleSet
+
+if TYPE_CHECKING:
+    from .esxi import ESXiIPTables
+    from .freebsd import FreeBSDIPTables
+    from .linux import LinuxIPTables
+    from .windows import WindowsIPTables
+
+    IPTablesFeatureType = Union[BaseIPTablesFeature, ESXiIPTables, FreeBSDIPTables, LinuxIPTables, WindowsIPTables]
 
-IPTablesFeatureType = Union[BaseIPTablesFeature, ESXiIPTables, FreeBSDIPTables, LinuxIPTables, WindowsIPTables]
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiIPTables": ".esxi", "FreeBSDIPTables": ".freebsd", "LinuxIPTables": ".linux", "WindowsIPTables": ".windows"},
+    {
+        "IPTablesFeatureType": (
+            "BaseIPTablesFeature",
+            "ESXiIPTables",
+            "FreeBSDIPTables",
+            "LinuxIPTables",
+            "WindowsIPTables",
+        )
+    },
+)
@@ -0,0 +1,257 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for IPTables feature data structures."""
+
+import shlex
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Iterable
+
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
+from ...exceptions import IPTablesFeatureException
+
+if TYPE_CHECKING:
+    from ipaddress import IPv4Address, IPv6Address
+
+FORBIDDEN_COMMENT_CHARACTERS = {'"', "'", "\n", "\\"}
+
+
+class IPTablesBackend(Enum):
+    """Backend of iptables tools, programs of backend are named with its prefix, e.g. iptables-nft-restore."""
+
+    DEFAULT = "iptables"
+    LEGACY = "iptables-legacy"
+    NFT = "iptables-nft"
+
+    def get_program(self, name: str = "", ip_ver: IPVersion = IPVersion.V4) -> str:
+        """
+        Get name of program of backend.
+
+        :param name: Suffix of program, e.g. restore or save, main program if not given
+        :param ip_ver: IPVersion field, ip6tables programs are used for IPv6
+        :return: Name of program, e.g. ip6tables-nft-save
+        """
+        program = self.value if ip_ver is IPVersion.V4 else self.value.replace("iptables", "ip6tables", 1)
+        return f"{program}-{name}" if name else program
+
+
+@dataclass
+class IPTablesRule:
+    """Rule of iptables chain."""
+
+    table: str
+    chain: str
+    specification: str
+    comment: str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate comment, it is quoted in restore input."""
+        if self.comment is not None and (
+            not self.comment or FORBIDDEN_COMMENT_CHARACTERS.intersection(self.comment) or len(self.comment) > 256
+        ):
+            raise IPTablesFeatureException(f"Invalid comment of iptables rule: {self.comment!r}")
+
+    def to_restore_line(self, action: str = "-A") -> str:
+        """
+        Get line of rule in iptables-restore input.
+
+        :param action: Action of rule, -A to append or -D to delete
+        :return: Line of rule, e.g. -A POSTROUTING -s 1.1.1.1 -j SNAT --to-source 2.2.2.2
+        """
+        line = f"{action} {self.chain} {self.specification}"
+        if self.comment is not None:
+            line += f' -m comment --comment "{self.comment}"'
+        return line
+
+
+@dataclass
+class IPTablesRuleSet:
+    """
+    Set of iptables rules built locally and applied in single iptables-restore call.
+
+    Rules are appended to chains in order of adding, custom chains are created before rules.
+    """
+
+    ip_ver: IPVersion = IPVersion.V4
+    rules: list[IPTablesRule] = field(default_factory=list)
+    chains: list[tuple[str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Get number of rules."""
+        return len(self.rules)
+
+    def add_chain(self, table: str, chain: str) -> None:
+        """
+        Add custom chain, created when rule set is applied.
+
+        :param table: Name of table, e.g. filter
+        :param chain: Name of chain
+        """
+        if (table, chain) not in self.chains:
+            self.chains.append((table, chain))
+
+    def add_rule(self, table: str, chain: str, specification: str, comment: str | None = None) -> IPTablesRule:
+        """
+        Add rule appended to chain.
+
+        :param table: Name of table, e.g. nat or filter
+        :param chain: Name of chain, e.g. POSTROUTING
+        :param specification: Rule specification, e.g. -s 1.1.1.1 -j ACCEPT
+        :param comment: Comment of rule, used e.g. to delete rules of test by comment
+        :return: Added rule
+        """
+        rule = IPTablesRule(table=table, chain=chain, specification=specification, comment=comment)
+        self.rules.append(rule)
+        return rule
+
+    def add_snat_rule(
+        self,
+        source_interface_ip: "IPv4Address | IPv6Address",
+        destination_ip: "IPv4Address | IPv6Address",
+        new_source_ip: "IPv4Address | IPv6Address",
+        comment: str | None = None,
+    ) -> IPTablesRule:
+        """
+        Add rule changing source IP address of packets going from source_interface_ip to destination_ip.
+
+        :param source_interface_ip: the IP of the interface that we want to change the source IP for
+        :param destination_ip: the IP address that the packets from source_interface_ip are intended to reach
+        :param new_source_ip: the new source IP that packets will appear to come from after the rule is applied
+        :param comment: Comment of rule
+        :return: Added rule
+        """
+        return self.add_rule(
+            "nat",
+            "POSTROUTING",
+            f"-s {source_interface_ip} -d {destination_ip} -j SNAT --to-source {new_source_ip}",
+            comment,
+        )
+
+    def add_dnat_rule(
+        self,
+        original_destination_ip: "IPv4Address | IPv6Address",
+        new_destination_ip: "IPv4Address | IPv6Address",
+        comment: str | None = None,
+    ) -> IPTablesRule:
+        """
+        Add rule changing destination IP address of packets originally intended for original_destination_ip.
+
+        :param original_destination_ip: the original destination IP that the incoming packets are intended for
+        :param new_destination_ip: the new destination IP that the packets will be redirected to
+        :param comment: Comment of rule
+        :return: Added rule
+        """
+        return self.add_rule(
+            "nat", "PREROUTING", f"-d {original_destination_ip} -j DNAT --to-destination {new_destination_ip}", comment
+        )
+
+    def get_restore_lines(self) -> list[tuple[str, IPTablesRule | None]]:
+        """
+        Get lines of iptables-restore input, grouped by table.
+
+        :return: List of lines with rule of line, None for table, chain and commit lines
+        """
+        tables = dict.fromkeys([rule.table for rule in self.rules] + [table for table, _ in self.chains])
+        lines = []
+        for table in tables:
+            lines.append((f"*{table}", None))
+            lines.extend((f":{chain} - [0:0]", None) for chain_table, chain in self.chains if chain_table == table)
+            lines.extend((rule.to_restore_line(), rule) for rule in self.rules if rule.table == table)
+            lines.append(("COMMIT", None))
+        return lines
+
+    def to_restore_input(self) -> str:
+        """
+        Get input of iptables-restore.
+
+        :return: Rule set in iptables-restore format
+        """
+        return "\n".join(line for line, _ in self.get_restore_lines()) + "\n"
+
+
+@dataclass
+class IPTablesCounter:
+    """Packet and byte counters of iptables rule."""
+
+    table: str
+    chain: str
+    rule: str
+    packets: int
+    bytes: int
+    comment: str | None = None
+
+
+@dataclass
+class IPTablesRuleRate:
+    """Packet and byte rates of iptables rule between two samples of counters."""
+
+    table: str
+    chain: str
+    rule: str
+    packets_per_second: float
+    bytes_per_second: float
+    comment: str | None = None
+
+
+def get_rule_comment(specification: str) -> str | None:
+    """
+    Get comment of rule in iptables-save output.
+
+    :param specification: Rule specification, e.g. -s 1.1.1.1/32 -m comment --comment "test 1" -j ACCEPT
+    :return: Comment of rule, None if rule has no comment
+    """
+    try:
+        tokens = shlex.split(specification)
+    except ValueError:
+        return None
+    for token, value in zip(tokens, tokens[1:]):
+        if token == "--comment":
+            return value
+    return None
+
+
+def calculate_rule_rates(
+    before: Iterable[IPTablesCounter], after: Iterable[IPTablesCounter], elapsed: float
+) -> list[IPTablesRuleRate]:
+    """
+    Calculate per rule rates from two samples of counters.
+
+    Rules are matched by table, chain, specification and position among identical rules, rules present only in
+    one sample are skipped. Counters lower than in previous sample (e.g. rule reapplied) are counted from zero.
+
+    :param before: Counters of first sample
+    :param after: Counters of second sample
+    :param elapsed: Time between samples in seconds
+    :return: List of rates in order of second sample
+    """
+    if elapsed <= 0:
+        raise IPTablesFeatureException(f"Time between samples of counters must be positive, got {elapsed}")
+
+    def index(counters: Iterable[IPTablesCounter]) -> dict[tuple[str, str, str, int], IPTablesCounter]:
+        indexed = {}
+        occurrences = Counter()
+        for counter in counters:
+            key = (counter.table, counter.chain, counter.rule)
+            indexed[(*key, occurrences[key])] = counter
+            occurrences[key] += 1
+        return indexed
+
+    previous = index(before)
+    rates = []
+    for key, counter in index(after).items():
+        if key not in previous:
+            continue
+        packets = counter.packets - previous[key].packets
+        octets = counter.bytes - previous[key].bytes
+        rates.append(
+            IPTablesRuleRate(
+                table=counter.table,
+                chain=counter.chain,
+                rule=counter.rule,
+                packets_per_second=(packets if packets >= 0 else counter.packets) / elapsed,
+                bytes_per_second=(octets if octets >= 0 else counter.bytes) / elapsed,
+                comment=counter.comment,
+            )
+        )
+    return rates
@@ -3,11 +3,25 @@
 """Module for IPTables feature for Linux systems."""
 
 import logging
+import re
+import time
 from typing import TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
+from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 from .base import BaseIPTablesFeature
+from .data_structures import (
+    IPTablesBackend,
+    IPTablesCounter,
+    IPTablesRule,
+    IPTablesRuleRate,
+    IPTablesRuleSet,
+    calculate_rule_rates,
+    get_rule_comment,
+)
+from ...exceptions import IPTablesFeatureException
 
 if TYPE_CHECKING:
     from ipaddress import IPv4Address
@@ -15,6 +29,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+RESTORE_INPUT_DELIMITER = "MFD_IPTABLES_RULES"
+SAVE_RULE_REGEX = re.compile(r"^(?:\[(?P<packets>\d+):(?P<bytes>\d+)\]\s+)?-A\s+(?P<chain>\S+)\s*(?P<rule>.*)$")
+RESTORE_FAILED_LINE_REGEX = re.compile(r"line:?\s*(?P<line>\d+)", re.IGNORECASE)
+
 
 class LinuxIPTables(BaseIPTablesFeature):
     """Linux class for IPTables feature."""
@@ -50,3 +68,198 @@ class LinuxIPTables(BaseIPTablesFeature):
             f"iptables -t nat -A PREROUTING -d {original_destination_ip} -j DNAT --to-destination {new_destination_ip}"
         )
         self._connection.execute_command(cmd)
+
+    def _get_restore_command(self, restore_input: str, ip_ver: IPVersion, backend: IPTablesBackend) -> str:
+        """
+        Get command applying input with iptables-restore, input is passed by here-document in single call.
+
+        :param restore_input: Input in iptables-restore format
+        :param ip_ver: IPVersion field
+        :param backend: Backend of iptables tools
+        :return: Command
+        """
+        return (
+            f"{backend.get_program('restore', ip_ver)} --noflush <<'{RESTORE_INPUT_DELIMITER}'\n"
+            f"{restore_input}{RESTORE_INPUT_DELIMITER}"
+        )
+
+    def apply_rule_set(
+        self,
+        rule_set: IPTablesRuleSet,
+        backend: IPTablesBackend = IPTablesBackend.DEFAULT,
+        namespace: str | None = None,
+    ) -> None:
+        """
+        Apply rule set atomically with single iptables-restore --noflush call.
+
+        Existing rules are kept, rules of set are appended to their chains. Tables are committed by restore
+        all at once, so when any rule is invalid, none of rules is applied.
+        With IPTablesBackend.NFT rule set is applied as single nftables transaction.
+
+        :param rule_set: Rule set to apply
+        :param backend: Backend of iptables tools
+        :param namespace: Name of network namespace
+        :raises IPTablesFeatureException: When rule set was not applied
+        """
+        if not rule_set.rules and not rule_set.chains:
+            return
+        lines = rule_set.get_restore_lines()
+        restore_input = "\n".join(line for line, _ in lines) + "\n"
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Applying {len(rule_set)} iptables rules with {backend.get_program('restore', rule_set.ip_ver)}",
+        )
+        result = self._connection.execute_command(
+            add_namespace_call_command(
+                self._get_restore_command(restore_input, rule_set.ip_ver, backend), namespace=namespace
+            ),
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+        if result.return_code:
+            failed_rule = None
+            match = RESTORE_FAILED_LINE_REGEX.search(result.stdout)
+            if match and 0 < int(match.group("line")) <= len(lines):
+                failed_rule = lines[int(match.group("line")) - 1][1]
+            reason = f", failed rule: {failed_rule.to_restore_line()}" if failed_rule is not None else ""
+            raise IPTablesFeatureException(f"Rule set was not applied{reason}\n{result.stdout}")
+
+    def _save(
+        self, table: str | None, ip_ver: IPVersion, backend: IPTablesBackend, namespace: str | None, counters: bool
+    ) -> str:
+        """
+        Get output of iptables-save.
+
+        :param table: Name of table, all tables if not given
+        :param ip_ver: IPVersion field
+        :param backend: Backend of iptables tools
+        :param namespace: Name of network namespace
+        :param counters: Whether to include counters of rules
+        :return: Output of iptables-save
+        """
+        cmd = backend.get_program("save", ip_ver)
+        if counters:
+            cmd += " -c"
+        if table is not None:
+            cmd += f" -t {table}"
+        return self._connection.execute_command(add_namespace_call_command(cmd, namespace=namespace)).stdout
+
+    @staticmethod
+    def _parse_save_output(output: str) -> list[IPTablesCounter]:
+        """
+        Parse rules of iptables-save output.
+
+        :param output: Output of iptables-save, with or without counters
+        :return: List of rules with counters, zero when not present in output
+        """
+        counters = []
+        table = None
+        for line in output.splitlines():
+            line = line.strip()
+            if line.startswith("*"):
+                table = line[1:]
+                continue
+            match = SAVE_RULE_REGEX.match(line)
+            if match is None or table is None:
+                continue
+            counters.append(
+                IPTablesCounter(
+                    table=table,
+                    chain=match.group("chain"),
+                    rule=match.group("rule"),
+                    packets=int(match.group("packets") or 0),
+                    bytes=int(match.group("bytes") or 0),
+                    comment=get_rule_comment(match.group("rule")),
+                )
+            )
+        return counters
+
+    def get_rule_counters(
+        self,
+        table: str | None = None,
+        ip_ver: IPVersion = IPVersion.V4,
+        backend: IPTablesBackend = IPTablesBackend.DEFAULT,
+        namespace: str | None = None,
+    ) -> list[IPTablesCounter]:
+        """
+        Get packet and byte counters of all rules in single iptables-save -c call.
+
+        :param table: Name of table, all tables if not given
+        :param ip_ver: IPVersion field
+        :param backend: Backend of iptables tools
+        :param namespace: Name of network namespace
+        :return: List of counters in order of rules
+        """
+        return self._parse_save_output(self._save(table, ip_ver, backend, namespace, counters=True))
+
+    def get_rule_rates(
+        self,
+        interval: float,
+        table: str | None = None,
+        ip_ver: IPVersion = IPVersion.V4,
+        backend: IPTablesBackend = IPTablesBackend.DEFAULT,
+        namespace: str | None = None,
+    ) -> list[IPTablesRuleRate]:
+        """
+        Get packet and byte rates of rules, e.g. during traffic, from two samples of counters.
+
+        Rates are calculated with time measured between samples, not with interval.
+
+        :param interval: Time between samples in seconds
+        :param table: Name of table, all tables if not given
+        :param ip_ver: IPVersion field
+        :param backend: Backend of iptables tools
+        :param namespace: Name of network namespace
+        :return: List of rates of rules present in both samples
+        """
+        start = time.monotonic()
+        before = self.get_rule_counters(table, ip_ver, backend, namespace)
+        time.sleep(interval)
+        after = self.get_rule_counters(table, ip_ver, backend, namespace)
+        return calculate_rule_rates(before, after, time.monotonic() - start)
+
+    def delete_rules_by_comment(
+        self,
+        comment: str,
+        table: str | None = None,
+        ip_ver: IPVersion = IPVersion.V4,
+        backend: IPTablesBackend = IPTablesBackend.DEFAULT,
+        namespace: str | None = None,
+    ) -> int:
+        """
+        Delete all rules with comment, e.g. to clean up rules of test, with one iptables-save and restore call.
+
+        :param comment: Comment of rules
+        :param table: Name of table, all tables if not given
+        :param ip_ver: IPVersion field
+        :param backend: Backend of iptables tools
+        :param namespace: Name of network namespace
+        :return: Number of deleted rules
+        :raises IPTablesFeatureException: When rules were not deleted
+        """
+        rules = [
+            IPTablesRule(table=counter.table, chain=counter.chain, specification=counter.rule)
+            for counter in self._parse_save_output(self._save(table, ip_ver, backend, namespace, counters=False))
+            if counter.comment == comment
+        ]
+        if not rules:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"No iptables rules with comment {comment} found")
+            return 0
+        lines = []
+        for rule_table in dict.fromkeys(rule.table for rule in rules):
+            lines.append(f"*{rule_table}")
+            lines.extend(rule.to_restore_line("-D") for rule in rules if rule.table == rule_table)
+            lines.append("COMMIT")
+        result = self._connection.execute_command(
+            add_namespace_call_command(
+                self._get_restore_command("\n".join(lines) + "\n", ip_ver, backend), namespace=namespace
+            ),
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+        if result.return_code:
+            raise IPTablesFeatureException(f"Rules with comment {comment} were not deleted\n{result.stdout}")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Deleted {len(rules)} iptables rules with comment {comment}")
+        return len(rules)
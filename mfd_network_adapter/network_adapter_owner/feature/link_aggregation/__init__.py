@@ -2,16 +2,42 @@
 # SPDX-License-Identifier: MIT
 """Module for NICTeam feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureLinkAggregation
-from .esxi import EsxiLinkAggregation
-from .freebsd import FreeBsdLinkAggregation
-from .linux import LinuxLinkAggregation
-from .windows import WindowsLinkAggregation
 
-LinkAggregationFeatureType = (
-    BaseFeatureLinkAggregation
-    | EsxiLinkAggregation
-    | FreeBsdLinkAggregation
-    | LinuxLinkAggregation
-    | WindowsLinkAggregation
+if TYPE_CHECKING:
+    from .esxi import EsxiLinkAggregation
+    from .freebsd import FreeBsdLinkAggregation
+    from .linux import LinuxLinkAggregation
+    from .windows import WindowsLinkAggregation
+
+    LinkAggregationFeatureType = (
+        BaseFeatureLinkAggregation
+        | EsxiLinkAggregation
+        | FreeBsdLinkAggregation
+        | LinuxLinkAggregation
+        | WindowsLinkAggregation
+    )
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "EsxiLinkAggregation": ".esxi",
+        "FreeBsdLinkAggregation": ".freebsd",
+        "LinuxLinkAggregation": ".linux",
+        "WindowsLinkAggregation": ".windows",
+    },
+    {
+        "LinkAggregationFeatureType": (
+            "BaseFeatureLinkAggregation",
+            "EsxiLinkAggregation",
+            "FreeBsdLinkAggregation",
+            "LinuxLinkAggregation",
+            "WindowsLinkAggregation",
+        )
+    },
 )
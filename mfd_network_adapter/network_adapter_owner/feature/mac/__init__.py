@@ -2,10 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for MAC Feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureMAC
-from .freebsd import FreeBSDMAC
-from .linux import LinuxMAC
-from .windows import WindowsMAC
 
+if TYPE_CHECKING:
+    from .freebsd import FreeBSDMAC
+    from .linux import LinuxMAC
+    from .windows import WindowsMAC
+
+    MACFeatureType = BaseFeatureMAC | FreeBSDMAC | LinuxMAC | WindowsMAC
 
-MACFeatureType = BaseFeatureMAC | FreeBSDMAC | LinuxMAC | WindowsMAC
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBSDMAC": ".freebsd", "LinuxMAC": ".linux", "WindowsMAC": ".windows"},
+    {"MACFeatureType": ("BaseFeatureMAC", "FreeBSDMAC", "LinuxMAC", "WindowsMAC")},
+)
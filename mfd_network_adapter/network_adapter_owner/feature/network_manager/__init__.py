@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for NM feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseNMFeature
-from .esxi import ESXiNM
-from .freebsd import FreeBSDNM
-from .linux import LinuxNM
-from .windows import WindowsNM
 
-NMFeatureType = Union[BaseNMFeature, ESXiNM, FreeBSDNM, LinuxNM, WindowsNM]
+if TYPE_CHECKING:
+    from .esxi import ESXiNM
+    from .freebsd import FreeBSDNM
+    from .linux import LinuxNM
+    from .windows import WindowsNM
+
+    NMFeatureType = Union[BaseNMFeature, ESXiNM, FreeBSDNM, LinuxNM, WindowsNM]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiNM": ".esxi", "FreeBSDNM": ".freebsd", "LinuxNM": ".linux", "WindowsNM": ".windows"},
+    {"NMFeatureType": ("BaseNMFeature", "ESXiNM", "FreeBSDNM", "LinuxNM", "WindowsNM")},
+)
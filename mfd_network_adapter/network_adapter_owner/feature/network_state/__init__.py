@@ -0,0 +1,21 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Network State feature."""
+
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
+from .base import BaseNetworkStateFeature
+
+if TYPE_CHECKING:
+    from .linux import LinuxNetworkState
+
+    NetworkStateFeatureType = BaseNetworkStateFeature | LinuxNetworkState
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"LinuxNetworkState": ".linux"},
+    {"NetworkStateFeatureType": ("BaseNetworkStateFeature", "LinuxNetworkState")},
+)
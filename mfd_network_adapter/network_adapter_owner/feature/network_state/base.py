@@ -0,0 +1,11 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Network State feature."""
+
+from abc import ABC
+
+from ..base import BaseFeature
+
+
+class BaseNetworkStateFeature(BaseFeature, ABC):
+    """Base class for Network State feature."""
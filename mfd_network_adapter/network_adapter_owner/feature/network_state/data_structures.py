@@ -0,0 +1,92 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Network State feature data structures."""
+
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+SNAPSHOT_SECTIONS = ("namespaces", "links", "addresses", "routes", "neighbors")
+
+
+@dataclass
+class SectionDiff:
+    """Difference of single section of network state, entries are keyed the same way as in snapshot."""
+
+    added: dict[str, dict[str, Any]] = field(default_factory=dict)
+    removed: dict[str, dict[str, Any]] = field(default_factory=dict)
+    changed: dict[str, tuple[dict[str, Any], dict[str, Any]]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass
+class NetworkStateDiff:
+    """Structured difference between two network state snapshots."""
+
+    namespaces: SectionDiff = field(default_factory=SectionDiff)
+    links: SectionDiff = field(default_factory=SectionDiff)
+    addresses: SectionDiff = field(default_factory=SectionDiff)
+    routes: SectionDiff = field(default_factory=SectionDiff)
+    neighbors: SectionDiff = field(default_factory=SectionDiff)
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, section.name) for section in fields(self))
+
+
+@dataclass
+class NetworkStateSnapshot:
+    """
+    Network state of the host (or network namespace).
+
+    Each section maps unique key of entry to its normalized attributes:
+    - namespaces: namespace name
+    - links: interface name, VLANs, bonds, tunnels and VFs (num_vfs of PF) are covered by link details
+    - addresses: '<interface> <ip>/<prefix>'
+    - routes: '<table> <destination> via <gateway> dev <interface>', kernel generated routes are skipped
+    - neighbors: '<interface> <ip>', only permanent entries
+    """
+
+    namespace: str | None = None
+    namespaces: dict[str, dict[str, Any]] = field(default_factory=dict)
+    links: dict[str, dict[str, Any]] = field(default_factory=dict)
+    addresses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    routes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    neighbors: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def _links_of_kind(self, kind: str | tuple[str, ...]) -> dict[str, dict[str, Any]]:
+        kinds = (kind,) if isinstance(kind, str) else kind
+        return {name: link for name, link in self.links.items() if link.get("kind") in kinds}
+
+    @property
+    def vlans(self) -> dict[str, dict[str, Any]]:
+        """VLAN links."""
+        return self._links_of_kind("vlan")
+
+    @property
+    def bonds(self) -> dict[str, dict[str, Any]]:
+        """Bonding links."""
+        return self._links_of_kind("bond")
+
+    @property
+    def tunnels(self) -> dict[str, dict[str, Any]]:
+        """Tunnel links."""
+        return self._links_of_kind(("vxlan", "geneve", "gre", "gretap", "ip6gre", "ip6gretap", "ipip", "sit"))
+
+    def diff(self, other: "NetworkStateSnapshot") -> NetworkStateDiff:
+        """
+        Compare snapshot with other (later) snapshot.
+
+        :param other: Snapshot to compare with
+        :return: Difference, 'added' entries are present only in other snapshot
+        """
+        result = NetworkStateDiff()
+        for section in SNAPSHOT_SECTIONS:
+            before, after = getattr(self, section), getattr(other, section)
+            section_diff = getattr(result, section)
+            section_diff.added = {key: value for key, value in after.items() if key not in before}
+            section_diff.removed = {key: value for key, value in before.items() if key not in after}
+            section_diff.changed = {
+                key: (value, after[key]) for key, value in before.items() if key in after and after[key] != value
+            }
+        return result
@@ -0,0 +1,327 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Network State feature for Linux systems."""
+
+import json
+import logging
+from typing import Any
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .base import BaseNetworkStateFeature
+from .data_structures import NetworkStateSnapshot, NetworkStateDiff
+from ...batch import BatchConnection
+from ....iproute2 import is_json_supported
+from ...exceptions import NetworkStateFeatureException
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+SECTION_MARKER = "### "
+
+
+class LinuxNetworkState(BaseNetworkStateFeature):
+    """Linux class for Network State feature."""
+
+    @staticmethod
+    def _get_collect_commands(namespace: str | None) -> dict[str, str]:
+        """
+        Get commands collecting all sections of network state.
+
+        :param namespace: Name of network namespace
+        :return: Dictionary {section: command}
+        """
+        ip = f"ip -n {namespace}" if namespace else "ip"
+        return {
+            "namespaces": "ip -j netns list",
+            "links": f"{ip} -d -j link show",
+            "addresses": f"{ip} -j addr show",
+            "routes4": f"{ip} -j -4 route show table all",
+            "routes6": f"{ip} -j -6 route show table all",
+            "neighbors": f"{ip} -j neigh show nud permanent",
+        }
+
+    @staticmethod
+    def _split_sections(output: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Split output of collect script into sections and load JSON of each.
+
+        :param output: Output of collect script
+        :return: Dictionary {section: loaded JSON}
+        :raises NetworkStateFeatureException: When output of section is not valid JSON
+        """
+        sections: dict[str, list[str]] = {}
+        current = None
+        for line in output.splitlines():
+            if line.startswith(SECTION_MARKER):
+                current = line.removeprefix(SECTION_MARKER).strip()
+                sections[current] = []
+            elif current is not None:
+                sections[current].append(line)
+
+        loaded = {}
+        for name, lines in sections.items():
+            content = "".join(lines).strip()
+            try:
+                loaded[name] = json.loads(content) if content else []
+            except json.JSONDecodeError as e:
+                raise NetworkStateFeatureException(f"Invalid JSON output of {name} section: {content}") from e
+        return loaded
+
+    @staticmethod
+    def _parse_links(links: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """
+        Normalize `ip -d -j link show` entries.
+
+        :param links: Loaded JSON
+        :return: Dictionary {interface name: attributes}
+        """
+        parsed = {}
+        for link in links:
+            link_info = link.get("linkinfo", {})
+            kind = link_info.get("info_kind")
+            info_data = link_info.get("info_data", {}) if kind == "vlan" else {}
+            parsed[link["ifname"]] = {
+                "kind": kind,
+                "parent": link.get("link"),
+                "master": link.get("master"),
+                "mtu": link.get("mtu"),
+                "up": "UP" in link.get("flags", []),
+                "mac": link.get("address"),
+                "vlan_id": info_data.get("id"),
+                "vlan_protocol": info_data.get("protocol"),
+                "num_vfs": len(link.get("vfinfo_list", [])),
+            }
+        return parsed
+
+    @staticmethod
+    def _parse_addresses(links: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """
+        Normalize `ip -j addr show` entries, IPv6 link-local addresses generated by kernel are skipped.
+
+        :param links: Loaded JSON
+        :return: Dictionary {'<interface> <ip>/<prefix>': attributes}
+        """
+        parsed = {}
+        for link in links:
+            for address in link.get("addr_info", []):
+                if "local" not in address or (address.get("family") == "inet6" and address.get("scope") == "link"):
+                    continue
+                ip = f"{address['local']}/{address['prefixlen']}"
+                parsed[f"{link['ifname']} {ip}"] = {"interface": link["ifname"], "ip": ip}
+        return parsed
+
+    @staticmethod
+    def _parse_routes(routes: list[dict[str, Any]], family: str) -> dict[str, dict[str, Any]]:
+        """
+        Normalize `ip -j route show table all` entries, kernel generated and local table routes are skipped.
+
+        :param routes: Loaded JSON
+        :param family: Address family of routes - 'inet' or 'inet6'
+        :return: Dictionary {'<table> <destination> via <gateway> dev <interface>': attributes}
+        """
+        parsed = {}
+        for route in routes:
+            table = route.get("table", "main")
+            if route.get("protocol") == "kernel" or table == "local" or route.get("type", "unicast") != "unicast":
+                continue
+            destination = route["dst"]
+            if destination == "default" and family == "inet6":
+                destination = "::/0"
+            entry = {
+                "destination": destination,
+                "gateway": route.get("gateway"),
+                "interface": route.get("dev"),
+                "table": table,
+                "metric": route.get("metric"),
+            }
+            parsed[f"{table} {destination} via {entry['gateway']} dev {entry['interface']}"] = entry
+        return parsed
+
+    @staticmethod
+    def _parse_neighbors(neighbors: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """
+        Normalize `ip -j neigh show` entries.
+
+        :param neighbors: Loaded JSON
+        :return: Dictionary {'<interface> <ip>': attributes}
+        """
+        return {
+            f"{neighbor['dev']} {neighbor['dst']}": {
+                "interface": neighbor["dev"],
+                "ip": neighbor["dst"],
+                "mac": neighbor.get("lladdr"),
+            }
+            for neighbor in neighbors
+        }
+
+    def snapshot(self, namespace: str | None = None) -> NetworkStateSnapshot:
+        """
+        Capture network state of the host in one remote call.
+
+        Links (with VLANs, bonds, tunnels and VFs), addresses, routes, permanent neighbors and namespaces are collected.
+
+        :param namespace: Name of network namespace
+        :return: NetworkStateSnapshot object
+        :raises NetworkStateFeatureException: When iproute2 on the host doesn't support JSON output
+        """
+        if not is_json_supported(self._connection):
+            raise NetworkStateFeatureException(
+                "Network state requires JSON output of iproute2 (ip -j), not supported by iproute2 on the host."
+            )
+        script = "; ".join(
+            f"echo '{SECTION_MARKER}{section}'; {command} 2>/dev/null"
+            for section, command in self._get_collect_commands(namespace).items()
+        )
+        output = self._connection.execute_command(script, shell=True, expected_return_codes=None).stdout
+        sections = self._split_sections(output)
+
+        routes = self._parse_routes(sections.get("routes4", []), "inet")
+        routes.update(self._parse_routes(sections.get("routes6", []), "inet6"))
+        return NetworkStateSnapshot(
+            namespace=namespace,
+            namespaces={entry["name"]: {} for entry in sections.get("namespaces", [])},
+            links=self._parse_links(sections.get("links", [])),
+            addresses=self._parse_addresses(sections.get("addresses", [])),
+            routes=routes,
+            neighbors=self._parse_neighbors(sections.get("neighbors", [])),
+        )
+
+    @staticmethod
+    def _route_spec(route: dict[str, Any]) -> str:
+        """
+        Get route specification used in `ip route` commands.
+
+        :param route: Route attributes
+        :return: Route specification
+        """
+        spec = route["destination"]
+        if route["gateway"]:
+            spec += f" via {route['gateway']}"
+        if route["interface"]:
+            spec += f" dev {route['interface']}"
+        if route["metric"] is not None:
+            spec += f" metric {route['metric']}"
+        return f"{spec} table {route['table']}"
+
+    @staticmethod
+    def _get_link_settings_commands(name: str, expected: dict[str, Any], current: dict[str, Any] | None) -> list[str]:
+        """
+        Get commands applying expected link settings, which differ from current ones.
+
+        :param name: Interface name
+        :param expected: Expected link attributes
+        :param current: Current link attributes, None if link is just created
+        :return: List of `ip -batch` commands
+        """
+        current = current or {}
+        commands = []
+        if expected["master"] != current.get("master"):
+            master = f"master {expected['master']}" if expected["master"] else "nomaster"
+            commands.append(f"link set dev {name} {master}")
+        if expected["mtu"] != current.get("mtu"):
+            commands.append(f"link set dev {name} mtu {expected['mtu']}")
+        if expected["up"] != current.get("up"):
+            commands.append(f"link set dev {name} {'up' if expected['up'] else 'down'}")
+        return commands
+
+    def _get_restore_commands(self, diff: NetworkStateDiff) -> tuple[list[str], list[str]]:
+        """
+        Get minimal list of commands reverting the difference.
+
+        Entries of interfaces, which are going to be deleted, are skipped, kernel removes them together with interface.
+
+        :param diff: Difference between expected (before) and current (after) state
+        :return: Shell commands and `ip -batch` commands
+        """
+        shell_commands = []
+        batch = [f"netns delete {namespace}" for namespace in diff.namespaces.added]
+        batch.extend(f"netns add {namespace}" for namespace in diff.namespaces.removed)
+
+        deleted_links = set(diff.links.added)
+        batch.extend(
+            f"neigh del {neighbor['ip']} dev {neighbor['interface']}"
+            for neighbor in diff.neighbors.added.values()
+            if neighbor["interface"] not in deleted_links
+        )
+        batch.extend(
+            f"route del {self._route_spec(route)}"
+            for route in diff.routes.added.values()
+            if route["interface"] not in deleted_links
+        )
+        batch.extend(
+            f"addr del {address['ip']} dev {address['interface']}"
+            for address in diff.addresses.added.values()
+            if address["interface"] not in deleted_links
+        )
+        for name, link in diff.links.added.items():
+            if link["kind"] and link["parent"] not in deleted_links:
+                batch.append(f"link del {name}")
+
+        for name, (expected, current) in diff.links.changed.items():
+            if expected["num_vfs"] != current["num_vfs"]:
+                sriov_path = f"/sys/class/net/{name}/device/sriov_numvfs"
+                shell_commands.append(f"echo 0 > {sriov_path}")
+                if expected["num_vfs"]:
+                    shell_commands.append(f"echo {expected['num_vfs']} > {sriov_path}")
+
+        for name, link in diff.links.removed.items():
+            if link["kind"] != "vlan":
+                logger.warning(f"Interface {name} ({link['kind'] or 'physical'}) cannot be restored, skipping.")
+                continue
+            protocol = f" protocol {link['vlan_protocol']}" if link["vlan_protocol"] else ""
+            batch.append(f"link add link {link['parent']} name {name} type vlan{protocol} id {link['vlan_id']}")
+            batch.extend(self._get_link_settings_commands(name, link, None))
+
+        for name, (expected, current) in diff.links.changed.items():
+            batch.extend(self._get_link_settings_commands(name, expected, current))
+
+        batch.extend(
+            f"addr add {address['ip']} dev {address['interface']}" for address in diff.addresses.removed.values()
+        )
+        batch.extend(f"route add {self._route_spec(route)}" for route in diff.routes.removed.values())
+        batch.extend(
+            f"neigh add {neighbor['ip']} lladdr {neighbor['mac']} dev {neighbor['interface']} nud permanent"
+            for neighbor in diff.neighbors.removed.values()
+        )
+        return shell_commands, batch
+
+    def restore(self, snapshot: NetworkStateSnapshot) -> NetworkStateDiff:
+        """
+        Restore network state of the host to the snapshot.
+
+        Current state is collected and only differences are reverted, in one remote call.
+        Result of each command is verified separately, all failed commands are reported.
+        Removed interfaces other than VLANs cannot be recreated and are reported in log.
+
+        :param snapshot: Snapshot to restore
+        :return: Reverted difference between snapshot and state before restore
+        :raises NetworkStateFeatureException: When any of restore commands failed
+        """
+        diff = snapshot.diff(self.snapshot(namespace=snapshot.namespace))
+        if not diff:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Network state already matches the snapshot.")
+            return diff
+
+        shell_commands, batch = self._get_restore_commands(diff)
+        connection = BatchConnection(self._connection)
+        for command in shell_commands:
+            connection.execute_command(command, shell=True)
+        ip = f"ip netns exec {snapshot.namespace} ip" if snapshot.namespace else "ip"
+        for command in batch:
+            connection.execute_command(f"{ip} {command}")
+
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Restoring network state with {len(batch)} ip commands.")
+        # each command (or ip -batch group) is followed by marker, so every failed one is reported, not only last
+        failed = [call for call in connection.execute(raise_on_error=False) if call.return_code != 0]
+        if failed:
+            details = "\n".join(
+                f"'{call.command}' "
+                + ("was not executed" if call.return_code is None else f"returned {call.return_code}: {call.output}")
+                for call in failed
+            )
+            raise NetworkStateFeatureException(
+                f"Restore of network state finished with errors, {len(failed)} of {len(connection.calls)} "
+                f"commands failed:\n{details}"
+            )
+        return diff
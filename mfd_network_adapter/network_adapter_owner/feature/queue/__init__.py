@@ -3,11 +3,22 @@
 # SPDX-License-Identifier: MIT
 """Module for Queue feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseQueueFeature
-from .freebsd import FreeBSDQueue
-from .linux import LinuxQueue
-from .windows import WindowsQueue
 
-QueueFeatureType = Union[BaseQueueFeature, FreeBSDQueue, LinuxQueue, WindowsQueue]
+if TYPE_CHECKING:
+    from .freebsd import FreeBSDQueue
+    from .linux import LinuxQueue
+    from .windows import WindowsQueue
+
+    QueueFeatureType = Union[BaseQueueFeature, FreeBSDQueue, LinuxQueue, WindowsQueue]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBSDQueue": ".freebsd", "LinuxQueue": ".linux", "WindowsQueue": ".windows"},
+    {"QueueFeatureType": ("BaseQueueFeature", "FreeBSDQueue", "LinuxQueue", "WindowsQueue")},
+)
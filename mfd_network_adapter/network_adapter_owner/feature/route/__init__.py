@@ -2,11 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Route feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseRouteFeature
-from .freebsd import FreeBSDRoute
-from .linux import LinuxRoute
-from .windows import WindowsRoute
+from .data_structures import RouteEntry, RouteNexthop, RouteTable
+
+if TYPE_CHECKING:
+    from .freebsd import FreeBSDRoute
+    from .linux import LinuxRoute
+    from .windows import WindowsRoute
+
+    RouteFeatureType = Union[BaseRouteFeature, FreeBSDRoute, LinuxRoute, WindowsRoute]
 
-RouteFeatureType = Union[BaseRouteFeature, FreeBSDRoute, LinuxRoute, WindowsRoute]
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBSDRoute": ".freebsd", "LinuxRoute": ".linux", "WindowsRoute": ".windows"},
+    {"RouteFeatureType": ("BaseRouteFeature", "FreeBSDRoute", "LinuxRoute", "WindowsRoute")},
+)
@@ -0,0 +1,133 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Route feature data structures."""
+
+from dataclasses import dataclass, field
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network, ip_address, ip_network
+from typing import Iterable, Iterator
+
+MAIN_TABLE = "main"
+
+
+@dataclass
+class RouteNexthop:
+    """Nexthop of multipath route."""
+
+    gateway: IPv4Address | IPv6Address | None = None
+    device: str | None = None
+    weight: int | None = None
+
+
+@dataclass
+class RouteEntry:
+    """Entry of routing table."""
+
+    destination: IPv4Network | IPv6Network
+    gateway: IPv4Address | IPv6Address | None = None
+    device: str | None = None
+    table: str = MAIN_TABLE
+    type: str = "unicast"
+    protocol: str | None = None
+    scope: str | None = None
+    source: IPv4Address | IPv6Address | None = None
+    metric: int | None = None
+    flags: list[str] = field(default_factory=list)
+    nexthops: list[RouteNexthop] = field(default_factory=list)
+
+
+class RouteTable:
+    """
+    Snapshot of routing tables, indexed by table and destination prefix.
+
+    Indexes are built once, when snapshot is created. Longest prefix match (lookup) checks only prefix lengths
+    present in the table, from the longest one, so it does not scan the entries.
+    """
+
+    def __init__(self, entries: Iterable[RouteEntry] = ()) -> None:
+        """
+        Initialize RouteTable.
+
+        :param entries: Entries of routing tables
+        """
+        self.entries: list[RouteEntry] = []
+        self._by_destination: dict[tuple[str, IPv4Network | IPv6Network], list[RouteEntry]] = {}
+        self._by_device: dict[str, list[RouteEntry]] = {}
+        prefix_lengths: dict[tuple[str, int], set[int]] = {}
+        for entry in entries:
+            self.entries.append(entry)
+            self._by_destination.setdefault((entry.table, entry.destination), []).append(entry)
+            prefix_lengths.setdefault((entry.table, entry.destination.version), set()).add(entry.destination.prefixlen)
+            for device in {entry.device, *(nexthop.device for nexthop in entry.nexthops)} - {None}:
+                self._by_device.setdefault(device, []).append(entry)
+        self._prefix_lengths = {key: sorted(lengths, reverse=True) for key, lengths in prefix_lengths.items()}
+
+    def __len__(self) -> int:
+        """Get number of entries."""
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[RouteEntry]:
+        """Iterate over entries."""
+        return iter(self.entries)
+
+    def __contains__(self, destination: IPv4Network | IPv6Network) -> bool:
+        """Check whether main table contains route to destination prefix."""
+        return (MAIN_TABLE, destination) in self._by_destination
+
+    @property
+    def tables(self) -> list[str]:
+        """Names of tables with entries."""
+        return list(dict.fromkeys(table for table, _ in self._by_destination))
+
+    def get(self, destination: IPv4Network | IPv6Network | str, table: str = MAIN_TABLE) -> list[RouteEntry]:
+        """
+        Get entries of destination prefix, e.g. routes with different metrics.
+
+        :param destination: Destination prefix
+        :param table: Name of table
+        :return: List of entries, empty if not found
+        """
+        return list(self._by_destination.get((table, ip_network(destination)), []))
+
+    def get_by_device(self, device: str) -> list[RouteEntry]:
+        """
+        Get entries of device, also multipath routes with nexthop on device.
+
+        :param device: Name of interface
+        :return: List of entries, empty if not found
+        """
+        return list(self._by_device.get(device, []))
+
+    def lookup(self, address: IPv4Address | IPv6Address | str, table: str = MAIN_TABLE) -> RouteEntry | None:
+        """
+        Find route to address by longest prefix match, route with the lowest metric is chosen among the same prefix.
+
+        :param address: Destination address
+        :param table: Name of table
+        :return: Matching entry, None if there is no route to address
+        """
+        address = ip_address(address)
+        for prefix_length in self._prefix_lengths.get((table, address.version), []):
+            entries = self._by_destination.get((table, ip_network(f"{address}/{prefix_length}", strict=False)))
+            if entries:
+                return min(entries, key=lambda entry: entry.metric or 0)
+        return None
+
+    def get_missing(self, routes: Iterable[RouteEntry]) -> list[RouteEntry]:
+        """
+        Get routes not present in snapshot, e.g. to verify programmed routes without querying each prefix.
+
+        Route is present, when table contains entry of its destination with the same gateway and device (if given).
+
+        :param routes: Expected routes
+        :return: List of routes not found
+        """
+        missing = []
+        for route in routes:
+            entries = self._by_destination.get((route.table, route.destination), [])
+            if not any(
+                (route.gateway is None or entry.gateway == route.gateway)
+                and (route.device is None or entry.device == route.device)
+                for entry in entries
+            ):
+                missing.append(route)
+        return missing
@@ -2,14 +2,19 @@
 # SPDX-License-Identifier: MIT
 """Module for Route feature for Linux systems."""
 
+import json
 import logging
-
-from typing import TYPE_CHECKING, Optional
+from ipaddress import ip_address, ip_network
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_kernel_namespace import add_namespace_call_command
 
+from mfd_network_adapter.iproute2 import is_json_supported
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 from .base import BaseRouteFeature
+from .data_structures import MAIN_TABLE, RouteEntry, RouteNexthop, RouteTable
+from ...batch import BatchConnection
 from ...exceptions import RouteFeatureException
 
 if TYPE_CHECKING:
@@ -18,9 +23,43 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+ROUTE_TYPES = {"unicast", "local", "broadcast", "multicast", "anycast", "blackhole", "unreachable", "prohibit", "throw"}
+# keywords of `ip route show` output followed by value
+ROUTE_KEYWORDS = {
+    "via",
+    "dev",
+    "proto",
+    "scope",
+    "src",
+    "metric",
+    "table",
+    "pref",
+    "expires",
+    "mtu",
+    "advmss",
+    "hoplimit",
+    "realm",
+    "realms",
+    "from",
+    "tos",
+    "weight",
+    "nhid",
+    "rtt",
+    "rttvar",
+    "initcwnd",
+    "initrwnd",
+    "congctl",
+}
+ROUTE_FAMILY_MARKER = "@@MFD_ROUTE_FAMILY@@"
+
 
 class LinuxRoute(BaseRouteFeature):
-    """Linux class for Route feature."""
+    """
+    Linux class for Route feature.
+
+    Routing tables are available as RouteTable snapshot (get_route_table), routes are added/replaced/deleted
+    in bulk (add_routes, delete_routes) with `ip -batch`, failures are reported per route.
+    """
 
     def _verify_ip_route_output(self, stdout: str) -> None:
         """
@@ -136,3 +175,245 @@ class LinuxRoute(BaseRouteFeature):
         """
         cmd = f"ip route flush dev {device}"
         self._connection.execute_command(add_namespace_call_command(cmd, namespace))
+
+    @staticmethod
+    def _get_destination(destination: str, version: int) -> Any:
+        """
+        Get destination prefix of route.
+
+        :param destination: Destination of `ip route show` output, e.g. 'default', '10.0.0.0/24', '10.0.0.1'
+        :param version: IP version of route
+        :return: IPv4Network or IPv6Network
+        """
+        if destination == "default":
+            return ip_network("0.0.0.0/0" if version == 4 else "::/0")
+        return ip_network(destination, strict=False)
+
+    @staticmethod
+    def parse_route_line(line: str, version: int = 4) -> RouteEntry | RouteNexthop | None:
+        """
+        Parse single line of `ip route show` output.
+
+        :param line: Line of output, e.g. '10.0.0.0/24 via 10.0.0.254 dev eth0 proto static metric 100'
+        :param version: IP version of output
+        :return: RouteEntry, RouteNexthop for 'nexthop' line of multipath route, None if line is not route
+        """
+        tokens = line.split()
+        if not tokens:
+            return None
+        route_type = "unicast"
+        if tokens[0] == "nexthop":
+            route_type, tokens = "nexthop", tokens[1:]
+        elif tokens[0] in ROUTE_TYPES and len(tokens) > 1:
+            route_type, tokens = tokens[0], tokens[1:]
+        fields = {}
+        flags = []
+        index = 0 if route_type == "nexthop" else 1
+        while index < len(tokens):
+            token = tokens[index]
+            if token in ROUTE_KEYWORDS and index + 1 < len(tokens):
+                if token == "via" and tokens[index + 1] in ("inet", "inet6") and index + 2 < len(tokens):
+                    index += 1
+                fields[token] = tokens[index + 1]
+                index += 2
+                continue
+            flags.append(token)
+            index += 1
+
+        gateway = ip_address(fields["via"]) if "via" in fields else None
+        if route_type == "nexthop":
+            weight = fields.get("weight")
+            return RouteNexthop(gateway=gateway, device=fields.get("dev"), weight=int(weight) if weight else None)
+        try:
+            destination = LinuxRoute._get_destination(tokens[0], version)
+        except ValueError:
+            return None
+        return RouteEntry(
+            destination=destination,
+            gateway=gateway,
+            device=fields.get("dev"),
+            table=fields.get("table", MAIN_TABLE),
+            type=route_type,
+            protocol=fields.get("proto"),
+            scope=fields.get("scope"),
+            source=ip_address(fields["src"]) if "src" in fields else None,
+            metric=int(fields["metric"]) if "metric" in fields else None,
+            flags=flags,
+        )
+
+    @staticmethod
+    def _get_route_from_json(route: Dict[str, Any], version: int) -> RouteEntry:
+        """
+        Get route entry from JSON object of `ip -j route show`.
+
+        :param route: JSON object of single route
+        :param version: IP version of output
+        :return: RouteEntry
+        """
+        return RouteEntry(
+            destination=LinuxRoute._get_destination(route["dst"], version),
+            gateway=ip_address(route["gateway"]) if "gateway" in route else None,
+            device=route.get("dev"),
+            table=str(route.get("table", MAIN_TABLE)),
+            type=route.get("type", "unicast"),
+            protocol=route.get("protocol"),
+            scope=route.get("scope"),
+            source=ip_address(route["prefsrc"]) if "prefsrc" in route else None,
+            metric=route.get("metric"),
+            flags=list(route.get("flags", [])),
+            nexthops=[
+                RouteNexthop(
+                    gateway=ip_address(nexthop["gateway"]) if "gateway" in nexthop else None,
+                    device=nexthop.get("dev"),
+                    weight=nexthop.get("weight"),
+                )
+                for nexthop in route.get("nexthops", [])
+            ],
+        )
+
+    def _parse_route_output(self, output: str, version: int, json_output: bool) -> list[RouteEntry]:
+        """
+        Parse output of `ip [-j] route show`.
+
+        :param output: Output of command
+        :param version: IP version of output
+        :param json_output: Output is in JSON format
+        :return: List of routes
+        """
+        if json_output:
+            return [self._get_route_from_json(route, version) for route in json.loads(output.strip() or "[]")]
+
+        entries = []
+        for line in output.splitlines():
+            entry = self.parse_route_line(line, version)
+            if isinstance(entry, RouteNexthop):
+                if entries:
+                    entries[-1].nexthops.append(entry)
+            elif entry is not None:
+                entries.append(entry)
+        return entries
+
+    def get_route_table(
+        self, table: str = "all", ip_ver: IPVersion | None = None, namespace: str | None = None
+    ) -> RouteTable:
+        """
+        Get snapshot of routing tables, indexed by table and destination prefix, read in one remote call.
+
+        :param table: Name or ID of table, 'all' for all tables (also local one)
+        :param ip_ver: IPVersion field, both versions when not given
+        :param namespace: Name of network namespace
+        :return: RouteTable
+        """
+        json_output = is_json_supported(self._connection)
+        versions = [int(ip_ver.value)] if ip_ver is not None else [4, 6]
+        commands = [
+            add_namespace_call_command(
+                f"ip {'-j ' if json_output else ''}-{version} route show table {table}", namespace=namespace
+            )
+            for version in versions
+        ]
+        output = self._connection.execute_command(
+            f" && echo {ROUTE_FAMILY_MARKER} && ".join(commands), shell=len(commands) > 1
+        ).stdout
+        entries = []
+        for version, version_output in zip(versions, output.split(f"{ROUTE_FAMILY_MARKER}\n")):
+            entries.extend(self._parse_route_output(version_output, version, json_output))
+        route_table = RouteTable(entries)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Route table read, {len(route_table)} entries.")
+        return route_table
+
+    @staticmethod
+    def _get_route_command(operation: str, route: RouteEntry) -> str:
+        """
+        Get `ip route` command programming route.
+
+        :param operation: 'add', 'replace' or 'del'
+        :param route: Route
+        :return: Command
+        """
+        parts = ["ip route", operation]
+        if route.type != "unicast":
+            parts.append(route.type)
+        parts.append(str(route.destination))
+        if route.gateway is not None:
+            parts.append(f"via {route.gateway}")
+        if route.device is not None:
+            parts.append(f"dev {route.device}")
+        if operation != "del":
+            for nexthop in route.nexthops:
+                parts.append("nexthop")
+                if nexthop.gateway is not None:
+                    parts.append(f"via {nexthop.gateway}")
+                if nexthop.device is not None:
+                    parts.append(f"dev {nexthop.device}")
+                if nexthop.weight is not None:
+                    parts.append(f"weight {nexthop.weight}")
+            if route.protocol is not None:
+                parts.append(f"proto {route.protocol}")
+            if route.scope is not None:
+                parts.append(f"scope {route.scope}")
+            if route.source is not None:
+                parts.append(f"src {route.source}")
+        if route.table != MAIN_TABLE:
+            parts.append(f"table {route.table}")
+        if route.metric is not None:
+            parts.append(f"metric {route.metric}")
+        if operation != "del" and "onlink" in route.flags:
+            parts.append("onlink")
+        return " ".join(parts)
+
+    def _execute_route_commands(
+        self, operation: str, routes: Iterable[RouteEntry], namespace: str | None
+    ) -> list[tuple[RouteEntry, str]]:
+        """
+        Execute `ip route` commands in `ip -batch` calls.
+
+        :param operation: 'add', 'replace' or 'del'
+        :param routes: Routes
+        :param namespace: Name of network namespace
+        :return: List of tuples (failed route, error message)
+        """
+        routes = list(routes)
+        batch = BatchConnection(self._owner()._connection)
+        for route in routes:
+            batch.execute_command(add_namespace_call_command(self._get_route_command(operation, route), namespace))
+        calls = batch.execute(raise_on_error=False)
+        failures = []
+        existing = 0
+        for route, call in zip(routes, calls):
+            if not call.failed:
+                continue
+            if operation == "add" and "file exists" in call.output.casefold():
+                existing += 1
+                continue
+            failures.append((route, call.output or f"returned {call.return_code}"))
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Executed {len(routes)} route commands, {existing} routes already existed, {len(failures)} failed.",
+        )
+        return failures
+
+    def add_routes(
+        self, routes: Iterable[RouteEntry], replace: bool = False, namespace: str | None = None
+    ) -> list[tuple[RouteEntry, str]]:
+        """
+        Add (or replace) routes in `ip -batch` calls.
+
+        As in add_route, already existing routes are not reported as failures.
+
+        :param routes: Routes to add
+        :param replace: Replace existing routes (`ip route replace`)
+        :param namespace: Name of network namespace
+        :return: List of tuples (failed route, error message), empty when all routes were added
+        """
+        return self._execute_route_commands("replace" if replace else "add", routes, namespace)
+
+    def delete_routes(self, routes: Iterable[RouteEntry], namespace: str | None = None) -> list[tuple[RouteEntry, str]]:
+        """
+        Delete routes in `ip -batch` calls, e.g. filtered entries of get_route_table snapshot.
+
+        :param routes: Routes to delete
+        :param namespace: Name of network namespace
+        :return: List of tuples (failed route, error message), empty when all routes were deleted
+        """
+        return self._execute_route_commands("del", routes, namespace)
@@ -0,0 +1,20 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Tunnel fleet feature."""
+
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
+from .base import BaseTunnelFeature
+from .data_structures import TunnelFleetResult, TunnelSpec
+
+if TYPE_CHECKING:
+    from .linux import LinuxTunnel
+
+    TunnelFeatureType = BaseTunnelFeature | LinuxTunnel
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"LinuxTunnel": ".linux"}, {"TunnelFeatureType": ("BaseTunnelFeature", "LinuxTunnel")}
+)
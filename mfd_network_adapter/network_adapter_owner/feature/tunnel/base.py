@@ -0,0 +1,11 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Tunnel fleet feature."""
+
+from abc import ABC
+
+from ..base import BaseFeature
+
+
+class BaseTunnelFeature(BaseFeature, ABC):
+    """Base class for Tunnel fleet feature."""
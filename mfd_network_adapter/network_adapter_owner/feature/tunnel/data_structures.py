@@ -0,0 +1,58 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Tunnel fleet feature data structures."""
+
+from dataclasses import dataclass, field
+from ipaddress import IPv4Address, IPv4Interface, IPv6Address, IPv6Interface
+
+from ...data_structures import TunnelType
+
+
+@dataclass
+class TunnelSpec:
+    """
+    Specification of tunnel interface.
+
+    :param name: Name of tunnel interface
+    :param tunnel_type: Type of tunnel, GRE tunnels are created as gretap (ip6gretap for IPv6 endpoints)
+    :param vni: VxLAN/Geneve ID or GRE key
+    :param remote: Remote endpoint, required for Geneve and GRE, alternative to group for VxLAN
+    :param local: Local endpoint
+    :param group: Multicast group of VxLAN
+    :param interface_name: Underlying network interface
+    :param dstport: Destination UDP port of VxLAN/Geneve
+    :param ttl: Time to live of outer packets
+    :param ip_addr: Inner IP address assigned to tunnel interface
+    :param namespace_name: Namespace of tunnel interface
+    """
+
+    name: str
+    tunnel_type: TunnelType
+    vni: int | None = None
+    remote: IPv4Address | IPv6Address | None = None
+    local: IPv4Address | IPv6Address | None = None
+    group: IPv4Address | IPv6Address | None = None
+    interface_name: str | None = None
+    dstport: int | None = None
+    ttl: int | None = None
+    ip_addr: IPv4Interface | IPv6Interface | None = None
+    namespace_name: str | None = None
+
+    @property
+    def kind(self) -> str:
+        """Link kind of tunnel as reported by `ip -d link show`."""
+        if self.tunnel_type is TunnelType.GRE:
+            endpoint = self.remote or self.local
+            return "ip6gretap" if endpoint is not None and endpoint.version == 6 else "gretap"
+        return self.tunnel_type.value
+
+
+@dataclass
+class TunnelFleetResult:
+    """Result of operation on tunnel fleet, failures map tunnel name to reason."""
+
+    succeeded: list[str] = field(default_factory=list)
+    failures: dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return not self.failures
@@ -0,0 +1,221 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Tunnel fleet feature for Linux systems."""
+
+import json
+import logging
+from ipaddress import IPv4Interface, IPv6Interface
+from typing import Any, Iterable
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_kernel_namespace import add_namespace_call_command
+
+from .base import BaseTunnelFeature
+from .data_structures import TunnelFleetResult, TunnelSpec
+from ...batch import BatchCall, BatchConnection
+from ...data_structures import TunnelType
+from ...exceptions import TunnelFeatureException
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+LINK_DUMP_COMMAND = "ip -d -j addr show"
+
+
+class LinuxTunnel(BaseTunnelFeature):
+    """
+    Linux class for Tunnel fleet feature.
+
+    Tunnels of each namespace are created/deleted with one `ip -batch`, all namespaces are handled in one remote call
+    together with JSON link dump used for verification.
+    """
+
+    @staticmethod
+    def _get_address(address: Any) -> Any:
+        """
+        Get address without prefix.
+
+        :param address: IP address or interface
+        :return: IP address
+        """
+        return address.ip if isinstance(address, (IPv4Interface, IPv6Interface)) else address
+
+    def _get_add_command(self, spec: TunnelSpec) -> str:
+        """
+        Get `ip link add` command for tunnel.
+
+        :param spec: Tunnel specification
+        :return: Command
+        :raises TunnelFeatureException: When required parameters of tunnel type are missing
+        """
+        remote, local, group = (self._get_address(value) for value in (spec.remote, spec.local, spec.group))
+        cmd = f"ip link add {spec.name} type {spec.kind}"
+        if spec.tunnel_type is TunnelType.GRE:
+            if remote is None or local is None:
+                raise TunnelFeatureException(f"Remote and local addresses are required for GRE tunnel {spec.name}")
+            cmd += f" local {local} remote {remote}"
+            if spec.vni is not None:
+                cmd += f" key {spec.vni}"
+        else:
+            if spec.vni is None:
+                raise TunnelFeatureException(f"VNI is required for {spec.tunnel_type.value} tunnel {spec.name}")
+            cmd += f" id {spec.vni}"
+            if spec.tunnel_type is TunnelType.VXLAN and group is not None:
+                cmd += f" group {group}"
+            elif remote is not None:
+                cmd += f" remote {remote}"
+            else:
+                raise TunnelFeatureException(f"Remote address or group is required for tunnel {spec.name}")
+            if local is not None and spec.tunnel_type is TunnelType.VXLAN:
+                cmd += f" local {local}"
+            if spec.dstport is not None:
+                cmd += f" dstport {spec.dstport}"
+        if spec.ttl is not None:
+            cmd += f" ttl {spec.ttl}"
+        if spec.interface_name is not None and spec.tunnel_type is not TunnelType.GENEVE:
+            cmd += f" dev {spec.interface_name}"
+        return cmd
+
+    def _get_create_commands(self, spec: TunnelSpec) -> list[str]:
+        """
+        Get commands creating, configuring and setting up tunnel.
+
+        :param spec: Tunnel specification
+        :return: Commands
+        """
+        commands = [self._get_add_command(spec)]
+        if spec.ip_addr is not None:
+            commands.append(f"ip addr add {spec.ip_addr} dev {spec.name}")
+        commands.append(f"ip link set {spec.name} up")
+        return commands
+
+    @staticmethod
+    def _group_by_namespace(specs: Iterable[TunnelSpec]) -> dict[str | None, list[TunnelSpec]]:
+        """
+        Group tunnel specifications by namespace.
+
+        :param specs: Tunnel specifications
+        :return: Dictionary {namespace: specifications}
+        """
+        groups: dict[str | None, list[TunnelSpec]] = {}
+        for spec in specs:
+            groups.setdefault(spec.namespace_name, []).append(spec)
+        return groups
+
+    def _execute(
+        self, commands: dict[str | None, list[tuple[str, str]]]
+    ) -> tuple[dict[str, list[BatchCall]], dict[str | None, dict[str, dict[str, Any]]]]:
+        """
+        Execute tunnel commands of all namespaces and dump links of each namespace in one remote call.
+
+        :param commands: Dictionary {namespace: [(tunnel name, command)]}
+        :return: Tuple (calls of each tunnel, {namespace: {link name: link JSON}})
+        :raises TunnelFeatureException: When link dump cannot be read
+        """
+        batch = BatchConnection(self._owner()._connection)
+        tunnel_calls: dict[str, list[BatchCall]] = {}
+        dump_calls: dict[str | None, BatchCall] = {}
+        for namespace, namespace_commands in commands.items():
+            for name, command in namespace_commands:
+                batch.execute_command(add_namespace_call_command(command, namespace), expected_return_codes={0})
+                tunnel_calls.setdefault(name, []).append(batch.calls[-1])
+            batch.execute_command(add_namespace_call_command(LINK_DUMP_COMMAND, namespace))
+            dump_calls[namespace] = batch.calls[-1]
+        batch.execute(raise_on_error=False)
+
+        links = {}
+        for namespace, call in dump_calls.items():
+            try:
+                links[namespace] = {link["ifname"]: link for link in json.loads(call.output or "[]")}
+            except (ValueError, KeyError, TypeError) as e:
+                raise TunnelFeatureException(f"Cannot read links of namespace {namespace}: {call.output}") from e
+        return tunnel_calls, links
+
+    @staticmethod
+    def _verify_link(spec: TunnelSpec, link: dict[str, Any] | None) -> str | None:
+        """
+        Verify link of created tunnel.
+
+        :param spec: Tunnel specification
+        :param link: Link JSON from `ip -d -j addr show`, None when link does not exist
+        :return: Reason of mismatch, None when link matches specification
+        """
+        if link is None:
+            return "link not present"
+        linkinfo = link.get("linkinfo", {})
+        if linkinfo.get("info_kind") != spec.kind:
+            return f"unexpected kind {linkinfo.get('info_kind')}"
+        if spec.tunnel_type is not TunnelType.GRE and linkinfo.get("info_data", {}).get("id") != spec.vni:
+            return f"unexpected id {linkinfo.get('info_data', {}).get('id')}"
+        if "UP" not in link.get("flags", []):
+            return "link is not up"
+        if spec.ip_addr is not None:
+            addresses = {(info.get("local"), info.get("prefixlen")) for info in link.get("addr_info", [])}
+            if (str(spec.ip_addr.ip), spec.ip_addr.network.prefixlen) not in addresses:
+                return f"address {spec.ip_addr} not assigned"
+        return None
+
+    def create_tunnels(self, specs: Iterable[TunnelSpec]) -> TunnelFleetResult:
+        """
+        Create, configure and set up tunnels.
+
+        Commands of each namespace are sent as one `ip -batch`, all namespaces in one remote call.
+        Result is verified with JSON link dump collected in the same call.
+
+        :param specs: Tunnel specifications
+        :return: TunnelFleetResult with names of created tunnels and reasons of failures of remaining ones
+        :raises TunnelFeatureException: When specification is incomplete or link dump cannot be read
+        """
+        specs = list(specs)
+        commands = {
+            namespace: [(spec.name, command) for spec in group for command in self._get_create_commands(spec)]
+            for namespace, group in self._group_by_namespace(specs).items()
+        }
+        tunnel_calls, links = self._execute(commands)
+
+        result = TunnelFleetResult()
+        for spec in specs:
+            failed = [call for call in tunnel_calls[spec.name] if call.failed]
+            reason = self._verify_link(spec, links[spec.namespace_name].get(spec.name))
+            if failed:
+                result.failures[spec.name] = "; ".join(f"'{call.command}': {call.output.strip()}" for call in failed)
+            elif reason:
+                result.failures[spec.name] = reason
+            else:
+                result.succeeded.append(spec.name)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Created {len(result.succeeded)} of {len(specs)} tunnels, failures: {result.failures}",
+        )
+        return result
+
+    def delete_tunnels(self, specs: Iterable[TunnelSpec]) -> TunnelFleetResult:
+        """
+        Delete tunnels, tunnels not present on the host are treated as deleted.
+
+        Commands of each namespace are sent as one `ip -batch`, all namespaces in one remote call.
+        Result is verified with JSON link dump collected in the same call.
+
+        :param specs: Tunnel specifications, only name and namespace_name are used
+        :return: TunnelFleetResult with names of deleted tunnels and reasons of failures of remaining ones
+        :raises TunnelFeatureException: When link dump cannot be read
+        """
+        specs = list(specs)
+        commands = {
+            namespace: [(spec.name, f"ip link del {spec.name}") for spec in group]
+            for namespace, group in self._group_by_namespace(specs).items()
+        }
+        tunnel_calls, links = self._execute(commands)
+
+        result = TunnelFleetResult()
+        for spec in specs:
+            if spec.name in links[spec.namespace_name]:
+                output = "; ".join(call.output.strip() for call in tunnel_calls[spec.name] if call.failed)
+                result.failures[spec.name] = f"link still present {output}".strip()
+            else:
+                result.succeeded.append(spec.name)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Deleted {len(result.succeeded)} of {len(specs)} tunnels, failures: {result.failures}",
+        )
+        return result
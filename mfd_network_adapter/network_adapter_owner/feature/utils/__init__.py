@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Utils feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseUtilsFeature
-from .esxi import ESXiUtils
-from .freebsd import FreeBSDUtils
-from .linux import LinuxUtils
-from .windows import WindowsUtils
 
-UtilsFeatureType = Union[BaseUtilsFeature, ESXiUtils, FreeBSDUtils, LinuxUtils, WindowsUtils]
+if TYPE_CHECKING:
+    from .esxi import ESXiUtils
+    from .freebsd import FreeBSDUtils
+    from .linux import LinuxUtils
+    from .windows import WindowsUtils
+
+    UtilsFeatureType = Union[BaseUtilsFeature, ESXiUtils, FreeBSDUtils, LinuxUtils, WindowsUtils]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiUtils": ".esxi", "FreeBSDUtils": ".freebsd", "LinuxUtils": ".linux", "WindowsUtils": ".windows"},
+    {"UtilsFeatureType": ("BaseUtilsFeature", "ESXiUtils", "FreeBSDUtils", "LinuxUtils", "WindowsUtils")},
+)
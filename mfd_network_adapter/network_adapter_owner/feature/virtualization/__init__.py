@@ -2,10 +2,27 @@
 # SPDX-License-Identifier: MIT
 """Module for Virtualization feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseVirtualizationFeature
-from .esxi import ESXiVirtualizationFeature
-from .linux import LinuxVirtualizationFeature
 
-VirtualizationFeatureType = Union[BaseVirtualizationFeature, LinuxVirtualizationFeature, ESXiVirtualizationFeature]
+if TYPE_CHECKING:
+    from .esxi import ESXiVirtualizationFeature
+    from .linux import LinuxVirtualizationFeature
+
+    VirtualizationFeatureType = Union[BaseVirtualizationFeature, LinuxVirtualizationFeature, ESXiVirtualizationFeature]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiVirtualizationFeature": ".esxi", "LinuxVirtualizationFeature": ".linux"},
+    {
+        "VirtualizationFeatureType": (
+            "BaseVirtualizationFeature",
+            "LinuxVirtualizationFeature",
+            "ESXiVirtualizationFeature",
+        )
+    },
+)
@@ -2,11 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for VLAN feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseVLANFeature
-from .freebsd import FreeBSDVLAN
-from .linux import LinuxVLAN
-from .windows import WindowsVLAN
 
-VLANFeatureType = Union[BaseVLANFeature, FreeBSDVLAN, LinuxVLAN, WindowsVLAN]
+if TYPE_CHECKING:
+    from .freebsd import FreeBSDVLAN
+    from .linux import LinuxVLAN
+    from .windows import WindowsVLAN
+
+    VLANFeatureType = Union[BaseVLANFeature, FreeBSDVLAN, LinuxVLAN, WindowsVLAN]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBSDVLAN": ".freebsd", "LinuxVLAN": ".linux", "WindowsVLAN": ".windows"},
+    {"VLANFeatureType": ("BaseVLANFeature", "FreeBSDVLAN", "LinuxVLAN", "WindowsVLAN")},
+)
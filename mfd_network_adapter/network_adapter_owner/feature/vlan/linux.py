@@ -4,16 +4,19 @@
 
 import logging
 import re
-from typing import TYPE_CHECKING, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_kernel_namespace import add_namespace_call_command
 from mfd_package_manager import LinuxPackageManager
 from mfd_typing import MACAddress
+from mfd_typing.network_interface import VlanInterfaceInfo
 
 from .base import BaseVLANFeature
-from ...exceptions import VLANFeatureException
+from ...exceptions import BatchExecutionError, VLANFeatureException
+from ....iproute2 import is_json_supported, parse_vlans_json, parse_vlans_text
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
@@ -92,14 +95,103 @@ class LinuxVLAN(BaseVLANFeature):
             shell=True,
         )
 
+    def create_vlans(
+        self,
+        vlan_ids: Iterable[int],
+        interface_name: str,
+        protocol: Optional[str] = None,
+        reorder: bool = True,
+        namespace_name: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Create VLANs with desired IDs on interface in one batched operation.
+
+        VLAN interfaces are named '<interface_name>.<vlan_id>'.
+
+        :param vlan_ids: IDs for VLANs, e.g. range(1, 4095).
+        :param interface_name: Network interface name.
+        :param protocol: Specify '802.1ad' or '802.1Q' protocol type.
+        :param reorder: Specifies whether ethernet headers are reordered or not.
+        :param namespace_name: Namespace of VLANs
+        :return: Names of created VLAN interfaces.
+        :raises VLANFeatureException: When creation of any VLAN failed, remaining VLANs are created anyway.
+        """
+        vlan_ids = list(vlan_ids)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Creating {len(vlan_ids)} VLANs on {interface_name}.")
+        with self._batch_vlan_operation("create"):
+            for vlan_id in vlan_ids:
+                self.create_vlan(
+                    vlan_id=vlan_id,
+                    interface_name=interface_name,
+                    protocol=protocol,
+                    reorder=reorder,
+                    namespace_name=namespace_name,
+                )
+        return [f"{interface_name}.{vlan_id}" for vlan_id in vlan_ids]
+
+    def remove_vlans(
+        self,
+        vlan_names: Optional[Iterable[str]] = None,
+        vlan_ids: Optional[Iterable[int]] = None,
+        interface_name: Optional[str] = None,
+        namespace_name: Optional[str] = None,
+    ) -> None:
+        """
+        Remove desired VLANs in one batched operation.
+
+        :param vlan_names: Names of existing VLAN interfaces.
+        :param vlan_ids: IDs of VLANs to remove, used together with interface_name when vlan_names not given.
+        :param interface_name: Network interface name.
+        :param namespace_name: Namespace of VLANs
+        :raises VLANFeatureException: When removal of any VLAN failed, remaining VLANs are removed anyway.
+        """
+        if vlan_names is None:
+            vlan_names = [f"{interface_name}.{vlan_id}" for vlan_id in vlan_ids or []]
+        with self._batch_vlan_operation("remove"):
+            for vlan_name in vlan_names:
+                self.remove_vlan(vlan_name=vlan_name, namespace_name=namespace_name)
+
+    def list_vlans(
+        self, interface_name: Optional[str] = None, namespace_name: Optional[str] = None
+    ) -> Dict[str, VlanInterfaceInfo]:
+        """
+        List VLANs with single "ip -d [-j] link show type vlan" call, JSON output is used when supported by `ip`.
+
+        :param interface_name: Name of parent interface to filter VLANs, all VLANs when not given.
+        :param namespace_name: Namespace of VLANs
+        :return: Dictionary {VLAN interface name: VlanInterfaceInfo}
+        """
+        json_supported = is_json_supported(self._connection)
+        command = "ip -d -j link show type vlan" if json_supported else "ip -d link show type vlan"
+        result = self._connection.execute_command(
+            add_namespace_call_command(command, namespace=namespace_name), expected_return_codes={0}, shell=True
+        )
+        vlans = parse_vlans_json(result.stdout) if json_supported else parse_vlans_text(result.stdout)
+        if interface_name is None:
+            return vlans
+        return {name: info for name, info in vlans.items() if info.parent == interface_name}
+
     def remove_all_vlans(self) -> None:
-        """Remove all VLANs from interface."""
+        """Remove all VLANs from interface, in one batched operation."""
         result = self._connection.execute_command("ls /proc/net/vlan", expected_return_codes={0, 2}, shell=True)
         vlans = sorted(
             [vlan_name.strip() for vlan_name in result.stdout.split() if "config" not in vlan_name], reverse=True
         )
-        for vlan_name in vlans:
-            self.remove_vlan(vlan_name=vlan_name)
+        self.remove_vlans(vlan_names=vlans)
+
+    @contextmanager
+    def _batch_vlan_operation(self, operation: str) -> Iterator[None]:
+        """
+        Execute VLAN commands called within the block as one batch of owner.
+
+        :param operation: Name of operation used in error message
+        :raises VLANFeatureException: When any of batched commands failed
+        """
+        try:
+            with self._owner().batch():
+                yield
+        except BatchExecutionError as e:
+            raise VLANFeatureException(f"Cannot {operation} VLANs: {e}") from e
 
     def create_macvlan(self, interface_name: str, mac: MACAddress, macvlan_name: str) -> ConnectionCompletedProcess:
         """Create MACVLAN on interface.
@@ -2,11 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for VxLAN feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseVxLANFeature
-from .freebsd import FreeBSDVxLAN
-from .linux import LinuxVxLAN
-from .windows import WindowsVxLAN
 
-VxLANFeatureType = Union[BaseVxLANFeature, FreeBSDVxLAN, LinuxVxLAN, WindowsVxLAN]
+if TYPE_CHECKING:
+    from .freebsd import FreeBSDVxLAN
+    from .linux import LinuxVxLAN
+    from .windows import WindowsVxLAN
+
+    VxLANFeatureType = Union[BaseVxLANFeature, FreeBSDVxLAN, LinuxVxLAN, WindowsVxLAN]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBSDVxLAN": ".freebsd", "LinuxVxLAN": ".linux", "WindowsVxLAN": ".windows"},
+    {"VxLANFeatureType": ("BaseVxLANFeature", "FreeBSDVxLAN", "LinuxVxLAN", "WindowsVxLAN")},
+)
@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: MIT
 """Module for adapter owner for Linux."""
 
+import json
 import logging
 import re
 import time
 from collections import Counter
+from contextlib import contextmanager
 from ipaddress import IPv4Interface
-from typing import Dict, Optional, List, TYPE_CHECKING
+from typing import Dict, Iterator, Optional, List, TYPE_CHECKING
 
 from funcy import walk_values, partial
 from mfd_common_libs import os_supported, log_levels, add_logging_level
@@ -17,16 +19,29 @@ from mfd_typing import PCIDevice, PCIAddress, OSName, MACAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType, VlanInterfaceInfo
 
 from .base import NetworkAdapterOwner
+from .batch import BatchConnection, activate_batch
+from .namespace_parallel import NamespaceParallelConnection, PrefetchedConnection, prefetch_commands
 from ..const import LINUX_SYS_CLASS_FULL_REGEX, LINUX_SYS_CLASS_VIRTUAL_DEVICE_REGEX, LINUX_SYS_CLASS_VMBUS_REGEX
 from ..exceptions import VlanNotFoundException, NetworkAdapterModuleException
+from ..iproute2 import is_json_supported, parse_vlans_json
+from ..network_interface.capabilities import notify_driver_reload
 from ..network_interface.exceptions import MacAddressNotFound
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from mfd_connect import Connection
+
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+LSPCI_ETHERNET_COMMAND = (
+    "lspci -D -nnvvvmm | awk '/^Slot:/{p=0; slot=$0} /^Class:.*Ethernet controller/{p=1; print slot} p'"
+)
+SYS_CLASS_NET_COMMAND = r"\ls -l /sys/class/net"
+PHYSFN_FIND_COMMAND = 'find -L /sys/class/net/ -maxdepth 3 -path "/sys/class/net/*/device/physfn"'
+TUNNEL_LIST_COMMAND = "ip tunnel show | awk '{print $1}'"
+
 
 class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
     """Class to handle Owner of Network Adapters in Linux."""
@@ -36,6 +51,41 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
 
     __init__ = os_supported(OSName.LINUX)(NetworkAdapterOwner.__init__)
 
+    @contextmanager
+    def batch(self, raise_on_error: bool = True, parallel_namespaces: bool = False) -> Iterator[BatchConnection]:
+        """
+        Queue commands of owner features called within the block and execute them at once when leaving it.
+
+        Commands of interface features using connection of owner are queued as well.
+        Consecutive `ip` commands of the same namespace are sent as one `ip -batch`, remaining ones as lines
+        of the same shell script. Results of features' calls are placeholders (return code 0, empty output),
+        so only configuration calls should be used in the block. Real results are stored in BatchConnection.calls,
+        commands whose return code is verified by feature (no expected return codes) are not failures of batch,
+        they are listed in BatchConnection.unchecked_failures.
+        Queue is dropped if exception is raised within the block. Nested blocks are merged into the outer one.
+
+        :param raise_on_error: Raise BatchExecutionError if any command returned unexpected return code
+        :param parallel_namespaces: Group commands by network namespace and run scripts of namespaces in parallel
+            on the host (NamespaceParallelConnection), order of commands is kept only within namespace
+        :return: BatchConnection object with queued calls
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        self._batch = (
+            NamespaceParallelConnection(self._connection) if parallel_namespaces else BatchConnection(self._connection)
+        )
+        activate_batch(self._connection, self._batch)
+        try:
+            yield self._batch
+            batch, self._batch = self._batch, None
+            activate_batch(self._connection, None)
+            batch.execute(raise_on_error=raise_on_error)
+        finally:
+            self._batch = None
+            activate_batch(self._connection, None)
+
     def _get_network_namespaces(self) -> List[str]:
         """Get network namespaces.
 
@@ -288,16 +338,16 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
                 )
         return interfaces
 
-    def _get_vlan_interfaces(self, namespace: str) -> List[str]:
+    def _get_vlan_interfaces(self, namespace: str, connection: "Connection | None" = None) -> List[str]:
         """Get list of VLAN interface names.
 
         :param namespace: Network Namespace name
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         :return: List of VLAN interfaces names
         """
+        connection = connection or self._connection
         command = add_namespace_call_command(command="ls /proc/net/vlan", namespace=namespace)
-        res = self._connection.execute_command(
-            command=command, expected_return_codes={0, 2}
-        )  # no such file or directory
+        res = connection.execute_command(command=command, expected_return_codes={0, 2})  # no such file or directory
 
         return [vlan_name.strip() for vlan_name in res.stdout.split() if vlan_name != "config"]
 
@@ -317,41 +367,69 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
             raise VlanNotFoundException(f"Can't parse VLAN ID from command output: {string}")
         return VlanInterfaceInfo(vlan_id=int(match.group("vlan_id")), parent=match.group("parent"))
 
-    def _update_vlans(self, interfaces: List[LinuxInterfaceInfo], namespace: str = None) -> None:
+    def _get_all_vlans_info(
+        self, namespace: str | None = None, connection: "Connection | None" = None
+    ) -> Optional[Dict[str, VlanInterfaceInfo]]:
+        """
+        Get details of all VLANs of namespace in one call.
+
+        :param namespace: Network Namespace name
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
+        :return: Dictionary {VLAN interface name: VlanInterfaceInfo}, None if JSON output is not supported by `ip`
+        """
+        if not is_json_supported(self._connection):
+            return None
+        connection = connection or self._connection
+        command = add_namespace_call_command(command="ip -d -j link show type vlan", namespace=namespace)
+        res = connection.execute_command(command=command, shell=True, expected_return_codes={0, 1})
+        return parse_vlans_json(res.stdout)
+
+    def _update_vlans(
+        self, interfaces: List[LinuxInterfaceInfo], namespace: str = None, connection: "Connection | None" = None
+    ) -> None:
         """
         Update VLAN info for all VLAN interfaces from provided list.
 
-        Gather all vlan interfaces (parse output from ls /proc/net/vlan) then for each of them:
-        - get VLAN ID and Parent name and store them in matching InterfaceInfo object.
+        Details of all VLANs are read with single "ip -d -j link show type vlan" call.
+        For `ip` without JSON support gather all vlan interfaces (parse output from ls /proc/net/vlan)
+        then for each of them get VLAN ID and Parent name.
+        Info is stored in matching InterfaceInfo object.
         :param interfaces: List of LinuxInterfaceInfo objects
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         :return: None
         """
-        vlan_interfaces = self._get_vlan_interfaces(namespace=namespace)
-
-        for vlan_interface in vlan_interfaces:
-            command_list_vlan_ids = add_namespace_call_command(
-                command=f"ip -d link show dev {vlan_interface}", namespace=namespace
-            )
-            res = self._connection.execute_command(command=command_list_vlan_ids, shell=True)
+        connection = connection or self._connection
+        vlans_info = self._get_all_vlans_info(namespace=namespace, connection=connection)
+        if vlans_info is None:
+            vlans_info = {}
+            for vlan_interface in self._get_vlan_interfaces(namespace=namespace, connection=connection):
+                command_list_vlan_ids = add_namespace_call_command(
+                    command=f"ip -d link show dev {vlan_interface}", namespace=namespace
+                )
+                res = connection.execute_command(command=command_list_vlan_ids, shell=True)
+                vlans_info[vlan_interface] = self._get_vlan_info(string=res.stdout)
 
-            vlan_info = self._get_vlan_info(string=res.stdout)
-            for interface in interfaces:
-                if interface.name == vlan_interface:
-                    interface.vlan_info = vlan_info
-                    interface.interface_type = InterfaceType.VLAN
+        for interface in interfaces:
+            vlan_info = vlans_info.get(interface.name)
+            if vlan_info is not None:
+                interface.vlan_info = vlan_info
+                interface.interface_type = InterfaceType.VLAN
 
-    def _update_data_based_on_sys_class_net(self, interfaces: List[LinuxInterfaceInfo], namespace: str = None) -> None:
+    def _update_data_based_on_sys_class_net(
+        self, interfaces: List[LinuxInterfaceInfo], namespace: str = None, connection: "Connection | None" = None
+    ) -> None:
         """
         Update list of LinuxInterfaceInfo based on output from ls -l /sys/class/net.
 
         :param interfaces: List of `lspci` InterfaceInfo objects
         :param namespace: Network Namespace name
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         :return: None
         """
-        command_sys_class_net = r"\ls -l /sys/class/net"
-        command = add_namespace_call_command(command=command_sys_class_net, namespace=namespace)
+        connection = connection or self._connection
+        command = add_namespace_call_command(command=SYS_CLASS_NET_COMMAND, namespace=namespace)
         # do not throw error for minor problems (e.g. rc=1 is cannot access subdirectory)
-        res = self._connection.execute_command(command, expected_return_codes={0, 1})
+        res = connection.execute_command(command, expected_return_codes={0, 1})
         sys_class_net_lines = res.stdout.splitlines()
         self._update_interfaces_with_sys_class_net_data_not_virtual(
             interfaces=interfaces, sys_class_net_lines=sys_class_net_lines, namespace=namespace
@@ -361,20 +439,23 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
                 sys_class_net_lines=sys_class_net_lines, namespace=namespace
             )
         )
-        self._update_vlans(interfaces=interfaces, namespace=namespace)
-        self._update_virtual_function_interfaces(interfaces=interfaces, namespace=namespace)
+        self._update_vlans(interfaces=interfaces, namespace=namespace, connection=connection)
+        self._update_virtual_function_interfaces(interfaces=interfaces, namespace=namespace, connection=connection)
 
-    def _update_virtual_function_interfaces(self, interfaces: List[LinuxInterfaceInfo], namespace: str) -> None:
+    def _update_virtual_function_interfaces(
+        self, interfaces: List[LinuxInterfaceInfo], namespace: str, connection: "Connection | None" = None
+    ) -> None:
         """
         Set Interface Type to VF based on physfn link in /sys/class/net/<dev>/.. directory.
 
         :param interfaces: List of LinuxInterfaceInfo objects
         :param namespace: Name of network namespace
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         :return: None
         """
-        find_command = 'find -L /sys/class/net/ -maxdepth 3 -path "/sys/class/net/*/device/physfn"'
-        find_command = add_namespace_call_command(command=find_command, namespace=namespace)
-        physfn_output = self._connection.execute_command(command=find_command, expected_return_codes={0, 1}).stdout
+        connection = connection or self._connection
+        find_command = add_namespace_call_command(command=PHYSFN_FIND_COMMAND, namespace=namespace)
+        physfn_output = connection.execute_command(command=find_command, expected_return_codes={0, 1}).stdout
         pattern = r"/sys/class/net/(?P<name>.*)/device/physfn"
 
         for name in re.findall(pattern=pattern, string=physfn_output, flags=re.MULTILINE):
@@ -382,19 +463,21 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
                 if iface.name == name:
                     iface.interface_type = InterfaceType.VF
 
-    def _get_lspci_interfaces(self, namespace: Optional[str] = None) -> List[LinuxInterfaceInfo]:
+    def _get_lspci_interfaces(
+        self, namespace: Optional[str] = None, connection: "Connection | None" = None
+    ) -> List[LinuxInterfaceInfo]:
         """
         Get list of interfaces based on lspci command.
 
         This method will update InterfaceType, PCI Address, PCI Device.
         :param namespace: Name of network namespace
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         :return:  List of LinuxInterfaceInfo objects
         """
         interfaces = []
-        command = "lspci -D -nnvvvmm | awk '/^Slot:/{p=0; slot=$0} /^Class:.*Ethernet controller/{p=1; print slot} p'"
-        command = add_namespace_call_command(command=command, namespace=namespace)
+        command = add_namespace_call_command(command=LSPCI_ETHERNET_COMMAND, namespace=namespace)
 
-        result = self._connection.execute_command(command, shell=True, expected_return_codes={0, 1})
+        result = (connection or self._connection).execute_command(command, shell=True, expected_return_codes={0, 1})
         if not result.stdout:
             return interfaces
         lspci_blocks = result.stdout.strip()
@@ -441,19 +524,19 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
                 interface.interface_type = InterfaceType.MANAGEMENT
 
     def _remove_tunnel_interfaces(
-        self, interfaces: List[LinuxInterfaceInfo], namespace: str = None
+        self, interfaces: List[LinuxInterfaceInfo], namespace: str = None, connection: "Connection | None" = None
     ) -> List[LinuxInterfaceInfo]:
         """
         Get copy of list of LinuxInterfaceInfo without tunnel interfaces.
 
         :param interfaces: List of LinuxInterfaceInfo
         :param namespace: network namespace name
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         :return: List without tunnel interfaces
         """
-        command = "ip tunnel show | awk '{print $1}'"
-        command = add_namespace_call_command(command=command, namespace=namespace)
+        command = add_namespace_call_command(command=TUNNEL_LIST_COMMAND, namespace=namespace)
 
-        res = self._connection.execute_command(command=command, shell=True)
+        res = (connection or self._connection).execute_command(command=command, shell=True)
         tunnel_interfaces = [name.replace(":", "") for name in res.stdout.splitlines()]
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"Removing tunnel interfaces: {tunnel_interfaces} from the list.")
         return [x for x in interfaces if x.name not in tunnel_interfaces]
@@ -473,13 +556,29 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
             raise MacAddressNotFound(f"No MAC address found for interface: {interface_name}")
         return MACAddress(match.group("mac_address"))
 
-    def _update_mac_addresses(self, interfaces: List[LinuxInterfaceInfo], namespace: str | None) -> None:
-        command = "ip a"
-        command = add_namespace_call_command(command=command, namespace=namespace)
+    @staticmethod
+    def _get_mac_addresses_from_json(output: str) -> Dict[str, str]:
+        """
+        Get MAC addresses of Ethernet interfaces from JSON output.
 
-        output = self._connection.execute_command(command=command).stdout.strip()
+        :param output: output from "ip -j link show"
+        :return: Dictionary {interface name: MAC address}
+        """
+        return {
+            link["ifname"]: link["address"]
+            for link in json.loads(output or "[]")
+            if link.get("link_type") == "ether" and "address" in link
+        }
 
-        ip_a_entries = re.split(r"^(\d+:)", output, flags=re.MULTILINE)
+    @staticmethod
+    def _get_mac_addresses_from_text(output: str) -> Dict[str, str]:
+        """
+        Get MAC addresses of Ethernet interfaces from text output.
+
+        :param output: output from "ip a"
+        :return: Dictionary {interface name: MAC address}
+        """
+        ip_a_entries = re.split(r"^(\d+:)", output.strip(), flags=re.MULTILINE)
 
         macs = {}
         for ip_a_entry in ip_a_entries:
@@ -490,11 +589,23 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
                 name = match_name.group("name")
                 mac = match_mac.group("mac")
                 macs[name] = mac
+        return macs
+
+    def _update_mac_addresses(
+        self, interfaces: List[LinuxInterfaceInfo], namespace: str | None, connection: "Connection | None" = None
+    ) -> None:
+        connection = connection or self._connection
+        if is_json_supported(self._connection):
+            command = add_namespace_call_command(command="ip -j link show", namespace=namespace)
+            macs = self._get_mac_addresses_from_json(connection.execute_command(command=command).stdout)
+        else:
+            command = add_namespace_call_command(command="ip a", namespace=namespace)
+            macs = self._get_mac_addresses_from_text(connection.execute_command(command=command).stdout)
 
         for interface in interfaces:
-            for name, mac in macs.items():
-                if interface.name == name:
-                    interface.mac_address = MACAddress(addr=mac)
+            mac = macs.get(interface.name)
+            if mac is not None:
+                interface.mac_address = MACAddress(addr=mac)
 
     def _get_all_interfaces_info(self) -> List[LinuxInterfaceInfo]:
         """
@@ -540,28 +651,79 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
 
         :return: List of LinuxInterfaceInfo
         """
-        interfaces: List[LinuxInterfaceInfo] = []
         namespaces = self._get_network_namespaces()
         namespaces.insert(0, None)  # adding extra element to mimic "no namespace" case
 
+        # prefetched results are passed to discovery helpers, owner connection (used by its features) is not replaced
+        connection = self._prefetch_discovery_commands(namespaces) if len(namespaces) > 1 else self._connection
+        interfaces = self._gather_interfaces_of_namespaces(namespaces, connection=connection)
+        self._mark_management_interface(interfaces=interfaces)  # MANAGEMENT
+
+        return interfaces
+
+    def _prefetch_discovery_commands(self, namespaces: List[Optional[str]]) -> PrefetchedConnection:
+        """
+        Execute read-only discovery commands of all namespaces in one call, namespaces are read in parallel.
+
+        :param namespaces: Names of network namespaces, None for root namespace
+        :return: Connection serving results of discovery commands
+        """
+        return prefetch_commands(self._connection, self._get_discovery_commands(namespaces))
+
+    def _get_discovery_commands(self, namespaces: List[Optional[str]]) -> List[str]:
+        """
+        Get read-only commands executed by discovery of interfaces in namespaces.
+
+        :param namespaces: Names of network namespaces, None for root namespace
+        :return: List of commands
+        """
+        json_supported = is_json_supported(self._connection)
+        per_namespace = [
+            LSPCI_ETHERNET_COMMAND,
+            SYS_CLASS_NET_COMMAND,
+            "ip -d -j link show type vlan" if json_supported else "ls /proc/net/vlan",
+            PHYSFN_FIND_COMMAND,
+            TUNNEL_LIST_COMMAND,
+            "ip -j link show" if json_supported else "ip a",
+        ]
+        commands = [
+            add_namespace_call_command(command, namespace) for namespace in namespaces for command in per_namespace
+        ]
+        # read by bonding detection for each namespace
+        commands.append("ip addr show")
+        return commands
+
+    def _gather_interfaces_of_namespaces(
+        self, namespaces: List[Optional[str]], connection: "Connection | None" = None
+    ) -> List[LinuxInterfaceInfo]:
+        """
+        Gather interfaces of namespaces.
+
+        :param namespaces: Names of network namespaces, None for root namespace
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
+        :return: List of LinuxInterfaceInfo
+        """
+        interfaces: List[LinuxInterfaceInfo] = []
         for namespace in namespaces:
-            temp_interfaces = self._get_lspci_interfaces(namespace=namespace)
+            temp_interfaces = self._get_lspci_interfaces(namespace=namespace, connection=connection)
             pci_addresses = [x.pci_address for x in interfaces]
             for temp_iface in temp_interfaces:
                 if temp_iface.pci_address not in pci_addresses:
                     interfaces.append(temp_iface)
 
             # PF + Virtual Device + VLAN + VF (MEV IPU based on check if physfn exist)
-            self._update_data_based_on_sys_class_net(interfaces=interfaces, namespace=namespace)
-            interfaces = self._remove_tunnel_interfaces(interfaces=interfaces, namespace=namespace)
+            self._update_data_based_on_sys_class_net(interfaces=interfaces, namespace=namespace, connection=connection)
+            interfaces = self._remove_tunnel_interfaces(
+                interfaces=interfaces, namespace=namespace, connection=connection
+            )
             self._mark_bts_interfaces(interfaces=interfaces)
-            self._update_mac_addresses(interfaces=interfaces, namespace=namespace)
-            self._mark_bonding_interfaces(interfaces=interfaces)
-        self._mark_management_interface(interfaces=interfaces)  # MANAGEMENT
-
+            self._update_mac_addresses(interfaces=interfaces, namespace=namespace, connection=connection)
+            self._mark_bonding_interfaces(interfaces=interfaces, connection=connection)
         return interfaces
 
-    def _mark_bonding_interfaces(self, interfaces: list[LinuxInterfaceInfo]) -> None:
+    def _mark_bonding_interfaces(
+        self, interfaces: list[LinuxInterfaceInfo], connection: "Connection | None" = None
+    ) -> None:
         """
         Mark bonding interfaces.
 
@@ -576,10 +738,11 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         8. Set interface type to BOND if interface is in bonding interfaces list
 
         :param interfaces: List of LinuxInterfaceInfo
+        :param connection: Connection used for discovery commands, e.g. PrefetchedConnection, owner connection if None
         """
         bonding_interfaces = self.bonding.get_bond_interfaces()
         command = "ip addr show"
-        res = self._connection.execute_command(command=command, shell=True)
+        res = (connection or self._connection).execute_command(command=command, shell=True)
         if not res.stdout:
             raise NetworkAdapterModuleException("Empty output while trying to find bonding interfaces.")
 
@@ -662,6 +825,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         # parse kwargs into string if params are given
         if params:
             command.extend([f"{key}={val}" for (key, val) in params.items()])
+        notify_driver_reload(self._connection)
         self._connection.execute_command(" ".join(command))
 
     def load_driver_file(self, *, driver_filepath: "Path", params: Optional[Dict] = None) -> None:
@@ -676,6 +840,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         # parse kwargs into string if params are given
         if params:
             command.extend([f"{key}={val}" for (key, val) in params.items()])
+        notify_driver_reload(self._connection)
         self._connection.execute_command(" ".join(command))
 
     def unload_driver_module(self, *, driver_name: str) -> None:
@@ -685,6 +850,7 @@ class LinuxNetworkAdapterOwner(NetworkAdapterOwner):
         :param driver_name: Name of module with driver
         """
         logger.warning("This API is deprecated. Please use NetworkAdapterOwner.driver.unload_driver_module() instead.")
+        notify_driver_reload(self._connection)
         self._connection.execute_command(f"modprobe -r {driver_name}")
 
     def reload_driver_module(self, *, driver_name: str, reload_time: float = 5, params: Optional[Dict] = None) -> None:
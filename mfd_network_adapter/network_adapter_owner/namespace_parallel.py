@@ -0,0 +1,291 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for execution of owner commands grouped by network namespace, in parallel on the host."""
+
+import logging
+import re
+import shlex
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+
+from . import batch as batch_module
+from .batch import NAMESPACE_PREFIX_REGEX, BatchCall, BatchConnection
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+NAMESPACE_MARKER = "@@MFD_NAMESPACE@@"
+NAMESPACE_MARKER_REGEX = re.compile(rf"^{NAMESPACE_MARKER} (?P<job>\d+) (?P<return_code>\d+)$")
+# number of namespace scripts running at the same time on the host
+MAX_PARALLEL_NAMESPACES = 32
+
+
+@dataclass
+class NamespaceJob:
+    """Script executing calls of single namespace."""
+
+    namespace: str | None
+    calls: list[BatchCall] = field(default_factory=list)
+    script: str = ""
+
+
+class NamespaceParallelConnection(BatchConnection):
+    """
+    Connection proxy, which queues executed commands and runs them grouped by network namespace.
+
+    Commands prefixed with 'ip netns exec <namespace>' (as built by add_namespace_call_command) are sent
+    as one `ip netns exec <namespace> sh -c` script per namespace, commands without prefix as script of root namespace.
+    Scripts of different namespaces run in parallel on the host, commands of single namespace are executed in order,
+    consecutive `ip` commands as one `ip -batch`. Results are assigned back to queued calls.
+    """
+
+    def __init__(self, connection: "Connection", max_parallel: int = MAX_PARALLEL_NAMESPACES) -> None:
+        """
+        Initialize NamespaceParallelConnection.
+
+        :param connection: Object of mfd-connect
+        :param max_parallel: Maximum number of namespace scripts running at the same time
+        """
+        super().__init__(connection)
+        self._max_parallel = max_parallel
+        self._discard_stderr: set[int] = set()
+        # indexes of calls without own marker in output, their results are return code and output of whole script
+        self.unmarked: set[int] = set()
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Iterable[int] | None = frozenset({0}),
+        discard_stderr: bool = False,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Queue command for execution.
+
+        :param command: Command to queue, optionally prefixed with 'ip netns exec <namespace>'
+        :param expected_return_codes: Return codes to be considered acceptable, if None - any return code is accepted
+        :param discard_stderr: Discard stderr of command, by default it is merged into output
+        :param kwargs: Other execute_command parameters, ignored - all queued commands are run in shell
+        :return: Placeholder of result with return code 0 and empty output, real result is stored in BatchCall
+        """
+        result = super().execute_command(command, expected_return_codes=expected_return_codes)
+        if discard_stderr:
+            self._discard_stderr.add(self.calls[-1].index)
+        return result
+
+    def _get_jobs(self) -> list[NamespaceJob]:
+        """
+        Group queued calls into namespace scripts, each fitting into single remote call.
+
+        :return: List of jobs, jobs of the same namespace in order of execution
+        """
+        groups: dict[str | None, list[BatchCall]] = {}
+        for call in self.calls:
+            match = NAMESPACE_PREFIX_REGEX.match(call.command)
+            namespace, command = (match["namespace"], match["command"]) if match else (None, call.command)
+            if call.index in self._discard_stderr:
+                command = f"{{ {command}\n}} 2>/dev/null"
+            groups.setdefault(namespace, []).append(
+                BatchCall(index=call.index, command=command, expected_return_codes=call.expected_return_codes)
+            )
+
+        jobs = []
+        for namespace, calls in groups.items():
+            namespace_batch = BatchConnection(self._connection)
+            namespace_batch.calls = calls
+            for chunk in namespace_batch._split_into_chunks():
+                script = shlex.quote(namespace_batch._build_script(chunk))
+                script = f"ip netns exec {namespace} sh -c {script}" if namespace else f"sh -c {script}"
+                jobs.append(NamespaceJob(namespace=namespace, calls=chunk, script=script))
+        return jobs
+
+    @staticmethod
+    def _split_jobs_into_chunks(jobs: list[NamespaceJob]) -> list[list[NamespaceJob]]:
+        """
+        Split jobs into chunks, each fitting into single remote call.
+
+        Chunk contains at most one job of namespace, so jobs of the same namespace are executed in order.
+
+        :param jobs: Jobs to split
+        :return: List of chunks
+        """
+        chunks: list[list[NamespaceJob]] = [[]]
+        size = 0
+        for job in jobs:
+            job_size = len(job.script) + 64
+            if chunks[-1] and (
+                size + job_size > batch_module.MAX_SCRIPT_SIZE
+                or any(chunk_job.namespace == job.namespace for chunk_job in chunks[-1])
+            ):
+                chunks.append([])
+                size = 0
+            chunks[-1].append(job)
+            size += job_size
+        return chunks
+
+    def _build_parallel_script(self, jobs: list[NamespaceJob]) -> str:
+        """
+        Build shell script running jobs in background, outputs are printed in order of jobs after all finished.
+
+        :param jobs: Jobs to run
+        :return: Shell script
+        """
+        parts = ["d=$(mktemp -d) || exit 1"]
+        for number, job in enumerate(jobs):
+            if number and not number % self._max_parallel:
+                parts.append("wait")
+            parts.append(f'( {job.script}\necho "{NAMESPACE_MARKER} {number} $?" ) >"$d/{number}" 2>&1 </dev/null &')
+        parts.append("wait")
+        parts.append(f'cat {" ".join(f"$d/{number}" for number in range(len(jobs)))}')
+        parts.append('rm -rf "$d"')
+        return "\n".join(parts)
+
+    def _assign_job_results(self, jobs: list[NamespaceJob], output: str) -> None:
+        """
+        Assign return codes and outputs from output of parallel script to calls.
+
+        Calls not reached by namespace script (e.g. namespace does not exist) get return code of the script,
+        with its output.
+
+        :param jobs: Jobs of executed script
+        :param output: Output of executed script
+        """
+        buffer: list[str] = []
+        for line in output.splitlines():
+            match = NAMESPACE_MARKER_REGEX.match(line)
+            if not match:
+                buffer.append(line)
+                continue
+
+            job = jobs[int(match["job"])]
+            job_output = "\n".join(buffer)
+            namespace_batch = BatchConnection(self._connection)
+            namespace_batch.calls = job.calls
+            namespace_batch._assign_results(job_output)
+            for call in job.calls:
+                if call.return_code is None:
+                    self.unmarked.add(call.index)
+                    call.return_code = int(match["return_code"]) or 1
+                    call.output = job_output
+                queued = self.calls[call.index]
+                queued.return_code, queued.output = call.return_code, call.output
+            buffer = []
+
+        for call in (call for job in jobs for call in job.calls if call.return_code is None):
+            # script not executed at all
+            self.unmarked.add(call.index)
+            call.return_code = 1
+            queued = self.calls[call.index]
+            queued.return_code, queued.output = call.return_code, output.strip()
+
+    def execute(self, raise_on_error: bool = True) -> list[BatchCall]:
+        """
+        Execute all queued commands.
+
+        :param raise_on_error: Raise exception if any command returned unexpected return code
+        :return: List of executed calls with results
+        :raises BatchExecutionError: When any of commands failed and raise_on_error is set
+        """
+        if not self.calls:
+            return []
+        chunks = self._split_jobs_into_chunks(self._get_jobs())
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Executing {len(self.calls)} commands in {sum(len(chunk) for chunk in chunks)} namespace script(s), "
+            f"{len(chunks)} call(s).",
+        )
+        for chunk in chunks:
+            result = self._connection.execute_command(
+                self._build_parallel_script(chunk), shell=True, expected_return_codes=None, stderr_to_stdout=True
+            )
+            self._assign_job_results(chunk, result.stdout)
+
+        if raise_on_error:
+            self._raise_on_failures()
+        return self.calls
+
+    def get_results(self, include_unmarked: bool = True) -> dict[str, ConnectionCompletedProcess]:
+        """
+        Get results of executed calls.
+
+        :param include_unmarked: Include calls not reached by namespace script, with result of the script
+        :return: Dictionary {queued command: result}, for repeated command result of the last call
+        """
+        return {
+            call.command: ConnectionCompletedProcess(
+                args=call.command, stdout=call.output, stderr="", return_code=call.return_code
+            )
+            for call in self.calls
+            if call.return_code is not None and (include_unmarked or call.index not in self.unmarked)
+        }
+
+
+class PrefetchedConnection:
+    """
+    Connection proxy serving results of prefetched commands, other commands are passed to wrapped connection.
+
+    Results are served as long as the object exists, so it should be used only for read-only commands
+    in a short block, e.g. single discovery of interfaces.
+    """
+
+    def __init__(self, connection: "Connection", results: dict[str, ConnectionCompletedProcess]) -> None:
+        """
+        Initialize PrefetchedConnection.
+
+        :param connection: Object of mfd-connect
+        :param results: Dictionary {command: result}
+        """
+        self._connection = connection
+        self._results = results
+
+    def __getattr__(self, item: str) -> Any:
+        """Pass not overridden attributes to wrapped connection."""
+        return getattr(self._connection, item)
+
+    def execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """
+        Get result of prefetched command or execute command on wrapped connection.
+
+        :param command: Command to execute
+        :param kwargs: Parameters of execute_command
+        :return: Result of command
+        :raises ConnectionCalledProcessError: When prefetched command returned unexpected return code
+        """
+        result = self._results.get(command)
+        if result is None:
+            return self._connection.execute_command(command, **kwargs)
+        expected_return_codes = kwargs.get("expected_return_codes", frozenset({0}))
+        if expected_return_codes and result.return_code not in expected_return_codes:
+            raise ConnectionCalledProcessError(
+                returncode=result.return_code, cmd=command, output=result.stdout, stderr=result.stderr
+            )
+        return result
+
+
+def prefetch_commands(
+    connection: "Connection", commands: Iterable[str], max_parallel: int = MAX_PARALLEL_NAMESPACES
+) -> PrefetchedConnection:
+    """
+    Execute read-only commands grouped by namespace, in parallel on the host, and get connection serving their results.
+
+    Stderr of prefetched commands is discarded. Commands not reached by their namespace script (e.g. script failed
+    or namespace was removed) are not served from prefetch, they are executed live by returned connection.
+
+    :param connection: Object of mfd-connect
+    :param commands: Commands, optionally prefixed with 'ip netns exec <namespace>'
+    :param max_parallel: Maximum number of namespace scripts running at the same time
+    :return: PrefetchedConnection
+    """
+    parallel = NamespaceParallelConnection(connection, max_parallel=max_parallel)
+    for command in dict.fromkeys(commands):
+        parallel.execute_command(command, expected_return_codes=None, discard_stderr=True)
+    parallel.execute(raise_on_error=False)
+    return PrefetchedConnection(connection, parallel.get_results(include_unmarked=False))
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Module for Network Interface."""
 
+import importlib
 import logging
 import typing
 import warnings
@@ -10,7 +11,7 @@ from functools import lru_cache, cached_property
 from typing import Optional, Union, Any
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_const import Family, DEVICE_IDS, Speed, SPEED_IDS
+from mfd_const import Family, Speed
 from mfd_typing import MACAddress, PCIAddress, OSName, PCIDevice
 from mfd_typing.network_interface import (
     InterfaceType,
@@ -19,6 +20,7 @@ from mfd_typing.network_interface import (
 )
 
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException, NetworkInterfaceIncomparableObject
+from .capabilities import get_family_name, get_speed_name
 from .exceptions import NetworkInterfaceConnectedOSNotSupported, DeviceIDException
 
 from ..stat_checker import StatChecker
@@ -54,6 +56,7 @@ if typing.TYPE_CHECKING:
     from .feature.ens import ENSFeatureType
     from .feature.nic_team import NICTeamFeatureType
     from .feature.mac import MACFeatureType
+    from .feature.packet_steering import PacketSteeringFeatureType
 
 
 logger = logging.getLogger(__name__)
@@ -73,11 +76,6 @@ class NetworkInterface(ABC):
         if cls != NetworkInterface:
             return super().__new__(cls)
 
-        from .linux import LinuxNetworkInterface
-        from .windows import WindowsNetworkInterface
-        from .esxi import ESXiNetworkInterface
-        from .freebsd import FreeBSDNetworkInterface
-
         owner = kwargs.get("owner")
         connection = kwargs.get("connection")
         if not (owner or connection):
@@ -86,17 +84,19 @@ class NetworkInterface(ABC):
                 raise NetworkAdapterModuleException("Owner or preferably connection should be provided.")
         connection = connection if connection is not None else owner._connection
         os_name = connection.get_os_name()
+        # only module of connected OS is imported
         os_name_to_class = {
-            OSName.WINDOWS: WindowsNetworkInterface,
-            OSName.LINUX: LinuxNetworkInterface,
-            OSName.ESXI: ESXiNetworkInterface,
-            OSName.FREEBSD: FreeBSDNetworkInterface,
+            OSName.WINDOWS: (".windows", "WindowsNetworkInterface"),
+            OSName.LINUX: (".linux", "LinuxNetworkInterface"),
+            OSName.ESXI: (".esxi", "ESXiNetworkInterface"),
+            OSName.FREEBSD: (".freebsd", "FreeBSDNetworkInterface"),
         }
 
         if os_name not in os_name_to_class.keys():
             raise NetworkInterfaceConnectedOSNotSupported(f"Not supported OS for NetworkInterface: {os_name}")
 
-        interface_class = os_name_to_class.get(os_name)
+        module_name, class_name = os_name_to_class.get(os_name)
+        interface_class = getattr(importlib.import_module(module_name, __package__), class_name)
         return super().__new__(interface_class)
 
     def __lt__(self, other: Any):
@@ -175,6 +175,7 @@ class NetworkInterface(ABC):
         self._ens: "ENSFeatureType | None" = None
         self._nic_team: "NICTeamFeatureType | None" = None
         self._mac: "MACFeatureType | None" = None
+        self._packet_steering: "PacketSteeringFeatureType | None" = None
 
         self._check_if_intel_vendor = lru_cache()(self.__check_if_intel_vendor)
 
@@ -496,6 +497,16 @@ class NetworkInterface(ABC):
 
         return self._mac
 
+    @property
+    def packet_steering(self) -> "PacketSteeringFeatureType":
+        """Packet Steering (RPS/XPS/aRFS) feature."""
+        if self._packet_steering is None:
+            from .feature.packet_steering import BaseFeaturePacketSteering
+
+            self._packet_steering = BaseFeaturePacketSteering(connection=self._connection, interface=self)
+
+        return self._packet_steering
+
     def __check_if_intel_vendor(self) -> None:
         """Check if Vendor id of interface == 8086."""
         if self.pci_device is None:
@@ -511,10 +522,7 @@ class NetworkInterface(ABC):
         """Get family."""
         self._check_if_intel_vendor()
 
-        interface_family = next(
-            (fam for fam, dev_ids in DEVICE_IDS.items() if f"0x{self.pci_device.device_id}" in dev_ids),
-            None,
-        )
+        interface_family = get_family_name(self.pci_device.device_id)
         if interface_family is None:
             raise DeviceIDException(f"Device ID of {self.pci_device} was not found in DEVICE_IDS consts.")
         return getattr(Family, interface_family)
@@ -524,10 +532,7 @@ class NetworkInterface(ABC):
         """Get speed."""
         self._check_if_intel_vendor()
 
-        interface_speed = next(
-            (speed for speed, dev_ids in SPEED_IDS.items() if f"0x{self.pci_device.device_id}" in dev_ids),
-            None,
-        )
+        interface_speed = get_speed_name(self.pci_device.device_id)
         if interface_speed is None:
             raise DeviceIDException(f"Device ID of {self.pci_device} was not found in SPEED_IDS consts.")
         return Speed(interface_speed)
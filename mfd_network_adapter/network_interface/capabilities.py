@@ -0,0 +1,210 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for capabilities of devices, probed once per PCI device and driver."""
+
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from mfd_const import DEVICE_IDS, SPEED_IDS, Family, Speed
+
+from .data_structures import RingBuffer
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_typing import PCIDevice
+
+CHANNEL_NAMES = ("rx", "tx", "other", "combined")
+
+# generation of driver per connection, increased on driver load/unload to invalidate static data of all interfaces
+_driver_generations: "weakref.WeakKeyDictionary[Connection, int]" = weakref.WeakKeyDictionary()
+# catalog of capabilities per connection, shared by all interfaces of host
+_catalogs: "weakref.WeakKeyDictionary[Connection, DeviceCapabilitiesCatalog]" = weakref.WeakKeyDictionary()
+
+
+def notify_driver_reload(connection: "Connection") -> None:
+    """
+    Invalidate static data of all devices of host, e.g. after driver load, unload or reload.
+
+    :param connection: Object of mfd-connect
+    """
+    _driver_generations[connection] = _driver_generations.get(connection, 0) + 1
+
+
+def get_driver_generation(connection: "Connection") -> int:
+    """
+    Get generation of driver on host, increased by each driver load, unload or reload.
+
+    :param connection: Object of mfd-connect
+    :return: Generation of driver
+    """
+    return _driver_generations.get(connection, 0)
+
+
+@lru_cache(maxsize=None)
+def _get_device_id_index(table: str) -> Dict[str, str]:
+    """Get index {device ID: key} of DEVICE_IDS or SPEED_IDS, first key listing device ID wins."""
+    index = {}
+    for key, device_ids in (DEVICE_IDS if table == "DEVICE_IDS" else SPEED_IDS).items():
+        for device_id in device_ids:
+            index.setdefault(device_id, key)
+    return index
+
+
+def get_family_name(device_id: str) -> Optional[str]:
+    """
+    Get name of family of device from DEVICE_IDS.
+
+    :param device_id: PCI device ID, e.g. 1592
+    :return: Name of Family member, None if device ID is not known
+    """
+    return _get_device_id_index("DEVICE_IDS").get(f"0x{device_id}")
+
+
+def get_speed_name(device_id: str) -> Optional[str]:
+    """
+    Get speed of device from SPEED_IDS.
+
+    :param device_id: PCI device ID, e.g. 1592
+    :return: Value of Speed member, None if device ID is not known
+    """
+    return _get_device_id_index("SPEED_IDS").get(f"0x{device_id}")
+
+
+def get_device_key(pci_device: "PCIDevice") -> Tuple[str, ...]:
+    """
+    Get key of PCI device in catalog, subsystem IDs are part of key when known.
+
+    :param pci_device: PCI device
+    :return: Tuple of vendor, device, subsystem vendor and subsystem device IDs
+    """
+    return tuple(
+        str(value).lower() if value is not None else ""
+        for value in (pci_device.vendor_id, pci_device.device_id, pci_device.sub_vendor_id, pci_device.sub_device_id)
+    )
+
+
+def _to_int(values: Optional[List[str]]) -> Optional[int]:
+    """Convert parsed ethtool value, e.g. ['64'] or ['n/a'], to int."""
+    return int(values[0]) if values and values[0].isdigit() else None
+
+
+def parse_channel_maxima(parameters: Any) -> Dict[str, Optional[int]]:
+    """
+    Get pre-set maximums of channels from parsed ethtool -l output.
+
+    :param parameters: Dataclass with channel parameters
+    :return: Dictionary with maximum number of rx, tx, other and combined channels, None if not supported
+    """
+    return {name: _to_int(getattr(parameters, f"preset_max_{name}", None)) for name in CHANNEL_NAMES}
+
+
+def parse_ring_maxima(parameters: Any) -> RingBuffer:
+    """
+    Get pre-set maximums of ring sizes from parsed ethtool -g output.
+
+    :param parameters: Dataclass with ring parameters
+    :return: RingBuffer with maximum sizes
+    """
+    return RingBuffer(
+        rx=_to_int(getattr(parameters, "preset_max_rx", None)),
+        rx_mini=_to_int(getattr(parameters, "preset_max_rx_mini", None)),
+        rx_jumbo=_to_int(getattr(parameters, "preset_max_rx_jumbo", None)),
+        tx=_to_int(getattr(parameters, "preset_max_tx", None)),
+    )
+
+
+def parse_supported_link_modes(info: Any) -> List[str]:
+    """
+    Get supported link modes from parsed ethtool DEVNAME output.
+
+    :param info: Dataclass with standard device info
+    :return: List of link modes, e.g. ['10000baseT/Full', '25000baseCR/Full']
+    """
+    return [mode for line in getattr(info, "supported_link_modes", []) for mode in line.split()]
+
+
+@dataclass
+class DeviceCapabilities:
+    """
+    Capabilities of PCI device with loaded driver, the same for all its ports.
+
+    Port specific data, e.g. supported link modes depending on transceiver, is not part of capabilities.
+    """
+
+    pci_device: "PCIDevice"
+    driver_name: Optional[str] = None
+    driver_version: Optional[str] = None
+    family: Optional[Family] = None
+    speed: Optional[Speed] = None
+    max_channels: Dict[str, Optional[int]] = field(default_factory=dict)
+    max_rings: RingBuffer = field(default_factory=RingBuffer)
+    max_vfs: Optional[int] = None
+
+
+class DeviceCapabilitiesCatalog:
+    """
+    Capabilities of devices of host, indexed by PCI device.
+
+    Entries are valid for loaded driver, catalog is cleared when driver load, unload or reload is notified.
+    """
+
+    def __init__(self, generation: int = 0) -> None:
+        """
+        Initialize DeviceCapabilitiesCatalog.
+
+        :param generation: Generation of driver on host
+        """
+        self.generation = generation
+        self._entries: Dict[Tuple[str, ...], DeviceCapabilities] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get number of devices in catalog."""
+        return len(self._entries)
+
+    def get(self, pci_device: "PCIDevice", driver_version: Optional[str] = None) -> Optional[DeviceCapabilities]:
+        """
+        Get capabilities of PCI device.
+
+        :param pci_device: PCI device
+        :param driver_version: Version of driver, capabilities probed with other version are not returned
+        :return: DeviceCapabilities, None if device was not probed
+        """
+        capabilities = self._entries.get(get_device_key(pci_device))
+        if capabilities is None or (driver_version is not None and capabilities.driver_version != driver_version):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return capabilities
+
+    def add(self, capabilities: DeviceCapabilities) -> None:
+        """
+        Add capabilities of PCI device.
+
+        :param capabilities: Probed capabilities
+        """
+        self._entries[get_device_key(capabilities.pci_device)] = capabilities
+
+    def clear(self) -> None:
+        """Remove all capabilities."""
+        self._entries.clear()
+
+
+def get_capabilities_catalog(connection: "Connection") -> DeviceCapabilitiesCatalog:
+    """
+    Get catalog of capabilities of devices of host, cleared if driver was reloaded since last call.
+
+    :param connection: Object of mfd-connect
+    :return: DeviceCapabilitiesCatalog shared by all interfaces of host
+    """
+    generation = get_driver_generation(connection)
+    catalog = _catalogs.get(connection)
+    if catalog is None:
+        catalog = _catalogs[connection] = DeviceCapabilitiesCatalog(generation)
+    elif catalog.generation != generation:
+        catalog.clear()
+        catalog.generation = generation
+    return catalog
@@ -5,12 +5,13 @@
 from collections import namedtuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING, Tuple
 
 from mfd_network_adapter.data_structures import State
 
 if TYPE_CHECKING:
     from mfd_typing import MACAddress
+    from .feature.rss.data_structures import RSSIndirectionTable
 
 
 class Switch:
@@ -79,3 +80,52 @@ class SwitchInfo:
 
     switch: "Switch"
     port: str
+
+
+@dataclass
+class InterfaceSnapshot:
+    """
+    Tunable settings of interface captured by snapshot.
+
+    Dictionaries are keyed by ethtool set option names (e.g. rings 'rx', coalesce 'rx-usecs', features 'gro'),
+    settings not reported by driver are not present.
+    """
+
+    mtu: Optional[int] = None
+    tx_queue_len: Optional[int] = None
+    up: Optional[bool] = None
+    rings: Dict[str, int] = field(default_factory=dict)
+    channels: Dict[str, int] = field(default_factory=dict)
+    coalesce: Dict[str, str] = field(default_factory=dict)
+    pause: Dict[str, str] = field(default_factory=dict)
+    features: Dict[str, str] = field(default_factory=dict)
+    private_flags: Dict[str, str] = field(default_factory=dict)
+    wol: Optional[str] = None
+    rss: Optional["RSSIndirectionTable"] = None
+
+    def diff(self, current: "InterfaceSnapshot") -> Dict[str, Tuple[Any, Any]]:
+        """
+        Compare snapshot with current settings.
+
+        :param current: Current settings
+        :return: Dictionary {'<field>[.<key>]': (snapshot value, current value)} of differing settings
+        """
+        differences = {}
+        for name in ("mtu", "tx_queue_len", "up", "wol"):
+            expected, actual = getattr(self, name), getattr(current, name)
+            if expected is not None and expected != actual:
+                differences[name] = (expected, actual)
+        for name in ("rings", "channels", "coalesce", "pause", "features", "private_flags"):
+            actual_values = getattr(current, name)
+            for key, expected in getattr(self, name).items():
+                if actual_values.get(key) != expected:
+                    differences[f"{name}.{key}"] = (expected, actual_values.get(key))
+        if self.rss is not None:
+            actual_rss = current.rss
+            if len(self.rss) and (actual_rss is None or self.rss.entries != actual_rss.entries):
+                differences["rss.entries"] = (list(self.rss.entries), actual_rss and list(actual_rss.entries))
+            for name in ("hash_key", "hash_function"):
+                expected, actual = getattr(self.rss, name), actual_rss and getattr(actual_rss, name)
+                if expected is not None and expected != actual:
+                    differences[f"rss.{name}"] = (expected, actual)
+        return differences
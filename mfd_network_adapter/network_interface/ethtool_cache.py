@@ -0,0 +1,247 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for ethtool facade shared by features of interface, with per query cache policy."""
+
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_ethtool import Ethtool
+
+from .capabilities import (
+    get_capabilities_catalog,
+    get_driver_generation,
+    parse_channel_maxima,
+    parse_ring_maxima,
+    parse_supported_link_modes,
+)
+from .data_structures import RingBuffer
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_typing import PCIDevice
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+
+class EthtoolCachePolicy(Enum):
+    """Cache policy of ethtool query."""
+
+    STATIC = "static"  # cached until driver reload
+    DYNAMIC = "dynamic"  # never cached
+
+
+# Schema of cached queries, queries not listed here (statistics, current settings, features) are dynamic.
+# Static queries return data which changes only with driver (re)load: permanent MAC and maxima.
+# Driver information is dynamic, driver can be upgraded by other means than driver feature (e.g. package manager).
+ETHTOOL_QUERY_POLICIES: Dict[str, EthtoolCachePolicy] = {
+    "get_driver_information": EthtoolCachePolicy.DYNAMIC,
+    "get_perm_hw_address": EthtoolCachePolicy.STATIC,
+    "get_time_stamping_capabilities": EthtoolCachePolicy.STATIC,
+    "get_channel_maxima": EthtoolCachePolicy.STATIC,
+    "get_ring_maxima": EthtoolCachePolicy.STATIC,
+    "get_supported_link_modes": EthtoolCachePolicy.STATIC,
+}
+# static queries answered from capabilities of device, when PCI device of interface was already probed
+CAPABILITY_FIELDS: Dict[str, str] = {
+    "get_channel_maxima": "max_channels",
+    "get_ring_maxima": "max_rings",
+}
+
+
+@dataclass
+class EthtoolCacheStats:
+    """Hits and misses of cached ethtool query."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of hits to all calls, 0 when query was not called."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class CachedEthtool(Ethtool):
+    """
+    Ethtool of interface shared by its features, with cache policy per query defined in ETHTOOL_QUERY_POLICIES.
+
+    Static data is cached until driver reload is notified with notify_driver_reload (done by driver feature of owner)
+    or until invalidate is called. Dynamic queries are always executed, they are passed to Ethtool unchanged.
+    Static queries listed in CAPABILITY_FIELDS are answered without executing ethtool, when capabilities of PCI device
+    are in catalog of host, e.g. probed for other port of the same adapter.
+    """
+
+    def __init__(self, *, connection: "Connection", pci_device: "PCIDevice | None" = None) -> None:
+        """
+        Initialize CachedEthtool.
+
+        :param connection: Object of mfd-connect
+        :param pci_device: PCI device of interface, used to find its capabilities in catalog
+        """
+        super().__init__(connection=connection)
+        self._pci_device = pci_device
+        self._cache: Dict[tuple, Any] = {}
+        self._generation = get_driver_generation(connection)
+        self.cache_stats: Dict[str, EthtoolCacheStats] = {
+            query: EthtoolCacheStats()
+            for query, policy in ETHTOOL_QUERY_POLICIES.items()
+            if policy is EthtoolCachePolicy.STATIC
+        }
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of hits to all calls of static queries."""
+        return EthtoolCacheStats(
+            hits=sum(stats.hits for stats in self.cache_stats.values()),
+            misses=sum(stats.misses for stats in self.cache_stats.values()),
+        ).hit_rate
+
+    def get_hit_rates(self) -> Dict[str, float]:
+        """
+        Get hit rates of static queries.
+
+        :return: Dictionary with hit rate per query
+        """
+        return {query: stats.hit_rate for query, stats in self.cache_stats.items()}
+
+    def invalidate(self) -> None:
+        """Drop cached static data, e.g. after firmware update or driver reload not done by driver feature."""
+        self._cache.clear()
+
+    def _get_cached(self, query: str, key: tuple, getter: Callable[[], Any]) -> Any:
+        """
+        Get result of query from cache or call getter and cache its result, according to policy of query.
+
+        :param query: Name of query
+        :param key: Key of result, e.g. device name and namespace
+        :param getter: Function executing query
+        :return: Result of query
+        """
+        if ETHTOOL_QUERY_POLICIES.get(query) is not EthtoolCachePolicy.STATIC:
+            return getter()
+        generation = get_driver_generation(self._connection)
+        if generation != self._generation:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Driver reloaded, dropping cached ethtool data")
+            self._cache.clear()
+            self._generation = generation
+        if (query, *key) in self._cache:
+            self.cache_stats[query].hits += 1
+            return self._cache[(query, *key)]
+        if query in CAPABILITY_FIELDS and self._pci_device is not None:
+            capabilities = get_capabilities_catalog(self._connection).get(self._pci_device)
+            if capabilities is not None:
+                self.cache_stats[query].hits += 1
+                result = self._cache[(query, *key)] = getattr(capabilities, CAPABILITY_FIELDS[query])
+                return result
+        self.cache_stats[query].misses += 1
+        result = self._cache[(query, *key)] = getter()
+        return result
+
+    def get_perm_hw_address(self, device_name: str, namespace: str | None = None) -> str:
+        """
+        Get permanent hardware address - ethtool -P DEVNAME, cached until driver reload.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: Permanent hardware address
+        """
+        return self._get_cached(
+            "get_perm_hw_address",
+            (device_name, namespace),
+            lambda: super(CachedEthtool, self).get_perm_hw_address(device_name=device_name, namespace=namespace),
+        )
+
+    def get_time_stamping_capabilities(self, device_name: str, namespace: str | None = None) -> str:
+        """
+        Get time stamping capabilities - ethtool -T DEVNAME, cached until driver reload.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: Output of ethtool
+        """
+        return self._get_cached(
+            "get_time_stamping_capabilities",
+            (device_name, namespace),
+            lambda: super(CachedEthtool, self).get_time_stamping_capabilities(
+                device_name=device_name, namespace=namespace
+            ),
+        )
+
+    def get_channel_parameters(self, device_name: str, namespace: str | None = None) -> Any:
+        """
+        Get channel parameters - ethtool -l DEVNAME, always executed, pre-set maximums of output are cached.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: Dataclass with channel parameters
+        """
+        parameters = super().get_channel_parameters(device_name=device_name, namespace=namespace)
+        self._cache.setdefault(("get_channel_maxima", device_name, namespace), parse_channel_maxima(parameters))
+        return parameters
+
+    def get_ring_parameters(self, device_name: str, namespace: str | None = None) -> Any:
+        """
+        Get ring parameters - ethtool -g DEVNAME, always executed, pre-set maximums of output are cached.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: Dataclass with ring parameters
+        """
+        parameters = super().get_ring_parameters(device_name=device_name, namespace=namespace)
+        self._cache.setdefault(("get_ring_maxima", device_name, namespace), parse_ring_maxima(parameters))
+        return parameters
+
+    def get_channel_maxima(self, device_name: str, namespace: str | None = None) -> Dict[str, Optional[int]]:
+        """
+        Get pre-set maximums of channels, cached until driver reload.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: Dictionary with maximum number of rx, tx, other and combined channels, None if not supported
+        """
+        return self._get_cached(
+            "get_channel_maxima",
+            (device_name, namespace),
+            lambda: parse_channel_maxima(
+                super(CachedEthtool, self).get_channel_parameters(device_name=device_name, namespace=namespace)
+            ),
+        )
+
+    def get_ring_maxima(self, device_name: str, namespace: str | None = None) -> RingBuffer:
+        """
+        Get pre-set maximums of ring sizes, cached until driver reload.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: RingBuffer with maximum sizes
+        """
+        return self._get_cached(
+            "get_ring_maxima",
+            (device_name, namespace),
+            lambda: parse_ring_maxima(
+                super(CachedEthtool, self).get_ring_parameters(device_name=device_name, namespace=namespace)
+            ),
+        )
+
+    def get_supported_link_modes(self, device_name: str, namespace: str | None = None) -> List[str]:
+        """
+        Get link modes supported by port, cached per interface until driver reload.
+
+        Link modes depend on transceiver of port, so they are not answered from capabilities of device.
+
+        :param device_name: Name of interface
+        :param namespace: Name of network namespace
+        :return: List of link modes, e.g. ['10000baseT/Full', '25000baseCR/Full']
+        """
+        return self._get_cached(
+            "get_supported_link_modes",
+            (device_name, namespace),
+            lambda: parse_supported_link_modes(
+                super(CachedEthtool, self).get_standard_device_info(device_name=device_name, namespace=namespace)
+            ),
+        )
@@ -205,3 +205,15 @@ class MACFeatureError(NetworkAdapterModuleException):
 
 class MACFeatureExecutionError(NetworkAdapterModuleException, subprocess.CalledProcessError):
     """Handle MAC feature execution exceptions."""
+
+
+class NumaFeatureException(NetworkAdapterModuleException):
+    """Handle NUMA feature exceptions."""
+
+
+class PacketSteeringFeatureException(NetworkAdapterModuleException):
+    """Handle packet steering (RPS/XPS/aRFS) feature exceptions."""
+
+
+class InterfaceSnapshotException(NetworkAdapterModuleException):
+    """Handle interface snapshot restore exceptions."""
@@ -2,9 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for Buffers feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureBuffers
-from .linux import LinuxBuffers
-from .windows import WindowsBuffers
-from .esxi import EsxiBuffers
 
-BuffersFeatureType = BaseFeatureBuffers | LinuxBuffers | WindowsBuffers | EsxiBuffers
+if TYPE_CHECKING:
+    from .linux import LinuxBuffers
+    from .windows import WindowsBuffers
+    from .esxi import EsxiBuffers
+
+    BuffersFeatureType = BaseFeatureBuffers | LinuxBuffers | WindowsBuffers | EsxiBuffers
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"LinuxBuffers": ".linux", "WindowsBuffers": ".windows", "EsxiBuffers": ".esxi"},
+    {"BuffersFeatureType": ("BaseFeatureBuffers", "LinuxBuffers", "WindowsBuffers", "EsxiBuffers")},
+)
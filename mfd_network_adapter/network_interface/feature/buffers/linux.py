@@ -7,7 +7,6 @@ import logging
 from typing import Dict, Optional, TYPE_CHECKING, Union
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool import Ethtool
 from mfd_dmesg import Dmesg
 from mfd_ethtool.const import ETHTOOL_RC_VALUE_UNCHANGED, ETHTOOL_RC_VALUE_OUT_OF_RANGE
 
@@ -36,7 +35,7 @@ class LinuxBuffers(BaseFeatureBuffers):
         """
         super().__init__(connection=connection, interface=interface)
         # create object for ethtool mfd
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
         # create object for dmesg mfd
         self._dmesg = Dmesg(connection=connection)
@@ -115,10 +114,10 @@ class LinuxBuffers(BaseFeatureBuffers):
             - 'min': minimum beffers size supported by the adapter
         :return: RX buffers size of the adapter
         """
-        output = self._ethtool.get_ring_parameters(self._interface().name)
         if attr == BuffersAttribute.MAX:
-            return int(output.preset_max_rx[0])
-        elif attr == BuffersAttribute.MIN:
+            return self._ethtool.get_ring_maxima(self._interface().name).rx
+        output = self._ethtool.get_ring_parameters(self._interface().name)
+        if attr == BuffersAttribute.MIN:
             min_size = self.get_min_buffers()
             if min_size is None:
                 return int(output.current_hw_rx[0])
@@ -138,10 +137,10 @@ class LinuxBuffers(BaseFeatureBuffers):
             - 'min': minimum beffers size supported by the adapter
         :return: TX buffers size of the adapter
         """
-        output = self._ethtool.get_ring_parameters(self._interface().name)
         if attr == BuffersAttribute.MAX:
-            return int(output.preset_max_tx[0])
-        elif attr == BuffersAttribute.MIN:
+            return self._ethtool.get_ring_maxima(self._interface().name).tx
+        output = self._ethtool.get_ring_parameters(self._interface().name)
+        if attr == BuffersAttribute.MIN:
             min_size = self.get_min_buffers()
             if min_size is None:
                 return int(output.current_hw_tx[0])
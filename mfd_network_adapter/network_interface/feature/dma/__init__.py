@@ -2,9 +2,18 @@
 # SPDX-License-Identifier: MIT
 """Module for Dma feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureDma
-from .windows import WindowsDma
 
-DmaFeatureType = Union[BaseFeatureDma, WindowsDma]
+if TYPE_CHECKING:
+    from .windows import WindowsDma
+
+    DmaFeatureType = Union[BaseFeatureDma, WindowsDma]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"WindowsDma": ".windows"}, {"DmaFeatureType": ("BaseFeatureDma", "WindowsDma")}
+)
@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Driver feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureDriver
-from .esxi import EsxiDriver
-from .freebsd import FreeBsdDriver
-from .linux import LinuxDriver
-from .windows import WindowsDriver
 
-DriverFeatureType = Union[BaseFeatureDriver, EsxiDriver, LinuxDriver, FreeBsdDriver, WindowsDriver]
+if TYPE_CHECKING:
+    from .esxi import EsxiDriver
+    from .freebsd import FreeBsdDriver
+    from .linux import LinuxDriver
+    from .windows import WindowsDriver
+
+    DriverFeatureType = Union[BaseFeatureDriver, EsxiDriver, LinuxDriver, FreeBsdDriver, WindowsDriver]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiDriver": ".esxi", "FreeBsdDriver": ".freebsd", "LinuxDriver": ".linux", "WindowsDriver": ".windows"},
+    {"DriverFeatureType": ("BaseFeatureDriver", "EsxiDriver", "LinuxDriver", "FreeBsdDriver", "WindowsDriver")},
+)
@@ -6,7 +6,6 @@ import re
 from typing import Dict, TYPE_CHECKING
 
 from mfd_const import Speed
-from mfd_ethtool import Ethtool
 
 from .base import BaseFeatureDriver
 from ...exceptions import DriverInfoNotFound
@@ -28,7 +27,7 @@ class LinuxDriver(BaseFeatureDriver):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
         self.utils = self._interface().utils
 
     def get_driver_info(self) -> "DriverInfo":
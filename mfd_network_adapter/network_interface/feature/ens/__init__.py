@@ -2,7 +2,18 @@
 # SPDX-License-Identifier: MIT
 """Module for enhanced data path feature feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from mfd_network_adapter.network_interface.feature.ens.base import BaseFeatureENS
-from mfd_network_adapter.network_interface.feature.ens.esxi import ESXiFeatureENS
 
-ENSFeatureType = BaseFeatureENS | ESXiFeatureENS
+if TYPE_CHECKING:
+    from mfd_network_adapter.network_interface.feature.ens.esxi import ESXiFeatureENS
+
+    ENSFeatureType = BaseFeatureENS | ESXiFeatureENS
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__, {"ESXiFeatureENS": ".esxi"}, {"ENSFeatureType": ("BaseFeatureENS", "ESXiFeatureENS")}
+)
@@ -2,15 +2,39 @@
 # SPDX-License-Identifier: MIT
 """Module for Flow Control feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureFlowControl
-from .linux import LinuxFlowControl
-from .freebsd import FreeBsdFlowControl
-from .windows import WindowsFlowControl
-from .esxi import EsxiFlowControl
-from .data_structures import FlowControlParams, FlowHashParams, Direction, FlowControlType
+from .data_structures import FlowControlParams, FlowHashParams, Direction, FlowControlType, NtupleRule
+
+if TYPE_CHECKING:
+    from .linux import LinuxFlowControl
+    from .freebsd import FreeBsdFlowControl
+    from .windows import WindowsFlowControl
+    from .esxi import EsxiFlowControl
+
+    FlowControlFeatureType = Union[
+        BaseFeatureFlowControl, LinuxFlowControl, FreeBsdFlowControl, WindowsFlowControl, EsxiFlowControl
+    ]
 
-FlowControlFeatureType = Union[
-    BaseFeatureFlowControl, LinuxFlowControl, FreeBsdFlowControl, WindowsFlowControl, EsxiFlowControl
-]
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "LinuxFlowControl": ".linux",
+        "FreeBsdFlowControl": ".freebsd",
+        "WindowsFlowControl": ".windows",
+        "EsxiFlowControl": ".esxi",
+    },
+    {
+        "FlowControlFeatureType": (
+            "BaseFeatureFlowControl",
+            "LinuxFlowControl",
+            "FreeBsdFlowControl",
+            "WindowsFlowControl",
+            "EsxiFlowControl",
+        )
+    },
+)
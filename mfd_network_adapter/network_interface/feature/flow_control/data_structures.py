@@ -140,3 +140,51 @@ class Watermark(Enum):
 
 
 PauseParams = namedtuple("PauseParams", ["Pause_Autonegotiate", "Pause_RX", "Pause_TX"])
+
+
+NTUPLE_DROP_ACTION = -1
+
+
+@dataclass
+class NtupleRule:
+    """Dataclass for ethtool n-tuple (flow director) rule, fields set to None are not matched."""
+
+    flow_type: str
+    action: int
+    location: Optional[int] = None
+    src_ip: Optional[str] = None
+    dst_ip: Optional[str] = None
+    src_port: Optional[int] = None
+    dst_port: Optional[int] = None
+    vlan: Optional[int] = None
+    dst_mac: Optional[str] = None
+
+    def __post_init__(self):
+        if self.dst_mac is not None:
+            self.dst_mac = self.dst_mac.lower()
+
+    def to_ethtool_params(self) -> str:
+        """
+        Get rule definition in `ethtool -N` format.
+
+        :return: Parameters, e.g. 'flow-type tcp4 dst-ip 10.0.0.1 dst-port 5201 action 3 loc 0'
+        """
+        params = [f"flow-type {self.flow_type}"]
+        for name, option in NTUPLE_OPTIONS.items():
+            value = getattr(self, name)
+            if value is not None:
+                params.append(f"{option} {value}")
+        params.append(f"action {self.action}")
+        if self.location is not None:
+            params.append(f"loc {self.location}")
+        return " ".join(params)
+
+
+NTUPLE_OPTIONS = {
+    "src_ip": "src-ip",
+    "dst_ip": "dst-ip",
+    "src_port": "src-port",
+    "dst_port": "dst-port",
+    "vlan": "vlan",
+    "dst_mac": "dst-mac",
+}
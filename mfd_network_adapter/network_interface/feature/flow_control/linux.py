@@ -3,15 +3,16 @@
 """Module for Flow Control feature for Linux."""
 
 import logging
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from dataclasses import fields
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool import Ethtool
+from mfd_kernel_namespace import add_namespace_call_command
 from mfd_network_adapter.data_structures import State
 
 from .base import BaseFeatureFlowControl
-from .data_structures import FlowControlParams, FlowHashParams
+from .data_structures import FlowControlParams, FlowHashParams, NtupleRule, NTUPLE_DROP_ACTION
 from ...exceptions import FlowControlException, FlowDirectorException
 
 if TYPE_CHECKING:
@@ -21,6 +22,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+NTUPLE_RULE_TYPES = {
+    "TCP over IPv4": "tcp4",
+    "UDP over IPv4": "udp4",
+    "SCTP over IPv4": "sctp4",
+    "AH over IPv4": "ah4",
+    "ESP over IPv4": "esp4",
+    "Raw IPv4": "ip4",
+    "TCP over IPv6": "tcp6",
+    "UDP over IPv6": "udp6",
+    "SCTP over IPv6": "sctp6",
+    "AH over IPv6": "ah6",
+    "ESP over IPv6": "esp6",
+    "Raw IPv6": "ip6",
+    "Raw Ethernet": "ether",
+}
+NTUPLE_FIELD_REGEX = re.compile(r"^\s*(?P<name>[A-Za-z -]+):\s+(?P<value>\S+)\s+mask:\s+(?P<mask>\S+)\s*$")
+NTUPLE_FIELDS = {
+    "Src IP addr": "src_ip",
+    "Dest IP addr": "dst_ip",
+    "Src port": "src_port",
+    "Dest port": "dst_port",
+    "VLAN": "vlan",
+    "Dest MAC addr": "dst_mac",
+}
+RX_QUEUE_PACKETS_REGEX = re.compile(r"^rx_queue_(?P<queue>\d+)_packets$")
+
 
 class LinuxFlowControl(BaseFeatureFlowControl):
     """Linux class for flow control feature."""
@@ -33,7 +60,7 @@ class LinuxFlowControl(BaseFeatureFlowControl):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
     def get_flow_control(self) -> FlowControlParams:
         """
@@ -135,3 +162,202 @@ class LinuxFlowControl(BaseFeatureFlowControl):
             return State.ENABLED if getattr(output, flag_name)[0] == "on" else State.DISABLED
         else:
             raise FlowDirectorException(f"{flag_name} may be unsupported on the interface {self._interface().name}")
+
+    @staticmethod
+    def _is_wildcard_mask(mask: str) -> bool:
+        """
+        Check whether mask of n-tuple field printed by ethtool ignores all bits, so field is not matched.
+
+        :param mask: Mask, e.g. '255.255.255.255', '0xffff', 'FF:FF:FF:FF:FF:FF'
+        :return: True if field is not matched
+        """
+        parts = re.split(r"[.:]", mask.lower().removeprefix("0x"))
+        return all(part == "255" or (part and set(part) == {"f"}) for part in parts)
+
+    @classmethod
+    def parse_ntuple_rules(cls, output: str) -> Dict[int, NtupleRule]:
+        """
+        Parse n-tuple rules from `ethtool -n <interface>` output.
+
+        :param output: ethtool output
+        :return: Dictionary {location: NtupleRule}
+        """
+        rules = {}
+        for block in re.split(r"^Filter:\s*", output, flags=re.MULTILINE)[1:]:
+            lines = block.splitlines()
+            location = int(lines[0])
+            rule_type = flow_type = None
+            values = {}
+            action = None
+            for line in lines[1:]:
+                line = line.strip()
+                if line.startswith("Rule Type:"):
+                    rule_type = line.removeprefix("Rule Type:").strip()
+                    flow_type = NTUPLE_RULE_TYPES.get(rule_type, rule_type)
+                elif line.startswith("Action:"):
+                    if "Drop" in line:
+                        action = NTUPLE_DROP_ACTION
+                    else:
+                        queue = re.search(r"queue (?P<queue>\d+)", line)
+                        action = int(queue["queue"]) if queue else None
+                else:
+                    match = NTUPLE_FIELD_REGEX.match(line)
+                    if match and match["name"] in NTUPLE_FIELDS and not cls._is_wildcard_mask(match["mask"]):
+                        values[NTUPLE_FIELDS[match["name"]]] = match["value"]
+            if flow_type is None or action is None:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Skipping unsupported rule {location}: {rule_type}")
+                continue
+            for port in ("src_port", "dst_port"):
+                if port in values:
+                    values[port] = int(values[port])
+            if "vlan" in values:
+                values["vlan"] = int(values["vlan"], 16) & 0x0FFF
+            rules[location] = NtupleRule(flow_type=flow_type, action=action, location=location, **values)
+        return rules
+
+    def _get_ntuple_rules_command(self) -> str:
+        """Get command listing n-tuple rules of interface."""
+        return add_namespace_call_command(f"ethtool -n {self._interface().name}", self._interface().namespace)
+
+    def get_ntuple_rules(self) -> Dict[int, NtupleRule]:
+        """
+        Get n-tuple (flow director) rules of the interface.
+
+        :raises FlowDirectorException: When rules cannot be read, e.g. ntuple filters are not supported
+        :return: Dictionary {location: NtupleRule}
+        """
+        result = self._connection.execute_command(
+            self._get_ntuple_rules_command(), expected_return_codes=None, stderr_to_stdout=True
+        )
+        if result.return_code:
+            raise FlowDirectorException(f"Cannot read n-tuple rules of {self._interface().name}: {result.stdout}")
+        return self.parse_ntuple_rules(result.stdout)
+
+    @staticmethod
+    def _allocate_locations(
+        rules: List[NtupleRule], used: Iterable[int], max_locations: Optional[int] = None
+    ) -> List[NtupleRule]:
+        """
+        Assign the lowest free locations to rules without location.
+
+        :param rules: Rules to be added
+        :param used: Locations of existing rules
+        :param max_locations: Size of rule table, unlimited when not given
+        :raises FlowDirectorException: When rule table has not enough free locations
+        :return: Copies of rules with locations
+        """
+        taken = set(used) | {rule.location for rule in rules if rule.location is not None}
+        allocated = []
+        candidate = 0
+        for rule in rules:
+            if rule.location is None:
+                while candidate in taken:
+                    candidate += 1
+                taken.add(candidate)
+                rule = NtupleRule(**{**vars(rule), "location": candidate})
+            if max_locations is not None and rule.location >= max_locations:
+                raise FlowDirectorException(f"No free location for rule {rule.to_ethtool_params()}")
+            allocated.append(rule)
+        return allocated
+
+    def _execute_ntuple_commands(self, params: List[str]) -> Dict[int, NtupleRule]:
+        """
+        Execute `ethtool -N` commands and read rules back, in one remote call.
+
+        :param params: Parameters of each `ethtool -N <interface>` command
+        :raises FlowDirectorException: When any command failed or rules cannot be read
+        :return: Rules after execution, {location: NtupleRule}
+        """
+        # local import, batch module belongs to owner package, which imports interfaces
+        from mfd_network_adapter.network_adapter_owner.batch import BatchConnection
+
+        name, namespace = self._interface().name, self._interface().namespace
+        batch = BatchConnection(self._connection)
+        for param in params:
+            batch.execute_command(add_namespace_call_command(f"ethtool -N {name} {param}", namespace))
+        batch.execute_command(self._get_ntuple_rules_command())
+        calls = batch.execute(raise_on_error=False)
+
+        failed = [call for call in calls if call.failed]
+        if failed:
+            details = "\n".join(f"'{call.command}': {call.output}" for call in failed)
+            raise FlowDirectorException(
+                f"{len(failed)} of {len(calls)} n-tuple commands failed on {name}:\n{details}"
+            )
+        return self.parse_ntuple_rules(calls[-1].output)
+
+    def add_ntuple_rules(
+        self, rules: Iterable[NtupleRule], max_locations: Optional[int] = None
+    ) -> List[NtupleRule]:
+        """
+        Add n-tuple rules in one remote call.
+
+        Rules without location get the lowest free ones, existing rules are read first in that case.
+        Rules are read back after adding and compared with requested ones.
+
+        :param rules: Rules to add
+        :param max_locations: Size of rule table of the device, used to validate allocated locations
+        :raises FlowDirectorException: When any rule cannot be added or doesn't match after adding
+        :return: Added rules with locations
+        """
+        rules = list(rules)
+        used = self.get_ntuple_rules() if any(rule.location is None for rule in rules) else {}
+        rules = self._allocate_locations(rules, used, max_locations)
+        current = self._execute_ntuple_commands([rule.to_ethtool_params() for rule in rules])
+
+        mismatched = [rule for rule in rules if current.get(rule.location) != rule]
+        if mismatched:
+            details = ", ".join(f"{rule.location}: {current.get(rule.location)}" for rule in mismatched)
+            raise FlowDirectorException(f"N-tuple rules not matching after add on {self._interface().name}: {details}")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Added {len(rules)} n-tuple rules.")
+        return rules
+
+    def delete_ntuple_rules(self, locations: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Delete n-tuple rules in one remote call.
+
+        :param locations: Locations of rules to delete, all rules when not given
+        :raises FlowDirectorException: When any rule cannot be deleted
+        :return: Deleted locations
+        """
+        locations = sorted(self.get_ntuple_rules() if locations is None else locations)
+        if not locations:
+            return []
+        current = self._execute_ntuple_commands([f"delete {location}" for location in locations])
+        remaining = [location for location in locations if location in current]
+        if remaining:
+            raise FlowDirectorException(f"N-tuple rules {remaining} still present on {self._interface().name}")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Deleted {len(locations)} n-tuple rules.")
+        return locations
+
+    def verify_ntuple_rule_hits(
+        self, rules: Iterable[NtupleRule], baseline: Dict[str, int], min_packets: int = 1
+    ) -> Dict[int, int]:
+        """
+        Verify that traffic matching rules reached their target queues.
+
+        Packets are counted on Rx queue of each rule action, relative to counters read before traffic.
+        Rules directing to the same queue can't be distinguished, drop rules are not verified.
+
+        :param rules: Rules to verify
+        :param baseline: Per queue packet counters read before traffic (queue.get_per_queue_packet_stats)
+        :param min_packets: Minimal number of packets expected on queue of each rule
+        :raises FlowDirectorException: When queue of any rule received less packets than expected
+        :return: Dictionary {location: number of packets received on rule queue}
+        """
+        counters = self._interface().queue.get_per_queue_packet_stats()
+        received = {}
+        for name, value in counters.items():
+            match = RX_QUEUE_PACKETS_REGEX.match(name)
+            if match:
+                received[int(match["queue"])] = int(value) - int(baseline.get(name, 0))
+
+        hits = {
+            rule.location: received.get(rule.action, 0) for rule in rules if rule.action != NTUPLE_DROP_ACTION
+        }
+        missed = {location: packets for location, packets in hits.items() if packets < min_packets}
+        if missed:
+            raise FlowDirectorException(
+                f"N-tuple rules not hit on {self._interface().name}, packets on rule queues: {missed}"
+            )
+        return hits
@@ -2,10 +2,21 @@
 # SPDX-License-Identifier: MIT
 """Module for Inter Frame feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureInterFrame
-from .windows import WindowsInterFrame
 from .data_structures import InterFrameInfo
 
-InterFrameFeatureType = Union[BaseFeatureInterFrame, WindowsInterFrame]
+if TYPE_CHECKING:
+    from .windows import WindowsInterFrame
+
+    InterFrameFeatureType = Union[BaseFeatureInterFrame, WindowsInterFrame]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"WindowsInterFrame": ".windows"},
+    {"InterFrameFeatureType": ("BaseFeatureInterFrame", "WindowsInterFrame")},
+)
@@ -2,12 +2,36 @@
 # SPDX-License-Identifier: MIT
 """Module for Interrupt feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureInterrupt
-from .esxi import EsxiInterrupt
-from .windows import WindowsInterrupt
-from .linux import LinuxInterrupt
-from .freebsd import FreeBsdInterrupt
 
-InterruptFeatureType = BaseFeatureInterrupt | EsxiInterrupt | WindowsInterrupt | LinuxInterrupt | FreeBsdInterrupt
+if TYPE_CHECKING:
+    from .esxi import EsxiInterrupt
+    from .windows import WindowsInterrupt
+    from .linux import LinuxInterrupt
+    from .freebsd import FreeBsdInterrupt
+
+    InterruptFeatureType = BaseFeatureInterrupt | EsxiInterrupt | WindowsInterrupt | LinuxInterrupt | FreeBsdInterrupt
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "EsxiInterrupt": ".esxi",
+        "WindowsInterrupt": ".windows",
+        "LinuxInterrupt": ".linux",
+        "FreeBsdInterrupt": ".freebsd",
+    },
+    {
+        "InterruptFeatureType": (
+            "BaseFeatureInterrupt",
+            "EsxiInterrupt",
+            "WindowsInterrupt",
+            "LinuxInterrupt",
+            "FreeBsdInterrupt",
+        )
+    },
+)
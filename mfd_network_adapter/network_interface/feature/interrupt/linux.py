@@ -9,7 +9,6 @@ from typing import TYPE_CHECKING, List, Dict
 
 from mfd_common_libs import add_logging_level, log_levels
 from ...exceptions import InterruptFeatureException
-from mfd_ethtool.base import Ethtool
 from mfd_network_adapter.data_structures import State
 from .const import InterruptMode
 from collections import Counter
@@ -41,7 +40,7 @@ class LinuxInterrupt(BaseFeatureInterrupt):
         super().__init__(connection=connection, interface=interface)
 
         # create object for ethtool mfd
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
     def set_interrupt_moderation_rate(self, rxvalue: str, txvalue: str | None = None) -> None:
         """Set interrupt moderation rate value.
@@ -327,6 +326,33 @@ class LinuxInterrupt(BaseFeatureInterrupt):
         cmd = f"grep '{self._interface().name}\\|CPU' /proc/interrupts"
         return self._connection.execute_command(cmd).stdout
 
+    def get_queue_irqs(self) -> dict[str, int]:
+        """
+        Get IRQ numbers of interface queues, based on /proc/interrupts naming, e.g. '<interface>-TxRx-0'.
+
+        :return: Dictionary {queue name: IRQ number}, ordered by queue index
+        """
+        return self.parse_queue_irqs(self._read_proc_interrupts(), self._interface().name)
+
+    @staticmethod
+    def parse_queue_irqs(output: str, interface_name: str) -> dict[str, int]:
+        """
+        Parse IRQ numbers of interface queues from /proc/interrupts output.
+
+        Queue names may be prefixed with driver name, e.g. 'ice-ens1f0-TxRx-0' (ice, i40e).
+
+        :param output: /proc/interrupts output
+        :param interface_name: Name of interface
+        :return: Dictionary {queue name: IRQ number}, ordered by queue index
+        """
+        # name of interface has to follow whitespace or '-' of driver prefix, so 'xens1f0' doesn't match 'ens1f0'
+        queue_regex = re.compile(
+            rf"^\s*(?P<irq>\d+):.*\s(?P<queue>(?:\S+-)?{re.escape(interface_name)}-(TxRx|rx|tx)-(?P<index>\d+))\s*$",
+            re.MULTILINE,
+        )
+        matches = sorted(queue_regex.finditer(output), key=lambda match: int(match["index"]))
+        return {match["queue"]: int(match["irq"]) for match in matches}
+
     def _read_proc_interrupts(self) -> str:
         """Read proc interrupts.
 
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Module for IP feature for Linux."""
 
+import json
 import logging
 import re
 from ipaddress import IPv4Interface, IPv6Interface
@@ -14,6 +15,9 @@ from mfd_kernel_namespace import add_namespace_call_command
 from mfd_typing import MACAddress
 
 from mfd_network_adapter.data_structures import State
+from mfd_network_adapter.iproute2 import is_json_supported
+from mfd_network_adapter.network_adapter_owner.exceptions import EventsFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.events.data_structures import EventType
 from .base import BaseFeatureIP
 from .data_structures import IPs, IPVersion, DynamicIPType
 from ..link import LinkState
@@ -23,6 +27,7 @@ if TYPE_CHECKING:
     from mfd_connect import Connection
     from mfd_connect.base import ConnectionCompletedProcess
     from mfd_network_adapter import NetworkInterface
+    from mfd_network_adapter.network_adapter_owner.feature.events.linux import EventSubscription
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -44,8 +49,16 @@ class LinuxIP(BaseFeatureIP):
         """
         Get IPs from the interface.
 
+        JSON output of `ip` is parsed, when supported by the host.
+
         :return: IPs object.
         """
+        if is_json_supported(self._connection):
+            cmd = add_namespace_call_command(
+                f"ip -j addr show dev {self._interface().name}", namespace=self._interface().namespace
+            )
+            return self._get_ips_from_json(self._connection.execute_command(cmd).stdout)
+
         output = self._ip_addr_show()
         inet_regex = re.compile(r"(?P<version>inet6?)\s+(?P<ip>\S+)/(?P<mask>\d+)\s+")
         ips = IPs()
@@ -64,6 +77,26 @@ class LinuxIP(BaseFeatureIP):
 
         return ips
 
+    @staticmethod
+    def _get_ips_from_json(output: str) -> IPs:
+        """
+        Get IPs, which are not in tentative state, from JSON output.
+
+        :param output: Output of `ip -j addr show dev <interface>`
+        :return: IPs object.
+        """
+        ips = IPs()
+        for link in json.loads(output or "[]"):
+            for address in link.get("addr_info", []):
+                if "local" not in address or address.get("tentative"):
+                    continue
+                ip_with_mask = f"{address['local']}/{address['prefixlen']}"
+                if address["family"] == "inet6":
+                    ips.v6.append(IPv6Interface(ip_with_mask))
+                elif address["family"] == "inet":
+                    ips.v4.append(IPv4Interface(ip_with_mask))
+        return ips
+
     def add_ip(self, ip: Union[IPv4Interface, IPv6Interface]) -> None:
         """
         Add IP to interface.
@@ -349,12 +382,20 @@ class LinuxIP(BaseFeatureIP):
         """
         return "tentative" in self._ip_addr_show().casefold()
 
-    def wait_till_tentative_exit(self, ip: Union[IPv4Interface, IPv6Interface], timeout: int = 15) -> None:
+    def wait_till_tentative_exit(
+        self,
+        ip: Union[IPv4Interface, IPv6Interface],
+        timeout: int = 15,
+        subscription: "EventSubscription | None" = None,
+    ) -> None:
         """
         Wait till the given address will exit tentative state.
 
+        When events subscription is passed, DAD completion event is awaited instead of polling the address state.
+
         :param ip: IP on which we'll wait
         :param timeout: Timeout
+        :param subscription: Events subscription started on the owner before the address was added
         :raises IPFeatureException: When timeout, while waiting on status change
         :raises IPFeatureException: When IP not found on interface
         """
@@ -371,10 +412,37 @@ class LinuxIP(BaseFeatureIP):
                 logger.log(level=log_levels.MODULE_DEBUG, msg=f"{ip} is not in tentative state.")
                 return
 
+            if subscription is not None:
+                self._wait_for_dad_event(ip, timeout, subscription)
+                return
+
             sleep(1)
 
         raise IPFeatureException(f"{ip} still in tentative mode after {timeout}s.")
 
+    def _wait_for_dad_event(
+        self, ip: Union[IPv4Interface, IPv6Interface], timeout: int, subscription: "EventSubscription"
+    ) -> None:
+        """
+        Wait for address event reporting end of Duplicate Address Detection.
+
+        :param ip: IP on which we'll wait
+        :param timeout: Timeout
+        :param subscription: Events subscription
+        :raises IPFeatureException: When timeout, while waiting on status change
+        """
+        try:
+            event = subscription.wait_for(
+                EventType.ADDRESS_ADDED,
+                interface_name=self._interface().name,
+                ip=ip,
+                predicate=lambda e: "tentative" not in e.flags,
+                timeout=timeout,
+            )
+        except EventsFeatureException as e:
+            raise IPFeatureException(f"{ip} still in tentative mode after {timeout}s.") from e
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"{ip} exited tentative state at {event.timestamp}.")
+
     def get_ipv6_autoconf(self) -> State:
         """
         Get ipv6 autoconfiguration state.
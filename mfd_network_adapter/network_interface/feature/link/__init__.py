@@ -2,13 +2,24 @@
 # SPDX-License-Identifier: MIT
 """Module for Link feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureLink
 from .data_structures import LinkState, DuplexType, AutoNeg, Speed
-from .esxi import EsxiLink
-from .freebsd import FreeBsdLink
-from .linux import LinuxLink
-from .windows import WindowsLink
 
-LinkFeatureType = Union[BaseFeatureLink, EsxiLink, FreeBsdLink, LinuxLink, WindowsLink]
+if TYPE_CHECKING:
+    from .esxi import EsxiLink
+    from .freebsd import FreeBsdLink
+    from .linux import LinuxLink
+    from .windows import WindowsLink
+
+    LinkFeatureType = Union[BaseFeatureLink, EsxiLink, FreeBsdLink, LinuxLink, WindowsLink]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiLink": ".esxi", "FreeBsdLink": ".freebsd", "LinuxLink": ".linux", "WindowsLink": ".windows"},
+    {"LinkFeatureType": ("BaseFeatureLink", "EsxiLink", "FreeBsdLink", "LinuxLink", "WindowsLink")},
+)
@@ -8,7 +8,6 @@ import time
 from typing import Dict, List, Union, TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool import Ethtool
 from mfd_kernel_namespace import add_namespace_call_command
 
 from .base import BaseFeatureLink
@@ -34,7 +33,7 @@ class LinuxLink(BaseFeatureLink):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
     def set_link(self, state: LinkState) -> None:
         """
@@ -2,11 +2,22 @@
 # SPDX-License-Identifier: MIT
 """Module for LLDP feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureLLDP
-from .windows import WindowsLLDP
-from .linux import LinuxLLDP
-from .freebsd import FreeBsdLLDP
 
-LLDPFeatureType = Union[BaseFeatureLLDP, WindowsLLDP, LinuxLLDP, FreeBsdLLDP]
+if TYPE_CHECKING:
+    from .windows import WindowsLLDP
+    from .linux import LinuxLLDP
+    from .freebsd import FreeBsdLLDP
+
+    LLDPFeatureType = Union[BaseFeatureLLDP, WindowsLLDP, LinuxLLDP, FreeBsdLLDP]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"WindowsLLDP": ".windows", "LinuxLLDP": ".linux", "FreeBsdLLDP": ".freebsd"},
+    {"LLDPFeatureType": ("BaseFeatureLLDP", "WindowsLLDP", "LinuxLLDP", "FreeBsdLLDP")},
+)
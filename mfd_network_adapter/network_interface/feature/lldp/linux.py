@@ -6,7 +6,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool.base import Ethtool
 from mfd_const import Speed
 from mfd_network_adapter.network_interface.feature.utils.base import BaseFeatureUtils
 from mfd_network_adapter.network_interface.exceptions import LLDPFeatureException
@@ -35,7 +34,7 @@ class LinuxLLDP(BaseFeatureLLDP):
         """
         super().__init__(connection=connection, interface=interface)
         # create object for ethtool mfd
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
     def set_fwlldp(self, enabled: State) -> None:
         """Enable or disable FW-LLDP in NIC's registry.
@@ -2,7 +2,16 @@
 # SPDX-License-Identifier: MIT
 """MAC Feature module."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureMAC
-from .linux import LinuxMAC
 
-MACFeatureType = BaseFeatureMAC | LinuxMAC
+if TYPE_CHECKING:
+    from .linux import LinuxMAC
+
+    MACFeatureType = BaseFeatureMAC | LinuxMAC
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(__name__, {"LinuxMAC": ".linux"}, {"MACFeatureType": ("BaseFeatureMAC", "LinuxMAC")})
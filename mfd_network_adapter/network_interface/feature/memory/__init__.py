@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Memory feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureMemory
-from .esxi import EsxiMemory
-from .freebsd import FreeBsdMemory
-from .linux import LinuxMemory
-from .windows import WindowsMemory
 
-MemoryFeatureType = Union[BaseFeatureMemory, EsxiMemory, FreeBsdMemory, LinuxMemory, WindowsMemory]
+if TYPE_CHECKING:
+    from .esxi import EsxiMemory
+    from .freebsd import FreeBsdMemory
+    from .linux import LinuxMemory
+    from .windows import WindowsMemory
+
+    MemoryFeatureType = Union[BaseFeatureMemory, EsxiMemory, FreeBsdMemory, LinuxMemory, WindowsMemory]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiMemory": ".esxi", "FreeBsdMemory": ".freebsd", "LinuxMemory": ".linux", "WindowsMemory": ".windows"},
+    {"MemoryFeatureType": ("BaseFeatureMemory", "EsxiMemory", "FreeBsdMemory", "LinuxMemory", "WindowsMemory")},
+)
@@ -2,13 +2,24 @@
 # SPDX-License-Identifier: MIT
 """Module for MTU feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureMTU
 from .data_structures import MtuSize
-from .esxi import EsxiMTU
-from .freebsd import FreeBsdMTU
-from .linux import LinuxMTU
-from .windows import WindowsMTU
 
-MTUFeatureType = Union[BaseFeatureMTU, EsxiMTU, FreeBsdMTU, LinuxMTU, WindowsMTU]
+if TYPE_CHECKING:
+    from .esxi import EsxiMTU
+    from .freebsd import FreeBsdMTU
+    from .linux import LinuxMTU
+    from .windows import WindowsMTU
+
+    MTUFeatureType = Union[BaseFeatureMTU, EsxiMTU, FreeBsdMTU, LinuxMTU, WindowsMTU]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiMTU": ".esxi", "FreeBsdMTU": ".freebsd", "LinuxMTU": ".linux", "WindowsMTU": ".windows"},
+    {"MTUFeatureType": ("BaseFeatureMTU", "EsxiMTU", "FreeBsdMTU", "LinuxMTU", "WindowsMTU")},
+)
@@ -2,10 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for NICTeam feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureNICTeam
-from .esxi import EsxiNICTeam
-from .freebsd import FreeBsdNICTeam
-from .linux import LinuxNICTeam
-from .windows import WindowsNICTeam
 
-NICTeamFeatureType = BaseFeatureNICTeam | EsxiNICTeam | FreeBsdNICTeam | LinuxNICTeam | WindowsNICTeam
+if TYPE_CHECKING:
+    from .esxi import EsxiNICTeam
+    from .freebsd import FreeBsdNICTeam
+    from .linux import LinuxNICTeam
+    from .windows import WindowsNICTeam
+
+    NICTeamFeatureType = BaseFeatureNICTeam | EsxiNICTeam | FreeBsdNICTeam | LinuxNICTeam | WindowsNICTeam
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiNICTeam": ".esxi", "FreeBsdNICTeam": ".freebsd", "LinuxNICTeam": ".linux", "WindowsNICTeam": ".windows"},
+    {"NICTeamFeatureType": ("BaseFeatureNICTeam", "EsxiNICTeam", "FreeBsdNICTeam", "LinuxNICTeam", "WindowsNICTeam")},
+)
@@ -2,13 +2,24 @@
 # SPDX-License-Identifier: MIT
 """Module for Numa feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureNuma
 from .data_structures import NumaInfo
-from .esxi import EsxiNuma
-from .freebsd import FreeBsdNuma
-from .linux import LinuxNuma
-from .windows import WindowsNuma
 
-NumaFeatureType = Union[BaseFeatureNuma, EsxiNuma, FreeBsdNuma, LinuxNuma, WindowsNuma]
+if TYPE_CHECKING:
+    from .esxi import EsxiNuma
+    from .freebsd import FreeBsdNuma
+    from .linux import LinuxNuma
+    from .windows import WindowsNuma
+
+    NumaFeatureType = Union[BaseFeatureNuma, EsxiNuma, FreeBsdNuma, LinuxNuma, WindowsNuma]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiNuma": ".esxi", "FreeBsdNuma": ".freebsd", "LinuxNuma": ".linux", "WindowsNuma": ".windows"},
+    {"NumaFeatureType": ("BaseFeatureNuma", "EsxiNuma", "FreeBsdNuma", "LinuxNuma", "WindowsNuma")},
+)
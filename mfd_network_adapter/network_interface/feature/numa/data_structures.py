@@ -10,3 +10,46 @@ class NumaInfo:
     """Dataclass for NUMA Node."""
 
     NUMA_NODE_ID = "*NumaNodeId"
+
+
+@dataclass(frozen=True)
+class CPUInfo:
+    """Dataclass for logical CPU placement in topology."""
+
+    cpu: int
+    core: int
+    socket: int
+    node: int
+
+
+@dataclass
+class CPUTopology:
+    """Dataclass for CPU/NUMA topology of the host."""
+
+    cpus: list[CPUInfo]
+
+    @property
+    def nodes(self) -> list[int]:
+        """Get sorted NUMA node IDs."""
+        return sorted({cpu.node for cpu in self.cpus})
+
+    def get_node_cpus(self, node: int) -> list[CPUInfo]:
+        """
+        Get logical CPUs of NUMA node.
+
+        :param node: NUMA node ID
+        :return: List of CPUInfo objects
+        """
+        return [cpu for cpu in self.cpus if cpu.node == node]
+
+    def get_siblings(self, cpu: int) -> list[int]:
+        """
+        Get Hyper-Threading siblings of logical CPU (other threads of the same physical core).
+
+        :param cpu: Logical CPU ID
+        :return: List of logical CPU IDs
+        """
+        info = next(item for item in self.cpus if item.cpu == cpu)
+        return [
+            item.cpu for item in self.cpus if (item.socket, item.core) == (info.socket, info.core) and item.cpu != cpu
+        ]
@@ -3,14 +3,191 @@
 """Module for Numa feature for Linux."""
 
 import logging
+import re
+from typing import TYPE_CHECKING, Iterable
 
 from mfd_common_libs import add_logging_level, log_levels
 
 from .base import BaseFeatureNuma
+from .data_structures import CPUInfo, CPUTopology
+from ..interrupt.linux import LinuxInterrupt
+from ...exceptions import NumaFeatureException, NumaNodeException
+
+if TYPE_CHECKING:
+    from mfd_network_adapter import NetworkInterface
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+AFFINITY_MARKER = "@@MFD_IRQ_AFFINITY@@"
+AFFINITY_REGEX = re.compile(r"^/proc/irq/(?P<irq>\d+)/smp_affinity_list:(?P<cpus>\S+)$", re.MULTILINE)
+
+
+def _parse_cpu_list(cpus: int | str | None) -> frozenset[int] | None:
+    """
+    Parse CPU list to set of CPUs, kernel may format the same list differently, e.g. '3,2' as '2-3'.
+
+    :param cpus: CPU or CPU list, e.g. 3 or '0-3,8'
+    :return: Set of CPUs, None if value is not valid CPU list
+    """
+    result = set()
+    for part in str(cpus).split(","):
+        first, _, last = part.strip().partition("-")
+        if not first.isdigit() or (last and not last.isdigit()):
+            return None
+        result.update(range(int(first), int(last or first) + 1))
+    return frozenset(result)
+
 
 class LinuxNuma(BaseFeatureNuma):
     """Linux class for Numa feature."""
+
+    def get_cpu_topology(self) -> CPUTopology:
+        """
+        Get CPU/NUMA topology of the host.
+
+        :return: CPUTopology object
+        """
+        output = self._connection.execute_command("lscpu -p=CPU,CORE,SOCKET,NODE").stdout
+        cpus = []
+        for line in output.splitlines():
+            if not line or line.startswith("#"):
+                continue
+            cpu, core, socket, node = (int(value) if value else 0 for value in line.split(","))
+            cpus.append(CPUInfo(cpu=cpu, core=core, socket=socket, node=node))
+        return CPUTopology(cpus=cpus)
+
+    @staticmethod
+    def _compute_irq_placement(
+        topology: CPUTopology, interfaces_irqs: list[tuple[int, list[int]]], allow_remote: bool = False
+    ) -> dict[int, int]:
+        """
+        Compute CPU for each IRQ.
+
+        Queues of all interfaces are assigned round-robin, each to the least loaded physical core.
+        Local cores are used first, HT siblings only when all cores already have IRQs,
+        remote NUMA nodes only when allowed or when local node has no CPUs.
+
+        :param topology: CPU topology of the host
+        :param interfaces_irqs: List of tuples (NUMA node of interface, IRQs of its queues)
+        :param allow_remote: Use cores of remote NUMA nodes before HT siblings of local cores
+        :return: Dictionary {IRQ: CPU}
+        """
+        cpu_load = {info.cpu: 0 for info in topology.cpus}
+        core_load = {(info.socket, info.core): 0 for info in topology.cpus}
+        candidates = []
+        for node, _ in interfaces_irqs:
+            local = [(info, False) for info in topology.cpus if info.node == node]
+            if not local:
+                # unknown NUMA node of interface (-1) or node without CPUs
+                local = [(info, False) for info in topology.cpus]
+            elif allow_remote:
+                local.extend((info, True) for info in topology.cpus if info.node != node)
+            candidates.append(local)
+
+        placement = {}
+        max_queues = max((len(irqs) for _, irqs in interfaces_irqs), default=0)
+        for queue_index in range(max_queues):
+            for (_, irqs), interface_candidates in zip(interfaces_irqs, candidates):
+                if queue_index >= len(irqs):
+                    continue
+                info, _ = min(
+                    interface_candidates,
+                    key=lambda item: (core_load[(item[0].socket, item[0].core)], cpu_load[item[0].cpu], item[1]),
+                )
+                placement[irqs[queue_index]] = info.cpu
+                cpu_load[info.cpu] += 1
+                core_load[(info.socket, info.core)] += 1
+        return placement
+
+    def plan_irq_affinity(
+        self,
+        other_interfaces: Iterable["NetworkInterface"] = (),
+        allow_remote: bool = False,
+        topology: CPUTopology | None = None,
+    ) -> dict[int, int]:
+        """
+        Plan affinity of queue IRQs of the interface and other interfaces sharing the host CPUs.
+
+        Queues are placed on cores local to the interface NUMA node first, HT siblings are used only when
+        all local cores already serve IRQs, queues of multiple interfaces are spread over different cores.
+
+        :param other_interfaces: Other interfaces of the same host, which queues should be spread together
+        :param allow_remote: Use cores of remote NUMA nodes before HT siblings of local cores
+        :param topology: CPU topology, read from the host when not given
+        :return: Dictionary {IRQ: CPU}
+        :raises NumaFeatureException: When no queue IRQs found
+        """
+        topology = topology or self.get_cpu_topology()
+        interfaces = [self._interface(), *other_interfaces]
+        proc_interrupts = self._connection.execute_command("cat /proc/interrupts").stdout
+
+        interfaces_irqs = []
+        for interface in interfaces:
+            irqs = list(LinuxInterrupt.parse_queue_irqs(proc_interrupts, interface.name).values())
+            if not irqs:
+                raise NumaFeatureException(f"No queue IRQs found for interface: {interface.name}")
+            interfaces_irqs.append((interface.get_numa_node(), irqs))
+
+        placement = self._compute_irq_placement(topology, interfaces_irqs, allow_remote=allow_remote)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Planned IRQ affinity: {placement}")
+        return placement
+
+    def get_irq_affinity(self, irqs: Iterable[int]) -> dict[int, str]:
+        """
+        Get affinity of IRQs.
+
+        :param irqs: IRQ numbers
+        :return: Dictionary {IRQ: CPU list, e.g. '0-3,8'}
+        """
+        files = " ".join(f"/proc/irq/{irq}/smp_affinity_list" for irq in irqs)
+        output = self._connection.execute_command(f"grep -H . {files}", shell=True, expected_return_codes=None).stdout
+        return {int(match["irq"]): match["cpus"] for match in AFFINITY_REGEX.finditer(output)}
+
+    def set_irq_affinity(self, affinity: dict[int, int | str]) -> dict[int, str]:
+        """
+        Set affinity of IRQs in one remote call and verify it.
+
+        Previous affinity is read in the same call and returned, to be restored with restore_irq_affinity.
+        Note: irqbalance service may override the affinity.
+
+        :param affinity: Dictionary {IRQ: CPU or CPU list, e.g. 3 or '0-3,8'}
+        :return: Snapshot of previous affinity {IRQ: CPU list}
+        :raises NumaFeatureException: When affinity of any IRQ does not match after write
+        :raises NumaNodeException: When output of affinity script is incomplete
+        """
+        if not affinity:
+            return {}
+        files = " ".join(f"/proc/irq/{irq}/smp_affinity_list" for irq in affinity)
+        script = [f"grep -H . {files}", f"echo {AFFINITY_MARKER}"]
+        script.extend(f"echo {cpus} > /proc/irq/{irq}/smp_affinity_list" for irq, cpus in affinity.items())
+        script.extend([f"echo {AFFINITY_MARKER}", f"grep -H . {files}"])
+        output = self._connection.execute_command(
+            "\n".join(script), shell=True, expected_return_codes=None, stderr_to_stdout=True
+        ).stdout
+
+        sections = output.split(f"{AFFINITY_MARKER}\n", 2)
+        if len(sections) != 3:
+            raise NumaNodeException(f"Affinity of IRQs not verified, markers not found in output: {output}")
+        before, errors, after = sections
+        snapshot = {int(match["irq"]): match["cpus"] for match in AFFINITY_REGEX.finditer(before)}
+        current = {int(match["irq"]): match["cpus"] for match in AFFINITY_REGEX.finditer(after)}
+        mismatched = [
+            irq
+            for irq, cpus in affinity.items()
+            if _parse_cpu_list(cpus) is None or _parse_cpu_list(current.get(irq)) != _parse_cpu_list(cpus)
+        ]
+        if mismatched:
+            details = ", ".join(f"{irq}: expected {affinity[irq]}, current {current.get(irq)}" for irq in mismatched)
+            raise NumaFeatureException(f"Affinity of IRQs not set - {details}\n{errors.strip()}")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Affinity set for {len(affinity)} IRQs.")
+        return snapshot
+
+    def restore_irq_affinity(self, snapshot: dict[int, str]) -> None:
+        """
+        Restore affinity of IRQs from snapshot returned by set_irq_affinity.
+
+        :param snapshot: Dictionary {IRQ: CPU list}
+        :raises NumaFeatureException: When affinity of any IRQ does not match after write
+        """
+        self.set_irq_affinity(snapshot)
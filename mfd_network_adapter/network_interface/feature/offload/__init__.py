@@ -2,10 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Offload feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureOffload
-from .esxi import EsxiOffload
-from .freebsd import FreeBsdOffload
-from .linux import LinuxOffload
-from .windows import WindowsOffload
 
-OffloadFeatureType = BaseFeatureOffload | WindowsOffload | LinuxOffload | FreeBsdOffload | EsxiOffload
+if TYPE_CHECKING:
+    from .esxi import EsxiOffload
+    from .freebsd import FreeBsdOffload
+    from .linux import LinuxOffload
+    from .windows import WindowsOffload
+
+    OffloadFeatureType = BaseFeatureOffload | WindowsOffload | LinuxOffload | FreeBsdOffload | EsxiOffload
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiOffload": ".esxi", "FreeBsdOffload": ".freebsd", "LinuxOffload": ".linux", "WindowsOffload": ".windows"},
+    {"OffloadFeatureType": ("BaseFeatureOffload", "WindowsOffload", "LinuxOffload", "FreeBsdOffload", "EsxiOffload")},
+)
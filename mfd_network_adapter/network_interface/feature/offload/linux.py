@@ -7,7 +7,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool import Ethtool
 from mfd_ethtool.exceptions import EthtoolExecutionError
 
 from .base import BaseFeatureOffload
@@ -33,7 +32,7 @@ class LinuxOffload(BaseFeatureOffload):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
     @staticmethod
     def _convert_offload_setting(value: list[str]) -> OffloadSetting:
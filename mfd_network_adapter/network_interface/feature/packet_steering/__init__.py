@@ -0,0 +1,22 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Packet Steering (RPS/XPS/aRFS) feature."""
+
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
+from .base import BaseFeaturePacketSteering
+from .data_structures import PacketSteeringSettings
+
+if TYPE_CHECKING:
+    from .linux import LinuxPacketSteering, cpus_to_mask, mask_to_cpus
+
+    PacketSteeringFeatureType = BaseFeaturePacketSteering | LinuxPacketSteering
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"LinuxPacketSteering": ".linux", "cpus_to_mask": ".linux", "mask_to_cpus": ".linux"},
+    {"PacketSteeringFeatureType": ("BaseFeaturePacketSteering", "LinuxPacketSteering")},
+)
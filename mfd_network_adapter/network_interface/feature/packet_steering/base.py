@@ -0,0 +1,11 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Base Module for Packet Steering feature."""
+
+from abc import ABC
+
+from ..base import BaseFeature
+
+
+class BaseFeaturePacketSteering(BaseFeature, ABC):
+    """Base class for Packet Steering (RPS/XPS/aRFS) feature."""
@@ -0,0 +1,24 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Packet Steering data structures."""
+
+from dataclasses import dataclass, field
+
+from mfd_network_adapter.data_structures import State
+
+
+@dataclass
+class PacketSteeringSettings:
+    """
+    RPS/XPS/aRFS settings of interface.
+
+    CPU masks are stored in sysfs format - comma separated 32-bit hex groups, e.g. '00000000,0000000f'.
+    Global rps_sock_flow_entries is None when it cannot be read (e.g. inside network namespace),
+    ntuple is None when ethtool doesn't report the feature.
+    """
+
+    rps_cpus: dict[int, str] = field(default_factory=dict)
+    rps_flow_cnt: dict[int, int] = field(default_factory=dict)
+    xps_cpus: dict[int, str] = field(default_factory=dict)
+    rps_sock_flow_entries: int | None = None
+    ntuple: State | None = None
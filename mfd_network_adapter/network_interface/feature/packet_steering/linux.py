@@ -0,0 +1,337 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for Packet Steering feature for Linux."""
+
+import logging
+import re
+import shlex
+from typing import Iterable
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_network_adapter.data_structures import State
+
+from .base import BaseFeaturePacketSteering
+from .data_structures import PacketSteeringSettings
+from ..numa.data_structures import CPUTopology
+from ...exceptions import PacketSteeringFeatureException
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+STEERING_MARKER = "@@MFD_PACKET_STEERING@@"
+SOCK_FLOW_ENTRIES_PATH = "/proc/sys/net/core/rps_sock_flow_entries"
+QUEUE_FILE_REGEX = re.compile(
+    r"^/sys/class/net/[^/]+/queues/(?P<direction>rx|tx)-(?P<queue>\d+)/"
+    r"(?P<file>rps_cpus|rps_flow_cnt|xps_cpus):(?P<value>\S+)$",
+    re.MULTILINE,
+)
+SOCK_FLOW_ENTRIES_REGEX = re.compile(r"^rps_sock_flow_entries:(?P<value>\d+)$", re.MULTILINE)
+NTUPLE_REGEX = re.compile(r"^ntuple-filters:\s+(?P<state>on|off)", re.MULTILINE)
+
+
+def cpus_to_mask(cpus: Iterable[int]) -> str:
+    """
+    Convert CPU numbers to CPU mask in sysfs format.
+
+    :param cpus: CPU numbers
+    :return: Comma separated 32-bit hex groups, e.g. '00000001,00000003' for CPUs 0, 1 and 32
+    """
+    value = sum(1 << cpu for cpu in set(cpus))
+    groups = [f"{value & 0xFFFFFFFF:08x}"]
+    value >>= 32
+    while value:
+        groups.insert(0, f"{value & 0xFFFFFFFF:08x}")
+        value >>= 32
+    return ",".join(groups)
+
+
+def mask_to_cpus(mask: str) -> list[int]:
+    """
+    Convert CPU mask in sysfs format to CPU numbers.
+
+    :param mask: CPU mask, e.g. '00000001,00000003'
+    :return: Sorted CPU numbers
+    """
+    value = int(mask.replace(",", ""), 16)
+    return [cpu for cpu in range(value.bit_length()) if value >> cpu & 1]
+
+
+def _masks_equal(first: str | None, second: str | None) -> bool:
+    """Compare CPU masks regardless of number of groups."""
+    if first is None or second is None:
+        return first == second
+    return int(first.replace(",", ""), 16) == int(second.replace(",", ""), 16)
+
+
+def _kernel_flow_count(value: int | None) -> int | None:
+    """Get value of flow table size stored by kernel, rps_flow_cnt and rps_sock_flow_entries are rounded up to 2^n."""
+    if not value:
+        return value
+    return 1 << (value - 1).bit_length()
+
+
+class LinuxPacketSteering(BaseFeaturePacketSteering):
+    """Linux class for Packet Steering (RPS/XPS/aRFS) feature."""
+
+    def _in_namespace(self, command: str) -> str:
+        """
+        Wrap shell command to be executed in namespace of interface.
+
+        :param command: Shell command
+        :return: Command executed in namespace, or unchanged command when interface is not in namespace
+        """
+        namespace = self._interface().namespace
+        if namespace is None:
+            return command
+        return f"ip netns exec {namespace} sh -c {shlex.quote(command)}"
+
+    def _get_read_script(self) -> str:
+        """
+        Get shell script printing all RPS/XPS/aRFS settings of interface.
+
+        Global rps_sock_flow_entries is read outside of namespace, it exists only in root namespace.
+        """
+        name = self._interface().name
+        queues = f"/sys/class/net/{name}/queues"
+        interface_part = (
+            f"grep -H . {queues}/rx-*/rps_cpus {queues}/rx-*/rps_flow_cnt {queues}/tx-*/xps_cpus 2>/dev/null; "
+            f"ethtool -k {name} 2>/dev/null | grep '^ntuple-filters:'"
+        )
+        return "\n".join(
+            [
+                self._in_namespace(interface_part),
+                f'echo "rps_sock_flow_entries:$(cat {SOCK_FLOW_ENTRIES_PATH} 2>/dev/null)"',
+            ]
+        )
+
+    @staticmethod
+    def _parse_settings(output: str) -> PacketSteeringSettings:
+        """
+        Parse output of read script.
+
+        :param output: Output of read script
+        :return: PacketSteeringSettings object
+        """
+        settings = PacketSteeringSettings()
+        for match in QUEUE_FILE_REGEX.finditer(output):
+            queue = int(match["queue"])
+            if match["file"] == "rps_cpus":
+                settings.rps_cpus[queue] = match["value"]
+            elif match["file"] == "rps_flow_cnt":
+                settings.rps_flow_cnt[queue] = int(match["value"])
+            else:
+                settings.xps_cpus[queue] = match["value"]
+        match = SOCK_FLOW_ENTRIES_REGEX.search(output)
+        if match:
+            settings.rps_sock_flow_entries = int(match["value"])
+        match = NTUPLE_REGEX.search(output)
+        if match:
+            settings.ntuple = State.ENABLED if match["state"] == "on" else State.DISABLED
+        return settings
+
+    def get_settings(self) -> PacketSteeringSettings:
+        """
+        Get RPS/XPS masks and aRFS settings of all queues in one remote call, to be restored with restore.
+
+        :return: PacketSteeringSettings object
+        """
+        output = self._connection.execute_command(
+            self._get_read_script(), shell=True, expected_return_codes=None
+        ).stdout
+        return self._parse_settings(output)
+
+    @staticmethod
+    def _get_differences(expected: PacketSteeringSettings, current: PacketSteeringSettings) -> list[str]:
+        """
+        Get list of settings, which differ from expected ones.
+
+        :param expected: Expected settings, only set values are compared
+        :param current: Current settings
+        :return: Descriptions of differences
+        """
+        differences = []
+        for attribute in ("rps_cpus", "xps_cpus"):
+            for queue, mask in getattr(expected, attribute).items():
+                current_mask = getattr(current, attribute).get(queue)
+                if not _masks_equal(mask, current_mask):
+                    differences.append(f"{attribute} of queue {queue}: expected {mask}, current {current_mask}")
+        for queue, value in expected.rps_flow_cnt.items():
+            if current.rps_flow_cnt.get(queue) != _kernel_flow_count(value):
+                differences.append(
+                    f"rps_flow_cnt of queue {queue}: expected {value}, current {current.rps_flow_cnt.get(queue)}"
+                )
+        if (
+            expected.rps_sock_flow_entries is not None
+            and current.rps_sock_flow_entries != _kernel_flow_count(expected.rps_sock_flow_entries)
+        ):
+            differences.append(
+                f"rps_sock_flow_entries: expected {expected.rps_sock_flow_entries}, "
+                f"current {current.rps_sock_flow_entries}"
+            )
+        if expected.ntuple is not None and current.ntuple != expected.ntuple:
+            differences.append(f"ntuple: expected {expected.ntuple}, current {current.ntuple}")
+        return differences
+
+    @staticmethod
+    def _remove_unchanged(expected: PacketSteeringSettings, current: PacketSteeringSettings) -> None:
+        """
+        Remove settings already matching current ones from expected settings.
+
+        :param expected: Settings to be applied, modified in place
+        :param current: Current settings
+        """
+        expected.rps_cpus = {q: m for q, m in expected.rps_cpus.items() if not _masks_equal(m, current.rps_cpus.get(q))}
+        expected.xps_cpus = {q: m for q, m in expected.xps_cpus.items() if not _masks_equal(m, current.xps_cpus.get(q))}
+        expected.rps_flow_cnt = {
+            q: v for q, v in expected.rps_flow_cnt.items() if current.rps_flow_cnt.get(q) != _kernel_flow_count(v)
+        }
+        if _kernel_flow_count(expected.rps_sock_flow_entries) == current.rps_sock_flow_entries:
+            expected.rps_sock_flow_entries = None
+        if expected.ntuple == current.ntuple:
+            expected.ntuple = None
+
+    def apply_settings(
+        self, settings: PacketSteeringSettings, current: PacketSteeringSettings | None = None
+    ) -> PacketSteeringSettings:
+        """
+        Apply RPS/XPS/aRFS settings of multiple queues in one remote call and verify them.
+
+        Only given values are written. When current settings are given, values already matching are skipped.
+        Previous settings are read in the same call and returned, to be restored with restore.
+
+        :param settings: Settings to apply, CPU masks in sysfs format (see cpus_to_mask)
+        :param current: Current settings, used to skip unchanged values
+        :return: Snapshot of settings before apply
+        :raises PacketSteeringFeatureException: When any value doesn't match after write or output is incomplete
+        """
+        settings = PacketSteeringSettings(
+            rps_cpus=dict(settings.rps_cpus),
+            rps_flow_cnt=dict(settings.rps_flow_cnt),
+            xps_cpus=dict(settings.xps_cpus),
+            rps_sock_flow_entries=settings.rps_sock_flow_entries,
+            ntuple=settings.ntuple,
+        )
+        if current is not None:
+            self._remove_unchanged(settings, current)
+
+        name = self._interface().name
+        queues = f"/sys/class/net/{name}/queues"
+        writes = [f"echo {mask} > {queues}/rx-{queue}/rps_cpus" for queue, mask in settings.rps_cpus.items()]
+        writes.extend(
+            f"echo {value} > {queues}/rx-{queue}/rps_flow_cnt" for queue, value in settings.rps_flow_cnt.items()
+        )
+        writes.extend(f"echo {mask} > {queues}/tx-{queue}/xps_cpus" for queue, mask in settings.xps_cpus.items())
+        if settings.ntuple is not None:
+            writes.append(f"ethtool -K {name} ntuple {'on' if settings.ntuple is State.ENABLED else 'off'}")
+        script = [self._in_namespace("; ".join(writes))] if writes else []
+        if settings.rps_sock_flow_entries is not None:
+            script.append(f"echo {settings.rps_sock_flow_entries} > {SOCK_FLOW_ENTRIES_PATH}")
+        if not script:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Packet steering settings of {name} already match.")
+            return current if current is not None else self.get_settings()
+
+        read_script = self._get_read_script()
+        output = self._connection.execute_command(
+            "\n".join([read_script, f"echo {STEERING_MARKER}", *script, f"echo {STEERING_MARKER}", read_script]),
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        ).stdout
+        sections = output.split(f"{STEERING_MARKER}\n", 2)
+        if len(sections) != 3:
+            raise PacketSteeringFeatureException(
+                f"Packet steering settings of {name} not verified, markers not found in output: {output}"
+            )
+        before, errors, after = sections
+        differences = self._get_differences(settings, self._parse_settings(after))
+        if differences:
+            raise PacketSteeringFeatureException(
+                f"Packet steering settings of {name} not applied - {', '.join(differences)}\n{errors.strip()}"
+            )
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Packet steering settings of {name} applied.")
+        return self._parse_settings(before)
+
+    def restore(self, snapshot: PacketSteeringSettings) -> None:
+        """
+        Restore settings from snapshot, only values differing from current ones are written.
+
+        :param snapshot: Settings returned by get_settings or apply_settings
+        :raises PacketSteeringFeatureException: When any value doesn't match after write
+        """
+        self.apply_settings(snapshot, current=self.get_settings())
+
+    @staticmethod
+    def compute_numa_aware_masks(
+        topology: CPUTopology, numa_node: int, rx_queues: Iterable[int], tx_queues: Iterable[int]
+    ) -> PacketSteeringSettings:
+        """
+        Compute RPS and XPS masks using CPUs local to NUMA node of interface.
+
+        RPS mask of each Rx queue contains all local CPUs, XPS spreads local CPUs over Tx queues,
+        so each CPU transmits via single queue.
+
+        :param topology: CPU topology of the host
+        :param numa_node: NUMA node of interface, all CPUs are used for unknown node (-1)
+        :param rx_queues: Rx queue numbers
+        :param tx_queues: Tx queue numbers
+        :return: PacketSteeringSettings object with rps_cpus and xps_cpus
+        """
+        local_cpus = [info.cpu for info in topology.get_node_cpus(numa_node) or topology.cpus]
+        tx_queues = sorted(tx_queues)
+        xps_cpus = {}
+        step = len(tx_queues)
+        for index, queue in enumerate(tx_queues):
+            cpus = local_cpus[index::step] or [local_cpus[index % len(local_cpus)]]
+            xps_cpus[queue] = cpus_to_mask(cpus)
+        rps_mask = cpus_to_mask(local_cpus)
+        return PacketSteeringSettings(rps_cpus={queue: rps_mask for queue in rx_queues}, xps_cpus=xps_cpus)
+
+    def set_numa_aware_masks(
+        self, rps: bool = True, xps: bool = True, topology: CPUTopology | None = None
+    ) -> PacketSteeringSettings:
+        """
+        Set RPS and/or XPS masks of all queues to CPUs local to NUMA node of interface.
+
+        :param rps: Set RPS masks of Rx queues
+        :param xps: Set XPS masks of Tx queues
+        :param topology: CPU topology, read from the host when not given
+        :return: Snapshot of settings before apply
+        :raises PacketSteeringFeatureException: When any mask doesn't match after write
+        """
+        current = self.get_settings()
+        topology = topology or self._interface().numa.get_cpu_topology()
+        settings = self.compute_numa_aware_masks(
+            topology, self._interface().get_numa_node(), current.rps_cpus, current.xps_cpus
+        )
+        if not rps:
+            settings.rps_cpus = {}
+        if not xps:
+            settings.xps_cpus = {}
+        return self.apply_settings(settings, current=current)
+
+    def set_arfs(self, state: State, flow_entries: int = 32768) -> PacketSteeringSettings:
+        """
+        Enable or disable accelerated RFS.
+
+        Enabling turns ntuple filters on, sets global rps_sock_flow_entries and spreads them
+        over rps_flow_cnt of Rx queues, rounded down to power of two as kernel stores only such sizes.
+        Disabling turns ntuple filters off and clears rps_flow_cnt,
+        global rps_sock_flow_entries is left unchanged as it is shared with other interfaces.
+
+        :param state: State.ENABLED or State.DISABLED
+        :param flow_entries: Number of entries of global socket flow table
+        :return: Snapshot of settings before apply
+        :raises PacketSteeringFeatureException: When any value doesn't match after write
+        """
+        current = self.get_settings()
+        if not current.rps_flow_cnt:
+            raise PacketSteeringFeatureException(f"No Rx queues with rps_flow_cnt found for {self._interface().name}")
+        flow_cnt = 0
+        if state is State.ENABLED:
+            flow_cnt = 1 << (max(flow_entries // len(current.rps_flow_cnt), 1).bit_length() - 1)
+        settings = PacketSteeringSettings(
+            rps_flow_cnt={queue: flow_cnt for queue in current.rps_flow_cnt},
+            rps_sock_flow_entries=flow_entries if state is State.ENABLED else None,
+            ntuple=state,
+        )
+        return self.apply_settings(settings, current=current)
@@ -3,12 +3,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Queue feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureQueue
-from .esxi import ESXiQueue
-from .freebsd import FreeBSDQueue
-from .linux import LinuxQueue
-from .windows import WindowsQueue
 
-QueueFeatureType = Union[BaseFeatureQueue, LinuxQueue, WindowsQueue, ESXiQueue, FreeBSDQueue]
+if TYPE_CHECKING:
+    from .esxi import ESXiQueue
+    from .freebsd import FreeBSDQueue
+    from .linux import LinuxQueue
+    from .windows import WindowsQueue
+
+    QueueFeatureType = Union[BaseFeatureQueue, LinuxQueue, WindowsQueue, ESXiQueue, FreeBSDQueue]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiQueue": ".esxi", "FreeBSDQueue": ".freebsd", "LinuxQueue": ".linux", "WindowsQueue": ".windows"},
+    {"QueueFeatureType": ("BaseFeatureQueue", "LinuxQueue", "WindowsQueue", "ESXiQueue", "FreeBSDQueue")},
+)
@@ -3,10 +3,14 @@
 """Base Module for Queue feature."""
 
 from abc import ABC
+from typing import TYPE_CHECKING
 
 from ..base import BaseFeature
 from time import sleep
 
+if TYPE_CHECKING:
+    from .data_structures import QueueStatsSample
+
 
 class BaseFeatureQueue(BaseFeature, ABC):
     """Base class for Queue feature."""
@@ -25,3 +29,22 @@ class BaseFeatureQueue(BaseFeature, ABC):
         sleep(traffic_duration)
         stat_checker.get_values()
         return stat_checker.get_number_of_valid_statistics()
+
+    def get_queue_stats(self) -> "QueueStatsSample":
+        """
+        Get sample of per queue statistics, read with single command.
+
+        :return: QueueStatsSample, dense matrix of queues x counters
+        """
+        raise NotImplementedError("get_queue_stats is not implemented")
+
+    def get_queue_stats_delta(self, interval: float = 1) -> "QueueStatsSample":
+        """
+        Get increase of per queue statistics in interval, e.g. to check imbalance of queues during traffic.
+
+        :param interval: Time between samples in seconds
+        :return: QueueStatsSample with differences of counters, rates are values divided by its interval
+        """
+        before = self.get_queue_stats()
+        sleep(interval)
+        return self.get_queue_stats().delta(before)
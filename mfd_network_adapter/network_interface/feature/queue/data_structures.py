@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: MIT
 """Module for queue data structures."""
 
-from dataclasses import dataclass
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from ...exceptions import QueueFeatureInvalidValueException
 
 
 @dataclass
@@ -11,3 +15,144 @@ class WindowsQueueInfo:
 
     NUMBER_OF_VPORTS: str = "*NumVPorts"
     NUMBER_OF_VFS: str = "*NumVFs"
+
+
+@dataclass
+class QueueImbalance:
+    """Imbalance of counter between queues, e.g. of packets received during traffic."""
+
+    counter: str
+    mean: float
+    coefficient_of_variation: float
+    idle_queues: list[int]
+    busiest_queue: int | None
+
+
+@dataclass
+class QueueStatsSample:
+    """
+    Sample of per queue statistics, dense matrix of queues x counters.
+
+    Row of values is queue from queues, column is counter from counters, e.g. rx_packets or tx_bytes.
+    Counters not reported for queue are 0.
+    """
+
+    queues: list[int]
+    counters: list[str]
+    values: list[list[int]]
+    timestamp: float = field(default_factory=time.monotonic)
+    interval: float | None = None
+
+    @classmethod
+    def from_stats(cls, stats: dict[tuple[int, str], int], timestamp: float | None = None) -> "QueueStatsSample":
+        """
+        Build sample from sparse statistics.
+
+        :param stats: Dictionary {(queue, counter): value}
+        :param timestamp: Monotonic time of sample, current time if not given
+        :return: QueueStatsSample with queues and counters sorted
+        """
+        queues = sorted({queue for queue, _ in stats})
+        counters = sorted({counter for _, counter in stats})
+        values = [[stats.get((queue, counter), 0) for counter in counters] for queue in queues]
+        if timestamp is None:
+            return cls(queues=queues, counters=counters, values=values)
+        return cls(queues=queues, counters=counters, values=values, timestamp=timestamp)
+
+    def get_column(self, counter: str) -> list[int]:
+        """
+        Get values of counter for all queues.
+
+        :param counter: Name of counter, e.g. rx_packets
+        :return: List of values in order of queues
+        :raises QueueFeatureInvalidValueException: when counter is not in sample
+        """
+        if counter not in self.counters:
+            raise QueueFeatureInvalidValueException(
+                f"Counter {counter} not found in per queue statistics: {self.counters}"
+            )
+        column = self.counters.index(counter)
+        return [row[column] for row in self.values]
+
+    def get_queue(self, queue: int) -> dict[str, int]:
+        """
+        Get counters of queue.
+
+        :param queue: Number of queue
+        :return: Dictionary {counter: value}
+        :raises QueueFeatureInvalidValueException: when queue is not in sample
+        """
+        if queue not in self.queues:
+            raise QueueFeatureInvalidValueException(f"Queue {queue} not found in per queue statistics: {self.queues}")
+        return dict(zip(self.counters, self.values[self.queues.index(queue)]))
+
+    @property
+    def totals(self) -> dict[str, int]:
+        """Sum of each counter over all queues."""
+        return {counter: sum(column) for counter, column in zip(self.counters, zip(*self.values))}
+
+    def delta(self, previous: "QueueStatsSample") -> "QueueStatsSample":
+        """
+        Calculate increase of counters since previous sample.
+
+        Layout of this sample is kept, queues and counters missing in previous sample are counted from zero,
+        as well as counters lower than in previous sample (e.g. reset by driver reload).
+
+        :param previous: Earlier sample
+        :return: QueueStatsSample with differences, interval is time between samples
+        """
+        queue_index = {queue: row for row, queue in enumerate(previous.queues)}
+        counter_index = [previous.counters.index(c) if c in previous.counters else None for c in self.counters]
+        values = []
+        for queue, row in zip(self.queues, self.values):
+            previous_row = previous.values[queue_index[queue]] if queue in queue_index else None
+            values.append(
+                [
+                    (
+                        value - previous_row[index]
+                        if previous_row and index is not None and value >= previous_row[index]
+                        else value
+                    )
+                    for value, index in zip(row, counter_index)
+                ]
+            )
+        return QueueStatsSample(
+            queues=list(self.queues),
+            counters=list(self.counters),
+            values=values,
+            timestamp=self.timestamp,
+            interval=self.timestamp - previous.timestamp,
+        )
+
+    def rates(self, previous: "QueueStatsSample") -> list[list[float]]:
+        """
+        Calculate per second rates of counters since previous sample.
+
+        :param previous: Earlier sample
+        :return: Matrix of rates, in layout of this sample
+        :raises QueueFeatureInvalidValueException: when samples were not taken one after another
+        """
+        delta = self.delta(previous)
+        if delta.interval <= 0:
+            raise QueueFeatureInvalidValueException(
+                f"Time between samples of statistics must be positive, got {delta.interval}"
+            )
+        return [[value / delta.interval for value in row] for row in delta.values]
+
+    def get_imbalance(self, counter: str = "rx_packets", idle_threshold: int = 0) -> QueueImbalance:
+        """
+        Get imbalance of counter between queues, meaningful for delta of samples taken during traffic.
+
+        :param counter: Name of counter, e.g. rx_packets
+        :param idle_threshold: Queues with value not higher than threshold are idle
+        :return: QueueImbalance with coefficient of variation (standard deviation / mean, 0 when mean is 0)
+        """
+        column = self.get_column(counter)
+        mean = statistics.fmean(column) if column else 0.0
+        return QueueImbalance(
+            counter=counter,
+            mean=mean,
+            coefficient_of_variation=statistics.pstdev(column) / mean if mean else 0.0,
+            idle_queues=[queue for queue, value in zip(self.queues, column) if value <= idle_threshold],
+            busiest_queue=self.queues[column.index(max(column))] if column else None,
+        )
@@ -13,6 +13,7 @@ from mfd_typing import MACAddress
 
 from mfd_network_adapter.exceptions import NetworkAdapterModuleException
 from .base import BaseFeatureQueue
+from .data_structures import QueueStatsSample
 from ...exceptions import QueueFeatureInvalidValueException
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,18 @@ RxTx = namedtuple(typename="RxTx", field_names=("rx", "tx"))
 class ESXiQueue(BaseFeatureQueue):
     """ESXi class for queue feature."""
 
+    def get_queue_stats(self) -> QueueStatsSample:
+        """
+        Get sample of per queue statistics from private statistics of driver, only received packets are reported.
+
+        :return: QueueStatsSample with rx_packets counter
+        """
+        stats = {
+            (int(queue.removeprefix("rxq")), "rx_packets"): int(value)
+            for queue, value in self._interface().rss.get_rx_pkts_stats().items()
+        }
+        return QueueStatsSample.from_stats(stats)
+
     def get_queues_info(self, queues: str) -> dict[str, str]:
         """Get queues information for interface.
 
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Dict
 from mfd_common_libs import add_logging_level, log_levels
 
 from .base import BaseFeatureQueue
+from .data_structures import QueueStatsSample
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
@@ -17,6 +18,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+# per queue statistic of ethtool -S, names are normalized by parser,
+# e.g. rx-queue-0.rx_packets -> rx_queue_0_rx_packets, rx-0.bytes -> rx_0_bytes, tx_queue_0_packets stays unchanged
+PER_QUEUE_STAT_REGEX = re.compile(r"^(?P<direction>[rt]x)_?(?:queue_)?(?P<queue>\d+)_(?:[rt]x_)?(?P<counter>[a-z_]+)$")
+
 
 class LinuxQueue(BaseFeatureQueue):
     """Linux class for queue feature."""
@@ -39,3 +44,21 @@ class LinuxQueue(BaseFeatureQueue):
         stats = self._interface().stats.get_stats()
         queue_stats = {stat: value for stat, value in stats.items() if re.match(r"[tr]x_queue_\d+_packets", stat)}
         return queue_stats
+
+    def get_queue_stats(self) -> QueueStatsSample:
+        """
+        Get sample of per queue statistics from single ethtool -S call, regardless of naming used by driver.
+
+        :return: QueueStatsSample with counters named direction_counter, e.g. rx_packets, tx_bytes
+        """
+        statistics = self._interface().ethtool.get_adapter_statistics(
+            device_name=self._interface().name, namespace=self._interface().namespace
+        )
+        stats = {}
+        for name, values in statistics.__dict__.items():
+            match = PER_QUEUE_STAT_REGEX.match(name)
+            if match and values and values[0].isdigit():
+                stats[(int(match.group("queue")), f"{match.group('direction')}_{match.group('counter')}")] = int(
+                    values[0]
+                )
+        return QueueStatsSample.from_stats(stats)
@@ -13,7 +13,7 @@ from mfd_win_registry.constants import NIC_SWITCHES_REGISTRY_BASE_PATH
 from .base import BaseFeatureQueue
 from ...exceptions import QueueFeatureException
 from ..link import LinkState
-from .data_structures import WindowsQueueInfo
+from .data_structures import QueueStatsSample, WindowsQueueInfo
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
@@ -22,6 +22,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+# counters of Per Processor Network Interface Card Activity, raw values of rate counters are cumulative
+PER_PROCESSOR_COUNTERS = {"received packets/sec": "rx_packets", "sent packets/sec": "tx_packets"}
+
 
 class WindowsQueue(BaseFeatureQueue):
     """Windows class for queue feature."""
@@ -108,3 +111,31 @@ class WindowsQueue(BaseFeatureQueue):
             max_rss_queues_used = max(max_rss_queues_used, queues_in_use)
             sleep(sampling_interval)
         return max_rss_queues_used
+
+    def get_queue_stats(self) -> QueueStatsSample:
+        """
+        Get sample of per queue statistics from performance counters, read with single Get-Counter call.
+
+        Counters are reported per processor handling traffic of adapter, so rows of sample are RSS processors.
+
+        :return: QueueStatsSample with rx_packets and tx_packets counters
+        """
+        card_name = self._interface().branding_string.replace("/", "-")
+        paths = ",".join(
+            rf"'\Per Processor Network Interface Card Activity(*{card_name})\{counter}'"
+            for counter in PER_PROCESSOR_COUNTERS
+        )
+        cmd = (
+            f"(Get-Counter -Counter {paths}).CounterSamples | "
+            "ForEach-Object {\"$($_.InstanceName)|$($_.Path.Split('\\')[-1])|$($_.RawValue)\"}"
+        )
+        output = self._connection.execute_powershell(cmd, expected_return_codes={0}).stdout
+        stats = {}
+        for line in output.splitlines():
+            fields = line.strip().split("|")
+            if len(fields) != 3 or fields[1].lower() not in PER_PROCESSOR_COUNTERS:
+                continue
+            processor = fields[0].split(",")[0].strip()
+            if processor.isdigit() and fields[2].isdigit():
+                stats[(int(processor), PER_PROCESSOR_COUNTERS[fields[1].lower()])] = int(fields[2])
+        return QueueStatsSample.from_stats(stats)
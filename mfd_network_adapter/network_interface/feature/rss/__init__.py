@@ -2,13 +2,24 @@
 # SPDX-License-Identifier: MIT
 """Module for RSS feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureRSS
-from .data_structures import RSSWindowsInfo, RSSProfileInfo, FlowType
-from .freebsd import FreeBsdRSS
-from .linux import LinuxRSS
-from .windows import WindowsRSS
-from .esxi import ESXiRSS
+from .data_structures import RSSWindowsInfo, RSSProfileInfo, FlowType, RSSIndirectionTable, RSSQueueBalance
+
+if TYPE_CHECKING:
+    from .freebsd import FreeBsdRSS
+    from .linux import LinuxRSS
+    from .windows import WindowsRSS
+    from .esxi import ESXiRSS
+
+    RSSFeatureType = BaseFeatureRSS | WindowsRSS | LinuxRSS | FreeBsdRSS | ESXiRSS
 
-RSSFeatureType = BaseFeatureRSS | WindowsRSS | LinuxRSS | FreeBsdRSS | ESXiRSS
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"FreeBsdRSS": ".freebsd", "LinuxRSS": ".linux", "WindowsRSS": ".windows", "ESXiRSS": ".esxi"},
+    {"RSSFeatureType": ("BaseFeatureRSS", "WindowsRSS", "LinuxRSS", "FreeBsdRSS", "ESXiRSS")},
+)
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT
 """Module for RSS data structures."""
 
-from dataclasses import dataclass
+import re
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -51,3 +53,132 @@ class FlowType(Enum):
 
 
 KNOWN_FIELDS = ["IP SA", "IP DA", "src port", "dst port"]
+
+
+INDIRECTION_RINGS_REGEX = re.compile(r"with (?P<rings>\d+) RX ring")
+INDIRECTION_ROW_REGEX = re.compile(r"^\s*\d+:\s+(?P<entries>\d+(\s+\d+)*)\s*$")
+HASH_KEY_REGEX = re.compile(r"^\s*(?P<key>[0-9a-fA-F]{2}(:[0-9a-fA-F]{2})*)\s*$")
+HASH_FUNCTION_REGEX = re.compile(r"^\s*(?P<name>\S+):\s+(?P<state>on|off)\s*$")
+
+
+@dataclass
+class RSSIndirectionTable:
+    """Rx flow hash indirection table with RSS hash key and function, entries are stored in array of queue numbers."""
+
+    entries: array = field(default_factory=lambda: array("H"))
+    rings: int = 0
+    hash_key: str | None = None
+    hash_functions: dict[str, bool] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Get number of entries in table."""
+        return len(self.entries)
+
+    @property
+    def hash_function(self) -> str | None:
+        """Get name of enabled hash function."""
+        return next((name for name, enabled in self.hash_functions.items() if enabled), None)
+
+    @classmethod
+    def from_ethtool_output(cls, output: str) -> "RSSIndirectionTable":
+        """
+        Parse output of `ethtool -x`.
+
+        :param output: Output of `ethtool -x <interface>`
+        :return: RSSIndirectionTable object, without entries when table is not available
+        """
+        table = cls()
+        match = INDIRECTION_RINGS_REGEX.search(output)
+        if match:
+            table.rings = int(match["rings"])
+        section = None
+        for line in output.splitlines():
+            if line.startswith("RSS hash key"):
+                section = "key"
+                continue
+            if line.startswith("RSS hash function"):
+                section = "function"
+                continue
+            key_match = HASH_KEY_REGEX.match(line)
+            if section == "key" and key_match:
+                table.hash_key = key_match["key"].lower()
+                continue
+            function_match = HASH_FUNCTION_REGEX.match(line)
+            if section == "function" and function_match:
+                table.hash_functions[function_match["name"]] = function_match["state"] == "on"
+                continue
+            row_match = INDIRECTION_ROW_REGEX.match(line)
+            if section is None and row_match:
+                table.entries.extend(int(entry) for entry in row_match["entries"].split())
+            elif line and not line[0].isspace():
+                # other sections, e.g. 'RSS input transformation:'
+                section = None
+        return table
+
+    @classmethod
+    def from_equal(cls, size: int, queues: int, start: int = 0) -> "RSSIndirectionTable":
+        """
+        Create table spreading entries equally over queues, the same way as `ethtool -X <interface> equal N`.
+
+        :param size: Number of entries in table
+        :param queues: Number of queues
+        :param start: First queue
+        :return: RSSIndirectionTable object
+        """
+        return cls(entries=array("H", (start + index % queues for index in range(size))), rings=start + queues)
+
+    @classmethod
+    def from_weights(cls, size: int, weights: list[int], start: int = 0) -> "RSSIndirectionTable":
+        """
+        Create table spreading entries over queues by weights, the same way as `ethtool -X <interface> weight W0 W1..`.
+
+        :param size: Number of entries in table
+        :param weights: Weights of consecutive queues
+        :param start: First queue
+        :return: RSSIndirectionTable object
+        """
+        total = sum(weights)
+        entries = array("H")
+        queue, partial = -1, 0
+        for index in range(size):
+            while index >= size * partial // total:
+                queue += 1
+                partial += weights[queue]
+            entries.append(start + queue)
+        return cls(entries=entries, rings=start + len(weights))
+
+    def get_queue_weights(self) -> dict[int, int]:
+        """
+        Get number of table entries pointing to each queue.
+
+        :return: Dictionary {queue: number of entries}, queues without entries are included with 0
+        """
+        weights = dict.fromkeys(range(self.rings), 0)
+        for queue in self.entries:
+            weights[queue] = weights.get(queue, 0) + 1
+        return weights
+
+
+@dataclass
+class RSSQueueBalance:
+    """Comparison of traffic distribution expected from indirection table with per queue Rx packet counters."""
+
+    packets: dict[int, int]
+    expected_share: dict[int, float]
+    actual_share: dict[int, float]
+    coefficient_of_variation: float
+    idle_queues: list[int]
+    unexpected_queues: list[int]
+
+    @property
+    def skew(self) -> dict[int, float]:
+        """Get difference between actual and expected share of traffic for each queue."""
+        queues = self.expected_share.keys() | self.actual_share.keys()
+        return {
+            queue: self.actual_share.get(queue, 0.0) - self.expected_share.get(queue, 0.0) for queue in sorted(queues)
+        }
+
+    @property
+    def max_skew(self) -> float:
+        """Get the biggest absolute difference between actual and expected share of traffic."""
+        return max((abs(value) for value in self.skew.values()), default=0.0)
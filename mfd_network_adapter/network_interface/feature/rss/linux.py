@@ -4,17 +4,17 @@
 
 import logging
 import re
+import statistics
 import time
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool import Ethtool
 from mfd_ethtool.exceptions import EthtoolExecutionError
 from mfd_network_adapter.data_structures import State
 from mfd_network_adapter.stat_checker.base import Trend
 
 from .base import BaseFeatureRSS
-from .data_structures import FlowType, KNOWN_FIELDS
+from .data_structures import FlowType, KNOWN_FIELDS, RSSIndirectionTable, RSSQueueBalance
 from ..link import LinkState
 from ...exceptions import RSSException, RSSExecutionError, StatisticNotFoundException
 
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
+RX_QUEUE_PACKETS_REGEX = re.compile(r"^rx_queue_(?P<queue>\d+)_packets$")
+
 
 class LinuxRSS(BaseFeatureRSS):
     """Linux class for RSS feature."""
@@ -37,7 +39,7 @@ class LinuxRSS(BaseFeatureRSS):
         :param interface: NetworkInterface object, parent of feature
         """
         super().__init__(connection=connection, interface=interface)
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
         self._stats = self._interface().stats
         self._stat_checker = self._interface().stat_checker
 
@@ -94,9 +96,12 @@ class LinuxRSS(BaseFeatureRSS):
         :return: actual/max queue value based on actual_max flag
         """
         try:
-            output = self._ethtool.get_channel_parameters(device_name=self._interface().name)
-            value = int(output.preset_max_combined[0]) if actual_max else int(output.current_hw_combined[0])
-        except (ValueError, EthtoolExecutionError):
+            if actual_max:
+                value = int(self._ethtool.get_channel_maxima(device_name=self._interface().name)["combined"])
+            else:
+                output = self._ethtool.get_channel_parameters(device_name=self._interface().name)
+                value = int(output.current_hw_combined[0])
+        except (TypeError, ValueError, EthtoolExecutionError):
             # If getting rss queues via ethtool is not supported doing it via cat /proc/interrupts
             value = self.get_queues()
         return value
@@ -143,13 +148,105 @@ class LinuxRSS(BaseFeatureRSS):
         :return: Number of entries in the indirection table
         :raises RSSException: if indirection table is empty
         """
-        output = self._ethtool.get_rss_indirection_table(device_name=self._interface().name)
-        indirection_table = [line for line in output.splitlines() if re.search(r"\d+:\s+(\d+\s*){8}", line)]
-        if not indirection_table:
+        num_entries = len(self.get_indirection_table())
+        if not num_entries:
             raise RSSException("No data for indirection table")
-        num_entries = len(indirection_table) * 8  # there are 8 entries per line
         return num_entries
 
+    def get_indirection_table(self) -> RSSIndirectionTable:
+        """Get Rx flow hash indirection table, RSS hash key and hash function.
+
+        :return: RSSIndirectionTable object
+        """
+        output = self._ethtool.get_rss_indirection_table(device_name=self._interface().name)
+        return RSSIndirectionTable.from_ethtool_output(output)
+
+    def set_indirection_table(
+        self,
+        equal: int | None = None,
+        weights: List[int] | None = None,
+        hash_key: str | None = None,
+        hash_function: str | None = None,
+        current: RSSIndirectionTable | None = None,
+    ) -> bool:
+        """Set Rx flow hash indirection table, RSS hash key and hash function.
+
+        Only parameters differing from current configuration are applied, in one `ethtool -X` call.
+
+        :param equal: Number of queues to spread entries equally over
+        :param weights: Weights of consecutive queues, e.g. [1, 1, 0, 2]
+        :param hash_key: RSS hash key, colon separated hex bytes
+        :param hash_function: RSS hash function, e.g. 'toeplitz', 'xor'
+        :param current: Current table, read from interface when not given
+        :return: True if configuration was changed, False if it already matched
+        :raises RSSException: if both equal and weights given or configuration doesn't match after set
+        """
+        if equal is not None and weights is not None:
+            raise RSSException("Only one of equal and weights can be set.")
+        current = current or self.get_indirection_table()
+        expected = None
+        if equal is not None:
+            expected = RSSIndirectionTable.from_equal(len(current), equal)
+        elif weights is not None:
+            expected = RSSIndirectionTable.from_weights(len(current), weights)
+
+        params = []
+        if expected is not None and expected.entries != current.entries:
+            params.append(f"equal {equal}" if equal is not None else f"weight {' '.join(map(str, weights))}")
+        if hash_key is not None and hash_key.lower() != current.hash_key:
+            params.append(f"hkey {hash_key.lower()}")
+        if hash_function is not None and hash_function != current.hash_function:
+            params.append(f"hfunc {hash_function}")
+        if not params:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="RSS indirection table already matches, skipping.")
+            return False
+
+        self._ethtool.set_rss_indirection_table(device_name=self._interface().name, param_name=" ".join(params))
+        table = self.get_indirection_table()
+        if expected is not None and table.entries != expected.entries:
+            raise RSSException(f"Indirection table not set on {self._interface().name}: {list(table.entries)}")
+        if hash_key is not None and table.hash_key != hash_key.lower():
+            raise RSSException(f"RSS hash key not set on {self._interface().name}: {table.hash_key}")
+        if hash_function is not None and table.hash_function != hash_function:
+            raise RSSException(f"RSS hash function not set on {self._interface().name}: {table.hash_function}")
+        return True
+
+    def analyze_queue_balance(
+        self, baseline: Dict[str, int] | None = None, table: RSSIndirectionTable | None = None
+    ) -> RSSQueueBalance:
+        """Compare distribution of Rx packets over queues with distribution expected from indirection table.
+
+        :param baseline: Per queue packet counters read before traffic (get_per_queue_packet_stats),
+                         when not given - absolute counters are used
+        :param table: Indirection table, read from interface when not given
+        :return: RSSQueueBalance object
+        """
+        table = table or self.get_indirection_table()
+        counters = self._interface().queue.get_per_queue_packet_stats()
+        baseline = baseline or {}
+        packets = {}
+        for name, value in counters.items():
+            match = RX_QUEUE_PACKETS_REGEX.match(name)
+            if match:
+                packets[int(match["queue"])] = int(value) - int(baseline.get(name, 0))
+
+        weights = {queue: weight for queue, weight in table.get_queue_weights().items() if weight}
+        expected_share = {queue: weight / len(table) for queue, weight in weights.items()} if len(table) else {}
+        total = sum(packets.values())
+        actual_share = {queue: (value / total if total else 0.0) for queue, value in sorted(packets.items())}
+
+        ratios = [actual_share.get(queue, 0.0) / share for queue, share in expected_share.items()]
+        mean = statistics.fmean(ratios) if ratios else 0.0
+        coefficient_of_variation = statistics.pstdev(ratios) / mean if mean else 0.0
+        return RSSQueueBalance(
+            packets=dict(sorted(packets.items())),
+            expected_share=expected_share,
+            actual_share=actual_share,
+            coefficient_of_variation=coefficient_of_variation,
+            idle_queues=[queue for queue in expected_share if not packets.get(queue)],
+            unexpected_queues=[queue for queue, value in sorted(packets.items()) if value and queue not in weights],
+        )
+
     def get_hash_options(self, flow_type: FlowType) -> List[Optional[str]]:
         """Get Hash Options.
 
@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Stats feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureStats
-from .esxi import ESXiStats
-from .freebsd import FreeBsdStats
-from .linux import LinuxStats
-from .windows import WindowsStats
 
-StatsFeatureType = Union[BaseFeatureStats, FreeBsdStats, LinuxStats, WindowsStats, ESXiStats]
+if TYPE_CHECKING:
+    from .esxi import ESXiStats
+    from .freebsd import FreeBsdStats
+    from .linux import LinuxStats
+    from .windows import WindowsStats
+
+    StatsFeatureType = Union[BaseFeatureStats, FreeBsdStats, LinuxStats, WindowsStats, ESXiStats]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"ESXiStats": ".esxi", "FreeBsdStats": ".freebsd", "LinuxStats": ".linux", "WindowsStats": ".windows"},
+    {"StatsFeatureType": ("BaseFeatureStats", "FreeBsdStats", "LinuxStats", "WindowsStats", "ESXiStats")},
+)
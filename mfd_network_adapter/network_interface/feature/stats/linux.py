@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 """Module for Stats feature for Linux."""
 
+import json
 import logging
 import re
 from typing import Dict, Optional, TYPE_CHECKING
@@ -9,12 +10,12 @@ import yaml
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_const import Speed, Family
-from mfd_ethtool import Ethtool
 from mfd_kernel_namespace import add_namespace_call_command
 
 from .base import BaseFeatureStats
 from .data_structures import Direction, Protocol
 from ...exceptions import ReadStatisticException, StatisticNotFoundException
+from ....iproute2 import is_json_supported
 from ....stat_checker import StatChecker, Trend, Value
 
 if TYPE_CHECKING:
@@ -38,7 +39,7 @@ class LinuxStats(BaseFeatureStats):
         super().__init__(connection=connection, interface=interface)
         self.driver_obj = self._interface().driver
         self.stat_checker = self._interface().stat_checker
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
         self.utils = self._interface().utils
 
     def get_stats(self, name: Optional[str] = None) -> Dict:
@@ -73,6 +74,12 @@ class LinuxStats(BaseFeatureStats):
 
         :return: Dictionary of statistics
         """
+        if is_json_supported(self._connection):
+            cmd = add_namespace_call_command(
+                f"ip -j -s link show {self._interface().name}", self._interface().namespace
+            )
+            return self._get_netdev_stats_from_json(self._connection.execute_command(cmd).stdout)
+
         cmd = add_namespace_call_command(f"ip -s link show {self._interface().name}", self._interface().namespace)
         output = self._connection.execute_command(cmd).stdout
 
@@ -100,6 +107,34 @@ class LinuxStats(BaseFeatureStats):
             raise ReadStatisticException(f"Could not parse netdev stats:\n{output}")
         return match_dict
 
+    @staticmethod
+    def _get_netdev_stats_from_json(output: str) -> Dict:
+        """Get statistics from JSON output of iproute2.
+
+        :param output: Output of `ip -j -s link show <interface>`
+        :return: Dictionary of statistics, keys are the same as for text output
+        :raises ReadStatisticException: When statistics not found in output
+        """
+        try:
+            stats64 = json.loads(output)[0]["stats64"]
+            rx, tx = stats64["rx"], stats64["tx"]
+            return {
+                "rx_bytes": rx["bytes"],
+                "rx_packets": rx["packets"],
+                "rx_errors": rx["errors"],
+                "rx_dropped": rx["dropped"],
+                "overrun": rx["over_errors"],
+                "mcast": rx["multicast"],
+                "tx_bytes": tx["bytes"],
+                "tx_packets": tx["packets"],
+                "tx_errors": tx["errors"],
+                "tx_dropped": tx["dropped"],
+                "carrier": tx["carrier_errors"],
+                "collisions": tx["collisions"],
+            }
+        except (ValueError, KeyError, IndexError, TypeError):
+            raise ReadStatisticException(f"Could not parse netdev stats:\n{output}")
+
     def get_system_stats(self, name: Optional[str] = None) -> Dict:
         """Get a specific or all statistics from a network interface using system method.
 
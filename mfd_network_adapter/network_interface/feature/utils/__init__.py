@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Utils feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureUtils
-from .esxi import EsxiUtils
-from .freebsd import FreeBsdUtils
-from .linux import LinuxUtils
-from .windows import WindowsUtils
 
-UtilsFeatureType = Union[BaseFeatureUtils, EsxiUtils, FreeBsdUtils, LinuxUtils, WindowsUtils]
+if TYPE_CHECKING:
+    from .esxi import EsxiUtils
+    from .freebsd import FreeBsdUtils
+    from .linux import LinuxUtils
+    from .windows import WindowsUtils
+
+    UtilsFeatureType = Union[BaseFeatureUtils, EsxiUtils, FreeBsdUtils, LinuxUtils, WindowsUtils]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiUtils": ".esxi", "FreeBsdUtils": ".freebsd", "LinuxUtils": ".linux", "WindowsUtils": ".windows"},
+    {"UtilsFeatureType": ("BaseFeatureUtils", "EsxiUtils", "FreeBsdUtils", "LinuxUtils", "WindowsUtils")},
+)
@@ -40,9 +40,7 @@ class LinuxUtils(BaseFeatureUtils):
     def ethtool(self) -> "Ethtool":
         """Ethtool object for the interface."""
         if self._ethtool is None:
-            from mfd_ethtool import Ethtool
-
-            self._ethtool = Ethtool(connection=self._connection)
+            self._ethtool = self._interface().ethtool
         return self._ethtool
 
     def set_all_multicast(self, turned_on: bool = True) -> None:
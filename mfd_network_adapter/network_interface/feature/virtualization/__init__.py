@@ -2,14 +2,38 @@
 # SPDX-License-Identifier: MIT
 """Module for Virtualization feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureVirtualization
-from .esxi import EsxiVirtualization
-from .freebsd import FreeBsdVirtualization
-from .linux import LinuxVirtualization
-from .windows import WindowsVirtualization
-
-VirtualizationFeatureType = Union[
-    BaseFeatureVirtualization, EsxiVirtualization, FreeBsdVirtualization, LinuxVirtualization, WindowsVirtualization
-]
+
+if TYPE_CHECKING:
+    from .esxi import EsxiVirtualization
+    from .freebsd import FreeBsdVirtualization
+    from .linux import LinuxVirtualization
+    from .windows import WindowsVirtualization
+
+    VirtualizationFeatureType = Union[
+        BaseFeatureVirtualization, EsxiVirtualization, FreeBsdVirtualization, LinuxVirtualization, WindowsVirtualization
+    ]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "EsxiVirtualization": ".esxi",
+        "FreeBsdVirtualization": ".freebsd",
+        "LinuxVirtualization": ".linux",
+        "WindowsVirtualization": ".windows",
+    },
+    {
+        "VirtualizationFeatureType": (
+            "BaseFeatureVirtualization",
+            "EsxiVirtualization",
+            "FreeBsdVirtualization",
+            "LinuxVirtualization",
+            "WindowsVirtualization",
+        )
+    },
+)
@@ -2,10 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for VLAN feature."""
 
+from typing import TYPE_CHECKING
+
+from mfd_network_adapter.lazy_import import lazy_import
+
 from .base import BaseFeatureVLAN
-from .esxi import EsxiVLAN
-from .freebsd import FreeBsdVLAN
-from .linux import LinuxVLAN
-from .windows import WindowsVLAN
 
-VLANFeatureType = BaseFeatureVLAN | EsxiVLAN | FreeBsdVLAN | LinuxVLAN | WindowsVLAN
+if TYPE_CHECKING:
+    from .esxi import EsxiVLAN
+    from .freebsd import FreeBsdVLAN
+    from .linux import LinuxVLAN
+    from .windows import WindowsVLAN
+
+    VLANFeatureType = BaseFeatureVLAN | EsxiVLAN | FreeBsdVLAN | LinuxVLAN | WindowsVLAN
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"EsxiVLAN": ".esxi", "FreeBsdVLAN": ".freebsd", "LinuxVLAN": ".linux", "WindowsVLAN": ".windows"},
+    {"VLANFeatureType": ("BaseFeatureVLAN", "EsxiVLAN", "FreeBsdVLAN", "LinuxVLAN", "WindowsVLAN")},
+)
@@ -2,12 +2,23 @@
 # SPDX-License-Identifier: MIT
 """Module for Wol feature."""
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+from mfd_network_adapter.lazy_import import lazy_import
 
 from .base import BaseFeatureWol
-from .windows import WindowsWol
-from .linux import LinuxWol
-from .freebsd import FreeBsdWol
-from .esxi import EsxiWol
 
-WolFeatureType = Union[BaseFeatureWol, WindowsWol, LinuxWol, FreeBsdWol, EsxiWol]
+if TYPE_CHECKING:
+    from .windows import WindowsWol
+    from .linux import LinuxWol
+    from .freebsd import FreeBsdWol
+    from .esxi import EsxiWol
+
+    WolFeatureType = Union[BaseFeatureWol, WindowsWol, LinuxWol, FreeBsdWol, EsxiWol]
+
+# OS-specific modules are imported on first access of their names
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {"WindowsWol": ".windows", "LinuxWol": ".linux", "FreeBsdWol": ".freebsd", "EsxiWol": ".esxi"},
+    {"WolFeatureType": ("BaseFeatureWol", "WindowsWol", "LinuxWol", "FreeBsdWol", "EsxiWol")},
+)
@@ -6,7 +6,6 @@ import logging
 from typing import TYPE_CHECKING, List
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_ethtool.base import Ethtool
 from mfd_ethtool.exceptions import EthtoolException
 from mfd_network_adapter.network_interface.exceptions import WolFeatureException
 from mfd_network_adapter.data_structures import State
@@ -35,7 +34,7 @@ class LinuxWol(BaseFeatureWol):
         """
         super().__init__(connection=connection, interface=interface)
         # create object for ethtool mfd
-        self._ethtool = Ethtool(connection=connection)
+        self._ethtool = self._interface().ethtool
 
     def get_supported_wol_options(self) -> List[WolOptions]:
         """Get supported wake on LAN options by interface.
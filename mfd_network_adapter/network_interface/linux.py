@@ -4,20 +4,31 @@
 
 import logging
 import re
+import shlex
 from dataclasses import fields
-from typing import Dict, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple, Union
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_connect.exceptions import ConnectionCalledProcessError
 from mfd_kernel_namespace import add_namespace_call_command
+from mfd_const import Family, Speed
 from mfd_typing import MACAddress
 from mfd_typing.driver_info import DriverInfo
 from mfd_typing.network_interface import LinuxInterfaceInfo, VsiInfo
 
 from mfd_network_adapter import NetworkAdapterOwner
 from .base import NetworkInterface
-from .data_structures import RingBufferSettings, RingBuffer
+from .capabilities import (
+    DeviceCapabilities,
+    get_capabilities_catalog,
+    get_family_name,
+    get_speed_name,
+    parse_channel_maxima,
+    parse_ring_maxima,
+)
+from .data_structures import InterfaceSnapshot, RingBufferSettings, RingBuffer
 from .exceptions import (
+    InterfaceSnapshotException,
     BrandingStringException,
     DeviceStringException,
     NetworkQueuesException,
@@ -28,21 +39,38 @@ from .exceptions import (
     FirmwareVersionNotFound,
     DeviceSetupException,
 )
+from .feature.rss.data_structures import RSSIndirectionTable
 from ..api.basic.linux import get_mac_address
+from ..network_adapter_owner.batch import BatchConnection
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
     from mfd_model.config import NetworkInterfaceModelBase
     from mfd_libibverbs_utils import IBVDevices
 
+    from .ethtool_cache import CachedEthtool
+
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+SNAPSHOT_SECTION_MARKER = "### "
+SNAPSHOT_SETTING_REGEX = re.compile(r"^\s*(?P<name>[A-Za-z][A-Za-z0-9 -]*?)\s*:\s+(?P<value>\S+)\s*$")
+SNAPSHOT_FEATURE_REGEX = re.compile(r"^\s*(?P<name>[a-z0-9-]+):\s+(?P<value>on|off)(?P<fixed>\s+\[fixed\])?")
+SNAPSHOT_SYSFS_REGEX = re.compile(r"/(?P<name>mtu|tx_queue_len|flags):(?P<value>\S+)$", re.MULTILINE)
+RING_NAMES = {"RX": "rx", "RX Mini": "rx-mini", "RX Jumbo": "rx-jumbo", "TX": "tx"}
+CHANNEL_NAMES = {"RX": "rx", "TX": "tx", "Other": "other", "Combined": "combined"}
+PAUSE_NAMES = {"Autonegotiate": "autoneg", "RX": "rx", "TX": "tx"}
+# settings, change of which resets queues of the device, applied while link is down
+DISRUPTIVE_SNAPSHOT_FIELDS = ("channels", "rings", "mtu", "private_flags")
+IFF_UP = 0x1
+
 
 class LinuxNetworkInterface(NetworkInterface):
     """Class to handle Network Interface in Linux."""
 
     _ibv_devices: "IBVDevices" = None
+    _ethtool: "CachedEthtool" = None
+    _capabilities: "DeviceCapabilities | None" = None
 
     def __init__(
         self,
@@ -176,6 +204,21 @@ class LinuxNetworkInterface(NetworkInterface):
                 f"Failed to set network queues for interface {self.name}." f"\n{result.stdout}"
             )
 
+    @property
+    def ethtool(self) -> "CachedEthtool":
+        """
+        Ethtool of interface shared by its features, established with first usage.
+
+        Static data (driver information, pre-set maximums, supported link modes) is cached until driver reload.
+
+        :return CachedEthtool
+        """
+        if self._ethtool is None:
+            from .ethtool_cache import CachedEthtool
+
+            self._ethtool = CachedEthtool(connection=self._connection, pci_device=self.pci_device)
+        return self._ethtool
+
     @property
     def ibv_devices(self) -> "IBVDevices":
         """
@@ -320,3 +363,348 @@ class LinuxNetworkInterface(NetworkInterface):
     def restart(self) -> None:
         """Restart interface."""
         raise NotImplementedError
+
+    def _get_snapshot_script(self) -> str:
+        """Get shell script printing all tunable settings of interface, section by section."""
+        sysfs = f"/sys/class/net/{self.name}"
+        commands = {
+            "sysfs": f"grep -H . {sysfs}/mtu {sysfs}/tx_queue_len {sysfs}/flags",
+            "rings": f"ethtool -g {self.name}",
+            "channels": f"ethtool -l {self.name}",
+            "coalesce": f"ethtool -c {self.name}",
+            "pause": f"ethtool -a {self.name}",
+            "features": f"ethtool -k {self.name}",
+            "private_flags": f"ethtool --show-priv-flags {self.name}",
+            "wol": f"ethtool {self.name}",
+            "rss": f"ethtool -x {self.name}",
+        }
+        script = "; ".join(
+            f"echo '{SNAPSHOT_SECTION_MARKER}{section}'; {command} 2>/dev/null" for section, command in commands.items()
+        )
+        if self.namespace is not None:
+            script = f"ip netns exec {self.namespace} sh -c {shlex.quote(script)}"
+        return script
+
+    @staticmethod
+    def _parse_current_settings(output: str, names: Dict[str, str]) -> Dict[str, int]:
+        """
+        Parse current hardware settings from output of `ethtool -g` or `ethtool -l`.
+
+        :param output: ethtool output
+        :param names: Dictionary {name in output: name of ethtool set option}
+        :return: Dictionary {option: value}, settings not supported by device ('n/a') are skipped
+        """
+        _, _, current = output.partition("Current hardware settings:")
+        settings = {}
+        for line in current.splitlines():
+            match = SNAPSHOT_SETTING_REGEX.match(line)
+            if match and match["name"] in names and match["value"].isdigit():
+                settings[names[match["name"]]] = int(match["value"])
+        return settings
+
+    @staticmethod
+    def _parse_coalesce(output: str) -> Dict[str, str]:
+        """
+        Parse output of `ethtool -c`.
+
+        :param output: ethtool output
+        :return: Dictionary {option: value}, settings not supported by device ('n/a') are skipped
+        """
+        settings = {}
+        adaptive = re.search(r"Adaptive RX:\s+(?P<rx>on|off)\s+TX:\s+(?P<tx>on|off)", output)
+        if adaptive:
+            settings.update({"adaptive-rx": adaptive["rx"], "adaptive-tx": adaptive["tx"]})
+        for line in output.splitlines():
+            match = SNAPSHOT_SETTING_REGEX.match(line)
+            if match and re.fullmatch(r"[a-z][a-z0-9-]*", match["name"]) and match["value"] != "n/a":
+                settings[match["name"]] = match["value"]
+        return settings
+
+    @staticmethod
+    def _split_sections(output: str) -> Dict[str, List[str]]:
+        """
+        Split output of script printing sections, each started with SNAPSHOT_SECTION_MARKER and its name.
+
+        :param output: Output of script
+        :return: Dictionary {section name: lines of section}
+        """
+        sections: Dict[str, List[str]] = {}
+        current = None
+        for line in output.splitlines():
+            if line.startswith(SNAPSHOT_SECTION_MARKER):
+                current = line.removeprefix(SNAPSHOT_SECTION_MARKER).strip()
+                sections[current] = []
+            elif current is not None:
+                sections[current].append(line)
+        return sections
+
+    @classmethod
+    def _parse_snapshot(cls, output: str) -> InterfaceSnapshot:
+        """
+        Parse output of snapshot script.
+
+        :param output: Output of snapshot script
+        :return: InterfaceSnapshot object
+        """
+        sections = cls._split_sections(output)
+        sections_output = {name: "\n".join(lines) for name, lines in sections.items()}
+
+        snapshot = InterfaceSnapshot()
+        sysfs_output = sections_output.get("sysfs", "")
+        sysfs = {match["name"]: match["value"] for match in SNAPSHOT_SYSFS_REGEX.finditer(sysfs_output)}
+        if "mtu" in sysfs:
+            snapshot.mtu = int(sysfs["mtu"])
+        if "tx_queue_len" in sysfs:
+            snapshot.tx_queue_len = int(sysfs["tx_queue_len"])
+        if "flags" in sysfs:
+            snapshot.up = bool(int(sysfs["flags"], 16) & IFF_UP)
+        snapshot.rings = cls._parse_current_settings(sections_output.get("rings", ""), RING_NAMES)
+        snapshot.channels = cls._parse_current_settings(sections_output.get("channels", ""), CHANNEL_NAMES)
+        snapshot.coalesce = cls._parse_coalesce(sections_output.get("coalesce", ""))
+        for line in sections.get("pause", []):
+            match = SNAPSHOT_SETTING_REGEX.match(line)
+            if match and match["name"] in PAUSE_NAMES:
+                snapshot.pause[PAUSE_NAMES[match["name"]]] = match["value"]
+        for line in sections.get("features", []):
+            match = SNAPSHOT_FEATURE_REGEX.match(line)
+            if match and not match["fixed"]:
+                snapshot.features[match["name"]] = match["value"]
+        for line in sections.get("private_flags", []):
+            match = SNAPSHOT_SETTING_REGEX.match(line)
+            if match and match["value"] in ("on", "off"):
+                snapshot.private_flags[match["name"]] = match["value"]
+        wol = re.search(r"^\s*Wake-on:\s+(?P<wol>\w+)", sections_output.get("wol", ""), re.MULTILINE)
+        if wol:
+            snapshot.wol = wol["wol"]
+        rss = RSSIndirectionTable.from_ethtool_output(sections_output.get("rss", ""))
+        if len(rss) or rss.hash_key or rss.hash_functions:
+            snapshot.rss = rss
+        return snapshot
+
+    def snapshot(self) -> InterfaceSnapshot:
+        """
+        Capture tunable settings of interface in one remote call.
+
+        MTU, Tx queue length, link state, rings, channels, coalescing, flow control, offloads (non-fixed features),
+        private flags, Wake-on-LAN and RSS indirection table/hash key/function are collected.
+
+        :return: InterfaceSnapshot object
+        """
+        output = self._connection.execute_command(
+            self._get_snapshot_script(), shell=True, expected_return_codes=None
+        ).stdout
+        return self._parse_snapshot(output)
+
+    def _get_capabilities_script(self) -> str:
+        """Get shell script printing static data of device of interface, section by section."""
+        commands = {
+            "driver": f"ethtool -i {self.name}",
+            "channels": f"ethtool -l {self.name}",
+            "rings": f"ethtool -g {self.name}",
+            "sriov": f"cat /sys/class/net/{self.name}/device/sriov_totalvfs",
+        }
+        script = "; ".join(
+            f"echo '{SNAPSHOT_SECTION_MARKER}{section}'; {command} 2>/dev/null" for section, command in commands.items()
+        )
+        if self.namespace is not None:
+            script = f"ip netns exec {self.namespace} sh -c {shlex.quote(script)}"
+        return script
+
+    def _parse_capabilities(self, output: str) -> DeviceCapabilities:
+        """
+        Parse output of capabilities script.
+
+        :param output: Output of capabilities script
+        :return: DeviceCapabilities object
+        """
+        from mfd_ethtool import Ethtool
+
+        sections = {name: "\n".join(lines) for name, lines in self._split_sections(output).items()}
+
+        def parse(section: str, option: str = "") -> Any:
+            try:
+                return Ethtool.parser.parse(sections[section], option) if sections.get(section, "").strip() else None
+            except Exception:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Unable to parse {section} of {self.name}")
+                return None
+
+        driver = parse("driver", "-i")
+        # family and speed are known only for Intel devices
+        intel_device = self.pci_device is not None and str(self.pci_device.vendor_id) == "8086"
+        device_id = self.pci_device.device_id if intel_device else None
+        family, speed = get_family_name(device_id), get_speed_name(device_id)
+        sriov = sections.get("sriov", "").strip()
+        return DeviceCapabilities(
+            pci_device=self.pci_device,
+            driver_name=driver.driver[0] if driver is not None and getattr(driver, "driver", None) else None,
+            driver_version=driver.version[0] if driver is not None and getattr(driver, "version", None) else None,
+            family=getattr(Family, family) if family is not None else None,
+            speed=Speed(speed) if speed is not None else None,
+            max_channels=parse_channel_maxima(parse("channels", "-l")),
+            max_rings=parse_ring_maxima(parse("rings", "-g")),
+            max_vfs=int(sriov) if sriov.isdigit() else None,
+        )
+
+    @property
+    def capabilities(self) -> DeviceCapabilities:
+        """
+        Capabilities of device of interface, probed once in single remote call.
+
+        Capabilities are shared by interfaces of host with the same PCI device, so other ports of adapter are not
+        probed again, until driver load, unload or reload is done by driver feature of owner.
+
+        :return: DeviceCapabilities object
+        """
+        if self.pci_device is None:
+            # device cannot be identified, capabilities are not shared
+            if self._capabilities is None:
+                self._capabilities = self._probe_capabilities()
+            return self._capabilities
+        catalog = get_capabilities_catalog(self._connection)
+        capabilities = catalog.get(self.pci_device)
+        if capabilities is None:
+            capabilities = self._probe_capabilities()
+            catalog.add(capabilities)
+        return capabilities
+
+    def _probe_capabilities(self) -> DeviceCapabilities:
+        """Probe capabilities of device of interface in single remote call."""
+        output = self._connection.execute_command(
+            self._get_capabilities_script(), shell=True, expected_return_codes=None
+        ).stdout
+        return self._parse_capabilities(output)
+
+    @staticmethod
+    def _get_rss_table_param(table: RSSIndirectionTable) -> Optional[str]:
+        """
+        Get `ethtool -X` parameter producing indirection table.
+
+        :param table: Indirection table
+        :return: 'equal N' or 'weight W0 W1 ...', None if table is not spread equally or by weights over queues
+        """
+        queue_weights = table.get_queue_weights()
+        weights = [queue_weights.get(queue, 0) for queue in range(max(queue_weights) + 1)]
+        if RSSIndirectionTable.from_equal(len(table), len(weights)).entries == table.entries:
+            return f"equal {len(weights)}"
+        if RSSIndirectionTable.from_weights(len(table), weights).entries == table.entries:
+            return f"weight {' '.join(map(str, weights))}"
+        return None
+
+    def _get_rss_restore_params(
+        self, expected: RSSIndirectionTable, current: Optional[RSSIndirectionTable], force_table: bool
+    ) -> List[str]:
+        """
+        Get `ethtool -X` parameters restoring RSS settings.
+
+        :param expected: RSS settings from snapshot
+        :param current: Current RSS settings
+        :param force_table: Set indirection table even if it matches, e.g. when channels are changed before
+        :return: List of parameters
+        """
+        current = current or RSSIndirectionTable()
+        params = []
+        if len(expected) and (force_table or expected.entries != current.entries):
+            table_param = self._get_rss_table_param(expected)
+            if table_param is None:
+                logger.warning(f"RSS indirection table of {self.name} is not spread by weights, cannot be restored.")
+            else:
+                params.append(table_param)
+        if expected.hash_key is not None and expected.hash_key != current.hash_key:
+            params.append(f"hkey {expected.hash_key}")
+        if expected.hash_function is not None and expected.hash_function != current.hash_function:
+            params.append(f"hfunc {expected.hash_function}")
+        return params
+
+    def _get_restore_commands(
+        self, snapshot: InterfaceSnapshot, current: InterfaceSnapshot, diff: Dict[str, Tuple[Any, Any]]
+    ) -> List[str]:
+        """
+        Get commands restoring differing settings, in safe order with at most one link flap.
+
+        :param snapshot: Snapshot to restore
+        :param current: Current settings
+        :param diff: Difference between snapshot and current settings
+        :return: List of commands
+        """
+        changed = {key.split(".", 1)[0] for key in diff}
+
+        def changed_options(name: str) -> str:
+            values = getattr(snapshot, name).items()
+            return " ".join(f"{key} {value}" for key, value in values if f"{name}.{key}" in diff)
+
+        commands = []
+        flap = bool(current.up) and bool(changed.intersection(DISRUPTIVE_SNAPSHOT_FIELDS))
+        if flap:
+            commands.append(f"ip link set dev {self.name} down")
+        if "channels" in changed:
+            commands.append(f"ethtool -L {self.name} {changed_options('channels')}")
+        if "rings" in changed:
+            commands.append(f"ethtool -G {self.name} {changed_options('rings')}")
+        if "mtu" in changed:
+            commands.append(f"ip link set dev {self.name} mtu {snapshot.mtu}")
+        if "tx_queue_len" in changed:
+            commands.append(f"ip link set dev {self.name} txqueuelen {snapshot.tx_queue_len}")
+        if "private_flags" in changed:
+            commands.append(f"ethtool --set-priv-flags {self.name} {changed_options('private_flags')}")
+        if "features" in changed:
+            commands.append(f"ethtool -K {self.name} {changed_options('features')}")
+        if "coalesce" in changed:
+            commands.append(f"ethtool -C {self.name} {changed_options('coalesce')}")
+        if "pause" in changed:
+            commands.append(f"ethtool -A {self.name} {changed_options('pause')}")
+        if "wol" in changed:
+            commands.append(f"ethtool -s {self.name} wol {snapshot.wol}")
+        if snapshot.rss is not None and ("rss" in changed or "channels" in changed):
+            params = self._get_rss_restore_params(snapshot.rss, current.rss, force_table="channels" in changed)
+            if params:
+                commands.append(f"ethtool -X {self.name} {' '.join(params)}")
+        if snapshot.up is not None and (flap or "up" in changed):
+            commands.append(f"ip link set dev {self.name} {'up' if snapshot.up else 'down'}")
+        return commands
+
+    def restore(self, snapshot: InterfaceSnapshot) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Restore settings of interface from snapshot.
+
+        Current settings are read first, only differing ones are applied, in one remote call and verified.
+        Channels, rings, MTU and private flags are changed while link is down, so link is flapped at most once.
+
+        :param snapshot: Snapshot returned by snapshot()
+        :return: Restored difference {'<field>[.<key>]': (snapshot value, value before restore)}
+        :raises InterfaceSnapshotException: When any command failed or settings don't match after restore
+        """
+        # mfd_ethtool is imported on first use, not with interface module
+        from mfd_ethtool.const import ETHTOOL_RC_VALUE_UNCHANGED
+
+        current = self.snapshot()
+        diff = snapshot.diff(current)
+        if not diff:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Settings of {self.name} already match the snapshot.")
+            return diff
+
+        commands = self._get_restore_commands(snapshot, current, diff)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Restoring {len(diff)} settings of {self.name}.")
+        batch = BatchConnection(self._connection)
+        for command in commands:
+            expected_return_codes = {0, ETHTOOL_RC_VALUE_UNCHANGED} if command.startswith("ethtool") else {0}
+            batch.execute_command(
+                add_namespace_call_command(command, self.namespace), expected_return_codes=expected_return_codes
+            )
+        batch.execute_command(self._get_snapshot_script(), expected_return_codes=None)
+        calls = batch.execute(raise_on_error=False)
+
+        failed = [call for call in calls if call.failed]
+        if failed:
+            details = "\n".join(
+                f"'{call.command}' was not executed"
+                if call.return_code is None
+                else f"'{call.command}' returned {call.return_code}: {call.output}"
+                for call in failed
+            )
+            raise InterfaceSnapshotException(f"Restore of {self.name} settings failed:\n{details}")
+        remaining = snapshot.diff(self._parse_snapshot(calls[-1].output))
+        if "rss.entries" in remaining and self._get_rss_table_param(snapshot.rss) is None:
+            remaining.pop("rss.entries")
+        if remaining:
+            raise InterfaceSnapshotException(f"Settings of {self.name} not restored: {remaining}")
+        return diff
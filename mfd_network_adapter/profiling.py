@@ -0,0 +1,275 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for command-level profiling of remote calls of owner, interfaces and their features."""
+
+import json
+import logging
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from mfd_common_libs import add_logging_level, log_levels
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+PROFILED_METHODS = ("execute_command", "execute_powershell")
+PACKAGE_NAME = __name__.rpartition(".")[0]
+# connection proxies, their frames are part of stack, but not reported as calling feature
+PROXY_MODULES = (
+    __name__,
+    f"{PACKAGE_NAME}.command_cache",
+    f"{PACKAGE_NAME}.network_adapter_owner.batch",
+    f"{PACKAGE_NAME}.network_adapter_owner.namespace_parallel",
+    f"{PACKAGE_NAME}.iproute2",
+)
+
+
+@dataclass
+class CommandRecord:
+    """
+    Single remote call recorded by CommandProfiler.
+
+    Parse time is the time spent by the caller after the command returned, until the next recorded call
+    or end of profiling, e.g. parsing of output.
+    """
+
+    feature: str
+    method: str
+    command: str
+    api: str
+    start: float
+    latency: float
+    stdout_size: int
+    return_code: int | None
+    parse_time: float = 0.0
+    stack: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CommandStats:
+    """Aggregated records of the same command called by the same feature method."""
+
+    feature: str
+    method: str
+    command: str
+    calls: int = 0
+    latency: float = 0.0
+    parse_time: float = 0.0
+    stdout_size: int = 0
+
+
+class CommandProfiler:
+    """
+    Opt-in profiler of remote calls, installed on connection shared by owner, interfaces and all features.
+
+    When started, execute_command/execute_powershell of connection object are replaced with recording wrappers,
+    when stopped, original methods are restored - there is no overhead when profiling is not active.
+    Calling feature and method are found in call stack, as the innermost frame of mfd_network_adapter.
+
+    Usage::
+
+        with owner.profile() as profiler:
+            interface.stats.get_stats()
+        print(profiler.to_flame())
+    """
+
+    def __init__(self, connection: "Connection") -> None:
+        """
+        Initialize CommandProfiler.
+
+        :param connection: Object of mfd-connect to profile
+        """
+        self._connection = connection
+        self._originals: dict[str, Callable] = {}
+        self._last_end: float | None = None
+        self.records: list[CommandRecord] = []
+        self.trace_id = f"{random.getrandbits(128):032x}"
+
+    def __enter__(self) -> "CommandProfiler":
+        """Start profiling."""
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop profiling."""
+        self.stop()
+
+    @property
+    def active(self) -> bool:
+        """Check whether profiler is installed on connection."""
+        return bool(self._originals)
+
+    def start(self) -> None:
+        """Install recording wrappers on connection."""
+        if self.active:
+            return
+        for name in PROFILED_METHODS:
+            original = getattr(self._connection, name, None)
+            if original is not None:
+                self._originals[name] = original
+                setattr(self._connection, name, self._wrap(name, original))
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Command profiling started.")
+
+    def stop(self) -> None:
+        """Restore original methods of connection, parse time of the last record is closed."""
+        for name, original in self._originals.items():
+            setattr(self._connection, name, original)
+        self._originals = {}
+        self._close_parse_time(time.perf_counter())
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Command profiling stopped, {len(self.records)} calls recorded.")
+
+    def _close_parse_time(self, now: float) -> None:
+        """
+        Set parse time of the last record.
+
+        :param now: Current time of time.perf_counter()
+        """
+        if self._last_end is not None and self.records:
+            self.records[-1].parse_time = now - self._last_end
+        self._last_end = None
+
+    @staticmethod
+    def _get_caller_stack() -> tuple[list[str], str]:
+        """
+        Get frames of mfd_network_adapter calling the connection.
+
+        :return: Tuple (frames as 'Class.method' or 'module.function', outermost first;
+            the innermost frame, which is not connection proxy - calling feature method, empty if not found)
+        """
+        stack = []
+        caller = ""
+        frame = sys._getframe(1)
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith(PACKAGE_NAME) and module != __name__:
+                instance = frame.f_locals.get("self")
+                scope = type(instance).__name__ if instance is not None else module.rpartition(".")[2]
+                stack.append(f"{scope}.{frame.f_code.co_name}")
+                if not caller and module not in PROXY_MODULES:
+                    caller = stack[-1]
+            frame = frame.f_back
+        return stack[::-1], caller
+
+    def _wrap(self, api: str, original: Callable) -> Callable:
+        """
+        Get recording wrapper of connection method.
+
+        :param api: Name of wrapped method
+        :param original: Wrapped method
+        :return: Wrapper
+        """
+
+        def wrapper(command: str, *args, **kwargs) -> Any:
+            start = time.perf_counter()
+            self._close_parse_time(start)
+            stack, caller = self._get_caller_stack()
+            feature, _, method = caller.rpartition(".")
+            record = CommandRecord(
+                feature=feature,
+                method=method,
+                command=command,
+                api=api,
+                start=time.time(),
+                latency=0.0,
+                stdout_size=0,
+                return_code=None,
+                stack=stack,
+            )
+            try:
+                result = original(command, *args, **kwargs)
+            except Exception as e:
+                record.return_code = getattr(e, "returncode", None)
+                record.stdout_size = len(getattr(e, "output", None) or "")
+                raise
+            finally:
+                self._last_end = time.perf_counter()
+                record.latency = self._last_end - start
+                self.records.append(record)
+            record.return_code = getattr(result, "return_code", None)
+            record.stdout_size = len(getattr(result, "stdout", None) or "")
+            return result
+
+        return wrapper
+
+    def get_summary(self) -> list[CommandStats]:
+        """
+        Aggregate records by feature, method and command.
+
+        :return: List of CommandStats, sorted by total latency, descending
+        """
+        stats: dict[tuple[str, str, str], CommandStats] = {}
+        for record in self.records:
+            key = (record.feature, record.method, record.command)
+            command_stats = stats.setdefault(key, CommandStats(*key))
+            command_stats.calls += 1
+            command_stats.latency += record.latency
+            command_stats.parse_time += record.parse_time
+            command_stats.stdout_size += record.stdout_size
+        return sorted(stats.values(), key=lambda item: item.latency, reverse=True)
+
+    def to_flame(self) -> str:
+        """
+        Export records as folded stacks, input of flame graph tools (e.g. flamegraph.pl, speedscope).
+
+        Each line is 'frame;frame;...;command <microseconds>', latency and parse time of the same stack are summed.
+
+        :return: Folded stacks, one per line
+        """
+        folded: dict[str, int] = defaultdict(int)
+        for record in self.records:
+            frames = [*record.stack, record.command.replace(";", ",").replace("\n", " ")]
+            folded[";".join(frames)] += round((record.latency + record.parse_time) * 1_000_000)
+        return "\n".join(f"{stack} {micros}" for stack, micros in folded.items())
+
+    def to_json(self) -> str:
+        """
+        Export records and summary as JSON.
+
+        :return: JSON document {"records": [...], "summary": [...]}
+        """
+        return json.dumps(
+            {
+                "records": [asdict(record) for record in self.records],
+                "summary": [asdict(stats) for stats in self.get_summary()],
+            }
+        )
+
+    def to_spans(self) -> list[dict[str, Any]]:
+        """
+        Export records as OpenTelemetry-like spans, one span per remote call, all in the trace of profiler.
+
+        :return: List of spans
+        """
+        spans = []
+        for record in self.records:
+            start = int(record.start * 1_000_000_000)
+            spans.append(
+                {
+                    "name": f"{record.feature}.{record.method}" if record.feature else record.api,
+                    "trace_id": self.trace_id,
+                    "span_id": f"{random.getrandbits(64):016x}",
+                    "parent_span_id": None,
+                    "kind": "CLIENT",
+                    "start_time_unix_nano": start,
+                    "end_time_unix_nano": start + int(record.latency * 1_000_000_000),
+                    "status": {"code": "OK" if not record.return_code else "ERROR"},
+                    "attributes": {
+                        "mfd.api": record.api,
+                        "mfd.command": record.command,
+                        "mfd.feature": record.feature,
+                        "mfd.method": record.method,
+                        "mfd.return_code": record.return_code,
+                        "mfd.stdout_size": record.stdout_size,
+                        "mfd.parse_time_ms": record.parse_time * 1000,
+                        "code.stacktrace": ";".join(record.stack),
+                    },
+                }
+            )
+        return spans
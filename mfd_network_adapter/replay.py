@@ -0,0 +1,315 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for recording transcripts of remote calls and replaying them offline."""
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
+from subprocess import CalledProcessError
+from typing import Any, Iterable, Type
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSName, OSType
+
+from .exceptions import CommandNotRecordedException
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class TranscriptEntry:
+    """Single recorded remote call and its result."""
+
+    api: str
+    command: str
+    stdout: str = ""
+    stderr: str = ""
+    return_code: int = 0
+
+
+def save_transcript(path: str | Path, os_name: OSName, entries: Iterable[TranscriptEntry]) -> None:
+    """
+    Save transcript as JSON file.
+
+    :param path: Path of file
+    :param os_name: OS of recorded host
+    :param entries: Recorded calls
+    """
+    document = {"os_name": os_name.value, "entries": [asdict(entry) for entry in entries]}
+    Path(path).write_text(json.dumps(document, indent=1))
+
+
+def load_transcript(path: str | Path) -> tuple[OSName, list[TranscriptEntry]]:
+    """
+    Load transcript from JSON file.
+
+    :param path: Path of file saved by save_transcript
+    :return: Tuple (OS of recorded host, recorded calls)
+    """
+    document = json.loads(Path(path).read_text())
+    return OSName(document["os_name"]), [TranscriptEntry(**entry) for entry in document["entries"]]
+
+
+def _get_stream(result: ConnectionCompletedProcess | CalledProcessError, name: str) -> str:
+    """
+    Get output stream of result, empty if connection does not support it.
+
+    :param result: Result of command or exception raised for unexpected return code
+    :param name: Name of stream, 'stdout' or 'stderr'
+    :return: Content of stream
+    """
+    try:
+        return getattr(result, name) or ""
+    except NotImplementedError:
+        return ""
+
+
+# registered as virtual subclasses, owner and interfaces accept only objects of mfd-connect Connection
+@Connection.register
+class RecordingConnection:
+    """
+    Connection proxy recording transcript of execute_command/execute_powershell calls of wrapped connection.
+
+    Other connection methods are passed to the wrapped connection. Recorded transcript can be saved with
+    :meth:`save` and served offline by :class:`ReplayConnection`, e.g. to benchmark parsers without the host.
+
+    Usage::
+
+        recording = RecordingConnection(connection)
+        owner = NetworkAdapterOwner(connection=recording)
+        owner.get_interfaces()
+        recording.save("discovery.json")
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Initialize RecordingConnection.
+
+        :param connection: Object of mfd-connect
+        """
+        self._connection = connection
+        self.entries: list[TranscriptEntry] = []
+
+    def __getattr__(self, item: str) -> Any:
+        """Pass not overridden attributes to wrapped connection."""
+        return getattr(self._connection, item)
+
+    def execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """
+        Execute command on wrapped connection and record its result.
+
+        :param command: Command to execute
+        :param kwargs: Parameters of execute_command
+        :return: Result of command
+        """
+        return self._record("execute_command", command, **kwargs)
+
+    def execute_powershell(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """
+        Execute powershell command on wrapped connection and record its result.
+
+        :param command: Command to execute
+        :param kwargs: Parameters of execute_powershell
+        :return: Result of command
+        """
+        return self._record("execute_powershell", command, **kwargs)
+
+    def _record(self, api: str, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """
+        Call method of wrapped connection and record its result, also if unexpected return code was raised.
+
+        :param api: Name of connection method
+        :param command: Command to execute
+        :param kwargs: Parameters of method
+        :return: Result of command
+        """
+        try:
+            result = getattr(self._connection, api)(command, **kwargs)
+        except CalledProcessError as e:
+            self.entries.append(
+                TranscriptEntry(api, command, _get_stream(e, "stdout"), _get_stream(e, "stderr"), e.returncode)
+            )
+            raise
+        self.entries.append(
+            TranscriptEntry(
+                api, command, _get_stream(result, "stdout"), _get_stream(result, "stderr"), result.return_code
+            )
+        )
+        return result
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save recorded transcript as JSON file, readable by ReplayConnection.load.
+
+        :param path: Path of file
+        """
+        save_transcript(path, self._connection.get_os_name(), self.entries)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Saved transcript of {len(self.entries)} calls to {path}.")
+
+
+@Connection.register
+class ReplayConnection:
+    """
+    Connection serving recorded transcript instead of executing commands on the host.
+
+    Results of the same command are served in recorded order, the last one is repeated when all were served,
+    so polled commands and repeated benchmark rounds are replayed as well.
+    Return codes are validated as by mfd-connect (expected_return_codes, custom_exception).
+    Each served call is counted in rpc_count and delayed by latency, if given, to simulate round trip to the host.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[TranscriptEntry],
+        os_name: OSName,
+        latency: float = 0.0,
+        ip: str = "127.0.0.1",
+    ) -> None:
+        """
+        Initialize ReplayConnection.
+
+        :param entries: Recorded calls
+        :param os_name: OS of recorded host
+        :param latency: Simulated latency of each call in seconds
+        :param ip: IP address of recorded host
+        """
+        self._os_name = os_name
+        self._ip = ip
+        self.ip = ip
+        self.latency = latency
+        self.rpc_count = 0
+        self._entries: dict[tuple[str, str], list[TranscriptEntry]] = {}
+        self._served: dict[tuple[str, str], int] = {}
+        self.add_entries(entries)
+
+    @classmethod
+    def load(cls, path: str | Path, latency: float = 0.0, ip: str = "127.0.0.1") -> "ReplayConnection":
+        """
+        Create ReplayConnection from transcript file saved by RecordingConnection.
+
+        :param path: Path of file
+        :param latency: Simulated latency of each call in seconds
+        :param ip: IP address of recorded host
+        :return: ReplayConnection object
+        """
+        os_name, entries = load_transcript(path)
+        return cls(entries, os_name=os_name, latency=latency, ip=ip)
+
+    def add_entries(self, entries: Iterable[TranscriptEntry]) -> None:
+        """
+        Add recorded calls to transcript.
+
+        :param entries: Recorded calls, served after already added results of the same command
+        """
+        for entry in entries:
+            self._entries.setdefault((entry.api, entry.command), []).append(entry)
+
+    def rewind(self) -> None:
+        """Serve transcript from the beginning and reset counter of calls."""
+        self._served.clear()
+        self.rpc_count = 0
+
+    def get_os_name(self) -> OSName:
+        """
+        Get OS of recorded host.
+
+        :return: OSName
+        """
+        return self._os_name
+
+    def get_os_type(self) -> OSType:
+        """
+        Get OS type of recorded host.
+
+        :return: OSType
+        """
+        return OSType.WINDOWS if self._os_name == OSName.WINDOWS else OSType.POSIX
+
+    def path(self, *args: str | PurePath) -> PurePath:
+        """
+        Get path on recorded host, file system of host is not recorded, so only pure path operations are supported.
+
+        :param args: Segments of path
+        :return: Pure path of OS of recorded host
+        """
+        return PureWindowsPath(*args) if self._os_name == OSName.WINDOWS else PurePosixPath(*args)
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Iterable[int] | None = frozenset({0}),
+        custom_exception: Type[CalledProcessError] | None = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Serve recorded result of command.
+
+        :param command: Command to execute
+        :param expected_return_codes: Return codes to be considered acceptable, if None - any return code is accepted
+        :param custom_exception: Exception raised on unexpected return code instead of ConnectionCalledProcessError
+        :param kwargs: Other execute_command parameters, ignored
+        :return: Recorded result of command
+        """
+        return self._replay("execute_command", command, expected_return_codes, custom_exception)
+
+    def execute_powershell(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Iterable[int] | None = frozenset({0}),
+        custom_exception: Type[CalledProcessError] | None = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Serve recorded result of powershell command.
+
+        :param command: Command to execute
+        :param expected_return_codes: Return codes to be considered acceptable, if None - any return code is accepted
+        :param custom_exception: Exception raised on unexpected return code instead of ConnectionCalledProcessError
+        :param kwargs: Other execute_powershell parameters, ignored
+        :return: Recorded result of command
+        """
+        return self._replay("execute_powershell", command, expected_return_codes, custom_exception)
+
+    def _replay(
+        self,
+        api: str,
+        command: str,
+        expected_return_codes: Iterable[int] | None,
+        custom_exception: Type[CalledProcessError] | None,
+    ) -> ConnectionCompletedProcess:
+        """
+        Get next recorded result of command.
+
+        :param api: Name of connection method
+        :param command: Command to execute
+        :param expected_return_codes: Return codes to be considered acceptable, if None - any return code is accepted
+        :param custom_exception: Exception raised on unexpected return code instead of ConnectionCalledProcessError
+        :return: Recorded result of command
+        :raises CommandNotRecordedException: When command is not found in transcript
+        """
+        self.rpc_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        key = (api, command)
+        entries = self._entries.get(key)
+        if not entries:
+            raise CommandNotRecordedException(f"Command not found in transcript ({api}): {command}")
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        entry = entries[min(served, len(entries) - 1)]
+
+        if expected_return_codes and entry.return_code not in expected_return_codes:
+            raise (custom_exception or ConnectionCalledProcessError)(
+                returncode=entry.return_code, cmd=command, output=entry.stdout, stderr=entry.stderr
+            )
+        return ConnectionCompletedProcess(
+            args=command, stdout=entry.stdout, stderr=entry.stderr, return_code=entry.return_code
+        )
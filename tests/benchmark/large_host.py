@@ -0,0 +1,340 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Transcripts of large hosts, replayed by benchmarks of parsers."""
+
+import json
+
+from mfd_kernel_namespace import add_namespace_call_command
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner.linux import (
+    LSPCI_ETHERNET_COMMAND,
+    PHYSFN_FIND_COMMAND,
+    SYS_CLASS_NET_COMMAND,
+    TUNNEL_LIST_COMMAND,
+)
+from mfd_network_adapter.network_adapter_owner.namespace_parallel import NamespaceParallelConnection
+from mfd_network_adapter.replay import ReplayConnection, TranscriptEntry
+
+CPU_COUNT = 256
+VF_COUNT = 128
+VLAN_COUNT = 4000
+NAMESPACE_COUNT = 20
+ADDRESS_COUNT = 10000
+NEIGHBOR_COUNT = 10000
+OID_COUNT = 500
+PERFORMANCE_SAMPLES = 5
+
+MANAGEMENT_IP = "10.10.10.10"
+PF_NAME = "ens1f0"
+PF_PCI_ADDRESS = "0000:5e:00.0"
+WINDOWS_NAME = "Ethernet"
+WINDOWS_BRANDING_STRING = "Intel(R) Ethernet Network Adapter E810-C-Q2"
+ESXI_NAME = "vmnic0"
+
+
+def entry(command: str, stdout: str = "", return_code: int = 0, api: str = "execute_command") -> TranscriptEntry:
+    """Create transcript entry."""
+    return TranscriptEntry(api=api, command=command, stdout=stdout, return_code=return_code)
+
+
+def get_prefetch_entries(commands: list[str], outputs: dict[str, str]) -> list[TranscriptEntry]:
+    """
+    Create entries of scripts executed by prefetch_commands.
+
+    :param commands: Prefetched commands, in order of prefetch
+    :param outputs: Dictionary {command: stdout}, missing commands return 1
+    :return: Entries of parallel scripts
+    """
+    parallel = NamespaceParallelConnection(None)
+    for command in dict.fromkeys(commands):
+        parallel.execute_command(command, expected_return_codes=None, discard_stderr=True)
+    entries = []
+    for chunk in parallel._split_jobs_into_chunks(parallel._get_jobs()):
+        lines = []
+        for number, job in enumerate(chunk):
+            for call in job.calls:
+                command = parallel.calls[call.index].command
+                if outputs.get(command):
+                    lines.append(outputs[command])
+                lines.append(f"@@MFD_BATCH@@ {call.index} {0 if command in outputs else 1}")
+            lines.append(f"@@MFD_NAMESPACE@@ {number} 0")
+        entries.append(entry(parallel._build_parallel_script(chunk), "\n".join(lines)))
+    return entries
+
+
+def get_vf_name(vf_id: int) -> str:
+    """Get name of VF netdev."""
+    return f"{PF_NAME}v{vf_id}"
+
+
+def get_vf_pci_address(vf_id: int) -> str:
+    """Get PCI address of VF, 8 functions per slot."""
+    return f"0000:5e:{vf_id // 8 + 1:02x}.{vf_id % 8}"
+
+
+def get_mac(index: int) -> str:
+    """Get MAC address of interface."""
+    return f"00:a0:c9:{index >> 16 & 0xFF:02x}:{index >> 8 & 0xFF:02x}:{index & 0xFF:02x}"
+
+
+def get_lspci_output() -> str:
+    """Get output of lspci, filtered to Ethernet controllers, with PF, management interface and all VFs."""
+    devices = [
+        ("0000:01:00.0", "Ethernet Controller X710 for 10GbE SFP+ [1572]"),
+        (PF_PCI_ADDRESS, "Ethernet Controller E810-C for QSFP [1592]"),
+    ]
+    devices += [(get_vf_pci_address(vf_id), "Ethernet Adaptive Virtual Function [1889]") for vf_id in range(VF_COUNT)]
+    return "\n\n".join(
+        f"Slot:\t{address}\nClass:\tEthernet controller [0200]\nVendor:\tIntel Corporation [8086]\nDevice:\t{device}\n"
+        f"SVendor:\tIntel Corporation [8086]\nSDevice:\tEthernet Network Adapter [0002]\nRev:\t02"
+        for address, device in devices
+    )
+
+
+def get_linux_namespaces() -> dict[str | None, list[tuple[str, str | None]]]:
+    """
+    Get netdevs of namespaces, VF of the same number is moved to each namespace, VLANs are created on PF.
+
+    :return: Dictionary {namespace: [(name, PCI address or None for virtual devices)]}
+    """
+    namespaces: dict[str | None, list[tuple[str, str | None]]] = {
+        None: [("lo", None), ("eth0", "0000:01:00.0"), (PF_NAME, PF_PCI_ADDRESS)]
+    }
+    for vf_id in range(VF_COUNT):
+        namespace = f"ns{vf_id}" if vf_id < NAMESPACE_COUNT else None
+        namespaces.setdefault(namespace, [("lo", None)]).append((get_vf_name(vf_id), get_vf_pci_address(vf_id)))
+    namespaces[None] += [(f"{PF_NAME}.{vlan_id}", None) for vlan_id in range(1, VLAN_COUNT + 1)]
+    return namespaces
+
+
+def get_linux_discovery_outputs(namespace: str | None, netdevs: list[tuple[str, str | None]]) -> dict[str, str]:
+    """
+    Get outputs of discovery commands of namespace.
+
+    :param namespace: Name of namespace, None for root namespace
+    :param netdevs: Netdevs of namespace
+    :return: Dictionary {command: stdout}
+    """
+    sys_class_net = []
+    links = []
+    vlans = []
+    physfn = []
+    for index, (name, pci_address) in enumerate(netdevs, start=1):
+        if pci_address is None:
+            sys_class_net.append(f"lrwxrwxrwx 1 root root 0 Oct 19 10:00 {name} -> ../../devices/virtual/net/{name}")
+        else:
+            sys_class_net.append(
+                f"lrwxrwxrwx 1 root root 0 Oct 19 10:00 {name} -> "
+                f"../../devices/pci0000:5d/0000:5d:00.0/{pci_address}/net/{name}"
+            )
+        if name == "lo":
+            links.append({"ifindex": index, "ifname": name, "link_type": "loopback", "address": "00:00:00:00:00:00"})
+            continue
+        links.append({"ifindex": index, "ifname": name, "link_type": "ether", "address": get_mac(index)})
+        if name.startswith(f"{PF_NAME}."):
+            vlan_id = int(name.rpartition(".")[2])
+            vlans.append(
+                {
+                    "ifname": name,
+                    "link": PF_NAME,
+                    "linkinfo": {"info_kind": "vlan", "info_data": {"protocol": "802.1Q", "id": vlan_id}},
+                }
+            )
+        elif name.startswith(f"{PF_NAME}v"):
+            physfn.append(f"/sys/class/net/{name}/device/physfn")
+
+    outputs = {
+        LSPCI_ETHERNET_COMMAND: get_lspci_output(),
+        SYS_CLASS_NET_COMMAND: "\n".join(sys_class_net),
+        "ip -d -j link show type vlan": json.dumps(vlans),
+        PHYSFN_FIND_COMMAND: "\n".join(physfn),
+        TUNNEL_LIST_COMMAND: "",
+        "ip -j link show": json.dumps(links),
+    }
+    return {add_namespace_call_command(command, namespace): output for command, output in outputs.items()}
+
+
+def get_linux_host() -> ReplayConnection:
+    """
+    Get transcript of Linux host: 256 CPUs, PF with 128 VFs, 4000 VLANs and 10000 addresses, 20 network namespaces.
+
+    Discovery of interfaces is added by get_linux_discovery_entries.
+
+    :return: ReplayConnection
+    """
+    namespaces = [namespace for namespace in get_linux_namespaces() if namespace]
+    return ReplayConnection(
+        [
+            entry("ip -j link show dev lo", '[{"ifindex": 1, "ifname": "lo"}]'),
+            entry("ip netns list", "\n".join(f"{namespace} (id: {namespace[2:]})" for namespace in namespaces)),
+            entry("cat /sys/class/net/bonding_masters", "", return_code=1),
+            entry("ip addr show | grep 'inet '", f"    inet {MANAGEMENT_IP}/24 brd 10.10.10.255 scope global eth0"),
+            entry(f"grep '{PF_NAME}\\|CPU' /proc/interrupts", get_proc_interrupts_output()),
+            entry(f"ip -j -s link show {PF_NAME}", get_link_stats_output()),
+            entry(f"ip link show dev {PF_NAME}", get_vfs_output()),
+            entry(f"ip -j addr show dev {PF_NAME}", get_addresses_output()),
+            entry("ip -j -4 neigh show", get_neighbors_output()),
+        ],
+        os_name=OSName.LINUX,
+        ip=MANAGEMENT_IP,
+    )
+
+
+def get_linux_discovery_entries(discovery_commands: list[str]) -> list[TranscriptEntry]:
+    """
+    Get entries of discovery of interfaces of Linux host.
+
+    :param discovery_commands: Commands prefetched by discovery, from owner._get_discovery_commands
+    :return: Entries of prefetch scripts
+    """
+    namespaces = get_linux_namespaces()
+    outputs = {
+        "ip addr show": "\n".join(
+            f"{index}: {name}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc mq state UP group default qlen 1000"
+            for index, (name, _) in enumerate(namespaces[None], start=1)
+        )
+    }
+    for namespace, netdevs in namespaces.items():
+        outputs.update(get_linux_discovery_outputs(namespace, netdevs))
+    return get_prefetch_entries(discovery_commands, outputs)
+
+
+def get_proc_interrupts_output() -> str:
+    """Get /proc/interrupts filtered to PF, queue per CPU."""
+    header = " " * 11 + "".join(f"CPU{cpu:<8}" for cpu in range(CPU_COUNT))
+    rows = [
+        f"{queue + 200:>4}: "
+        + " ".join(f"{(queue * cpu) % 9973:>10}" for cpu in range(CPU_COUNT))
+        + f"  IR-PCI-MSI {queue + 1}-edge      ice-{PF_NAME}-TxRx-{queue}"
+        for queue in range(CPU_COUNT)
+    ]
+    return "\n".join([header, *rows])
+
+
+def get_link_stats_output() -> str:
+    """Get JSON statistics of PF from iproute2."""
+    rx = {"bytes": 1, "packets": 2, "errors": 0, "dropped": 0, "over_errors": 0, "multicast": 3}
+    tx = {"bytes": 4, "packets": 5, "errors": 0, "dropped": 0, "carrier_errors": 0, "collisions": 0}
+    return json.dumps([{"ifname": PF_NAME, "stats64": {"rx": rx, "tx": tx}}])
+
+
+def get_vfs_output() -> str:
+    """Get `ip link show` of PF with all VFs."""
+    lines = [
+        f"3: {PF_NAME}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc mq state UP mode DEFAULT qlen 1000",
+        f"    link/ether {get_mac(3)} brd ff:ff:ff:ff:ff:ff",
+    ]
+    lines += [
+        f"    vf {vf_id}     link/ether {get_mac(vf_id + 10_000)} brd ff:ff:ff:ff:ff:ff, spoof checking on, "
+        "link-state auto, trust off"
+        for vf_id in range(VF_COUNT)
+    ]
+    return "\n".join(lines)
+
+
+def get_address(index: int) -> str:
+    """Get IPv4 address of address or neighbor."""
+    return f"10.{index >> 16 & 0xFF}.{index >> 8 & 0xFF}.{index & 0xFF}"
+
+
+def get_addresses_output() -> str:
+    """Get JSON addresses of PF from iproute2."""
+    addresses = [{"family": "inet", "local": get_address(index), "prefixlen": 32} for index in range(ADDRESS_COUNT)]
+    return json.dumps([{"ifname": PF_NAME, "addr_info": addresses}])
+
+
+def get_neighbors_output() -> str:
+    """Get JSON IPv4 neighbors from iproute2, on PF."""
+    return json.dumps(
+        [
+            {"dst": get_address(index + 0x10000), "dev": PF_NAME, "lladdr": get_mac(index), "state": ["REACHABLE"]}
+            for index in range(NEIGHBOR_COUNT)
+        ]
+    )
+
+
+def get_windows_host() -> ReplayConnection:
+    """
+    Get transcript of Windows host: 256 CPUs, adapter with 500 OIDs.
+
+    :return: ReplayConnection
+    """
+    oids = "".join(f"Name  : OID_INTEL_STAT_{oid}\nValue : {oid * 1000}\n\n" for oid in range(OID_COUNT))
+    oids_command = (
+        "Set-ExecutionPolicy -Force -ExecutionPolicy Bypass ; "
+        f" c:\\NET_ADAPTER\\tools\\Get-Oids.ps1 -adapter_name '{WINDOWS_NAME}' -oid_name ''"
+    )
+    counter = rf"\Per Processor Network Interface Card Activity(*, {WINDOWS_BRANDING_STRING})\Interrupts/sec"
+    counter_command = (
+        f"Get-counter -Counter '{counter}' -MaxSamples {PERFORMANCE_SAMPLES} -SampleInterval 1 | Format-List"
+    )
+    samples = []
+    for sample in range(PERFORMANCE_SAMPLES):
+        readings = "".join(
+            f"\\\\host\\per processor network interface card activity({cpu}, {WINDOWS_BRANDING_STRING.lower()})"
+            f"\\interrupts/sec :\n            {index * sample / 7:.12f}\n            \n            "
+            for index, cpu in enumerate(["total", *range(CPU_COUNT)])
+        )
+        samples.append(f"Timestamp : 10/19/2026 10:00:0{sample} AM\nReadings  : {readings}\n")
+    return ReplayConnection(
+        [
+            entry(oids_command, oids, api="execute_powershell"),
+            entry(counter_command, "\n" + "\n".join(samples), api="execute_powershell"),
+        ],
+        os_name=OSName.WINDOWS,
+    )
+
+
+def get_esxi_host() -> ReplayConnection:
+    """
+    Get transcript of ESXi host: PF with queue per CPU (256 Rx and Tx queues).
+
+    :return: ReplayConnection
+    """
+    counters = ["rxpkt", "txpkt", "rxbytes", "txbytes", "rxerr", "txerr", "rxdrp", "txdrp", "rxmltcast", "txmltcast"]
+    queues = "\n".join(
+        [
+            *(
+                f"txq{queue}: totalPkts={queue} totalBytes={queue * 64} restartQueue=0 txBusy=0"
+                for queue in range(CPU_COUNT)
+            ),
+            *(f"rxq{queue}: totalPkts={queue} totalBytes={queue * 64} nonEopDescs=0" for queue in range(CPU_COUNT)),
+        ]
+    )
+    vsish = "\n".join(
+        [
+            "main():Python mode is deprecated and will be removed in future releases.",
+            "{",
+            '   "dumsw" : "",',
+            *(f'   "{name}" : {index * 1000},' for index, name in enumerate(counters)),
+            f'   "hw" : "Packets assigned to an invalid queue: 0\n\n{queues}\n\nRx Length Errors: 0\n",',
+            "}",
+        ]
+    )
+    localcli = "\n".join(
+        [
+            queues,
+            "LFC:",
+            "RxXon: 0",
+            "RxXoff: 0",
+            "TxXon: 0",
+            "TxXoff: 0",
+            *(f"PFC TC[{tc}]: RxXon=0 RxXoff=0 TxXon=0 TxXoff=0 Xon2Xoff=0" for tc in range(8)),
+        ]
+    )
+    ens_settings = (
+        "Name    Driver  ENS Capable  ENS Driven  ENS Interrupt Capable  ENS Interrupt Enabled\n"
+        f"{ESXI_NAME}  icen    True         False       True                   False\n"
+    )
+    return ReplayConnection(
+        [
+            entry(f"vsish -pe get /net/pNics/{ESXI_NAME}/stats", vsish),
+            entry("esxcfg-nics -e", ens_settings),
+            entry(
+                f'localcli --plugin-dir "/usr/lib/vmware/esxcli/int" networkinternal nic privstats get -n {ESXI_NAME}',
+                localcli,
+            ),
+        ],
+        os_name=OSName.ESXI,
+    )
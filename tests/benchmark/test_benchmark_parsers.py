@@ -0,0 +1,222 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Offline benchmarks of public APIs parsing outputs of large hosts, replayed from transcripts.
+
+Wall time is measured by pytest-benchmark, number of remote calls of single API call is stored
+in extra_info["rpc_count"] of benchmark and checked against budget.
+Run with `pytest tests/benchmark --benchmark-autosave` and compare runs with `--benchmark-compare`.
+"""
+
+from typing import Any, Callable
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.util import rpc_copy_utils
+from mfd_devcon import Devcon
+from mfd_ethtool import Ethtool
+from mfd_package_manager import LinuxPackageManager
+from mfd_typing import OSName, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceInfo, InterfaceType, LinuxInterfaceInfo, WindowsInterfaceInfo
+
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.esxi import ESXiNetworkInterface
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+from mfd_network_adapter.network_interface.windows import WindowsNetworkInterface
+from mfd_network_adapter.replay import ReplayConnection
+
+from . import large_host
+
+pytest.importorskip("pytest_benchmark")
+
+
+def run_benchmark(benchmark: Any, replay: ReplayConnection, function: Callable, *args, **kwargs) -> tuple[Any, int]:
+    """
+    Benchmark function replayed on host transcript.
+
+    :param benchmark: Fixture of pytest-benchmark
+    :param replay: Connection used by function
+    :param function: Benchmarked function
+    :param args: Positional arguments of function
+    :param kwargs: Keyword arguments of function
+    :return: Tuple (result of function, number of remote calls of single call)
+    """
+    # warm-up, fills caches kept per connection, e.g. JSON support of iproute2
+    function(*args, **kwargs)
+    replay.rewind()
+    result = function(*args, **kwargs)
+    rpc_count = replay.rpc_count
+    benchmark.extra_info["rpc_count"] = rpc_count
+    benchmark(function, *args, **kwargs)
+    return result, rpc_count
+
+
+class TestLinuxBenchmark:
+    @pytest.fixture
+    def replay(self):
+        return large_host.get_linux_host()
+
+    @pytest.fixture
+    def owner(self, replay):
+        owner = LinuxNetworkAdapterOwner(connection=replay)
+        namespaces = [None, *owner._get_network_namespaces()]
+        replay.add_entries(large_host.get_linux_discovery_entries(owner._get_discovery_commands(namespaces)))
+        return owner
+
+    @pytest.fixture
+    def interface(self, mocker, replay):
+        mocker.patch("mfd_ethtool.Ethtool.check_if_available", mocker.create_autospec(Ethtool.check_if_available))
+        mocker.patch("mfd_ethtool.Ethtool.get_version", mocker.create_autospec(Ethtool.get_version, return_value="6.1"))
+        mocker.patch(
+            "mfd_ethtool.Ethtool._get_tool_exec_factory",
+            mocker.create_autospec(Ethtool._get_tool_exec_factory, return_value="ethtool"),
+        )
+        yield LinuxNetworkInterface(
+            connection=replay,
+            interface_info=LinuxInterfaceInfo(
+                name=large_host.PF_NAME,
+                pci_address=PCIAddress(data=large_host.PF_PCI_ADDRESS),
+                pci_device=PCIDevice(data="8086:1592"),
+                interface_type=InterfaceType.PF,
+            ),
+        )
+        mocker.stopall()
+
+    def test_get_interfaces(self, benchmark, owner, replay):
+        interfaces, rpc_count = run_benchmark(benchmark, replay, owner.get_interfaces)
+        # namespaces, prefetch of all namespaces, bonding masters per namespace, management interface
+        assert rpc_count == 1 + 1 + (large_host.NAMESPACE_COUNT + 1) + 1
+        assert len(interfaces) == 2 + large_host.VF_COUNT + large_host.VLAN_COUNT
+        assert sum(interface.interface_type is InterfaceType.VLAN for interface in interfaces) == large_host.VLAN_COUNT
+        assert {interface.namespace for interface in interfaces} == {
+            None,
+            *(f"ns{number}" for number in range(large_host.NAMESPACE_COUNT)),
+        }
+
+    def test_get_per_queue_interrupts_delta(self, benchmark, interface, replay):
+        data, rpc_count = run_benchmark(
+            benchmark, replay, interface.interrupt.get_per_queue_interrupts_delta, interval=0
+        )
+        assert rpc_count == 2
+        assert len(data.pre_reading) == large_host.CPU_COUNT
+
+    def test_get_netdev_stats(self, benchmark, interface, replay):
+        stats, rpc_count = run_benchmark(benchmark, replay, interface.stats.get_netdev_stats)
+        assert rpc_count == 1
+        assert stats["rx_bytes"] == 1
+
+    def test_get_ips(self, benchmark, interface, replay):
+        ips, rpc_count = run_benchmark(benchmark, replay, interface.ip.get_ips)
+        assert rpc_count == 1
+        assert len(ips.v4) == large_host.ADDRESS_COUNT
+
+    def test_get_arp_table(self, benchmark, owner, replay):
+        arp_table, rpc_count = run_benchmark(benchmark, replay, owner.arp.get_arp_table)
+        assert rpc_count == 1
+        assert len(arp_table) == large_host.NEIGHBOR_COUNT
+
+    def test_get_vf_link_state(self, benchmark, interface, replay):
+        _, rpc_count = run_benchmark(
+            benchmark, replay, interface.virtualization.get_link_state, vf_id=large_host.VF_COUNT - 1
+        )
+        assert rpc_count == 1
+
+
+class TestLinuxVLANBenchmark:
+    @pytest.fixture
+    def owner(self, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.LinuxPackageManager",
+            mocker.create_autospec(LinuxPackageManager),
+        )
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.side_effect = self._batch_result
+        yield LinuxNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    @staticmethod
+    def _batch_result(command, **kwargs):
+        """Succeed batch script of any size, marker of ip -batch group is echoed back."""
+        group = command.split("@@MFD_BATCH@@ ")[1].split(" ")[0]
+        return ConnectionCompletedProcess(return_code=0, args="", stdout=f"@@MFD_BATCH@@ {group} 0", stderr="")
+
+    @pytest.mark.parametrize("vlan_count", [1000, 4094])
+    def test_vlan_lifecycle(self, benchmark, owner, vlan_count):
+        def lifecycle():
+            names = owner.vlan.create_vlans(vlan_ids=range(1, vlan_count + 1), interface_name=large_host.PF_NAME)
+            owner.vlan.remove_vlans(vlan_names=names)
+            return names
+
+        names = lifecycle()
+        rpc_count = owner._connection.execute_command.call_count
+        benchmark.extra_info["rpc_count"] = rpc_count
+        benchmark(lifecycle)
+        # each call carries ~100KB script, instead of one call per VLAN
+        assert rpc_count <= 2 * (vlan_count // 1500 + 1)
+        assert len(names) == vlan_count
+
+
+class TestWindowsBenchmark:
+    @pytest.fixture
+    def replay(self):
+        return large_host.get_windows_host()
+
+    @pytest.fixture
+    def interface(self, mocker, replay):
+        mocker.patch("mfd_connect.util.rpc_copy_utils.copy", mocker.create_autospec(rpc_copy_utils.copy))
+        mocker.patch("mfd_devcon.Devcon.check_if_available", mocker.create_autospec(Devcon.check_if_available))
+        mocker.patch("mfd_devcon.Devcon.get_version", mocker.create_autospec(Devcon.get_version, return_value="1.2"))
+        mocker.patch(
+            "mfd_devcon.Devcon._get_tool_exec_factory",
+            mocker.create_autospec(Devcon._get_tool_exec_factory, return_value="devcon"),
+        )
+        yield WindowsNetworkInterface(
+            connection=replay,
+            owner=None,
+            interface_info=WindowsInterfaceInfo(
+                name=large_host.WINDOWS_NAME,
+                pci_address=PCIAddress(0, 0x5E, 0, 0),
+                pci_device=PCIDevice(data="8086:1592"),
+                branding_string=large_host.WINDOWS_BRANDING_STRING,
+            ),
+        )
+        mocker.stopall()
+
+    def test_get_stats(self, benchmark, interface, replay):
+        stats, rpc_count = run_benchmark(benchmark, replay, interface.stats.get_stats)
+        assert rpc_count == 1
+        assert len(stats) == large_host.OID_COUNT
+
+    def test_get_per_queue_interrupts_per_sec(self, benchmark, interface, replay):
+        rates, rpc_count = run_benchmark(
+            benchmark,
+            replay,
+            interface.interrupt.get_per_queue_interrupts_per_sec,
+            interval=1,
+            samples=large_host.PERFORMANCE_SAMPLES,
+        )
+        assert rpc_count == 1
+        assert len(rates) == large_host.CPU_COUNT + 1
+
+
+class TestESXiBenchmark:
+    @pytest.fixture
+    def replay(self):
+        return large_host.get_esxi_host()
+
+    @pytest.fixture
+    def interface(self, replay):
+        return ESXiNetworkInterface(
+            connection=replay,
+            interface_info=InterfaceInfo(
+                name=large_host.ESXI_NAME, pci_address=PCIAddress(0, 0x5E, 0, 0), pci_device=PCIDevice(data="8086:1592")
+            ),
+        )
+
+    def test_get_pf_stats(self, benchmark, interface, replay):
+        stats, rpc_count = run_benchmark(benchmark, replay, interface.stats.get_pf_stats)
+        # stats, ENS status checked twice, localcli stats
+        assert rpc_count == 4
+        assert f"rxq{large_host.CPU_COUNT - 1}" in stats
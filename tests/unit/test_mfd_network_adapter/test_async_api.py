@@ -0,0 +1,122 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test asyncio API of owner and interfaces."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from mfd_typing import OSName
+
+from mfd_network_adapter.async_api import AsyncNetworkAdapterOwner, AsyncNetworkInterface, AsyncRunner
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+from mfd_network_adapter.replay import ReplayConnection, TranscriptEntry
+
+
+class TestAsyncRunner:
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def call(number):
+            with lock:
+                running.append(number)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(number)
+            return number
+
+        async def main():
+            runner = AsyncRunner(max_concurrency=2)
+            return await asyncio.gather(*(runner.run(call, number) for number in range(8)))
+
+        assert asyncio.run(main()) == list(range(8))
+        assert max(peak) == 2
+
+    def test_shared_by_many_event_loops(self):
+        def call(number):
+            time.sleep(0.01)
+            return number
+
+        runner = AsyncRunner(max_concurrency=1)
+
+        async def main():
+            return await asyncio.gather(*(runner.run(call, number) for number in range(3)))
+
+        assert asyncio.run(main()) == [0, 1, 2]
+        assert asyncio.run(main()) == [0, 1, 2]
+        assert runner.in_flight == 0
+
+    def test_exception_propagated(self):
+        def call():
+            raise ValueError("error")
+
+        async def main():
+            runner = AsyncRunner()
+            with pytest.raises(ValueError, match="error"):
+                await runner.run(call)
+            assert runner.in_flight == 0
+
+        asyncio.run(main())
+
+
+class TestAsyncNetworkAdapterOwner:
+    @pytest.fixture
+    def replay(self):
+        return ReplayConnection(
+            [
+                TranscriptEntry("execute_command", "ip neigh flush dev eth1"),
+                TranscriptEntry("execute_command", "cat /etc/hostname", "host"),
+            ],
+            os_name=OSName.LINUX,
+        )
+
+    def test_create_and_feature_call(self, replay, mocker):
+        interface = mocker.Mock()
+        interface.name = "eth1"
+
+        async def main():
+            owner = await AsyncNetworkAdapterOwner.create(replay, max_concurrency=4)
+            assert isinstance(owner.owner, LinuxNetworkAdapterOwner)
+            await owner.arp.flush_arp_table(interface)
+            return await owner.execute_command("cat /etc/hostname")
+
+        assert asyncio.run(main()).stdout == "host"
+        assert replay.rpc_count == 2
+
+    def test_interfaces_called_in_executor(self, mocker):
+        owner = mocker.create_autospec(LinuxNetworkAdapterOwner)
+        interfaces = [mocker.create_autospec(LinuxNetworkInterface, instance=True) for _ in range(3)]
+        for number, interface in enumerate(interfaces):
+            interface.name = f"eth{number}"
+        owner.get_interfaces.return_value = interfaces
+        main_thread = threading.current_thread()
+        threads = []
+
+        def get_stats():
+            threads.append(threading.current_thread())
+            return {"rx_packets": 1}
+
+        for interface in interfaces:
+            interface.stats.get_stats.side_effect = get_stats
+
+        async def main():
+            async_owner = AsyncNetworkAdapterOwner(owner)
+            async_interfaces = await async_owner.get_interfaces(pci_device="8086:1592")
+            assert all(isinstance(interface, AsyncNetworkInterface) for interface in async_interfaces)
+            assert [interface.name for interface in async_interfaces] == ["eth0", "eth1", "eth2"]
+            return await asyncio.gather(*(interface.stats.get_stats() for interface in async_interfaces))
+
+        assert asyncio.run(main()) == [{"rx_packets": 1}] * 3
+        owner.get_interfaces.assert_called_once_with(pci_device="8086:1592")
+        assert main_thread not in threads
+
+    def test_attribute_path(self, mocker):
+        async_owner = AsyncNetworkAdapterOwner(mocker.create_autospec(LinuxNetworkAdapterOwner))
+        assert repr(async_owner.arp.get_arp_table).endswith(".arp.get_arp_table)")
+        with pytest.raises(AttributeError):
+            async_owner._connection
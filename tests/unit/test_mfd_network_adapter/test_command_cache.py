@@ -0,0 +1,184 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test memoization of read-only commands within consistent view."""
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_ethtool import Ethtool
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.command_cache import CommandCache, is_idempotent_command, is_read_only_command
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.exceptions import RSSExecutionError
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+from mfd_network_adapter.replay import ReplayConnection, TranscriptEntry
+
+
+@pytest.mark.parametrize(
+    "command, api",
+    [
+        ("cat /proc/interrupts", "execute_command"),
+        ("ip -s link show eth0", "execute_command"),
+        ("ip -j -n ns1 addr show dev eth0", "execute_command"),
+        ("ip netns exec ns1 ethtool -S eth0", "execute_command"),
+        ("ethtool --json -i eth0", "execute_command"),
+        ("ethtool eth0", "execute_command"),
+        ("cat /sys/class/net/eth0/mtu 2>/dev/null | grep -E '[0-9]+'", "execute_command"),
+        ("ls /sys/class/net && cat /sys/class/net/bonding_masters", "execute_command"),
+        ("grep -E 'eth0|eth1' /proc/net/dev | cut -d ' ' -f 1", "execute_command"),
+        ("esxcfg-nics -e", "execute_command"),
+        ("esxcli network nic stats get -n vmnic0", "execute_command"),
+        ("vsish -e get /net/pNics/vmnic0/stats", "execute_command"),
+        ("sysctl -n net.ipv4.ip_forward", "execute_command"),
+        ("Get-NetAdapter -Name 'Ethernet' | Select-Object -ExpandProperty Name", "execute_powershell"),
+        ("(Get-NetAdapterAdvancedProperty -Name 'Ethernet').DisplayValue", "execute_powershell"),
+    ],
+)
+def test_read_only_command(command, api):
+    assert is_read_only_command(command, api)
+
+
+@pytest.mark.parametrize(
+    "command, api",
+    [
+        ("ip link set eth0 up", "execute_command"),
+        ("ip -batch -", "execute_command"),
+        ("ip netns exec ns1 ip addr add 1.1.1.1/24 dev eth0", "execute_command"),
+        ("ethtool -K eth0 rx off", "execute_command"),
+        ("cat /proc/interrupts > /tmp/interrupts", "execute_command"),
+        ("echo 1 > /sys/class/net/eth0/device/sriov_numvfs", "execute_command"),
+        ("cat $(ls /tmp/file)", "execute_command"),
+        ("esxcfg-nics -s 1000 vmnic0", "execute_command"),
+        ("sysctl net.ipv4.ip_forward=1", "execute_command"),
+        ("hostname new-host", "execute_command"),
+        ("modprobe ice", "execute_command"),
+        (
+            "Set-NetAdapterAdvancedProperty -Name 'Ethernet' -RegistryKeyword '*JumboPacket' -RegistryValue 9014",
+            "execute_powershell",
+        ),
+        ("$adapter = Get-NetAdapter", "execute_powershell"),
+        ("Get-NetAdapter | Disable-NetAdapter -Confirm:$false", "execute_powershell"),
+    ],
+)
+def test_mutating_command(command, api):
+    assert not is_read_only_command(command, api)
+
+
+def test_idempotent_command():
+    assert is_idempotent_command("ip link set eth0 up")
+    assert is_idempotent_command("ip netns exec ns1 ethtool -K eth0 rx off")
+    assert is_idempotent_command("Set-NetAdapterRss -Name 'Ethernet' -NumberOfReceiveQueues 4", "execute_powershell")
+    assert not is_idempotent_command("ip addr add 1.1.1.1/24 dev eth0")
+    assert not is_idempotent_command("echo 1 > /sys/class/net/eth0/device/reset")
+
+
+class TestCommandCache:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.side_effect = lambda command, **kwargs: ConnectionCompletedProcess(
+            args=command, stdout=command, stderr="", return_code=2 if "missing" in command else 0
+        )
+        return connection
+
+    @pytest.fixture
+    def owner(self, connection):
+        return LinuxNetworkAdapterOwner(connection=connection)
+
+    def test_read_only_command_deduplicated(self, owner, connection):
+        original = connection.execute_command
+        with owner.consistent_view() as cache:
+            assert owner.execute_command("cat /proc/interrupts").stdout == "cat /proc/interrupts"
+            assert owner.execute_command("cat /proc/interrupts").stdout == "cat /proc/interrupts"
+            owner.execute_command("cat /proc/interrupts", shell=True)
+        assert connection.execute_command is original
+        assert original.call_count == 2
+        original.assert_any_call("cat /proc/interrupts", expected_return_codes=None)
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hits_per_command == {"cat /proc/interrupts": 1}
+
+        owner.execute_command("cat /proc/interrupts")
+        assert original.call_count == 3
+
+    def test_mutation_invalidates(self, owner, connection):
+        with owner.consistent_view() as cache:
+            owner.execute_command("ip link show eth0")
+            owner.execute_command("ip link set eth0 down")
+            owner.execute_command("ip link show eth0")
+            owner.execute_command("ip link show eth0")
+        assert connection.execute_command.call_count == 3
+        assert (cache.hits, cache.invalidations) == (1, 1)
+
+    def test_repeated_idempotent_command(self, owner, connection):
+        with owner.consistent_view() as cache:
+            for _ in range(2):
+                owner.execute_command("ip link set eth0 up")
+                owner.execute_command("cat /proc/interrupts")
+            owner.execute_command("ip link set eth0 down")
+            owner.execute_command("cat /proc/interrupts")
+        assert [call.args[0] for call in connection.execute_command.call_args_list] == [
+            "ip link set eth0 up",
+            "cat /proc/interrupts",
+            "ip link set eth0 up",
+            "ip link set eth0 down",
+            "cat /proc/interrupts",
+        ]
+        assert (cache.hits, cache.invalidations) == (1, 2)
+
+    def test_return_codes_validated_per_call(self, owner, connection):
+        with owner.consistent_view():
+            assert owner.execute_command("cat missing", expected_return_codes={0, 2}).return_code == 2
+            with pytest.raises(ConnectionCalledProcessError):
+                owner.execute_command("cat missing")
+            with pytest.raises(RSSExecutionError):
+                owner.execute_command("cat missing", custom_exception=RSSExecutionError)
+        connection.execute_command.assert_called_once()
+
+    def test_nested_views_share_cache(self, owner, connection):
+        with owner.consistent_view() as outer:
+            owner.execute_command("ls /sys/class/net")
+            with owner.consistent_view() as inner:
+                owner.execute_command("ls /sys/class/net")
+            owner.execute_command("ls /sys/class/net")
+        assert inner is outer
+        assert outer.hits == 2
+        assert owner._command_cache is None
+        assert not outer.active
+
+    def test_not_installed_when_stopped(self, connection):
+        original = connection.execute_command
+        cache = CommandCache(connection)
+        cache.start()
+        cache.start()
+        cache.stop()
+        assert connection.execute_command is original
+        assert cache._results == {}
+
+    def test_rss_queues_on_replay(self, mocker):
+        mocker.patch("mfd_ethtool.Ethtool.check_if_available", mocker.create_autospec(Ethtool.check_if_available))
+        mocker.patch("mfd_ethtool.Ethtool.get_version", mocker.create_autospec(Ethtool.get_version, return_value="6.1"))
+        mocker.patch(
+            "mfd_ethtool.Ethtool._get_tool_exec_factory",
+            mocker.create_autospec(Ethtool._get_tool_exec_factory, return_value="ethtool"),
+        )
+        replay = ReplayConnection(
+            [
+                TranscriptEntry("execute_command", "ip link set eth0 up"),
+                TranscriptEntry("execute_command", "cat /proc/interrupts", " 50: 1 PCI-MSI eth0-TxRx-0\n"),
+            ],
+            os_name=OSName.LINUX,
+        )
+        owner = LinuxNetworkAdapterOwner(connection=replay)
+        interface = LinuxNetworkInterface(
+            connection=replay, interface_info=LinuxInterfaceInfo(pci_address=PCIAddress(0, 0, 0, 0), name="eth0")
+        )
+        with owner.consistent_view() as cache:
+            assert interface.rss.get_queues() == interface.rss.get_queues() == 1
+        # link is set up before each read, /proc/interrupts is read once
+        assert replay.rpc_count == 3
+        assert cache.hits_per_command == {"cat /proc/interrupts": 1}
+        mocker.stopall()
@@ -0,0 +1,69 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test detection of iproute2 JSON output support and parsers of iproute2 output."""
+
+import json
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing.network_interface import VlanInterfaceInfo
+
+from mfd_network_adapter.iproute2 import is_json_supported, parse_vlans_json, parse_vlans_text
+from mfd_network_adapter.network_adapter_owner.batch import BatchConnection
+
+
+class TestIproute2:
+    @pytest.fixture
+    def connection(self, mocker):
+        return mocker.create_autospec(RPyCConnection)
+
+    def test_json_supported_cached(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout='[{"ifindex":1,"ifname":"lo"}]', return_code=0
+        )
+        assert is_json_supported(connection)
+        assert is_json_supported(connection)
+        connection.execute_command.assert_called_once_with("ip -j link show dev lo", expected_return_codes=None)
+
+    def test_json_not_supported(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout='Option "-j" is unknown, try "ip -help".', return_code=255
+        )
+        assert not is_json_supported(connection)
+
+    def test_json_supported_detected_outside_batch(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="[]", return_code=0)
+        batch = BatchConnection(connection)
+        assert is_json_supported(batch)
+        assert batch.calls == []
+
+    def test_parse_vlans_json(self):
+        output = json.dumps(
+            [
+                {"ifname": "eth1.69", "link": "eth1", "linkinfo": {"info_kind": "vlan", "info_data": {"id": 69}}},
+                {"ifname": "eth9.8", "link_index": 17, "linkinfo": {"info_kind": "vlan", "info_data": {"id": 8}}},
+            ]
+        )
+        assert parse_vlans_json(output) == {
+            "eth1.69": VlanInterfaceInfo(vlan_id=69, parent="eth1"),
+            "eth9.8": VlanInterfaceInfo(vlan_id=8, parent="if17"),
+        }
+
+    def test_parse_vlans_text(self):
+        output = dedent(
+            """\
+            5: eth1.69@eth1: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc noqueue state UP mode DEFAULT
+                link/ether 00:00:00:00:00:01 brd ff:ff:ff:ff:ff:ff promiscuity 0 minmtu 0 maxmtu 65535
+                vlan protocol 802.1Q id 69 <REORDER_HDR> addrgenmode eui64 numtxqueues 1 numrxqueues 1
+            23: eth9.8@if17: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN mode DEFAULT group default
+                link/ether 00:00:00:00:00:00 brd 00:00:00:00:00:00 link-netnsid 0 promiscuity 0
+                vlan protocol 802.1ad id 8 <REORDER_HDR> addrgenmode eui64 numtxqueues 1 numrxqueues 1
+            """
+        )
+        assert parse_vlans_text(output) == {
+            "eth1.69": VlanInterfaceInfo(vlan_id=69, parent="eth1"),
+            "eth9.8": VlanInterfaceInfo(vlan_id=8, parent="if17"),
+        }
+        assert parse_vlans_text("") == {}
@@ -0,0 +1,121 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test lazy import of OS-specific modules."""
+
+import re
+import subprocess
+import sys
+from typing import Union
+
+import pytest
+
+from mfd_network_adapter import lazy_import as lazy_import_module
+from mfd_network_adapter.lazy_import import import_os_module, lazy_import
+from mfd_network_adapter.network_interface.feature.stats import BaseFeatureStats
+
+# regression budget of `python -X importtime` for import of Linux owner and interface
+IMPORT_STATEMENT = (
+    "from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner; "
+    "from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface"
+)
+MAX_PACKAGE_MODULES = 40
+MAX_PACKAGE_SELF_TIME_US = 300_000
+LAZY_DEPENDENCIES = ("mfd_ethtool", "mfd_dcb", "mfd_win_registry", "mfd_packet_capture")
+IMPORTTIME_REGEX = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent>\s+)(?P<name>\S+)$")
+
+
+def get_import_times(statement: str) -> dict[str, int]:
+    """
+    Measure import of statement in new interpreter with `python -X importtime`.
+
+    :param statement: Python code to execute
+    :return: Dictionary {module name: self import time in microseconds}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    return {
+        match["name"]: int(match["self"]) for match in map(IMPORTTIME_REGEX.match, result.stderr.splitlines()) if match
+    }
+
+
+class TestLazyImport:
+    def test_lazy_attributes(self, mocker):
+        module = type(sys)("mfd_lazy_test")
+        module.Base = int
+        mocker.patch.dict(sys.modules, {"mfd_lazy_test": module})
+        import_module = mocker.patch.object(
+            lazy_import_module.importlib, "import_module", return_value=mocker.Mock(LinuxX=str)
+        )
+        module.__getattr__, module.__dir__ = lazy_import(
+            "mfd_lazy_test", {"LinuxX": ".linux"}, {"XFeatureType": ("Base", "LinuxX")}
+        )
+
+        assert "LinuxX" in module.__dir__()
+        import_module.assert_not_called()
+        assert module.XFeatureType == Union[int, str]
+        import_module.assert_called_once_with(".linux", "mfd_lazy_test")
+        assert module.LinuxX is str
+        assert vars(module)["LinuxX"] is str
+        with pytest.raises(AttributeError, match="has no attribute 'WindowsX'"):
+            module.__getattr__("WindowsX")
+
+    def test_feature_package_lazy_names(self):
+        from mfd_network_adapter.network_interface.feature import stats
+        from mfd_network_adapter.network_interface.feature.stats.linux import LinuxStats
+
+        assert stats.LinuxStats is LinuxStats
+        assert LinuxStats in stats.StatsFeatureType.__args__
+
+    def test_import_os_module(self, mocker):
+        import_module = mocker.patch.object(lazy_import_module.importlib, "import_module")
+        mocker.patch.dict(sys.modules)
+        sys.modules.pop("mfd_network_adapter.network_interface.feature.stats.esxi", None)
+        assert import_os_module(BaseFeatureStats, "esxi") is True
+        import_module.assert_called_once_with("mfd_network_adapter.network_interface.feature.stats.esxi")
+
+        sys.modules["mfd_network_adapter.network_interface.feature.stats.esxi"] = mocker.Mock()
+        assert import_os_module(BaseFeatureStats, "esxi") is False
+
+    def test_import_os_module_not_existing(self):
+        assert import_os_module(BaseFeatureStats, "solaris") is False
+
+    def test_feature_of_not_imported_os(self):
+        statement = (
+            "import sys\n"
+            "from unittest.mock import Mock\n"
+            "from mfd_typing import OSName\n"
+            "from mfd_network_adapter.network_interface.feature.mtu import BaseFeatureMTU\n"
+            "assert 'mfd_network_adapter.network_interface.feature.mtu.freebsd' not in sys.modules\n"
+            "BaseFeatureMTU.__new__(BaseFeatureMTU, connection=Mock(get_os_name=Mock(return_value=OSName.LINUX)))\n"
+            "connection = Mock(get_os_name=Mock(return_value=OSName.FREEBSD))\n"
+            "print(type(BaseFeatureMTU.__new__(BaseFeatureMTU, connection=connection)).__name__)"
+        )
+        result = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "FreeBsdMTU"
+
+    def test_feature_of_os_imported_by_other_path(self):
+        statement = (
+            "from unittest.mock import Mock\n"
+            "from mfd_typing import OSName\n"
+            "from mfd_network_adapter.network_interface.feature.mtu import BaseFeatureMTU\n"
+            "connection = Mock(get_os_name=Mock(return_value=OSName.WINDOWS))\n"
+            "BaseFeatureMTU.__new__(BaseFeatureMTU, connection=connection)\n"
+            "import mfd_network_adapter.network_interface.feature.mtu.linux\n"
+            "connection = Mock(get_os_name=Mock(return_value=OSName.LINUX))\n"
+            "print(type(BaseFeatureMTU.__new__(BaseFeatureMTU, connection=connection)).__name__)"
+        )
+        result = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "LinuxMTU"
+
+    def test_import_budget(self):
+        import_times = get_import_times(IMPORT_STATEMENT)
+        package_modules = {name: time for name, time in import_times.items() if name.startswith("mfd_network_adapter")}
+
+        other_os_modules = [
+            name for name in package_modules if name.rpartition(".")[2] in ("windows", "esxi", "freebsd")
+        ]
+        assert other_os_modules == []
+        assert [name for name in import_times if name.split(".")[0] in LAZY_DEPENDENCIES] == []
+        assert len(package_modules) <= MAX_PACKAGE_MODULES, sorted(package_modules)
+        assert sum(package_modules.values()) <= MAX_PACKAGE_SELF_TIME_US
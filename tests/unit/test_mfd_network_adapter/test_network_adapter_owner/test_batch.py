@@ -0,0 +1,194 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test batch execution of owner feature commands."""
+
+from ipaddress import IPv4Interface
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_package_manager import LinuxPackageManager
+from mfd_typing import MACAddress, OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.network_adapter_owner import batch as batch_module
+from mfd_network_adapter.network_adapter_owner.batch import BatchConnection, build_ip_batch_command
+from mfd_network_adapter.network_adapter_owner.exceptions import BatchExecutionError
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+
+
+class TestBatch:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.LinuxPackageManager",
+            mocker.create_autospec(LinuxPackageManager),
+        )
+        yield LinuxNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    def test_build_ip_batch_command(self):
+        assert build_ip_batch_command(["link set dev eth0 up", "addr flush dev eth0"], namespace="ns1") == (
+            "ip -n ns1 -force -batch - <<'MFD_BATCH_EOF'\nlink set dev eth0 up\naddr flush dev eth0\nMFD_BATCH_EOF"
+        )
+
+    def test_batch_ip_commands_in_one_call(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="@@MFD_BATCH@@ 0-1 0\n", return_code=0
+        )
+        with owner.batch() as batch:
+            owner.vlan.create_vlan(vlan_id=10, interface_name="eth1")
+            owner.vlan.remove_vlan(vlan_name="eth1.5")
+            owner._connection.execute_command.assert_not_called()
+
+        owner._connection.execute_command.assert_called_once_with(
+            "{ ip -force -batch - <<'MFD_BATCH_EOF'\n"
+            "link add link eth1 name eth1.10 type vlan id 10\n"
+            "link del eth1.5\n"
+            "MFD_BATCH_EOF\n"
+            "} 2>&1\n"
+            'echo "@@MFD_BATCH@@ 0-1 $?"',
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+        assert [call.return_code for call in batch.calls] == [0, 0]
+        assert owner._batch is None
+        assert owner.vlan._connection is owner._connection
+
+    def test_batch_groups_namespaces_and_shell_commands(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="@@MFD_BATCH@@ 0-0 0\n@@MFD_BATCH@@ 1-1 0\ncat: x: No such file\n@@MFD_BATCH@@ 2 1\n",
+            return_code=0,
+        )
+        with owner.batch(raise_on_error=False) as batch:
+            batch.execute_command("ip link set dev eth1 up")
+            batch.execute_command("ip netns exec ns1 ip link set dev eth2 up")
+            batch.execute_command("cat x | grep y")
+
+        script = owner._connection.execute_command.call_args.args[0]
+        assert script == (
+            "{ ip -force -batch - <<'MFD_BATCH_EOF'\n"
+            "link set dev eth1 up\n"
+            "MFD_BATCH_EOF\n"
+            "} 2>&1\n"
+            'echo "@@MFD_BATCH@@ 0-0 $?"\n'
+            "{ ip -n ns1 -force -batch - <<'MFD_BATCH_EOF'\n"
+            "link set dev eth2 up\n"
+            "MFD_BATCH_EOF\n"
+            "} 2>&1\n"
+            'echo "@@MFD_BATCH@@ 1-1 $?"\n'
+            "{ cat x | grep y\n"
+            "} </dev/null 2>&1\n"
+            'echo "@@MFD_BATCH@@ 2 $?"'
+        )
+        assert batch.calls[2].failed
+        assert batch.calls[2].output == "cat: x: No such file"
+
+    def test_batch_maps_ip_batch_failures(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="RTNETLINK answers: File exists\nCommand failed -:2\n@@MFD_BATCH@@ 0-2 1\n",
+            return_code=0,
+        )
+        with pytest.raises(BatchExecutionError, match="1 of 3 batched commands failed"):
+            with owner.batch() as batch:
+                for vlan_id in range(3):
+                    owner.vlan.create_vlan(vlan_id=vlan_id, interface_name="eth1")
+
+        assert [call.return_code for call in batch.calls] == [0, 1, 0]
+        assert batch.calls[1].output == "RTNETLINK answers: File exists"
+        assert owner._batch is None
+
+    def test_batch_ip_batch_not_started(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout='Cannot open network namespace "ns1": No such file or directory\n@@MFD_BATCH@@ 0-1 255\n',
+            return_code=0,
+        )
+        with pytest.raises(BatchExecutionError, match="2 of 2 batched commands failed"):
+            with owner.batch() as batch:
+                owner.vlan.create_vlan(vlan_id=10, interface_name="eth1", namespace_name="ns1")
+                owner.vlan.create_vlan(vlan_id=11, interface_name="eth1", namespace_name="ns1")
+
+        assert [call.return_code for call in batch.calls] == [255, 255]
+        assert batch.calls[0].output == 'Cannot open network namespace "ns1": No such file or directory'
+
+    def test_batch_call_without_result_failed(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        # script killed after first command
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="@@MFD_BATCH@@ 0 0\nKilled\n", return_code=137
+        )
+        batch = BatchConnection(connection)
+        batch.execute_command("cat x")
+        batch.execute_command("cat y", expected_return_codes=None)
+        with pytest.raises(BatchExecutionError, match="'cat y' was not executed"):
+            batch.execute()
+        assert not batch.calls[0].failed
+        assert batch.calls[1].failed
+
+    def test_batch_queues_interface_features(self, owner):
+        interface = LinuxNetworkInterface(
+            connection=owner._connection,
+            interface_info=LinuxInterfaceInfo(name="eth1", pci_address=PCIAddress(0, 0, 0, 0)),
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="RTNETLINK answers: No such device\nCommand failed -:2\n@@MFD_BATCH@@ 0-1 1\n",
+            return_code=0,
+        )
+        with owner.batch() as batch:
+            interface.ip.add_ip_neighbor(IPv4Interface("1.1.1.1/24"), MACAddress("00:00:00:00:00:01"))
+            owner.route.add_route(IPv4Interface("2.2.2.0/24"), device="eth9")
+            owner._connection.execute_command.assert_not_called()
+
+        owner._connection.execute_command.assert_called_once()
+        assert interface.ip._connection is owner._connection
+        # route is verified by feature, its failure is recorded but not raised
+        assert batch.unchecked_failures == [batch.calls[1]]
+        assert batch.calls[1].output == "RTNETLINK answers: No such device"
+
+    def test_batch_dropped_on_exception(self, owner):
+        with pytest.raises(RuntimeError):
+            with owner.batch():
+                owner.vlan.create_vlan(vlan_id=10, interface_name="eth1")
+                raise RuntimeError("test")
+        owner._connection.execute_command.assert_not_called()
+        assert owner._batch is None
+
+    def test_nested_batch_merged(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="@@MFD_BATCH@@ 0-1 0\n", return_code=0
+        )
+        with owner.batch() as outer:
+            owner.vlan.create_vlan(vlan_id=10, interface_name="eth1")
+            with owner.batch() as inner:
+                owner.vlan.create_vlan(vlan_id=11, interface_name="eth1")
+            assert inner is outer
+            owner._connection.execute_command.assert_not_called()
+        owner._connection.execute_command.assert_called_once()
+        assert len(outer.calls) == 2
+
+    def test_batch_split_into_chunks(self, mocker, monkeypatch):
+        monkeypatch.setattr(batch_module, "MAX_SCRIPT_SIZE", 30)
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout="@@MFD_BATCH@@ 0-0 0\n", return_code=0),
+            ConnectionCompletedProcess(args="", stdout="@@MFD_BATCH@@ 1-1 0\n", return_code=0),
+        ]
+        batch = BatchConnection(connection)
+        batch.execute_command("ip link set dev eth1 up")
+        batch.execute_command("ip link set dev eth2 up")
+        batch.execute()
+        assert connection.execute_command.call_count == 2
+        assert [call.return_code for call in batch.calls] == [0, 0]
+
+    def test_empty_batch_not_executed(self, owner):
+        with owner.batch():
+            pass
+        owner._connection.execute_command.assert_not_called()
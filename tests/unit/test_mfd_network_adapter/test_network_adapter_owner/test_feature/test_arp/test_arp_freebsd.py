@@ -15,6 +15,7 @@ from mfd_typing import OSName, MACAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
 from mfd_network_adapter import NetworkInterface
+from mfd_network_adapter.network_adapter_owner.feature.arp import NeighborEntry
 from mfd_network_adapter.network_adapter_owner.freebsd import FreeBSDNetworkAdapterOwner
 
 arp_table_json_output_ipv4 = dedent(
@@ -50,6 +51,14 @@ Neighbor                              Linklayer Address  Netif Expire    S Flags
 fe80::abcd:1234:ef56:7890             00:00:00:00:00:00  em0   190s      R"""
 )
 
+ndp_an_output = dedent(
+    """\
+Neighbor                              Linklayer Address  Netif Expire    S Flags
+fe80::1%ix0                           00:00:00:00:00:01    ix0 23h59m58s S R
+2001:db8::2                           00:00:00:00:00:02    ix1 permanent R
+2001:db8::3                           (incomplete)         ix1 expired   N"""
+)
+
 arping_send_output = dedent(
     """\
 ARPING 10.10.10.10
@@ -152,3 +161,59 @@ class TestFreeBSDARP:
     def test_add_arp_entry_ipv6_wrong_mac(self, owner):
         with pytest.raises(ValueError):
             owner.arp.add_arp_entry(ip=IPv6Interface("2001:db8:85a3::8a2e:370:7334"), mac=MACAddress("c0f6:d:zzz3f"))
+
+    def test_get_neighbor_table(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=arp_table_json_output_ipv4, stderr=""
+        )
+        table = owner.arp.get_neighbor_table(allowed_states=["permanent"])
+        owner._connection.execute_command.assert_called_once_with("arp -a --libxo=json")
+        assert table.entries == [
+            NeighborEntry(
+                ip=IPv4Interface("10.10.10.10"),
+                mac=MACAddress("00:00:00:00:00:00"),
+                device="ix0",
+                states=["permanent"],
+            )
+        ]
+
+    def test_get_neighbor_table_ipv6(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=ndp_an_output, stderr=""
+        )
+        table = owner.arp.get_neighbor_table(ip_ver=IPVersion.V6)
+        owner._connection.execute_command.assert_called_once_with("ndp -an")
+        assert len(table) == 3
+        assert table.get_by_ip(IPv6Interface("fe80::1"))[0].device == "ix0"
+        assert table.get_by_ip(IPv6Interface("2001:db8::2"))[0].states == ["R", "permanent"]
+        assert table.get_by_ip(IPv6Interface("2001:db8::3"))[0].mac is None
+        assert [str(entry.ip) for entry in table.get_by_device("ix1")] == ["2001:db8::2/128", "2001:db8::3/128"]
+
+    def test_add_and_delete_neighbors(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_NEIGHBOR@@ 0 0\n@@MFD_NEIGHBOR@@ 1 0\n", stderr=""
+        )
+        entries = [
+            NeighborEntry(ip=IPv4Interface("10.10.10.1"), mac=MACAddress("00:00:00:00:00:01")),
+            NeighborEntry(ip=IPv6Interface("2001:db8::2"), mac=MACAddress("00:00:00:00:00:02")),
+        ]
+        assert owner.arp.add_neighbors(entries, replace=True) == []
+        owner._connection.execute_command.assert_called_with(
+            'arp -S 10.10.10.1 00:00:00:00:00:01 2>&1; echo "@@MFD_NEIGHBOR@@ 0 $?"\n'
+            "{ ndp -d 2001:db8::2 >/dev/null; ndp -s 2001:db8::2 00:00:00:00:00:02; } 2>&1; "
+            'echo "@@MFD_NEIGHBOR@@ 1 $?"',
+            shell=True,
+            expected_return_codes=None,
+        )
+
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout="@@MFD_NEIGHBOR@@ 0 0\nndp: cannot locate 2001:db8::2\n@@MFD_NEIGHBOR@@ 1 1\n",
+            stderr="",
+        )
+        assert owner.arp.delete_neighbors(entries) == [(entries[1], "ndp: cannot locate 2001:db8::2")]
+        assert owner._connection.execute_command.call_args.args[0] == (
+            'arp -d 10.10.10.1 2>&1; echo "@@MFD_NEIGHBOR@@ 0 $?"\n'
+            'ndp -d 2001:db8::2 2>&1; echo "@@MFD_NEIGHBOR@@ 1 $?"'
+        )
@@ -3,6 +3,7 @@
 """Test ARP Linux."""
 
 import ipaddress
+import json
 from ipaddress import IPv4Interface, IPv6Interface
 from textwrap import dedent
 
@@ -14,7 +15,9 @@ from mfd_typing import OSName, MACAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
 from mfd_network_adapter import NetworkInterface
+from mfd_network_adapter.network_adapter_owner.feature.arp import NeighborEntry, NeighborTable
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
 
 ip_arp_table_output_ipv4 = dedent(
     """\
@@ -68,6 +71,16 @@ ip_link_show_noarp_output = dedent(
 )
 
 
+ip_neigh_show_output = dedent(
+    """\
+10.10.10.1 dev eth0 lladdr 00:00:00:00:00:01 router REACHABLE
+10.10.10.2 dev eth0 lladdr 00:00:00:00:00:02 STALE
+10.10.10.3 dev eth1  FAILED
+10.10.10.4 dev eth1 lladdr 00:00:00:00:00:01 PERMANENT
+fe80::1 dev eth1 lladdr 00:00:00:00:00:01 router DELAY PROBE"""
+)
+
+
 class TestLinuxVLAN:
     @pytest.fixture
     def owner(self, mocker):
@@ -95,6 +108,46 @@ class TestLinuxVLAN:
         }
         assert owner.arp.get_arp_table() == expected_dict
 
+    def test_get_arp_table_json(self, owner, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.feature.arp.linux.is_json_supported", return_value=True)
+        output = json.dumps(
+            [
+                {"dst": "10.10.10.10", "dev": "br0", "lladdr": "AA:00:00:00:00:01", "state": ["REACHABLE"]},
+                {"dst": "10.10.10.11", "dev": "br0", "lladdr": "aa:00:00:00:00:02", "state": ["STALE"]},
+                {"dst": "10.10.10.12", "dev": "br0", "state": ["FAILED"]},
+            ]
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert owner.arp.get_arp_table() == {IPv4Interface("10.10.10.10"): MACAddress("aa:00:00:00:00:01")}
+        owner._connection.execute_command.assert_called_once_with("ip -j -4 neigh show")
+
+    @pytest.mark.parametrize("json_supported", [True, False])
+    def test_get_arp_table_large_output(self, owner, mocker, json_supported):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.arp.linux.is_json_supported",
+            return_value=json_supported,
+        )
+        neighbors = [
+            (f"10.{i // 65536}.{i // 256 % 256}.{i % 256}", f"00:00:00:00:{i // 256:02x}:{i % 256:02x}")
+            for i in range(10000)
+        ]
+        if json_supported:
+            output = json.dumps(
+                [{"dst": ip, "dev": "eth0", "lladdr": mac, "state": ["REACHABLE"]} for ip, mac in neighbors]
+            )
+        else:
+            output = "\n".join(f"{ip} dev eth0 lladdr {mac} REACHABLE" for ip, mac in neighbors)
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        arp_table = owner.arp.get_arp_table()
+
+        owner._connection.execute_command.assert_called_once()
+        assert len(arp_table) == 10000
+        assert arp_table[IPv4Interface("10.0.39.15")] == MACAddress("00:00:00:00:27:0f")
+
     def test_get_arp_table_blank_output(self, owner):
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="", stdout="", stderr=""
@@ -185,3 +238,125 @@ class TestLinuxVLAN:
         output = owner.arp.check_arp_response_state(interface=interface)
         owner._connection.execute_command.assert_called_with("ip link show interface")
         assert output is State.ENABLED
+
+    def test_parse_neighbor_line(self, owner):
+        assert owner.arp.parse_neighbor_line("10.10.10.1 dev eth0 lladdr 00:00:00:00:00:0A router REACHABLE") == (
+            NeighborEntry(
+                ip=IPv4Interface("10.10.10.1"),
+                mac=MACAddress("00:00:00:00:00:0a"),
+                device="eth0",
+                states=["REACHABLE"],
+            )
+        )
+        assert owner.arp.parse_neighbor_line("10.10.10.3  FAILED", device="eth1") == NeighborEntry(
+            ip=IPv4Interface("10.10.10.3"), device="eth1", states=["FAILED"]
+        )
+        assert owner.arp.parse_neighbor_line("Cannot open netlink socket") is None
+
+    def test_get_neighbor_table(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=ip_neigh_show_output, stderr=""
+        )
+        table = owner.arp.get_neighbor_table()
+        owner._connection.execute_command.assert_called_with("ip neigh show")
+
+        assert isinstance(table, NeighborTable)
+        assert len(table) == 5
+        assert IPv4Interface("10.10.10.3") in table
+        assert table.get_by_ip(IPv4Interface("10.10.10.3"))[0].mac is None
+        assert [entry.device for entry in table.get_by_mac(MACAddress("00:00:00:00:00:01"))] == ["eth0", "eth1", "eth1"]
+        assert [str(entry.ip) for entry in table.get_by_device("eth1")] == [
+            "10.10.10.3/32",
+            "10.10.10.4/32",
+            "fe80::1/128",
+        ]
+        assert table.get_by_device("eth2") == []
+        assert table.devices == ["eth0", "eth1"]
+        assert table.get_by_ip(IPv6Interface("fe80::1"))[0].states == ["DELAY", "PROBE"]
+        assert len(table.to_dict()) == 4
+
+    def test_get_neighbor_table_filtered(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=ip_neigh_show_output, stderr=""
+        )
+        table = owner.arp.get_neighbor_table(
+            ip_ver=IPVersion.V4, allowed_states=["REACHABLE", "PERMANENT"], namespace="ns1"
+        )
+        owner._connection.execute_command.assert_called_with("ip netns exec ns1 ip -4 neigh show")
+        assert [str(entry.ip) for entry in table] == ["10.10.10.1/32", "10.10.10.4/32"]
+
+    def test_get_neighbor_table_json(self, owner, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.feature.arp.linux.is_json_supported", return_value=True)
+        output = json.dumps(
+            [
+                {"dst": "10.10.10.10", "dev": "br0", "lladdr": "AA:00:00:00:00:01", "state": ["REACHABLE"]},
+                {"dst": "10.10.10.12", "dev": "br0", "state": ["FAILED"]},
+            ]
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        table = owner.arp.get_neighbor_table()
+        owner._connection.execute_command.assert_called_once_with("ip -j neigh show")
+        assert table.get_by_mac(MACAddress("aa:00:00:00:00:01"))[0].ip == IPv4Interface("10.10.10.10")
+        assert table.get_by_ip(IPv4Interface("10.10.10.12")) == [
+            NeighborEntry(ip=IPv4Interface("10.10.10.12"), device="br0", states=["FAILED"])
+        ]
+
+    def test_get_neighbor_table_stream(self, owner, mocker):
+        process = mocker.Mock()
+        process.get_stdout_iter.return_value = iter(line + "\n" for line in ip_neigh_show_output.splitlines())
+        owner._connection.start_process.return_value = process
+
+        table = owner.arp.get_neighbor_table(allowed_states=["STALE", "FAILED"], stream=True)
+        owner._connection.start_process.assert_called_once_with("ip neigh show")
+        owner._connection.execute_command.assert_not_called()
+        assert [str(entry.ip) for entry in table] == ["10.10.10.2/32", "10.10.10.3/32"]
+
+    def test_add_neighbors(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout="RTNETLINK answers: File exists\nCommand failed -:2\n@@MFD_BATCH@@ 0-1 1\n",
+            stderr="",
+        )
+        entries = [
+            NeighborEntry(ip=IPv4Interface("10.10.10.1"), mac=MACAddress("00:00:00:00:00:01"), device="eth0"),
+            NeighborEntry(
+                ip=IPv6Interface("fe80::2"), mac=MACAddress("00:00:00:00:00:02"), device="eth0", states=["STALE"]
+            ),
+            NeighborEntry(ip=IPv4Interface("10.10.10.3"), device="eth0"),
+        ]
+        failures = owner.arp.add_neighbors(entries)
+
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert (
+            "neigh add 10.10.10.1 lladdr 00:00:00:00:00:01 dev eth0\n"
+            "neigh add fe80::2 lladdr 00:00:00:00:00:02 dev eth0 nud stale\n"
+        ) in script
+        assert failures == [
+            (entries[2], "MAC address and device are required"),
+            (entries[1], "RTNETLINK answers: File exists"),
+        ]
+
+    def test_add_neighbors_replace_in_namespace(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-0 0\n", stderr=""
+        )
+        entry = NeighborEntry(ip=IPv4Interface("10.10.10.1"), mac=MACAddress("00:00:00:00:00:01"), device="eth0")
+        assert owner.arp.add_neighbors([entry], replace=True, namespace="ns1") == []
+        script = owner._connection.execute_command.call_args.args[0]
+        assert script.startswith("{ ip -n ns1 -force -batch - <<'MFD_BATCH_EOF'\n")
+        assert "neigh replace 10.10.10.1 lladdr 00:00:00:00:00:01 dev eth0\n" in script
+
+    def test_delete_neighbors(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-1 0\n", stderr=""
+        )
+        owner.arp.get_neighbor_table = lambda: NeighborTable(
+            owner.arp.parse_neighbor_line(line) for line in ip_neigh_show_output.splitlines()
+        )
+        assert owner.arp.delete_neighbors(owner.arp.get_neighbor_table().get_by_device("eth0")) == []
+        script = owner._connection.execute_command.call_args.args[0]
+        assert "neigh del 10.10.10.1 dev eth0\nneigh del 10.10.10.2 dev eth0\n" in script
@@ -3,6 +3,7 @@
 """Test ARP Windows."""
 
 from mfd_network_adapter.network_adapter_owner.exceptions import ARPFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.arp import NeighborEntry
 from mfd_network_adapter.network_adapter_owner.windows import WindowsNetworkAdapterOwner
 import ipaddress
 from textwrap import dedent
@@ -219,3 +220,67 @@ class TestWindowsARP:
         owner._connection.execute_powershell.side_effect = ARPFeatureException(cmd="arp -a", returncode=1, stderr="")
         with pytest.raises(ARPFeatureException):
             owner.arp.read_ndp_neighbors(ip=IPv6Interface("2001:db8:85a3::8a2e:370:7334"))
+
+    def test_get_neighbor_table(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=netsh_ipv4_show_neigh, stderr=""
+        )
+        table = owner.arp.get_neighbor_table()
+        owner._connection.execute_powershell.assert_called_once_with("netsh interface ipv4 show neighbors")
+        assert table.devices == ["Loopback Pseudo-Interface 1", "Ethernet 4"]
+        assert table.get_by_ip(IPv6Interface("ff02::2")) == [
+            NeighborEntry(ip=IPv6Interface("ff02::2"), device="Loopback Pseudo-Interface 1", states=["Permanent"]),
+            NeighborEntry(
+                ip=IPv6Interface("ff02::2"),
+                mac=MACAddress("33-33-00-00-00-02"),
+                device="Ethernet 4",
+                states=["Permanent"],
+            ),
+        ]
+        assert [entry.device for entry in table.get_by_mac(MACAddress("00-00-00-00-00-00"))] == ["Ethernet 4"]
+
+    def test_get_neighbor_table_filtered(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=netsh_arp_table_output, stderr=""
+        )
+        table = owner.arp.get_neighbor_table(allowed_states=["Reachable"])
+        assert [(entry.device, str(entry.mac)) for entry in table] == [
+            ("Wi-Fi", "c0:f6:c2:aa:2d:3f"),
+            ("Ethernet", "00:11:22:33:44:55"),
+        ]
+
+    def test_add_neighbors(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout="@@MFD_NEIGHBOR@@ 0 0\nThe object already exists.\n@@MFD_NEIGHBOR@@ 1 1\n",
+            stderr="",
+        )
+        entries = [
+            NeighborEntry(ip=IPv4Interface("10.10.10.1"), mac=MACAddress("00:00:00:00:00:01"), device="Ethernet"),
+            NeighborEntry(ip=IPv6Interface("fe80::2"), mac=MACAddress("00:00:00:00:00:02"), device="Ethernet"),
+        ]
+        assert owner.arp.add_neighbors(entries, replace=True) == [(entries[1], "The object already exists.")]
+        owner._connection.execute_powershell.assert_called_once_with(
+            "netsh int ip del neigh 'Ethernet' 10.10.10.1 | Out-Null; "
+            "netsh int ip add neigh 'Ethernet' 10.10.10.1 00-00-00-00-00-01; "
+            'echo "@@MFD_NEIGHBOR@@ 0 $LASTEXITCODE"\n'
+            "netsh int ipv6 del neigh 'Ethernet' fe80::2 | Out-Null; "
+            "netsh int ipv6 add neigh 'Ethernet' fe80::2 00-00-00-00-00-02; "
+            'echo "@@MFD_NEIGHBOR@@ 1 $LASTEXITCODE"',
+            expected_return_codes=None,
+        )
+
+    def test_delete_neighbors(self, owner):
+        owner._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="", stderr=""
+        )
+        entries = [
+            NeighborEntry(ip=IPv4Interface("10.10.10.1"), device="Ethernet"),
+            NeighborEntry(ip=IPv4Interface("10.10.10.2")),
+        ]
+        assert owner.arp.delete_neighbors(entries) == [(entries[1], "device is required"), (entries[0], "not executed")]
+        owner._connection.execute_powershell.assert_called_once_with(
+            "netsh int ip del neigh 'Ethernet' 10.10.10.1; echo \"@@MFD_NEIGHBOR@@ 0 $LASTEXITCODE\"",
+            expected_return_codes=None,
+        )
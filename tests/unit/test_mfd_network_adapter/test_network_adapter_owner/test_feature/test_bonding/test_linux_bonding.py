@@ -12,6 +12,8 @@ from mfd_ethtool import Ethtool
 from mfd_typing import OSName, PCIAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
+from mfd_network_adapter.network_adapter_owner.exceptions import BondingFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.bonding import BondSpec, FailoverResult
 from mfd_network_adapter.network_adapter_owner.feature.bonding.linux import BondingParams
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
@@ -165,16 +167,148 @@ class TestLinuxBonding:
         )
 
     def test_delete_bond_interface(self, owner, interface, interface_2):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-3 0\n"
+        )
         owner.bonding.delete_bond_interface(interface, [interface_2])
-        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout="")
-        owner._connection.execute_command.assert_has_calls(
-            [
-                call(f"ip link set {interface_2.name} down"),
-                call(f"ip link set {interface_2.name} nomaster"),
-                call(f"ip link set {interface_2.name} up"),
-                call(f"ip link delete {interface.name}"),
-            ]
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert (
+            f"link set {interface_2.name} down\n"
+            f"link set {interface_2.name} nomaster\n"
+            f"link set {interface_2.name} up\n"
+            f"link delete {interface.name}\n"
+        ) in script
+
+    def test_delete_bond_interface_failure(self, owner, interface, interface_2):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="Cannot find device\nCommand failed -:4\n@@MFD_BATCH@@ 0-3 1\n"
+        )
+        with pytest.raises(BondingFeatureException, match="Cannot delete bond interfaces"):
+            owner.bonding.delete_bond_interface(interface, [interface_2])
+
+    def test_create_bonds(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-9 0\n"
+        )
+        bond0, bond1 = mocker.Mock(), mocker.Mock()
+        bond0.name, bond1.name = "bond0", "bond1"
+        owner.get_interfaces = mocker.Mock(return_value=[bond1, bond0])
+        specs = [
+            BondSpec(name="bond0", children=["eth1", "eth2"], params={BondingParams.UPDELAY: 200}),
+            BondSpec(name="bond1", children=["eth3"], mode="802.3ad", miimon=None),
+        ]
+        assert owner.bonding.create_bonds(specs) == [bond0, bond1]
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert (
+            "link add bond0 type bond mode active-backup miimon 100 updelay 200\n"
+            "link set eth1 down\n"
+            "link set eth1 master bond0\n"
+            "link set eth2 down\n"
+            "link set eth2 master bond0\n"
+            "link set bond0 up\n"
+            "link add bond1 type bond mode 802.3ad\n"
+            "link set eth3 down\n"
+            "link set eth3 master bond1\n"
+            "link set bond1 up\n"
+        ) in script
+
+    def test_create_bonds_not_created(self, owner, mocker):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-1 0\n"
+        )
+        owner.get_interfaces = mocker.Mock(return_value=[])
+        with pytest.raises(BondingFeatureException, match="bond0 was not created properly"):
+            owner.bonding.create_bonds([BondSpec(name="bond0")])
+
+    def test_get_bonds_attributes(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout=(
+                "/sys/class/net/bond0/bonding/active_slave:eth1\n"
+                "/sys/class/net/bond0/bonding/mode:active-backup 1\n"
+                "/sys/class/net/bond0/bonding/slaves:eth1 eth2\n"
+                "/sys/class/net/bond1/bonding/active_slave:\n"
+                "/sys/class/net/bond1/bonding/mode:802.3ad 4\n"
+            ),
+        )
+        assert owner.bonding.get_bonds_attributes() == {
+            "bond0": {"active_slave": "eth1", "mode": "active-backup 1", "slaves": "eth1 eth2"},
+            "bond1": {"active_slave": "", "mode": "802.3ad 4"},
+        }
+        owner._connection.execute_command.assert_called_once_with(
+            "grep -H ^ /sys/class/net/*/bonding/* 2>/dev/null", shell=True, expected_return_codes=None
+        )
+
+    def test_get_bonds_attributes_selected(self, owner, interface):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=2, args="", stdout="")
+        assert owner.bonding.get_bonds_attributes([interface, "bond1"]) == {}
+        owner._connection.execute_command.assert_called_once_with(
+            "grep -H ^ /sys/class/net/eth0/bonding/* /sys/class/net/bond1/bonding/* 2>/dev/null",
+            shell=True,
+            expected_return_codes=None,
+        )
+
+    def test_delete_bonds(self, owner):
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="",
+                stdout="/sys/class/net/bond0/bonding/slaves:eth1 eth2\n/sys/class/net/bond1/bonding/mode:802.3ad 4\n",
+            ),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="@@MFD_BATCH@@ 0-7 0\n"),
+        ]
+        assert owner.bonding.delete_bonds() == ["bond0", "bond1"]
+        assert owner._connection.execute_command.call_count == 2
+        script = owner._connection.execute_command.call_args.args[0]
+        assert (
+            "link set eth1 down\nlink set eth1 nomaster\nlink set eth1 up\n"
+            "link set eth2 down\nlink set eth2 nomaster\nlink set eth2 up\n"
+            "link delete bond0\nlink delete bond1\n"
+        ) in script
+
+    def test_delete_bonds_none(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=2, args="", stdout="")
+        assert owner.bonding.delete_bonds() == []
+        owner._connection.execute_command.assert_called_once()
+
+    def test_measure_failover(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout=(
+                "@@MFD_FAILOVER@@ start eth1\n"
+                "@@MFD_FAILOVER@@ 1200000 \n"
+                "@@MFD_FAILOVER@@ 101500000 eth2\n"
+            ),
+        )
+        result = owner.bonding.measure_failover("bond0")
+        assert result == FailoverResult(
+            failed_child="eth1", new_active_child="eth2", latency_ms=101.5, samples=[(1.2, ""), (101.5, "eth2")]
+        )
+        script = owner._connection.execute_command.call_args.args[0]
+        assert 'child="$old"' in script
+        assert "end=$((start + 5000000000))" in script
+        assert script.rstrip().endswith('  done\n  ip link set dev "$child" up\nfi')
+
+    def test_measure_failover_not_active(self, owner, interface_2):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_FAILOVER@@ start eth1\n"
+        )
+        with pytest.raises(BondingFeatureException, match="eth2 is not active child of bond0"):
+            owner.bonding.measure_failover("bond0", interface_2, restore_link=False)
+        script = owner._connection.execute_command.call_args.args[0]
+        assert 'child="eth2"' in script
+        assert "ip link set dev \"$child\" up" not in script
+
+    def test_measure_failover_timeout(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_FAILOVER@@ start eth1\n@@MFD_FAILOVER@@ timeout\n"
         )
+        with pytest.raises(BondingFeatureException, match="not finished within 0.5s"):
+            owner.bonding.measure_failover("bond0", timeout=0.5)
 
     def test_verify_active_child(self, owner, interface, interface_2, mocker):
         owner.bonding.get_active_child = mocker.Mock()
@@ -0,0 +1,116 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Events Linux."""
+
+from datetime import datetime
+from ipaddress import IPv4Interface, IPv6Interface
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.process import RemoteProcess
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner.exceptions import EventsFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.events.data_structures import EventType, MonitorObject
+from mfd_network_adapter.network_adapter_owner.feature.events.linux import EventSubscription, parse_monitor_line
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+
+MONITOR_OUTPUT = dedent(
+    """\
+    [2025-10-19T10:00:00.100000] 3: eth1    inet6 fe80::1/64 scope link tentative
+           valid_lft forever preferred_lft forever
+    [2025-10-19T10:00:01.250000] 3: eth1    inet6 fe80::1/64 scope link
+           valid_lft forever preferred_lft forever
+    [2025-10-19T10:00:02.000000] 4: eth2: <NO-CARRIER,BROADCAST,MULTICAST,UP> mtu 1500 qdisc mq state DOWN group default
+        link/ether 00:00:00:00:00:01 brd ff:ff:ff:ff:ff:ff
+    [2025-10-19T10:00:03.000000] 4: eth2: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc mq state UP group default
+        link/ether 00:00:00:00:00:01 brd ff:ff:ff:ff:ff:ff
+    [2025-10-19T10:00:04.000000] Deleted 5: vlan10@eth2: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN
+    [2025-10-19T10:00:05.000000] 10.0.0.2 dev eth2 lladdr 00:00:00:00:00:02 REACHABLE
+    [2025-10-19T10:00:06.000000] Deleted 3: eth1    inet 10.0.0.1/24 scope global eth1
+    """
+)
+
+
+class TestLinuxEvents:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        host = LinuxNetworkAdapterOwner(connection=connection)
+        yield host
+        mocker.stopall()
+
+    @pytest.fixture
+    def process(self, mocker):
+        process = mocker.create_autospec(RemoteProcess)
+        process.get_stdout_iter.return_value = iter(MONITOR_OUTPUT.splitlines())
+        process.running = True
+        return process
+
+    def test_subscribe(self, owner, process):
+        owner._connection.start_process.return_value = process
+        subscription = owner.events.subscribe(objects=[MonitorObject.LINK, MonitorObject.ADDRESS], namespace="ns1")
+        owner._connection.start_process.assert_called_once_with("ip netns exec ns1 ip -ts monitor link address")
+        assert isinstance(subscription, EventSubscription)
+
+    def test_subscribe_all_objects(self, owner, process):
+        owner._connection.start_process.return_value = process
+        owner.events.subscribe()
+        owner._connection.start_process.assert_called_once_with("ip -ts monitor link address neigh")
+
+    def test_parse_monitor_line(self):
+        events = [parse_monitor_line(line) for line in MONITOR_OUTPUT.splitlines()]
+        events = [event for event in events if event is not None]
+        assert [event.event_type for event in events] == [
+            EventType.ADDRESS_ADDED,
+            EventType.ADDRESS_ADDED,
+            EventType.LINK_DOWN,
+            EventType.LINK_UP,
+            EventType.LINK_DELETED,
+            EventType.NEIGHBOR_ADDED,
+            EventType.ADDRESS_DELETED,
+        ]
+        assert events[0].ip == IPv6Interface("fe80::1/64")
+        assert "tentative" in events[0].flags
+        assert events[1].timestamp == datetime(2025, 10, 19, 10, 0, 1, 250000)
+        assert events[4].interface_name == "vlan10"
+        assert events[5].ip == IPv4Interface("10.0.0.2/32")
+        assert events[6].ip == IPv4Interface("10.0.0.1/24")
+
+    def test_wait_for(self, process):
+        subscription = EventSubscription(process)
+        event = subscription.wait_for(
+            EventType.ADDRESS_ADDED, interface_name="eth1", predicate=lambda e: "tentative" not in e.flags, timeout=1
+        )
+        assert event.timestamp == datetime(2025, 10, 19, 10, 0, 1, 250000)
+        assert subscription.wait_for(EventType.LINK_UP, interface_name="eth2", timeout=1).interface_name == "eth2"
+        assert len(subscription.history) == 4
+
+    def test_wait_for_events_out_of_order(self, process):
+        subscription = EventSubscription(process)
+        # link up of eth2 arrives before deletion of address of eth1
+        assert subscription.wait_for(EventType.ADDRESS_DELETED, interface_name="eth1", timeout=1)
+        event = subscription.wait_for(EventType.LINK_UP, interface_name="eth2", timeout=1)
+        assert event.timestamp == datetime(2025, 10, 19, 10, 0, 3)
+        # matching event is consumed
+        with pytest.raises(EventsFeatureException):
+            subscription.wait_for(EventType.LINK_UP, interface_name="eth2", timeout=0.1)
+
+    def test_wait_for_event_returned_by_get_events(self, process):
+        subscription = EventSubscription(process)
+        subscription._reader.join()
+        assert len(subscription.get_events()) == 7
+        assert subscription.wait_for(EventType.NEIGHBOR_ADDED, timeout=0.1).ip == IPv4Interface("10.0.0.2/32")
+
+    def test_wait_for_timeout(self, process):
+        subscription = EventSubscription(process)
+        with pytest.raises(EventsFeatureException, match="link_up for eth1 not received after 0.1s"):
+            subscription.wait_for(EventType.LINK_UP, interface_name="eth1", timeout=0.1)
+
+    def test_get_events_and_stop(self, process):
+        with EventSubscription(process) as subscription:
+            subscription._reader.join()
+            assert len(subscription.get_events()) == 7
+        process.kill.assert_called_once()
@@ -7,6 +7,7 @@ from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
 from mfd_network_adapter.network_adapter_owner.exceptions import IPFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.ip import NamespaceTeardownResult
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
 
@@ -118,18 +119,41 @@ class TestLinuxIP:
         owner._get_network_namespaces.assert_called_once()
         assert result == expected_namespaces
 
-    def test_delete_all_namespaces(self, owner, mocker):
-        # Arrange
-        namespaces = ["ns1", "ns2"]
-        owner.ip.get_namespaces = mocker.Mock(return_value=namespaces)
-        owner.ip.delete_namespace = mocker.Mock()
-
-        # Act
-        owner.ip.delete_all_namespaces()
+    def test_delete_all_namespaces(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout=(
+                "@@MFD_NS_TEARDOWN@@ killed ns1 1234 1240 \n"
+                "@@MFD_NS_TEARDOWN@@ moved ns1 eth1\n"
+                "@@MFD_NS_TEARDOWN@@ moved ns1 eth2\n"
+                "@@MFD_NS_TEARDOWN@@ deleted ns1\n"
+                "@@MFD_NS_TEARDOWN@@ deleted ns2\n"
+                "@@MFD_NS_TEARDOWN@@ failed ns3 Cannot remove namespace file: Device or resource busy \n"
+            ),
+        )
+        result = owner.ip.delete_all_namespaces()
+
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert script.startswith("for ns in $(ip netns list | awk '{print $1}'); do\n  pids=")
+        assert "kill -KILL $pids" in script
+        assert 'ip -n "$ns" link set dev "$dev" netns 1' in script
+        assert result == NamespaceTeardownResult(
+            deleted=["ns1", "ns2"],
+            killed_pids={"ns1": [1234, 1240]},
+            moved_interfaces={"ns1": ["eth1", "eth2"]},
+            failures={"ns3": "Cannot remove namespace file: Device or resource busy"},
+        )
 
-        # Assert
-        owner.ip.get_namespaces.assert_called_once()
-        owner.ip.delete_namespace.assert_has_calls([mocker.call("ns1"), mocker.call("ns2")])
+    def test_delete_all_namespaces_filtered(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(return_code=0, args="", stdout="")
+        assert owner.ip.delete_all_namespaces(namespaces=["ns1", "ns 2"], pattern="ns*", kill_signal="TERM") == (
+            NamespaceTeardownResult()
+        )
+        script = owner._connection.execute_command.call_args.args[0]
+        assert script.startswith("for ns in ns1 'ns 2'; do\n  case \"$ns\" in ns*) ;; *) continue ;; esac\n")
+        assert "kill -TERM $pids" in script
 
     def test_rename_interface(self, owner, mocker, caplog):
         # Arrange
@@ -4,9 +4,23 @@ from ipaddress import IPv4Address
 
 import pytest
 from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 
+from mfd_network_adapter.network_adapter_owner.exceptions import IPTablesFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.iptables import IPTablesBackend, IPTablesCounter, IPTablesRuleSet
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
+
+SAVE_OUTPUT = """# Generated by iptables-save v1.8.7 on Mon Oct 19 10:00:00 2026
+*nat
+:PREROUTING ACCEPT [0:0]
+:POSTROUTING ACCEPT [0:0]
+[10:1000] -A POSTROUTING -s 1.1.1.1/32 -d 2.2.2.2/32 -m comment --comment "test 1" -j SNAT --to-source 3.3.3.3
+[0:0] -A PREROUTING -d 4.4.4.4/32 -j DNAT --to-destination 5.5.5.5
+COMMIT
+# Completed on Mon Oct 19 10:00:00 2026
+"""
 
 
 class TestLinuxIPTables:
@@ -42,3 +56,113 @@ class TestLinuxIPTables:
         # Assert
 
         owner._connection.execute_command.assert_called_once_with(command)
+
+    def test_apply_rule_set(self, owner):
+        rule_set = IPTablesRuleSet()
+        rule_set.add_snat_rule(IPv4Address("1.1.1.1"), IPv4Address("2.2.2.2"), IPv4Address("3.3.3.3"), comment="t1")
+        rule_set.add_chain("filter", "MFD")
+        rule_set.add_rule("filter", "MFD", "-s 1.1.1.1 -j ACCEPT", comment="t1")
+        rule_set.add_dnat_rule(IPv4Address("4.4.4.4"), IPv4Address("5.5.5.5"))
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=0)
+
+        owner.iptables.apply_rule_set(rule_set, backend=IPTablesBackend.NFT, namespace="ns1")
+
+        owner._connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 iptables-nft-restore --noflush <<'MFD_IPTABLES_RULES'\n"
+            "*nat\n"
+            '-A POSTROUTING -s 1.1.1.1 -d 2.2.2.2 -j SNAT --to-source 3.3.3.3 -m comment --comment "t1"\n'
+            "-A PREROUTING -d 4.4.4.4 -j DNAT --to-destination 5.5.5.5\n"
+            "COMMIT\n"
+            "*filter\n"
+            ":MFD - [0:0]\n"
+            '-A MFD -s 1.1.1.1 -j ACCEPT -m comment --comment "t1"\n'
+            "COMMIT\n"
+            "MFD_IPTABLES_RULES",
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+
+    def test_apply_rule_set_failed_rule(self, owner):
+        rule_set = IPTablesRuleSet(ip_ver=IPVersion.V6)
+        rule_set.add_rule("filter", "INPUT", "-s fe80::1 -j ACCEPT")
+        rule_set.add_rule("filter", "INPUT", "-s fe80::2 -j WRONG")
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="ip6tables-restore v1.8.7 (nf_tables): line 3 failed", return_code=1
+        )
+
+        with pytest.raises(IPTablesFeatureException, match="failed rule: -A INPUT -s fe80::2 -j WRONG"):
+            owner.iptables.apply_rule_set(rule_set)
+        assert owner._connection.execute_command.call_args.args[0].startswith("ip6tables-restore --noflush")
+
+    def test_apply_empty_rule_set(self, owner):
+        owner.iptables.apply_rule_set(IPTablesRuleSet())
+        owner._connection.execute_command.assert_not_called()
+
+    def test_invalid_comment(self):
+        with pytest.raises(IPTablesFeatureException):
+            IPTablesRuleSet().add_rule("filter", "INPUT", "-j ACCEPT", comment='a" -j DROP')
+
+    def test_get_rule_counters(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=SAVE_OUTPUT, return_code=0
+        )
+
+        counters = owner.iptables.get_rule_counters(table="nat")
+
+        owner._connection.execute_command.assert_called_once_with("iptables-save -c -t nat")
+        assert counters == [
+            IPTablesCounter(
+                "nat",
+                "POSTROUTING",
+                '-s 1.1.1.1/32 -d 2.2.2.2/32 -m comment --comment "test 1" -j SNAT --to-source 3.3.3.3',
+                10,
+                1000,
+                "test 1",
+            ),
+            IPTablesCounter("nat", "PREROUTING", "-d 4.4.4.4/32 -j DNAT --to-destination 5.5.5.5", 0, 0),
+        ]
+
+    def test_get_rule_rates(self, owner, mocker):
+        after = SAVE_OUTPUT.replace("[10:1000]", "[30:3000]").replace("[0:0] -A PRE", "[5:500] -A PRE")
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=output, return_code=0) for output in (SAVE_OUTPUT, after)
+        ]
+        time_mock = mocker.patch("mfd_network_adapter.network_adapter_owner.feature.iptables.linux.time")
+        time_mock.monotonic.side_effect = [0, 2]
+
+        rates = owner.iptables.get_rule_rates(interval=2)
+
+        time_mock.sleep.assert_called_once_with(2)
+        assert [(rate.chain, rate.packets_per_second, rate.bytes_per_second, rate.comment) for rate in rates] == [
+            ("POSTROUTING", 10, 1000, "test 1"),
+            ("PREROUTING", 2.5, 250, None),
+        ]
+
+    def test_delete_rules_by_comment(self, owner):
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=SAVE_OUTPUT.replace("[10:1000] ", ""), return_code=0),
+            ConnectionCompletedProcess(args="", stdout="", return_code=0),
+        ]
+
+        assert owner.iptables.delete_rules_by_comment("test 1") == 1
+
+        owner._connection.execute_command.assert_any_call("iptables-save")
+        owner._connection.execute_command.assert_called_with(
+            "iptables-restore --noflush <<'MFD_IPTABLES_RULES'\n"
+            "*nat\n"
+            '-D POSTROUTING -s 1.1.1.1/32 -d 2.2.2.2/32 -m comment --comment "test 1" -j SNAT --to-source 3.3.3.3\n'
+            "COMMIT\n"
+            "MFD_IPTABLES_RULES",
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+
+    def test_delete_rules_by_comment_not_found(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=SAVE_OUTPUT, return_code=0
+        )
+
+        assert owner.iptables.delete_rules_by_comment("other", table="nat") == 0
+        owner._connection.execute_command.assert_called_once_with("iptables-save -t nat")
@@ -0,0 +1,277 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Network State Linux."""
+
+import json
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner.exceptions import NetworkStateFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.network_state.data_structures import NetworkStateSnapshot
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+
+LINKS = [
+    {"ifname": "lo", "flags": ["LOOPBACK", "UP", "LOWER_UP"], "mtu": 65536, "address": "00:00:00:00:00:00"},
+    {
+        "ifname": "eth0",
+        "flags": ["BROADCAST", "MULTICAST", "UP", "LOWER_UP"],
+        "mtu": 1500,
+        "address": "00:00:00:00:00:01",
+        "vfinfo_list": [{"vf": 0}, {"vf": 1}],
+    },
+    {
+        "ifname": "eth0.10",
+        "link": "eth0",
+        "flags": ["BROADCAST", "MULTICAST", "UP", "LOWER_UP"],
+        "mtu": 1500,
+        "address": "00:00:00:00:00:01",
+        "linkinfo": {"info_kind": "vlan", "info_data": {"protocol": "802.1Q", "id": 10}},
+    },
+]
+ADDRESSES = [
+    {
+        "ifname": "eth0",
+        "addr_info": [
+            {"family": "inet", "local": "10.0.0.1", "prefixlen": 24, "scope": "global"},
+            {"family": "inet6", "local": "fe80::1", "prefixlen": 64, "scope": "link"},
+        ],
+    }
+]
+ROUTES4 = [
+    {"dst": "default", "gateway": "10.0.0.254", "dev": "eth0"},
+    {"dst": "10.0.0.0/24", "dev": "eth0", "protocol": "kernel", "scope": "link"},
+    {"type": "local", "dst": "10.0.0.1", "table": "local", "dev": "eth0", "protocol": "kernel"},
+]
+ROUTES6 = [{"dst": "default", "gateway": "fe80::254", "dev": "eth0", "metric": 1024}]
+NEIGHBORS = [{"dst": "10.0.0.2", "dev": "eth0", "lladdr": "00:00:00:00:00:02", "state": ["PERMANENT"]}]
+NAMESPACES = [{"name": "ns1", "id": 0}]
+
+
+def build_output(**overrides) -> str:
+    sections = {
+        "namespaces": NAMESPACES,
+        "links": LINKS,
+        "addresses": ADDRESSES,
+        "routes4": ROUTES4,
+        "routes6": ROUTES6,
+        "neighbors": NEIGHBORS,
+    }
+    sections.update(overrides)
+    return "\n".join(f"### {name}\n{json.dumps(value)}" for name, value in sections.items())
+
+
+class TestLinuxNetworkState:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        host = LinuxNetworkAdapterOwner(connection=connection)
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.network_state.linux.is_json_supported", return_value=True
+        )
+        yield host
+        mocker.stopall()
+
+    def test_snapshot_json_not_supported(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.network_state.linux.is_json_supported",
+            return_value=False,
+        )
+        with pytest.raises(NetworkStateFeatureException, match="requires JSON output of iproute2"):
+            owner.network_state.snapshot()
+        owner._connection.execute_command.assert_not_called()
+
+    def test_snapshot_invalid_json(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="### links\n1: lo: <LOOPBACK,UP,LOWER_UP> mtu 65536\n", stderr=""
+        )
+        with pytest.raises(NetworkStateFeatureException, match="Invalid JSON output of links section"):
+            owner.network_state.snapshot()
+
+    def test_snapshot(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=build_output(namespaces=[]), stderr=""
+        )
+        snapshot = owner.network_state.snapshot(namespace="ns1")
+        command = owner._connection.execute_command.call_args.args[0]
+        assert "ip -n ns1 -d -j link show" in command
+        assert "ip -j netns list" in command
+        owner._connection.execute_command.assert_called_once()
+
+        assert snapshot.namespaces == {}
+        assert list(snapshot.links) == ["lo", "eth0", "eth0.10"]
+        assert snapshot.links["eth0"]["num_vfs"] == 2
+        assert snapshot.vlans == {"eth0.10": snapshot.links["eth0.10"]}
+        assert snapshot.vlans["eth0.10"]["vlan_id"] == 10
+        assert list(snapshot.addresses) == ["eth0 10.0.0.1/24"]
+        assert list(snapshot.routes) == [
+            "main default via 10.0.0.254 dev eth0",
+            "main ::/0 via fe80::254 dev eth0",
+        ]
+        assert list(snapshot.neighbors) == ["eth0 10.0.0.2"]
+
+    def test_snapshot_empty_sections(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="### namespaces\n### links\n[]", stderr=""
+        )
+        snapshot = owner.network_state.snapshot()
+        assert snapshot == NetworkStateSnapshot()
+
+    def test_diff(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=build_output(), stderr=""
+        )
+        before = owner.network_state.snapshot()
+        assert not before.diff(before)
+
+        changed_links = json.loads(json.dumps(LINKS[:2]))
+        changed_links[1]["mtu"] = 9000
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=build_output(links=changed_links, namespaces=[{"name": "ns2"}]), stderr=""
+        )
+        after = owner.network_state.snapshot()
+        diff = before.diff(after)
+        assert diff
+        assert list(diff.namespaces.added) == ["ns2"]
+        assert list(diff.namespaces.removed) == ["ns1"]
+        assert list(diff.links.removed) == ["eth0.10"]
+        assert diff.links.changed["eth0"][1]["mtu"] == 9000
+        assert not diff.addresses
+
+    def test_restore(self, owner, mocker):
+        before = NetworkStateSnapshot(
+            links={
+                "eth0": {
+                    "kind": None,
+                    "parent": None,
+                    "master": None,
+                    "mtu": 1500,
+                    "up": True,
+                    "mac": None,
+                    "vlan_id": None,
+                    "vlan_protocol": None,
+                    "num_vfs": 0,
+                },
+                "eth0.10": {
+                    "kind": "vlan",
+                    "parent": "eth0",
+                    "master": None,
+                    "mtu": 1500,
+                    "up": True,
+                    "mac": None,
+                    "vlan_id": 10,
+                    "vlan_protocol": "802.1Q",
+                    "num_vfs": 0,
+                },
+            },
+            addresses={"eth0 10.0.0.1/24": {"interface": "eth0", "ip": "10.0.0.1/24"}},
+        )
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=build_output(), stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0, args="", stdout="@@MFD_BATCH@@ 0 0\n@@MFD_BATCH@@ 1-4 0\n", stderr=""
+            ),
+        ]
+        diff = owner.network_state.restore(before)
+        assert list(diff.namespaces.added) == ["ns1"]
+        restore_call = owner._connection.execute_command.call_args_list[1]
+        assert restore_call == mocker.call(
+            "{ echo 0 > /sys/class/net/eth0/device/sriov_numvfs\n} </dev/null 2>&1\n"
+            'echo "@@MFD_BATCH@@ 0 $?"\n'
+            "{ ip -force -batch - <<'MFD_BATCH_EOF'\n"
+            "netns delete ns1\n"
+            "neigh del 10.0.0.2 dev eth0\n"
+            "route del default via 10.0.0.254 dev eth0 table main\n"
+            "route del ::/0 via fe80::254 dev eth0 metric 1024 table main\n"
+            "MFD_BATCH_EOF\n"
+            "} 2>&1\n"
+            'echo "@@MFD_BATCH@@ 1-4 $?"',
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+
+    def test_restore_recreates_vlan(self, owner):
+        current_links = [LINKS[1]]
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=build_output(), stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout=build_output(links=current_links), stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="@@MFD_BATCH@@ 0-3 0", stderr=""),
+        ]
+        before = owner.network_state.snapshot()
+        owner.network_state.restore(before)
+        restore_command = owner._connection.execute_command.call_args.args[0]
+        assert "link add link eth0 name eth0.10 type vlan protocol 802.1Q id 10\n" in restore_command
+        assert "link set dev eth0.10 mtu 1500\n" in restore_command
+        assert "link set dev eth0.10 up\n" in restore_command
+
+    def test_restore_nothing_to_do(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=build_output(), stderr=""
+        )
+        before = owner.network_state.snapshot()
+        assert not owner.network_state.restore(before)
+        assert owner._connection.execute_command.call_count == 2
+
+    def test_restore_failure(self, owner):
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=build_output(), stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="",
+                stdout="RTNETLINK answers: Operation not permitted\nCommand failed -:1\n@@MFD_BATCH@@ 0 1",
+                stderr="",
+            ),
+        ]
+        with pytest.raises(NetworkStateFeatureException, match="1 of 1 commands failed") as exception:
+            owner.network_state.restore(NetworkStateSnapshot())
+        assert "'ip netns delete ns1' returned 1: RTNETLINK answers: Operation not permitted" in str(exception.value)
+
+    def test_restore_ip_batch_not_started(self, owner):
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=build_output(), stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="",
+                stdout='Cannot open network namespace "ns2": No such file or directory\n@@MFD_BATCH@@ 0-0 255',
+                stderr="",
+            ),
+        ]
+        with pytest.raises(NetworkStateFeatureException, match="1 of 1 commands failed") as exception:
+            owner.network_state.restore(NetworkStateSnapshot(namespace="ns2"))
+        assert "returned 255: Cannot open network namespace" in str(exception.value)
+
+    def test_restore_failure_of_each_command_reported(self, owner):
+        before = NetworkStateSnapshot(
+            links={
+                "eth0": {
+                    "kind": None,
+                    "parent": None,
+                    "master": None,
+                    "mtu": 1500,
+                    "up": True,
+                    "mac": None,
+                    "vlan_id": None,
+                    "vlan_protocol": None,
+                    "num_vfs": 0,
+                }
+            }
+        )
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=build_output(), stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0,
+                args="",
+                stdout="sh: write error: Device or resource busy\n@@MFD_BATCH@@ 0 1\n@@MFD_BATCH@@ 1-6 0",
+                stderr="",
+            ),
+        ]
+        with pytest.raises(NetworkStateFeatureException, match="1 of 7 commands failed") as exception:
+            owner.network_state.restore(before)
+        assert (
+            "'echo 0 > /sys/class/net/eth0/device/sriov_numvfs' returned 1: sh: write error: Device or resource busy"
+            in str(exception.value)
+        )
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: MIT
 """Test Route Linux."""
 
-from ipaddress import IPv4Interface, IPv4Address
+import json
+from ipaddress import IPv4Address, IPv4Interface, IPv4Network, IPv6Address, IPv6Network, ip_network
+from textwrap import dedent
 
 import pytest
 from mfd_connect import RPyCConnection
@@ -11,7 +13,27 @@ from mfd_connect.exceptions import ConnectionCalledProcessError
 from mfd_typing import OSName
 
 from mfd_network_adapter.network_adapter_owner.exceptions import RouteFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.route import RouteEntry, RouteNexthop, RouteTable
+from mfd_network_adapter.network_adapter_owner.feature.route.linux import ROUTE_FAMILY_MARKER
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.feature.ip.data_structures import IPVersion
+
+ip_route_show_output = dedent("""\
+    default via 10.0.0.254 dev eth0 proto dhcp src 10.0.0.1 metric 100
+    10.0.0.0/24 dev eth0 proto kernel scope link src 10.0.0.1 metric 100
+    10.0.0.0/24 dev eth1 proto kernel scope link src 10.0.0.2 metric 200
+    10.0.1.0/24 via 10.0.0.253 dev eth0 proto static onlink
+    10.1.0.0/16 proto static metric 20
+    \tnexthop via 10.0.0.250 dev eth0 weight 1
+    \tnexthop via 10.0.0.251 dev eth1 weight 2
+    unreachable 10.2.0.0/16
+    10.3.0.0/16 via 10.0.0.252 dev eth0 table 100
+    local 10.0.0.1 dev eth0 table local proto kernel scope host src 10.0.0.1
+    broadcast 10.0.0.255 dev eth0 table local proto kernel scope link src 10.0.0.1""")
+
+ip_6_route_show_output = dedent("""\
+    2001:db8::/64 dev eth0 proto kernel metric 256 pref medium
+    default via fe80::1 dev eth0 proto ra metric 1024 expires 1797sec pref medium""")
 
 
 class TestLinuxRoute:
@@ -125,3 +147,162 @@ class TestLinuxRoute:
 
         # Assert
         owner._connection.execute_command.assert_called_once_with(command)
+
+    def test_parse_route_line(self, owner):
+        assert owner.route.parse_route_line("10.0.1.0/24 via 10.0.0.253 dev eth0 proto static onlink") == RouteEntry(
+            destination=IPv4Network("10.0.1.0/24"),
+            gateway=IPv4Address("10.0.0.253"),
+            device="eth0",
+            protocol="static",
+            flags=["onlink"],
+        )
+        assert owner.route.parse_route_line("default via fe80::1 dev eth0 metric 1024", version=6) == RouteEntry(
+            destination=IPv6Network("::/0"), gateway=IPv6Address("fe80::1"), device="eth0", metric=1024
+        )
+        assert owner.route.parse_route_line("\tnexthop via 10.0.0.250 dev eth0 weight 1") == RouteNexthop(
+            gateway=IPv4Address("10.0.0.250"), device="eth0", weight=1
+        )
+        assert owner.route.parse_route_line("blackhole 10.5.0.0/16").type == "blackhole"
+        assert owner.route.parse_route_line("Error: ipv4: FIB table does not exist.") is None
+
+    def test_get_route_table(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout=f"{ip_route_show_output}\n{ROUTE_FAMILY_MARKER}\n{ip_6_route_show_output}\n",
+            stderr="",
+        )
+        table = owner.route.get_route_table()
+        owner._connection.execute_command.assert_called_with(
+            f"ip -4 route show table all && echo {ROUTE_FAMILY_MARKER} && ip -6 route show table all", shell=True
+        )
+
+        assert isinstance(table, RouteTable)
+        assert len(table) == 11
+        assert table.tables == ["main", "100", "local"]
+        assert IPv4Network("10.0.1.0/24") in table
+        assert IPv4Network("10.3.0.0/16") not in table
+        assert [entry.device for entry in table.get("10.0.0.0/24")] == ["eth0", "eth1"]
+        assert table.get("10.3.0.0/16", table="100")[0].gateway == IPv4Address("10.0.0.252")
+        assert table.get(IPv4Network("10.1.0.0/16"))[0].nexthops == [
+            RouteNexthop(gateway=IPv4Address("10.0.0.250"), device="eth0", weight=1),
+            RouteNexthop(gateway=IPv4Address("10.0.0.251"), device="eth1", weight=2),
+        ]
+        assert len(table.get_by_device("eth1")) == 2
+
+        assert table.lookup("10.0.0.7").device == "eth0"
+        assert table.lookup("10.0.1.7").gateway == IPv4Address("10.0.0.253")
+        assert table.lookup("10.1.2.3").protocol == "static"
+        assert table.lookup("10.2.2.3").type == "unreachable"
+        assert table.lookup("192.168.0.1").gateway == IPv4Address("10.0.0.254")
+        assert table.lookup("10.0.0.1", table="local").type == "local"
+        assert table.lookup("2001:db8::5").device == "eth0"
+        assert table.lookup("2001:db9::5").gateway == IPv6Address("fe80::1")
+        assert RouteTable().lookup("10.0.0.1") is None
+
+    def test_get_route_table_json(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.route.linux.is_json_supported", return_value=True
+        )
+        output = json.dumps(
+            [
+                {"dst": "default", "gateway": "10.0.0.254", "dev": "eth0", "protocol": "dhcp", "metric": 100},
+                {"type": "local", "dst": "10.0.0.1", "dev": "eth0", "table": "local", "prefsrc": "10.0.0.1"},
+                {"dst": "10.1.0.0/16", "nexthops": [{"gateway": "10.0.0.250", "dev": "eth1", "weight": 1}]},
+            ]
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        table = owner.route.get_route_table(ip_ver=IPVersion.V4, namespace="ns1")
+        owner._connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 ip -j -4 route show table all", shell=False
+        )
+        assert table.lookup("8.8.8.8").metric == 100
+        assert table.get("10.0.0.1/32", table="local")[0].source == IPv4Address("10.0.0.1")
+        assert table.get_by_device("eth1")[0].destination == IPv4Network("10.1.0.0/16")
+
+    def test_add_routes(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout=(
+                "RTNETLINK answers: File exists\nCommand failed -:1\n"
+                "Error: Nexthop has invalid gateway.\nCommand failed -:3\n@@MFD_BATCH@@ 0-2 1\n"
+            ),
+            stderr="",
+        )
+        routes = [
+            RouteEntry(destination=IPv4Network("10.0.0.0/24"), device="eth0"),
+            RouteEntry(destination=IPv4Network("10.0.1.0/24"), gateway=IPv4Address("10.0.0.253"), metric=10),
+            RouteEntry(
+                destination=IPv4Network("10.0.2.0/24"),
+                gateway=IPv4Address("10.9.0.1"),
+                device="eth0",
+                table="100",
+                flags=["onlink"],
+            ),
+        ]
+        failures = owner.route.add_routes(routes)
+
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert (
+            "route add 10.0.0.0/24 dev eth0\n"
+            "route add 10.0.1.0/24 via 10.0.0.253 metric 10\n"
+            "route add 10.0.2.0/24 via 10.9.0.1 dev eth0 table 100 onlink\n"
+        ) in script
+        assert failures == [(routes[2], "Error: Nexthop has invalid gateway.")]
+
+    def test_add_routes_replace_in_namespace(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-0 0\n", stderr=""
+        )
+        route = RouteEntry(
+            destination=IPv4Network("10.1.0.0/16"),
+            nexthops=[RouteNexthop(gateway=IPv4Address("10.0.0.250"), device="eth0", weight=1)],
+        )
+        assert owner.route.add_routes([route], replace=True, namespace="ns1") == []
+        script = owner._connection.execute_command.call_args.args[0]
+        assert script.startswith("{ ip -n ns1 -force -batch - <<'MFD_BATCH_EOF'\n")
+        assert "route replace 10.1.0.0/16 nexthop via 10.0.0.250 dev eth0 weight 1\n" in script
+
+    def test_add_routes_large(self, owner):
+        owner._connection.execute_command.side_effect = lambda script, **kwargs: ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout="\n".join(
+                line.replace("echo ", "").replace('"', "") for line in script.splitlines() if "echo" in line
+            ).replace("$?", "0"),
+            stderr="",
+        )
+        routes = [
+            RouteEntry(destination=ip_network(f"10.{index // 256}.{index % 256}.0/24"), device="eth0")
+            for index in range(10_000)
+        ]
+        assert owner.route.add_routes(routes) == []
+        assert owner._connection.execute_command.call_count < 10
+
+    def test_delete_routes_and_get_missing(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=ip_route_show_output, stderr=""
+        )
+        table = owner.route.get_route_table(ip_ver=IPVersion.V4)
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout="Error: No such process\nCommand failed -:2\n@@MFD_BATCH@@ 0-4 1\n",
+            stderr="",
+        )
+        eth1_routes = table.get_by_device("eth1")
+        assert owner.route.delete_routes(eth1_routes) == [(eth1_routes[1], "Error: No such process")]
+        script = owner._connection.execute_command.call_args.args[0]
+        assert "route del 10.0.0.0/24 dev eth1 metric 200\nroute del 10.1.0.0/16 metric 20\n" in script
+
+        expected = [
+            RouteEntry(destination=IPv4Network("10.0.1.0/24"), gateway=IPv4Address("10.0.0.253")),
+            RouteEntry(destination=IPv4Network("10.0.1.0/24"), device="eth1"),
+            RouteEntry(destination=IPv4Network("10.3.0.0/16"), table="100"),
+            RouteEntry(destination=IPv4Network("10.4.0.0/16")),
+        ]
+        assert table.get_missing(expected) == expected[1::2]
@@ -0,0 +1,170 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Tunnel fleet Linux."""
+
+import json
+from ipaddress import IPv4Address, IPv4Interface, IPv6Address
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner.data_structures import TunnelType
+from mfd_network_adapter.network_adapter_owner.exceptions import TunnelFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.tunnel import TunnelSpec
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+
+
+def _link(name, kind, vni=None, addresses=(), up=True):
+    return {
+        "ifname": name,
+        "flags": ["BROADCAST", "MULTICAST", "UP", "LOWER_UP"] if up else ["BROADCAST", "MULTICAST"],
+        "linkinfo": {"info_kind": kind, "info_data": {} if vni is None else {"id": vni}},
+        "addr_info": [{"family": "inet", "local": ip, "prefixlen": prefix} for ip, prefix in addresses],
+    }
+
+
+class TestLinuxTunnel:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield LinuxNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    @pytest.fixture
+    def specs(self):
+        return [
+            TunnelSpec(
+                name="vxlan10",
+                tunnel_type=TunnelType.VXLAN,
+                vni=10,
+                group=IPv4Address("239.1.1.1"),
+                interface_name="eth1",
+                dstport=4789,
+                ip_addr=IPv4Interface("10.10.0.1/24"),
+            ),
+            TunnelSpec(
+                name="gnv20",
+                tunnel_type=TunnelType.GENEVE,
+                vni=20,
+                remote=IPv4Interface("1.1.1.2/24"),
+                namespace_name="ns1",
+            ),
+            TunnelSpec(
+                name="gre30",
+                tunnel_type=TunnelType.GRE,
+                vni=30,
+                local=IPv6Address("2001::1"),
+                remote=IPv6Address("2001::2"),
+                interface_name="eth2",
+                namespace_name="ns1",
+            ),
+        ]
+
+    def test_get_add_command(self, owner, specs):
+        assert [owner.tunnel._get_add_command(spec) for spec in specs] == [
+            "ip link add vxlan10 type vxlan id 10 group 239.1.1.1 dstport 4789 dev eth1",
+            "ip link add gnv20 type geneve id 20 remote 1.1.1.2",
+            "ip link add gre30 type ip6gretap local 2001::1 remote 2001::2 key 30 dev eth2",
+        ]
+
+    @pytest.mark.parametrize(
+        "spec, match",
+        [
+            (TunnelSpec(name="gre0", tunnel_type=TunnelType.GRE, remote=IPv4Address("1.1.1.1")), "Remote and local"),
+            (TunnelSpec(name="gnv0", tunnel_type=TunnelType.GENEVE, remote=IPv4Address("1.1.1.1")), "VNI"),
+            (TunnelSpec(name="vxlan0", tunnel_type=TunnelType.VXLAN, vni=1), "Remote address or group"),
+        ],
+    )
+    def test_get_add_command_incomplete(self, owner, spec, match):
+        with pytest.raises(TunnelFeatureException, match=match):
+            owner.tunnel._get_add_command(spec)
+
+    def test_create_tunnels(self, owner, specs):
+        root_links = [_link("vxlan10", "vxlan", 10, [("10.10.0.1", 24)])]
+        ns_links = [_link("gnv20", "geneve", 20), _link("gre30", "ip6gretap", up=False)]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            return_code=0,
+            stdout=(
+                "@@MFD_BATCH@@ 0-2 0\n"
+                f"{json.dumps(root_links)}\n@@MFD_BATCH@@ 3 0\n"
+                "RTNETLINK answers: File exists\nCommand failed -:3\n@@MFD_BATCH@@ 4-7 1\n"
+                f"{json.dumps(ns_links)}\n@@MFD_BATCH@@ 8 0\n"
+            ),
+        )
+        result = owner.tunnel.create_tunnels(specs)
+
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert (
+            "{ ip -force -batch - <<'MFD_BATCH_EOF'\n"
+            "link add vxlan10 type vxlan id 10 group 239.1.1.1 dstport 4789 dev eth1\n"
+            "addr add 10.10.0.1/24 dev vxlan10\n"
+            "link set vxlan10 up\n"
+            "MFD_BATCH_EOF\n"
+        ) in script
+        assert (
+            "{ ip -n ns1 -force -batch - <<'MFD_BATCH_EOF'\n"
+            "link add gnv20 type geneve id 20 remote 1.1.1.2\n"
+            "link set gnv20 up\n"
+            "link add gre30 type ip6gretap local 2001::1 remote 2001::2 key 30 dev eth2\n"
+            "link set gre30 up\n"
+            "MFD_BATCH_EOF\n"
+        ) in script
+        assert "{ ip netns exec ns1 ip -d -j addr show\n" in script
+        assert result.succeeded == ["vxlan10", "gnv20"]
+        assert result.failures == {
+            "gre30": "'ip netns exec ns1 ip link add gre30 type ip6gretap local 2001::1 remote 2001::2 key 30 "
+            "dev eth2': RTNETLINK answers: File exists"
+        }
+        assert not result
+
+    def test_create_tunnels_verification(self, owner, specs):
+        links = [_link("vxlan10", "vxlan", 11, [("10.10.0.1", 24)])]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout=f"@@MFD_BATCH@@ 0-2 0\n{json.dumps(links)}\n@@MFD_BATCH@@ 3 0\n"
+        )
+        result = owner.tunnel.create_tunnels(specs[:1])
+        assert result.failures == {"vxlan10": "unexpected id 11"}
+
+    @pytest.mark.parametrize(
+        "link, reason",
+        [
+            (None, "link not present"),
+            (_link("vxlan10", "geneve", 10), "unexpected kind geneve"),
+            (_link("vxlan10", "vxlan", 10, [("10.10.0.1", 24)], up=False), "link is not up"),
+            (_link("vxlan10", "vxlan", 10, [("10.10.0.1", 16)]), "address 10.10.0.1/24 not assigned"),
+            (_link("vxlan10", "vxlan", 10, [("10.10.0.1", 24)]), None),
+        ],
+    )
+    def test_verify_link(self, owner, specs, link, reason):
+        assert owner.tunnel._verify_link(specs[0], link) == reason
+
+    def test_create_tunnels_invalid_dump(self, owner, specs):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", return_code=0, stdout="@@MFD_BATCH@@ 0-2 0\nCannot open netns\n@@MFD_BATCH@@ 3 1\n"
+        )
+        with pytest.raises(TunnelFeatureException, match="Cannot read links of namespace None"):
+            owner.tunnel.create_tunnels(specs[:1])
+
+    def test_delete_tunnels(self, owner, specs):
+        ns_links = [_link("gre30", "ip6gretap")]
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            return_code=0,
+            stdout=(
+                'Cannot find device "vxlan10"\nCommand failed -:1\n@@MFD_BATCH@@ 0-0 1\n'
+                "[]\n@@MFD_BATCH@@ 1 0\n"
+                "Operation not permitted\nCommand failed -:2\n@@MFD_BATCH@@ 2-3 1\n"
+                f"{json.dumps(ns_links)}\n@@MFD_BATCH@@ 4 0\n"
+            ),
+        )
+        result = owner.tunnel.delete_tunnels(specs)
+        owner._connection.execute_command.assert_called_once()
+        script = owner._connection.execute_command.call_args.args[0]
+        assert "ip -n ns1 -force -batch - <<'MFD_BATCH_EOF'\nlink del gnv20\nlink del gre30\nMFD_BATCH_EOF" in script
+        assert result.succeeded == ["vxlan10", "gnv20"]
+        assert result.failures == {"gre30": "link still present Operation not permitted"}
@@ -2,8 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Test VLAN Linux."""
 
+import json
 from textwrap import dedent
-from unittest.mock import call
 
 import pytest
 from mfd_connect import RPyCConnection
@@ -11,7 +11,9 @@ from mfd_connect.base import ConnectionCompletedProcess
 from mfd_package_manager import LinuxPackageManager
 from mfd_typing import MACAddress
 from mfd_typing import OSName
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo, VlanInterfaceInfo
 
+from mfd_network_adapter.network_adapter_owner.exceptions import VLANFeatureException
 from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
 
 
@@ -52,18 +54,94 @@ class TestLinuxVLAN:
 
     def test_remove_all_vlans(self, owner):
         output_vlan = dedent("config  eth1.2 eth1.2.5  eth1.4  vtest")
+        owner._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=output_vlan, stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="", stdout="@@MFD_BATCH@@ 0-3 0", stderr=""),
+        ]
+        owner.vlan.remove_all_vlans()
+        assert owner._connection.execute_command.call_count == 2
+        script = owner._connection.execute_command.call_args.args[0]
+        assert "link del vtest\nlink del eth1.4\nlink del eth1.2.5\nlink del eth1.2\n" in script
+
+    def test_create_vlans(self, owner):
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="", stdout=output_vlan, stderr=""
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-2 0", stderr=""
         )
-        owner.vlan.remove_all_vlans()
-        owner._connection.execute_command.assert_has_calls(
+        assert owner.vlan.create_vlans(vlan_ids=range(1, 4), interface_name="eth1", protocol="802.1ad") == [
+            "eth1.1",
+            "eth1.2",
+            "eth1.3",
+        ]
+        owner._connection.execute_command.assert_called_once_with(
+            "{ ip -force -batch - <<'MFD_BATCH_EOF'\n"
+            "link add link eth1 name eth1.1 type vlan protocol 802.1ad id 1\n"
+            "link add link eth1 name eth1.2 type vlan protocol 802.1ad id 2\n"
+            "link add link eth1 name eth1.3 type vlan protocol 802.1ad id 3\n"
+            "MFD_BATCH_EOF\n"
+            "} 2>&1\n"
+            'echo "@@MFD_BATCH@@ 0-2 $?"',
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+
+    def test_create_vlans_failure(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0,
+            args="",
+            stdout="RTNETLINK answers: File exists\nCommand failed -:2\n@@MFD_BATCH@@ 0-2 1",
+            stderr="",
+        )
+        with pytest.raises(VLANFeatureException, match="link add link eth1 name eth1.2 type vlan id 2"):
+            owner.vlan.create_vlans(vlan_ids=[1, 2, 3], interface_name="eth1", namespace_name="ns1")
+        assert "ip -n ns1 -force -batch" in owner._connection.execute_command.call_args.args[0]
+
+    def test_remove_vlans_by_ids(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout="@@MFD_BATCH@@ 0-1 0", stderr=""
+        )
+        owner.vlan.remove_vlans(vlan_ids=[5, 6], interface_name="eth1")
+        owner._connection.execute_command.assert_called_once()
+        assert "link del eth1.5\nlink del eth1.6\n" in owner._connection.execute_command.call_args.args[0]
+
+    def test_list_vlans(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.is_json_supported", return_value=True
+        )
+        output = json.dumps(
             [
-                call("ip link del vtest", expected_return_codes={0}, shell=True),
-                call("ip link del eth1.4", expected_return_codes={0}, shell=True),
-                call("ip link del eth1.2.5", expected_return_codes={0}, shell=True),
-                call("ip link del eth1.2", expected_return_codes={0}, shell=True),
+                {"ifname": "eth1.4", "link": "eth1", "linkinfo": {"info_kind": "vlan", "info_data": {"id": 4}}},
+                {"ifname": "eth2.7", "link": "eth2", "linkinfo": {"info_kind": "vlan", "info_data": {"id": 7}}},
             ]
         )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert owner.vlan.list_vlans(interface_name="eth2", namespace_name="ns1") == {
+            "eth2.7": VlanInterfaceInfo(vlan_id=7, parent="eth2")
+        }
+        owner._connection.execute_command.assert_called_once_with(
+            "ip netns exec ns1 ip -d -j link show type vlan", expected_return_codes={0}, shell=True
+        )
+
+    def test_list_vlans_json_not_supported(self, owner, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.is_json_supported", return_value=False
+        )
+        output = dedent(
+            """\
+            5: eth1.4@eth1: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc noqueue state UP mode DEFAULT
+                link/ether 00:00:00:00:00:01 brd ff:ff:ff:ff:ff:ff promiscuity 0 minmtu 0 maxmtu 65535
+                vlan protocol 802.1Q id 4 <REORDER_HDR> addrgenmode eui64 numtxqueues 1 numrxqueues 1
+            """
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert owner.vlan.list_vlans() == {"eth1.4": VlanInterfaceInfo(vlan_id=4, parent="eth1")}
+        owner._connection.execute_command.assert_called_once_with(
+            "ip -d link show type vlan", expected_return_codes={0}, shell=True
+        )
 
     def test_create_macvlan(self, owner):
         owner._connection.execute_command.return_value = ConnectionCompletedProcess(
@@ -95,3 +173,62 @@ class TestLinuxVLAN:
             return_code=0, args="", stdout=output, stderr=""
         )
         owner.vlan.set_ingress_egress_map(interface_name="eth1", priority_map=egress_map, direction="egress")
+
+
+class TestLinuxVLANScale:
+    @pytest.fixture
+    def owner(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        host = LinuxNetworkAdapterOwner(connection=connection)
+
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.LinuxPackageManager",
+            mocker.create_autospec(LinuxPackageManager),
+        )
+
+        yield host
+        mocker.stopall()
+
+    @staticmethod
+    def _batch_result(command, **kwargs):
+        first, last = command.split("@@MFD_BATCH@@ ")[1].split(" ")[0].split("-")
+        return ConnectionCompletedProcess(return_code=0, args="", stdout=f"@@MFD_BATCH@@ {first}-{last} 0", stderr="")
+
+    @pytest.mark.parametrize("vlan_count", [1000, 4094])
+    def test_vlan_lifecycle_scale(self, owner, vlan_count):
+        owner._connection.execute_command.side_effect = self._batch_result
+        names = owner.vlan.create_vlans(vlan_ids=range(1, vlan_count + 1), interface_name="eth1")
+        assert len(names) == vlan_count
+        create_calls = owner._connection.execute_command.call_count
+        owner.vlan.remove_vlans(vlan_names=names)
+
+        # each call carries ~100KB script, instead of one call per VLAN
+        assert create_calls <= vlan_count // 1500 + 1
+        assert owner._connection.execute_command.call_count <= 2 * (vlan_count // 1500 + 1)
+
+    @pytest.mark.parametrize("vlan_count", [1000, 4094])
+    def test_update_vlans_scale(self, owner, mocker, vlan_count):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.linux.is_json_supported", return_value=True)
+        output = json.dumps(
+            [
+                {
+                    "ifname": f"eth1.{vlan_id}",
+                    "link": "eth1",
+                    "linkinfo": {"info_kind": "vlan", "info_data": {"protocol": "802.1Q", "id": vlan_id}},
+                }
+                for vlan_id in range(1, vlan_count + 1)
+            ]
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        interfaces = [
+            LinuxInterfaceInfo(name=f"eth1.{vlan_id}", interface_type=InterfaceType.VIRTUAL_DEVICE)
+            for vlan_id in range(1, vlan_count + 1)
+        ]
+        owner._update_vlans(interfaces=interfaces)
+
+        owner._connection.execute_command.assert_called_once()
+        assert all(interface.interface_type is InterfaceType.VLAN for interface in interfaces)
+        assert interfaces[-1].vlan_info == VlanInterfaceInfo(vlan_id=vlan_count, parent="eth1")
@@ -1,5 +1,6 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
 from dataclasses import dataclass
 from pathlib import PurePosixPath
 from textwrap import dedent
@@ -508,9 +509,33 @@ class TestLinuxNetworkOwner:
 
         assert owner._get_vlan_interfaces(namespace="") == expected_vlans
 
+    def test__update_vlans_json(self, owner, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.linux.is_json_supported", return_value=True)
+        stdout = json.dumps(
+            [{"ifname": "foo", "link": "eth1", "linkinfo": {"info_kind": "vlan", "info_data": {"id": 5}}}]
+        )
+        owner._connection.execute_command = mocker.Mock(
+            return_value=ConnectionCompletedProcess(args="", return_code=0, stdout=stdout)
+        )
+        iface_1 = LinuxInterfaceInfo(name="foo", interface_type=InterfaceType.VIRTUAL_DEVICE)
+        iface_2 = LinuxInterfaceInfo(name="dunno", interface_type=InterfaceType.PF)
+        ifaces = [iface_1, iface_2]
+
+        owner._update_vlans(ifaces, namespace="ns1")
+        owner._connection.execute_command.assert_called_once_with(
+            command="ip netns exec ns1 ip -d -j link show type vlan", shell=True, expected_return_codes={0, 1}
+        )
+        assert ifaces == [
+            LinuxInterfaceInfo(
+                name="foo", interface_type=InterfaceType.VLAN, vlan_info=VlanInterfaceInfo(vlan_id=5, parent="eth1")
+            ),
+            LinuxInterfaceInfo(name="dunno", interface_type=InterfaceType.PF),
+        ]
+
     def test__update_vlans(self, owner, mocker):
         vlan_ifaces = ["foo", "bar"]
         vlan_info = VlanInterfaceInfo(vlan_id=1, parent="parent")
+        owner._get_all_vlans_info = mocker.Mock(return_value=None)
         owner._get_vlan_interfaces = mocker.Mock(return_value=vlan_ifaces)
         owner._get_vlan_info = mocker.Mock(return_value=vlan_info)
 
@@ -895,6 +920,25 @@ class TestLinuxNetworkOwner:
 
         assert interfaces == interfaces_expected
 
+    def test__update_mac_addresses_json(self, owner, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.linux.is_json_supported", return_value=True)
+        output = json.dumps(
+            [
+                {"ifname": "lo", "link_type": "loopback", "address": "00:00:00:00:00:00"},
+                {"ifname": "eth1", "link_type": "ether", "address": "aa:bb:cc:dd:ee:01"},
+                {"ifname": "ppp0", "link_type": "ppp"},
+            ]
+        )
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=output)
+        interfaces = [LinuxInterfaceInfo(name="eth1"), LinuxInterfaceInfo(name="ppp0")]
+
+        owner._update_mac_addresses(interfaces=interfaces, namespace="ns1")
+        owner._connection.execute_command.assert_called_once_with(command="ip netns exec ns1 ip -j link show")
+        assert interfaces == [
+            LinuxInterfaceInfo(name="eth1", mac_address=MACAddress("aa:bb:cc:dd:ee:01")),
+            LinuxInterfaceInfo(name="ppp0"),
+        ]
+
     def test_get_pci_addresses_by_pci_device(self, owner, mocker):
         pci_device = PCIDevice(data="8086:1539:8086:0000")
         pci_addresses = [PCIAddress(data="0000:50:00.0"), PCIAddress(data="0000:50:00.1")]
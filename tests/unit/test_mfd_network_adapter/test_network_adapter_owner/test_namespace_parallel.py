@@ -0,0 +1,227 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test namespace-parallel execution of owner commands."""
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_package_manager import LinuxPackageManager
+from mfd_typing import OSName
+
+from mfd_network_adapter.network_adapter_owner import batch as batch_module
+from mfd_network_adapter.network_adapter_owner import linux as linux_module
+from mfd_network_adapter.network_adapter_owner.exceptions import BatchExecutionError
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_adapter_owner.namespace_parallel import (
+    NamespaceParallelConnection,
+    PrefetchedConnection,
+    prefetch_commands,
+)
+
+
+class TestNamespaceParallel:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        return connection
+
+    @pytest.fixture
+    def owner(self, mocker, connection):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.LinuxPackageManager",
+            mocker.create_autospec(LinuxPackageManager),
+        )
+        yield LinuxNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    def test_commands_grouped_by_namespace(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout=(
+                "@@MFD_BATCH@@ 0-0 0\n@@MFD_BATCH@@ 3 0\n@@MFD_NAMESPACE@@ 0 0\n"
+                "@@MFD_BATCH@@ 1-2 0\n@@MFD_NAMESPACE@@ 1 0\n"
+                "eth5\n@@MFD_BATCH@@ 4 0\n@@MFD_NAMESPACE@@ 2 0\n"
+            ),
+            return_code=0,
+        )
+        parallel = NamespaceParallelConnection(connection)
+        parallel.execute_command("ip link set dev eth0 up")
+        parallel.execute_command("ip netns exec ns1 ip link set dev eth1 up")
+        parallel.execute_command("ip netns exec ns1 ip addr flush dev eth1")
+        parallel.execute_command("cat /sys/class/net/eth0/mtu")
+        parallel.execute_command("ip netns exec ns2 ls /sys/class/net")
+        calls = parallel.execute()
+
+        connection.execute_command.assert_called_once()
+        script = connection.execute_command.call_args.args[0]
+        assert script.startswith("d=$(mktemp -d) || exit 1\n( sh -c '{ ip -force -batch - <<'\"'\"'MFD_BATCH_EOF")
+        assert (
+            "( ip netns exec ns1 sh -c '{ ip -force -batch - <<'\"'\"'MFD_BATCH_EOF'\"'\"'\n"
+            "link set dev eth1 up\n"
+            "addr flush dev eth1\n"
+            "MFD_BATCH_EOF\n"
+            "} 2>&1\n"
+            'echo "@@MFD_BATCH@@ 1-2 $?"\'\n'
+            'echo "@@MFD_NAMESPACE@@ 1 $?" ) >"$d/1" 2>&1 </dev/null &\n'
+        ) in script
+        assert "( ip netns exec ns2 sh -c '{ ls /sys/class/net\n" in script
+        assert script.endswith('wait\ncat $d/0 $d/1 $d/2\nrm -rf "$d"')
+        assert [call.return_code for call in calls] == [0, 0, 0, 0, 0]
+        assert calls[4].output == "eth5"
+
+    def test_namespace_failure_assigned_to_calls(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout=(
+                "@@MFD_BATCH@@ 0 0\n@@MFD_NAMESPACE@@ 0 0\n"
+                'Cannot open network namespace "ns1": No such file or directory\n@@MFD_NAMESPACE@@ 1 255\n'
+            ),
+            return_code=0,
+        )
+        parallel = NamespaceParallelConnection(connection)
+        parallel.execute_command("cat /etc/hostname")
+        parallel.execute_command("ip netns exec ns1 cat /etc/hostname")
+        with pytest.raises(BatchExecutionError, match="1 of 2 batched commands failed"):
+            parallel.execute()
+        assert parallel.calls[1].return_code == 255
+        assert parallel.calls[1].output == 'Cannot open network namespace "ns1": No such file or directory'
+
+    def test_script_not_executed(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="mktemp: failed\n", return_code=1
+        )
+        parallel = NamespaceParallelConnection(connection)
+        parallel.execute_command("cat /etc/hostname")
+        calls = parallel.execute(raise_on_error=False)
+        assert calls[0].failed
+        assert calls[0].output == "mktemp: failed"
+
+    def test_discard_stderr(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="@@MFD_BATCH@@ 0 2\n@@MFD_NAMESPACE@@ 0 0\n", return_code=0
+        )
+        parallel = NamespaceParallelConnection(connection)
+        parallel.execute_command("ls /proc/net/vlan", expected_return_codes={0, 2}, discard_stderr=True)
+        parallel.execute()
+        assert "{ { ls /proc/net/vlan\n} 2>/dev/null\n} </dev/null 2>&1" in connection.execute_command.call_args.args[0]
+        assert not parallel.calls[0].failed
+
+    def test_max_parallel(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=0)
+        parallel = NamespaceParallelConnection(connection, max_parallel=2)
+        for namespace in range(5):
+            parallel.execute_command(f"ip netns exec ns{namespace} cat /etc/hostname")
+        parallel.execute(raise_on_error=False)
+        lines = connection.execute_command.call_args.args[0].splitlines()
+        assert lines.count("wait") == 3
+
+    def test_namespace_split_into_ordered_chunks(self, connection, monkeypatch):
+        monkeypatch.setattr(batch_module, "MAX_SCRIPT_SIZE", 150)
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=f"@@MFD_BATCH@@ {index} 0\n@@MFD_NAMESPACE@@ 0 0\n")
+            for index in range(3)
+        ]
+        parallel = NamespaceParallelConnection(connection)
+        parallel.execute_command("ip netns exec ns1 grep -q 1500 /sys/class/net/eth1/mtu")
+        parallel.execute_command("ip netns exec ns1 grep -q 9000 /sys/class/net/eth1/mtu")
+        parallel.execute_command("ip netns exec ns2 cat /sys/class/net/eth2/mtu")
+        parallel.execute()
+
+        scripts = [call.args[0] for call in connection.execute_command.call_args_list]
+        assert len(scripts) == 3
+        assert "grep -q 1500" in scripts[0]
+        assert "grep -q 9000" in scripts[1]
+        assert "ns2" in scripts[2]
+        assert [call.return_code for call in parallel.calls] == [0, 0, 0]
+
+    def test_owner_batch_parallel_namespaces(self, owner):
+        owner._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="@@MFD_BATCH@@ 0-0 0\n@@MFD_NAMESPACE@@ 0 0\n@@MFD_BATCH@@ 1-1 0\n@@MFD_NAMESPACE@@ 1 0\n",
+            return_code=0,
+        )
+        with owner.batch(parallel_namespaces=True) as batch:
+            owner.vlan.create_vlan(vlan_id=10, interface_name="eth1", namespace_name="ns1")
+            owner.vlan.create_vlan(vlan_id=10, interface_name="eth2", namespace_name="ns2")
+            assert isinstance(batch, NamespaceParallelConnection)
+            owner._connection.execute_command.assert_not_called()
+
+        script = owner._connection.execute_command.call_args.args[0]
+        assert "( ip netns exec ns1 sh -c" in script
+        assert "( ip netns exec ns2 sh -c" in script
+        assert owner._batch is None
+
+    def test_prefetch_commands(self, connection):
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                args="",
+                stdout="eth0\n@@MFD_BATCH@@ 0 0\n@@MFD_NAMESPACE@@ 0 0\n@@MFD_BATCH@@ 1 2\n@@MFD_NAMESPACE@@ 1 0\n",
+            ),
+            ConnectionCompletedProcess(args="", stdout="passed", return_code=0),
+        ]
+        prefetched = prefetch_commands(
+            connection, ["ls /sys/class/net", "ip netns exec ns1 ls /proc/net/vlan", "ls /sys/class/net"]
+        )
+        assert isinstance(prefetched, PrefetchedConnection)
+        connection.execute_command.assert_called_once()
+        assert prefetched.execute_command("ls /sys/class/net").stdout == "eth0"
+        assert prefetched.execute_command("ls /sys/class/net", shell=True).stdout == "eth0"
+        result = prefetched.execute_command(command="ip netns exec ns1 ls /proc/net/vlan", expected_return_codes={0, 2})
+        assert result.return_code == 2
+        with pytest.raises(ConnectionCalledProcessError):
+            prefetched.execute_command("ip netns exec ns1 ls /proc/net/vlan")
+        assert prefetched.execute_command("cat /etc/hostname", shell=True).stdout == "passed"
+        connection.execute_command.assert_called_with("cat /etc/hostname", shell=True)
+
+    def test_discovery_prefetched_for_namespaces(self, owner, mocker):
+        prefetched = mocker.Mock()
+        connection = owner._connection
+        owner._get_network_namespaces = mocker.Mock(return_value=["ns1"])
+        owner._prefetch_discovery_commands = mocker.Mock(return_value=prefetched)
+        owner._mark_management_interface = mocker.Mock()
+
+        def gather(namespaces, connection):
+            assert namespaces == [None, "ns1"]
+            assert connection is prefetched
+            # features created during discovery keep connection of owner
+            assert owner.bonding._connection is owner._connection
+            return ["interface"]
+
+        owner._gather_interfaces_of_namespaces = mocker.Mock(side_effect=gather)
+        assert owner._get_all_interfaces_info() == ["interface"]
+        assert owner._connection is connection
+        owner._mark_management_interface.assert_called_once_with(interfaces=["interface"])
+
+    def test_prefetch_commands_not_reached_executed_live(self, connection):
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                args="", stdout="eth0\n@@MFD_BATCH@@ 0 0\n@@MFD_NAMESPACE@@ 0 0\nCannot open network namespace\n"
+                "@@MFD_NAMESPACE@@ 1 1\n"
+            ),
+            ConnectionCompletedProcess(args="", stdout="eth1", return_code=0),
+        ]
+        prefetched = prefetch_commands(connection, ["ls /sys/class/net", "ip netns exec ns1 ls /sys/class/net"])
+        assert prefetched.execute_command("ls /sys/class/net").stdout == "eth0"
+        assert prefetched.execute_command("ip netns exec ns1 ls /sys/class/net").stdout == "eth1"
+        connection.execute_command.assert_called_with("ip netns exec ns1 ls /sys/class/net")
+
+    def test_discovery_not_prefetched_without_namespaces(self, owner, mocker):
+        owner._get_network_namespaces = mocker.Mock(return_value=[])
+        owner._prefetch_discovery_commands = mocker.Mock()
+        owner._mark_management_interface = mocker.Mock()
+        owner._gather_interfaces_of_namespaces = mocker.Mock(return_value=[])
+        owner._get_all_interfaces_info()
+        owner._prefetch_discovery_commands.assert_not_called()
+
+    def test_prefetch_discovery_commands(self, owner, mocker):
+        mocker.patch.object(linux_module, "is_json_supported", return_value=True)
+        prefetch = mocker.patch.object(linux_module, "prefetch_commands")
+        owner._prefetch_discovery_commands([None, "ns1"])
+        commands = prefetch.call_args.args[1]
+        assert len(commands) == 13
+        assert "ip netns exec ns1 ip -d -j link show type vlan" in commands
+        assert "ip netns exec ns1 ip -j link show" in commands
+        assert r"\ls -l /sys/class/net" in commands
+        assert commands[-1] == "ip addr show"
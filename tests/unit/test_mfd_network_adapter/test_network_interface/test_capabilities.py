@@ -0,0 +1,149 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test capabilities of devices shared by interfaces."""
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_const import DEVICE_IDS, SPEED_IDS, Family, Speed
+from mfd_ethtool import Ethtool
+from mfd_typing import OSName, PCIAddress, PCIDevice
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.network_interface.capabilities import (
+    DeviceCapabilities,
+    DeviceCapabilitiesCatalog,
+    get_capabilities_catalog,
+    get_family_name,
+    get_speed_name,
+    notify_driver_reload,
+)
+from mfd_network_adapter.network_interface.data_structures import RingBuffer
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+
+PROBE_OUTPUT = """### driver
+driver: ice
+version: 1.13.7
+firmware-version: 4.40 0x8001c967 1.3534.0
+bus-info: 0000:18:00.0
+### channels
+Channel parameters for eth0:
+Pre-set maximums:
+RX:		n/a
+TX:		n/a
+Other:		1
+Combined:	64
+Current hardware settings:
+RX:		n/a
+TX:		n/a
+Other:		1
+Combined:	8
+### rings
+Ring parameters for eth0:
+Pre-set maximums:
+RX:		8160
+RX Mini:	n/a
+RX Jumbo:	n/a
+TX:		8160
+Current hardware settings:
+RX:		2048
+RX Mini:	n/a
+RX Jumbo:	n/a
+TX:		2048
+### sriov
+256
+"""
+
+
+def test_device_id_index():
+    for family, device_ids in DEVICE_IDS.items():
+        for device_id in device_ids:
+            expected = next(fam for fam, ids in DEVICE_IDS.items() if device_id in ids)
+            assert get_family_name(device_id[2:]) == expected
+    for speed, device_ids in SPEED_IDS.items():
+        for device_id in device_ids:
+            assert get_speed_name(device_id[2:]) == next(spd for spd, ids in SPEED_IDS.items() if device_id in ids)
+    assert get_family_name("FFFF") is None
+
+
+def test_catalog_driver_version():
+    catalog = DeviceCapabilitiesCatalog()
+    catalog.add(DeviceCapabilities(pci_device=PCIDevice(data="8086:1592"), driver_version="1.13.7"))
+    assert catalog.get(PCIDevice(data="8086:1592"), driver_version="1.13.7") is not None
+    assert catalog.get(PCIDevice(data="8086:1592"), driver_version="1.14.9") is None
+    assert catalog.get(PCIDevice(data="8086:159b")) is None
+    assert (catalog.hits, catalog.misses) == (1, 2)
+
+
+class TestLinuxCapabilities:
+    @pytest.fixture
+    def connection(self, mocker):
+        mocker.patch("mfd_ethtool.Ethtool.check_if_available", mocker.create_autospec(Ethtool.check_if_available))
+        mocker.patch("mfd_ethtool.Ethtool.get_version", mocker.create_autospec(Ethtool.get_version, return_value="6.1"))
+        mocker.patch(
+            "mfd_ethtool.Ethtool._get_tool_exec_factory",
+            mocker.create_autospec(Ethtool._get_tool_exec_factory, return_value="ethtool"),
+        )
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=PROBE_OUTPUT, stderr="", return_code=0
+        )
+        yield connection
+        mocker.stopall()
+
+    @pytest.fixture
+    def ports(self, connection):
+        return [
+            LinuxNetworkInterface(
+                connection=connection,
+                interface_info=LinuxInterfaceInfo(
+                    pci_address=PCIAddress(0, 0x18, 0, function),
+                    pci_device=PCIDevice(data="8086:1592"),
+                    name=f"eth{function}",
+                ),
+            )
+            for function in range(2)
+        ]
+
+    def test_probed_once_per_device(self, ports, connection):
+        capabilities = ports[0].capabilities
+        assert ports[1].capabilities is capabilities
+        connection.execute_command.assert_called_once()
+        assert connection.execute_command.call_args.args[0].startswith("echo '### driver'; ethtool -i eth0 2>/dev/null")
+        assert capabilities == DeviceCapabilities(
+            pci_device=PCIDevice(data="8086:1592"),
+            driver_name="ice",
+            driver_version="1.13.7",
+            family=Family.CVL,
+            speed=Speed.G100,
+            max_channels={"rx": None, "tx": None, "other": 1, "combined": 64},
+            max_rings=RingBuffer(rx=8160, tx=8160),
+            max_vfs=256,
+        )
+
+    def test_ethtool_maxima_from_catalog(self, ports, connection):
+        ports[0].capabilities
+        assert ports[1].ethtool.get_channel_maxima("eth1") == {"rx": None, "tx": None, "other": 1, "combined": 64}
+        assert ports[1].ethtool.get_ring_maxima("eth1").tx == 8160
+        connection.execute_command.assert_called_once()
+        assert ports[1].ethtool.hit_rate == 1
+
+    def test_link_modes_queried_per_port(self, ports, connection):
+        ports[0].capabilities
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="Settings for eth1:\n\tSupported link modes:   10000baseSR/Full\n\tSpeed: 10000Mb/s\n",
+            stderr="",
+            return_code=0,
+        )
+        # transceiver of other port of the same adapter may support other link modes
+        assert ports[1].ethtool.get_supported_link_modes("eth1") == ["10000baseSR/Full"]
+        assert connection.execute_command.call_args.args[0] == "ethtool eth1"
+
+    def test_driver_reload_clears_catalog(self, ports, connection):
+        ports[0].capabilities
+        notify_driver_reload(connection)
+        assert len(get_capabilities_catalog(connection)) == 0
+        ports[1].capabilities
+        assert connection.execute_command.call_count == 2
@@ -0,0 +1,108 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test ethtool facade shared by features of interface."""
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_ethtool import Ethtool
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.data_structures import RingBuffer
+from mfd_network_adapter.network_interface.capabilities import notify_driver_reload
+from mfd_network_adapter.network_interface.ethtool_cache import CachedEthtool
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+
+OUTPUTS = {
+    "ethtool -i eth0": "driver: ice\nversion: 1.13.7\nfirmware-version: 4.40 0x8001c967 1.3534.0\n",
+    "ethtool -P eth0": "Permanent address: 00:11:22:33:44:55\n",
+    "ethtool -l eth0": (
+        "Channel parameters for eth0:\nPre-set maximums:\nRX:\t\tn/a\nTX:\t\tn/a\nOther:\t\t1\nCombined:\t64\n"
+        "Current hardware settings:\nRX:\t\tn/a\nTX:\t\tn/a\nOther:\t\t1\nCombined:\t8\n"
+    ),
+    "ethtool -g eth0": (
+        "Ring parameters for eth0:\nPre-set maximums:\nRX:\t\t8160\nRX Mini:\tn/a\nRX Jumbo:\tn/a\nTX:\t\t8160\n"
+        "Current hardware settings:\nRX:\t\t2048\nRX Mini:\tn/a\nRX Jumbo:\tn/a\nTX:\t\t2048\n"
+    ),
+    "ethtool eth0": (
+        "Settings for eth0:\n\tSupported link modes:   1000baseT/Full\n\t                        25000baseCR/Full\n"
+        "\tSpeed: 25000Mb/s\n"
+    ),
+    "ethtool -S eth0": "NIC statistics:\n     rx_packets: 10\n",
+}
+
+
+class TestCachedEthtool:
+    @pytest.fixture
+    def interface(self, mocker):
+        mocker.patch("mfd_ethtool.Ethtool.check_if_available", mocker.create_autospec(Ethtool.check_if_available))
+        mocker.patch("mfd_ethtool.Ethtool.get_version", mocker.create_autospec(Ethtool.get_version, return_value="6.1"))
+        mocker.patch(
+            "mfd_ethtool.Ethtool._get_tool_exec_factory",
+            mocker.create_autospec(Ethtool._get_tool_exec_factory, return_value="ethtool"),
+        )
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.side_effect = lambda command, **kwargs: ConnectionCompletedProcess(
+            args=command, stdout=OUTPUTS[command], stderr="", return_code=0
+        )
+        yield LinuxNetworkInterface(
+            connection=connection, interface_info=LinuxInterfaceInfo(pci_address=PCIAddress(0, 0, 0, 0), name="eth0")
+        )
+        mocker.stopall()
+
+    def test_shared_by_features(self, interface):
+        assert isinstance(interface.ethtool, CachedEthtool)
+        assert interface.driver._ethtool is interface.ethtool
+        assert interface.stats._ethtool is interface.ethtool
+        assert interface.utils.ethtool is interface.ethtool
+
+    def test_static_query_cached(self, interface):
+        ethtool = interface.ethtool
+        assert interface.ethtool.get_perm_hw_address(device_name="eth0") == "00:11:22:33:44:55"
+        assert interface.utils.ethtool.get_perm_hw_address("eth0") == "00:11:22:33:44:55"
+        assert interface._connection.execute_command.call_count == 1
+        assert ethtool.cache_stats["get_perm_hw_address"].hits == 1
+        assert ethtool.get_hit_rates()["get_perm_hw_address"] == 0.5
+
+    def test_driver_information_not_cached(self, interface):
+        # driver can be upgraded without driver feature, e.g. by package manager
+        assert interface.driver._ethtool.get_driver_information("eth0").version == ["1.13.7"]
+        upgraded_outputs = {**OUTPUTS, "ethtool -i eth0": "driver: ice\nversion: 1.14.9\nfirmware-version: 4.40\n"}
+        interface._connection.execute_command.side_effect = lambda command, **kwargs: ConnectionCompletedProcess(
+            args=command, stdout=upgraded_outputs[command], stderr="", return_code=0
+        )
+        assert interface.driver._ethtool.get_driver_information("eth0").version == ["1.14.9"]
+        assert "get_driver_information" not in interface.ethtool.cache_stats
+
+    def test_dynamic_query_not_cached(self, interface):
+        ethtool = interface.ethtool
+        ethtool.get_adapter_statistics("eth0")
+        ethtool.get_adapter_statistics("eth0")
+        assert interface._connection.execute_command.call_count == 2
+        assert ethtool.hit_rate == 0
+
+    def test_maxima(self, interface):
+        ethtool = interface.ethtool
+        assert ethtool.get_ring_maxima("eth0") == RingBuffer(rx=8160, tx=8160)
+        assert ethtool.get_supported_link_modes("eth0") == ["1000baseT/Full", "25000baseCR/Full"]
+        # channel maxima are cached from output of dynamic query
+        ethtool.get_channel_parameters("eth0")
+        assert ethtool.get_channel_maxima("eth0") == {"rx": None, "tx": None, "other": 1, "combined": 64}
+        ethtool.get_ring_maxima("eth0")
+        assert interface._connection.execute_command.call_count == 3
+        assert ethtool.cache_stats["get_channel_maxima"].hits == 1
+
+    def test_driver_reload_invalidates(self, interface, mocker):
+        mocker.patch("mfd_network_adapter.network_adapter_owner.feature.driver.linux.LinuxPackageManager")
+        owner = LinuxNetworkAdapterOwner(connection=interface._connection)
+        interface.ethtool.get_perm_hw_address("eth0")
+        owner.driver.unload_module(module_name="ice")
+        interface.ethtool.get_perm_hw_address("eth0")
+        notify_driver_reload(interface._connection)
+        interface.ethtool.invalidate()
+        interface.ethtool.get_perm_hw_address("eth0")
+        assert interface._connection.execute_command.call_count == 3
+        assert interface.ethtool.hit_rate == 0
@@ -1,9 +1,11 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
 from dataclasses import fields, make_dataclass
+from textwrap import dedent
 
 import pytest
 from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import PCIAddress, OSName, OSBitness
 from mfd_typing.network_interface import LinuxInterfaceInfo
 from mfd_ethtool import Ethtool
@@ -13,7 +15,9 @@ from mfd_network_adapter.network_interface.exceptions import FlowControlExceptio
 from mfd_network_adapter.network_interface.feature.flow_control.data_structures import (
     FlowControlParams,
     FlowHashParams,
+    NtupleRule,
 )
+from mfd_network_adapter.network_interface.feature.flow_control.linux import LinuxFlowControl
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 from mfd_network_adapter.data_structures import State
 
@@ -235,3 +239,127 @@ class TestLinuxFlowControl:
         )
         with pytest.raises(FlowDirectorException, match=f"while getting flow director ATR on {port.name}"):
             port.flow_control.get_flow_director_atr()
+
+    ntuple_output = dedent(
+        """\
+        4 RX rings available
+        Total 3 rules
+
+        Filter: 0
+        \tRule Type: TCP over IPv4
+        \tSrc IP addr: 0.0.0.0 mask: 255.255.255.255
+        \tDest IP addr: 10.0.0.2 mask: 0.0.0.0
+        \tTOS: 0x0 mask: 0xff
+        \tSrc port: 0 mask: 0xffff
+        \tDest port: 5201 mask: 0x0
+        \tAction: Direct to queue 3
+
+        Filter: 1
+        \tRule Type: UDP over IPv6
+        \tSrc IP addr: 2001:db8::1 mask: ::
+        \tDest IP addr: :: mask: ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff
+        \tTraffic Class: 0x0 mask: 0xff
+        \tSrc port: 0 mask: 0xffff
+        \tDest port: 0 mask: 0xffff
+        \tVLAN EtherType: 0x0 mask: 0xffff
+        \tVLAN: 0x64 mask: 0xf000
+        \tUser-defined: 0x0 mask: 0xffffffffffffffff
+        \tAction: Drop
+
+        Filter: 5
+        \tRule Type: Raw Ethernet
+        \tSrc MAC addr: 00:00:00:00:00:00 mask: FF:FF:FF:FF:FF:FF
+        \tDest MAC addr: 00:AA:BB:CC:DD:EE mask: 00:00:00:00:00:00
+        \tEthertype: 0x0 mask: 0xFFFF
+        \tAction: Direct to queue 1
+        """
+    )
+
+    def test_parse_ntuple_rules(self):
+        assert LinuxFlowControl.parse_ntuple_rules(self.ntuple_output) == {
+            0: NtupleRule(flow_type="tcp4", action=3, location=0, dst_ip="10.0.0.2", dst_port=5201),
+            1: NtupleRule(flow_type="udp6", action=-1, location=1, src_ip="2001:db8::1", vlan=100),
+            5: NtupleRule(flow_type="ether", action=1, location=5, dst_mac="00:aa:bb:cc:dd:ee"),
+        }
+
+    def test_ntuple_rule_to_ethtool_params(self):
+        rule = NtupleRule(flow_type="tcp4", action=3, location=0, dst_ip="10.0.0.2", dst_port=5201)
+        assert rule.to_ethtool_params() == "flow-type tcp4 dst-ip 10.0.0.2 dst-port 5201 action 3 loc 0"
+
+    def test_allocate_ntuple_locations(self):
+        rules = [NtupleRule(flow_type="tcp4", action=0, dst_port=port) for port in range(3)]
+        rules.append(NtupleRule(flow_type="tcp4", action=0, location=2))
+        allocated = LinuxFlowControl._allocate_locations(rules, used=[0, 5])
+        assert [rule.location for rule in allocated] == [1, 3, 4, 2]
+        assert rules[0].location is None
+        with pytest.raises(FlowDirectorException, match="No free location"):
+            LinuxFlowControl._allocate_locations(rules, used=[0, 5], max_locations=4)
+
+    def test_add_ntuple_rules(self, ports):
+        port = ports[1]
+        rules = [NtupleRule(flow_type="tcp4", action=3, dst_ip="10.0.0.2", dst_port=5201)]
+        existing_rules = self.ntuple_output.replace("Filter: 0", "Filter: 7")
+        port._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=existing_rules, return_code=0),
+            ConnectionCompletedProcess(
+                args="",
+                stdout=f"Added rule with ID 0\n@@MFD_BATCH@@ 0 0\n{self.ntuple_output}@@MFD_BATCH@@ 1 0\n",
+                return_code=0,
+            ),
+        ]
+        added = port.flow_control.add_ntuple_rules(rules)
+        assert added[0].location == 0
+        script = port._connection.execute_command.call_args.args[0]
+        assert script.startswith(
+            "{ ip netns exec ns1 ethtool -N eth1 flow-type tcp4 dst-ip 10.0.0.2 dst-port 5201 action 3 loc 0\n"
+        )
+        assert port._connection.execute_command.call_count == 2
+
+    def test_add_ntuple_rules_failure(self, ports):
+        port = ports[0]
+        rules = [NtupleRule(flow_type="tcp4", action=3, location=loc) for loc in range(2)]
+        port._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout="@@MFD_BATCH@@ 0 0\nrmgr: Cannot insert RX class rule: Invalid argument\n@@MFD_BATCH@@ 1 1\n"
+            "@@MFD_BATCH@@ 2 0\n",
+            return_code=0,
+        )
+        with pytest.raises(FlowDirectorException, match="1 of 3 n-tuple commands failed on eth0"):
+            port.flow_control.add_ntuple_rules(rules)
+        port._connection.execute_command.assert_called_once()
+
+    def test_delete_ntuple_rules(self, ports):
+        port = ports[0]
+        port._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=self.ntuple_output, return_code=0),
+            ConnectionCompletedProcess(
+                args="",
+                stdout="@@MFD_BATCH@@ 0 0\n@@MFD_BATCH@@ 1 0\n@@MFD_BATCH@@ 2 0\nTotal 0 rules\n@@MFD_BATCH@@ 3 0\n",
+                return_code=0,
+            ),
+        ]
+        assert port.flow_control.delete_ntuple_rules() == [0, 1, 5]
+        script = port._connection.execute_command.call_args.args[0]
+        assert "ethtool -N eth0 delete 5\n" in script
+
+    def test_get_ntuple_rules_not_supported(self, ports):
+        port = ports[0]
+        port._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="rxclass: Cannot get RX class rule count: Operation not supported", return_code=95
+        )
+        with pytest.raises(FlowDirectorException, match="Cannot read n-tuple rules of eth0"):
+            port.flow_control.get_ntuple_rules()
+
+    def test_verify_ntuple_rule_hits(self, ports, mocker):
+        port = ports[0]
+        mocker.patch(
+            "mfd_network_adapter.network_interface.feature.queue.linux.LinuxQueue.get_per_queue_packet_stats",
+            return_value={"rx_queue_1_packets": 10, "rx_queue_3_packets": 500, "tx_queue_3_packets": 7},
+        )
+        rules = list(LinuxFlowControl.parse_ntuple_rules(self.ntuple_output).values())
+        assert port.flow_control.verify_ntuple_rule_hits(rules, baseline={"rx_queue_3_packets": 100}) == {
+            0: 400,
+            5: 10,
+        }
+        with pytest.raises(FlowDirectorException, match="not hit on eth0.*{5: 10}"):
+            port.flow_control.verify_ntuple_rule_hits(rules, baseline={}, min_packets=100)
@@ -1774,3 +1774,35 @@ class TestInterrupt:
             return_code=0, args="", stdout=self.output, stderr=""
         )
         assert interface.interrupt._read_proc_interrupts() == self.expected_output
+
+    def test_get_queue_irqs(self, interface):
+        output = dedent(
+            """\
+                       CPU0       CPU1
+             120:          0          0   PCI-MSI 1048576-edge      ens1f0
+             122:         10          0   PCI-MSI 1048578-edge      ens1f0-TxRx-1
+             121:         10          0   PCI-MSI 1048577-edge      ens1f0-TxRx-0
+             130:         10          0   PCI-MSI 1048580-edge      ens1f01-TxRx-0
+            """
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0
+        )
+        assert interface.interrupt.get_queue_irqs() == {"ens1f0-TxRx-0": 121, "ens1f0-TxRx-1": 122}
+        interface._connection.execute_command.assert_called_once_with("cat /proc/interrupts")
+
+    def test_get_queue_irqs_driver_prefix(self, interface):
+        output = dedent(
+            """\
+                       CPU0       CPU1
+             150:          0          0   IR-PCI-MSI 1048576-edge      ice-0000:18:00.0:misc
+             151:         10          0   IR-PCI-MSI 1048577-edge      ice-ens1f0-TxRx-0
+             152:         10          0   IR-PCI-MSI 1048578-edge      ens1f0-TxRx-1
+             160:         10          0   IR-PCI-MSI 1048580-edge      ice-xens1f0-TxRx-0
+             161:         10          0   IR-PCI-MSI 1048581-edge      xens1f0-TxRx-1
+            """
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0
+        )
+        assert interface.interrupt.get_queue_irqs() == {"ice-ens1f0-TxRx-0": 151, "ens1f0-TxRx-1": 152}
@@ -1,5 +1,6 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
 import re
 from ipaddress import IPv4Interface, IPv6Interface
 from textwrap import dedent
@@ -13,6 +14,9 @@ from mfd_typing import MACAddress, OSName, PCIAddress
 from mfd_typing.network_interface import LinuxInterfaceInfo
 
 from mfd_network_adapter.data_structures import State
+from mfd_network_adapter.network_adapter_owner.exceptions import EventsFeatureException
+from mfd_network_adapter.network_adapter_owner.feature.events.data_structures import EventType
+from mfd_network_adapter.network_adapter_owner.feature.events.linux import EventSubscription
 from mfd_network_adapter.network_interface.exceptions import IPFeatureException
 from mfd_network_adapter.network_interface.feature.ip import LinuxIP
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPs, IPVersion, DynamicIPType
@@ -119,6 +123,55 @@ class TestIPLinux:
         ips = IPs([IPv4Interface("192.168.0.0/25")], [IPv6Interface("fe80::a6bf:1ff:fe3f:f575/64")])
         assert interface.ip.get_ips() == ips
 
+    def test_get_ips_json(self, interface, mocker):
+        mocker.patch("mfd_network_adapter.network_interface.feature.ip.linux.is_json_supported", return_value=True)
+        output = json.dumps(
+            [
+                {
+                    "ifname": "eth0",
+                    "addr_info": [
+                        {"family": "inet", "local": "192.168.0.1", "prefixlen": 25},
+                        {"family": "inet6", "local": "fe80::1", "prefixlen": 64},
+                        {"family": "inet6", "local": "2001::1", "prefixlen": 64, "tentative": True},
+                    ],
+                }
+            ]
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        assert interface.ip.get_ips() == IPs([IPv4Interface("192.168.0.1/25")], [IPv6Interface("fe80::1/64")])
+        interface._connection.execute_command.assert_called_once_with(f"ip -j addr show dev {interface.name}")
+
+    @pytest.mark.parametrize("json_supported", [True, False])
+    def test_get_ips_large_output(self, interface, mocker, json_supported):
+        mocker.patch(
+            "mfd_network_adapter.network_interface.feature.ip.linux.is_json_supported", return_value=json_supported
+        )
+        addresses = [f"10.{i // 65536}.{i // 256 % 256}.{i % 256}" for i in range(10000)]
+        if json_supported:
+            output = json.dumps(
+                [
+                    {
+                        "ifname": "eth0",
+                        "addr_info": [{"family": "inet", "local": ip, "prefixlen": 32} for ip in addresses],
+                    }
+                ]
+            )
+        else:
+            output = "\n".join(
+                f"    inet {ip}/32 scope global eth0\n       valid_lft forever preferred_lft forever"
+                for ip in addresses
+            )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        ips = interface.ip.get_ips()
+
+        interface._connection.execute_command.assert_called_once()
+        assert len(ips.v4) == 10000
+        assert ips.v4[-1] == IPv4Interface("10.0.39.15/32")
+
     def test_del_ip(self, interface):
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="", stdout="", stderr=""
@@ -275,6 +328,29 @@ class TestIPLinux:
         ):
             interface.ip.wait_till_tentative_exit(ip=IPv6Interface("fe80::3efd:feff:fecf:8b72/64"), timeout=5)
 
+    def test_wait_till_tentative_exit_with_subscription(self, interface, mocker):
+        output = dedent(
+            """\
+        link/ether 00:00:00:00:00:00 brd 00:00:00:00:00:00
+        inet6 fe80::3efd:feff:fecf:8b72/64 scope link tentative
+        valid_lft forever preferred_lft forever
+        """
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="", stdout=output, stderr=""
+        )
+        subscription = mocker.create_autospec(EventSubscription)
+        ip = IPv6Interface("fe80::3efd:feff:fecf:8b72/64")
+        interface.ip.wait_till_tentative_exit(ip=ip, timeout=5, subscription=subscription)
+        subscription.wait_for.assert_called_once_with(
+            EventType.ADDRESS_ADDED, interface_name="eth0", ip=ip, predicate=mocker.ANY, timeout=5
+        )
+        interface._connection.execute_command.assert_called_once()
+
+        subscription.wait_for.side_effect = EventsFeatureException("timeout")
+        with pytest.raises(IPFeatureException, match=re.escape(f"{ip} still in tentative mode after 5s.")):
+            interface.ip.wait_till_tentative_exit(ip=ip, timeout=5, subscription=subscription)
+
     def test_add_ip_neighbor_ipv4(self, interface, interface_ns):
         interface._connection.execute_command.return_value = ConnectionCompletedProcess(
             return_code=0, args="", stdout="", stderr=""
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Numa Linux."""
+
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.network_interface.exceptions import NumaFeatureException, NumaNodeException
+from mfd_network_adapter.network_interface.feature.numa.data_structures import CPUInfo, CPUTopology
+from mfd_network_adapter.network_interface.feature.numa.linux import LinuxNuma
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+
+# 2 sockets/nodes, 4 cores per socket, 2 threads per core
+lscpu_output = "# The following is the parsable format\n# CPU,Core,Socket,Node\n" + "\n".join(
+    f"{cpu},{cpu % 8},{cpu % 8 // 4},{cpu % 8 // 4}" for cpu in range(16)
+)
+
+proc_interrupts_output = dedent(
+    """\
+               CPU0       CPU1
+      0:         40          0   IO-APIC    2-edge      timer
+    120:          0          0   PCI-MSI 1048576-edge      eth0
+    121:         10          0   PCI-MSI 1048577-edge      eth0-TxRx-0
+    122:         10          0   PCI-MSI 1048578-edge      eth0-TxRx-1
+    123:         10          0   PCI-MSI 1048579-edge      eth0-TxRx-2
+    130:         10          0   PCI-MSI 1048580-edge      eth1-TxRx-0
+    131:         10          0   PCI-MSI 1048581-edge      eth1-TxRx-1
+    """
+)
+
+
+class TestLinuxNuma:
+    @pytest.fixture()
+    def interface(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        interface = LinuxNetworkInterface(
+            connection=connection, interface_info=LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(0, 0, 0, 0))
+        )
+        yield interface
+        mocker.stopall()
+
+    @pytest.fixture()
+    def topology(self):
+        return CPUTopology(
+            cpus=[CPUInfo(cpu=cpu, core=cpu % 8, socket=cpu % 8 // 4, node=cpu % 8 // 4) for cpu in range(16)]
+        )
+
+    def test_get_cpu_topology(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=lscpu_output, return_code=0
+        )
+        topology = interface.numa.get_cpu_topology()
+        assert topology.nodes == [0, 1]
+        assert topology.cpus[9] == CPUInfo(cpu=9, core=1, socket=0, node=0)
+        assert [cpu.cpu for cpu in topology.get_node_cpus(1)] == [4, 5, 6, 7, 12, 13, 14, 15]
+        assert topology.get_siblings(1) == [9]
+
+    def test_compute_irq_placement_local_cores_first(self, topology):
+        placement = LinuxNuma._compute_irq_placement(topology, [(1, list(range(100, 106)))])
+        # 4 local physical cores of node 1 first, then their HT siblings
+        assert placement == {100: 4, 101: 5, 102: 6, 103: 7, 104: 12, 105: 13}
+
+    def test_compute_irq_placement_spread_nics(self, topology):
+        placement = LinuxNuma._compute_irq_placement(topology, [(0, [100, 101]), (0, [200, 201])])
+        assert placement == {100: 0, 200: 1, 101: 2, 201: 3}
+
+    def test_compute_irq_placement_remote_allowed(self, topology):
+        placement = LinuxNuma._compute_irq_placement(topology, [(0, list(range(100, 106)))], allow_remote=True)
+        assert placement == {100: 0, 101: 1, 102: 2, 103: 3, 104: 4, 105: 5}
+
+    def test_plan_irq_affinity(self, interface, mocker):
+        other = mocker.create_autospec(LinuxNetworkInterface)
+        other.name = "eth1"
+        other.get_numa_node.return_value = 1
+        interface.get_numa_node = mocker.Mock(return_value=0)
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=lscpu_output, return_code=0),
+            ConnectionCompletedProcess(args="", stdout=proc_interrupts_output, return_code=0),
+        ]
+        assert interface.numa.plan_irq_affinity(other_interfaces=[other]) == {
+            121: 0,
+            130: 4,
+            122: 1,
+            131: 5,
+            123: 2,
+        }
+
+    def test_plan_irq_affinity_no_queues(self, interface, mocker):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="  0:  40  IO-APIC  2-edge  timer", return_code=0
+        )
+        with pytest.raises(NumaFeatureException, match="No queue IRQs found for interface: eth0"):
+            interface.numa.plan_irq_affinity(topology=CPUTopology(cpus=[CPUInfo(cpu=0, core=0, socket=0, node=0)]))
+
+    def test_get_irq_affinity(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="/proc/irq/121/smp_affinity_list:0-15\n/proc/irq/122/smp_affinity_list:3\n", return_code=0
+        )
+        assert interface.numa.get_irq_affinity([121, 122]) == {121: "0-15", 122: "3"}
+        interface._connection.execute_command.assert_called_once_with(
+            "grep -H . /proc/irq/121/smp_affinity_list /proc/irq/122/smp_affinity_list",
+            shell=True,
+            expected_return_codes=None,
+        )
+
+    def test_set_irq_affinity(self, interface):
+        output = (
+            "/proc/irq/121/smp_affinity_list:0-15\n/proc/irq/122/smp_affinity_list:0-15\n"
+            "@@MFD_IRQ_AFFINITY@@\n@@MFD_IRQ_AFFINITY@@\n"
+            "/proc/irq/121/smp_affinity_list:0\n/proc/irq/122/smp_affinity_list:1\n"
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0
+        )
+        assert interface.numa.set_irq_affinity({121: 0, 122: 1}) == {121: "0-15", 122: "0-15"}
+        files = "/proc/irq/121/smp_affinity_list /proc/irq/122/smp_affinity_list"
+        interface._connection.execute_command.assert_called_once_with(
+            f"grep -H . {files}\n"
+            "echo @@MFD_IRQ_AFFINITY@@\n"
+            "echo 0 > /proc/irq/121/smp_affinity_list\n"
+            "echo 1 > /proc/irq/122/smp_affinity_list\n"
+            "echo @@MFD_IRQ_AFFINITY@@\n"
+            f"grep -H . {files}",
+            shell=True,
+            expected_return_codes=None,
+            stderr_to_stdout=True,
+        )
+
+    def test_set_irq_affinity_not_applied(self, interface):
+        output = (
+            "/proc/irq/121/smp_affinity_list:0-15\n@@MFD_IRQ_AFFINITY@@\n"
+            "sh: line 3: echo: write error: Input/output error\n@@MFD_IRQ_AFFINITY@@\n"
+            "/proc/irq/121/smp_affinity_list:0-15\n"
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0
+        )
+        with pytest.raises(NumaFeatureException, match="121: expected 4, current 0-15"):
+            interface.numa.set_irq_affinity({121: 4})
+
+    def test_set_irq_affinity_formatted_by_kernel(self, interface):
+        output = (
+            "/proc/irq/121/smp_affinity_list:0-15\n@@MFD_IRQ_AFFINITY@@\n@@MFD_IRQ_AFFINITY@@\n"
+            "/proc/irq/121/smp_affinity_list:2-3,8\n"
+        )
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, return_code=0
+        )
+        assert interface.numa.set_irq_affinity({121: "8,3,2"}) == {121: "0-15"}
+
+    def test_set_irq_affinity_marker_missing(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="/proc/irq/121/smp_affinity_list:0-15\n", return_code=0
+        )
+        with pytest.raises(NumaNodeException, match="markers not found"):
+            interface.numa.set_irq_affinity({121: 4})
+
+    def test_restore_irq_affinity(self, interface, mocker):
+        interface.numa.set_irq_affinity = mocker.Mock(return_value={121: "4"})
+        interface.numa.restore_irq_affinity({121: "0-15"})
+        interface.numa.set_irq_affinity.assert_called_once_with({121: "0-15"})
@@ -0,0 +1,177 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test Packet Steering Linux."""
+
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_network_adapter.data_structures import State
+from mfd_network_adapter.network_interface.exceptions import PacketSteeringFeatureException
+from mfd_network_adapter.network_interface.feature.numa.data_structures import CPUInfo, CPUTopology
+from mfd_network_adapter.network_interface.feature.packet_steering import (
+    LinuxPacketSteering,
+    PacketSteeringSettings,
+    cpus_to_mask,
+    mask_to_cpus,
+)
+from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
+
+read_output = dedent("""\
+    /sys/class/net/eth0/queues/rx-0/rps_cpus:00000000,00000000
+    /sys/class/net/eth0/queues/rx-1/rps_cpus:00000000,00000000
+    /sys/class/net/eth0/queues/rx-0/rps_flow_cnt:0
+    /sys/class/net/eth0/queues/rx-1/rps_flow_cnt:0
+    /sys/class/net/eth0/queues/tx-0/xps_cpus:00000000,00000001
+    /sys/class/net/eth0/queues/tx-1/xps_cpus:00000000,00000002
+    ntuple-filters: off
+    rps_sock_flow_entries:0
+    """)
+
+MARKER = "@@MFD_PACKET_STEERING@@\n"
+
+
+class TestLinuxPacketSteering:
+    @pytest.fixture()
+    def interface(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        interface = LinuxNetworkInterface(
+            connection=connection, interface_info=LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(0, 0, 0, 0))
+        )
+        yield interface
+        mocker.stopall()
+
+    def test_object_type(self, interface):
+        assert isinstance(interface.packet_steering, LinuxPacketSteering)
+
+    def test_masks(self):
+        assert cpus_to_mask([0, 1, 32]) == "00000001,00000003"
+        assert cpus_to_mask([]) == "00000000"
+        assert mask_to_cpus("00000001,00000003") == [0, 1, 32]
+        assert mask_to_cpus("f0") == [4, 5, 6, 7]
+
+    def test_get_settings(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=read_output, return_code=0
+        )
+        settings = interface.packet_steering.get_settings()
+        assert settings == PacketSteeringSettings(
+            rps_cpus={0: "00000000,00000000", 1: "00000000,00000000"},
+            rps_flow_cnt={0: 0, 1: 0},
+            xps_cpus={0: "00000000,00000001", 1: "00000000,00000002"},
+            rps_sock_flow_entries=0,
+            ntuple=State.DISABLED,
+        )
+        interface._connection.execute_command.assert_called_once()
+
+    def test_get_settings_namespace(self, interface):
+        interface._interface_info.namespace = "ns1"
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="rps_sock_flow_entries:\n", return_code=0
+        )
+        settings = interface.packet_steering.get_settings()
+        assert settings.rps_sock_flow_entries is None
+        script = interface._connection.execute_command.call_args.args[0]
+        assert script.startswith("ip netns exec ns1 sh -c 'grep -H . /sys/class/net/eth0/queues/rx-*/rps_cpus")
+        assert script.splitlines()[-1].startswith('echo "rps_sock_flow_entries:$(cat /proc/sys/net/core/')
+
+    def test_apply_settings(self, interface):
+        after = read_output.replace("rx-1/rps_cpus:00000000,00000000", "rx-1/rps_cpus:00000000,0000000f")
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=f"{read_output}{MARKER}{MARKER}{after}", return_code=0
+        )
+        current = LinuxPacketSteering._parse_settings(read_output)
+        snapshot = interface.packet_steering.apply_settings(
+            PacketSteeringSettings(rps_cpus={0: "0", 1: "f"}, ntuple=State.DISABLED), current=current
+        )
+        assert snapshot == current
+        script = interface._connection.execute_command.call_args.args[0]
+        assert "echo f > /sys/class/net/eth0/queues/rx-1/rps_cpus" in script
+        assert "rx-0/rps_cpus\n" not in script and "ethtool -K" not in script
+        interface._connection.execute_command.assert_called_once()
+
+    def test_apply_settings_mismatch(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout=f"{read_output}{MARKER}sh: write error: Invalid argument\n{MARKER}{read_output}",
+            return_code=0,
+        )
+        with pytest.raises(PacketSteeringFeatureException, match="(?s)rps_cpus of queue 1: expected ffff.*Invalid arg"):
+            interface.packet_steering.apply_settings(PacketSteeringSettings(rps_cpus={1: "ffff"}))
+
+    def test_apply_settings_markers_missing(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout='Cannot open network namespace "ns1": No such file or directory\n', return_code=0
+        )
+        with pytest.raises(PacketSteeringFeatureException, match="markers not found.*ns1"):
+            interface.packet_steering.apply_settings(PacketSteeringSettings(rps_cpus={1: "ffff"}))
+
+    def test_apply_settings_no_change(self, interface):
+        current = LinuxPacketSteering._parse_settings(read_output)
+        assert interface.packet_steering.apply_settings(PacketSteeringSettings(xps_cpus={0: "1"}), current) is current
+        interface._connection.execute_command.assert_not_called()
+
+    def test_compute_numa_aware_masks(self):
+        # node 0: CPUs 0-3, node 1: CPUs 4-7
+        topology = CPUTopology(cpus=[CPUInfo(cpu=cpu, core=cpu, socket=cpu // 4, node=cpu // 4) for cpu in range(8)])
+        settings = LinuxPacketSteering.compute_numa_aware_masks(topology, 1, rx_queues=[0, 1], tx_queues=[0, 1, 2])
+        assert settings.rps_cpus == {0: "000000f0", 1: "000000f0"}
+        assert {queue: mask_to_cpus(mask) for queue, mask in settings.xps_cpus.items()} == {
+            0: [4, 7],
+            1: [5],
+            2: [6],
+        }
+        settings = LinuxPacketSteering.compute_numa_aware_masks(topology, -1, rx_queues=[0], tx_queues=range(10))
+        assert mask_to_cpus(settings.rps_cpus[0]) == list(range(8))
+        assert mask_to_cpus(settings.xps_cpus[9]) == [1]
+
+    def test_set_arfs(self, interface, mocker):
+        after = (
+            read_output.replace("rps_flow_cnt:0", "rps_flow_cnt:16384")
+            .replace("ntuple-filters: off", "ntuple-filters: on")
+            .replace("rps_sock_flow_entries:0", "rps_sock_flow_entries:32768")
+        )
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=read_output, return_code=0),
+            ConnectionCompletedProcess(args="", stdout=f"{read_output}{MARKER}{MARKER}{after}", return_code=0),
+        ]
+        interface.packet_steering.set_arfs(State.ENABLED)
+        script = interface._connection.execute_command.call_args.args[0]
+        assert "echo 16384 > /sys/class/net/eth0/queues/rx-1/rps_flow_cnt" in script
+        assert "ethtool -K eth0 ntuple on" in script
+        assert "echo 32768 > /proc/sys/net/core/rps_sock_flow_entries" in script
+
+    def test_set_arfs_queues_not_power_of_two(self, interface):
+        three_queues = read_output.replace(
+            "rx-1/rps_flow_cnt:0\n", "rx-1/rps_flow_cnt:0\n/sys/class/net/eth0/queues/rx-2/rps_flow_cnt:0\n"
+        )
+        # kernel rounds table sizes up to power of two
+        after = (
+            three_queues.replace("rps_flow_cnt:0", "rps_flow_cnt:8192")
+            .replace("ntuple-filters: off", "ntuple-filters: on")
+            .replace("rps_sock_flow_entries:0", "rps_sock_flow_entries:32768")
+        )
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=three_queues, return_code=0),
+            ConnectionCompletedProcess(args="", stdout=f"{three_queues}{MARKER}{MARKER}{after}", return_code=0),
+        ]
+        interface.packet_steering.set_arfs(State.ENABLED, flow_entries=30000)
+        script = interface._connection.execute_command.call_args.args[0]
+        assert "echo 8192 > /sys/class/net/eth0/queues/rx-2/rps_flow_cnt" in script
+        assert "echo 30000 > /proc/sys/net/core/rps_sock_flow_entries" in script
+
+    def test_restore(self, interface):
+        changed = read_output.replace("tx-1/xps_cpus:00000000,00000002", "tx-1/xps_cpus:00000000,000000ff")
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=changed, return_code=0),
+            ConnectionCompletedProcess(args="", stdout=f"{changed}{MARKER}{MARKER}{read_output}", return_code=0),
+        ]
+        interface.packet_steering.restore(LinuxPacketSteering._parse_settings(read_output))
+        script = interface._connection.execute_command.call_args.args[0]
+        writes = script.split("@@MFD_PACKET_STEERING@@")[1]
+        assert writes == "\necho 00000000,00000002 > /sys/class/net/eth0/queues/tx-1/xps_cpus\necho "
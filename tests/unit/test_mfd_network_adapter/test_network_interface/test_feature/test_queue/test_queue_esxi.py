@@ -158,3 +158,13 @@ class TestQueueESXi:
         interface._connection.execute_command.return_value.stdout = "Invalid output"
         with pytest.raises(NetworkAdapterModuleException, match="Cannot fetch FPO statistics."):
             interface.queue.get_ens_fpo_stats(lcore=15)
+
+    def test_get_queue_stats(self, mocker, interface):
+        mocker.patch(
+            "mfd_network_adapter.network_interface.feature.rss.esxi.ESXiRSS.get_rx_pkts_stats",
+            return_value={"rxq0": "120", "rxq1": "0", "rxq10": "35"},
+        )
+        sample = interface.queue.get_queue_stats()
+        assert sample.queues == [0, 1, 10]
+        assert sample.counters == ["rx_packets"]
+        assert sample.get_column("rx_packets") == [120, 0, 35]
@@ -4,11 +4,14 @@
 import pytest
 
 from mfd_connect import SSHConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_ethtool import Ethtool
 from mfd_typing import PCIAddress, OSName
 from mfd_typing.network_interface import LinuxInterfaceInfo
 import time
 
+from mfd_network_adapter.network_interface.exceptions import QueueFeatureInvalidValueException
+from mfd_network_adapter.network_interface.feature.queue.data_structures import QueueStatsSample
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
 from mfd_network_adapter.stat_checker import StatChecker
 from mfd_network_adapter.network_interface.feature.stats.linux import LinuxStats
@@ -122,3 +125,47 @@ class TestQueueLinux:
         )
 
         assert interface.queue.get_queues_in_use() == 4
+
+    def test_get_queue_stats(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="ethtool -S Ethernet",
+            stdout=(
+                "NIC statistics:\n     rx_packets: 100\n     tx_queue_0_packets: 8\n     tx_queue_0_bytes: 656\n"
+                "     rx-queue-1.rx_packets: 40\n     rx-queue-1.rx_bytes: 4000\n     rx-0.drops: 2\n"
+                "     rx_1024_to_1518_packets: 9\n"
+            ),
+            stderr="",
+            return_code=0,
+        )
+        sample = interface.queue.get_queue_stats()
+        assert sample.queues == [0, 1]
+        assert sample.counters == ["rx_bytes", "rx_drops", "rx_packets", "tx_bytes", "tx_packets"]
+        assert sample.values == [[0, 2, 0, 656, 8], [4000, 0, 40, 0, 0]]
+        assert interface._connection.execute_command.call_count == 1
+
+    def test_queue_stats_delta_and_rates(self):
+        before = QueueStatsSample.from_stats({(0, "rx_packets"): 100, (1, "rx_packets"): 50}, timestamp=10.0)
+        after = QueueStatsSample.from_stats(
+            {(0, "rx_packets"): 300, (1, "rx_packets"): 20, (2, "rx_packets"): 10}, timestamp=12.0
+        )
+        delta = after.delta(before)
+        # counter of queue 1 was reset, queue 2 is new - both counted from zero
+        assert delta.values == [[200], [20], [10]]
+        assert delta.interval == 2.0
+        assert delta.totals == {"rx_packets": 230}
+        assert after.rates(before) == [[100.0], [10.0], [5.0]]
+        with pytest.raises(QueueFeatureInvalidValueException):
+            before.rates(after)
+
+    def test_queue_stats_imbalance(self):
+        sample = QueueStatsSample.from_stats(
+            {(0, "rx_packets"): 300, (1, "rx_packets"): 100, (2, "rx_packets"): 0, (3, "rx_packets"): 0}
+        )
+        imbalance = sample.get_imbalance("rx_packets")
+        assert imbalance.mean == 100
+        assert imbalance.coefficient_of_variation == pytest.approx(1.5**0.5)
+        assert imbalance.idle_queues == [2, 3]
+        assert imbalance.busiest_queue == 0
+        assert sample.get_queue(1) == {"rx_packets": 100}
+        with pytest.raises(QueueFeatureInvalidValueException):
+            sample.get_imbalance("tx_packets")
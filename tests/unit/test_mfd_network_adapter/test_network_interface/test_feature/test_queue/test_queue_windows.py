@@ -317,3 +317,23 @@ class TestQueueWindows:
         cmd = rf"{ps_cmd}.CounterSamples.CookedValue"
         interface._connection.execute_powershell.assert_called_with(cmd, expected_return_codes={0})
         assert executed_output == 0
+
+    def test_get_queue_stats(self, interface):
+        interface._connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout=dedent(
+                """\
+                0, intel(r) ethernet network adapter e810-c-q2 #8|received packets/sec|1500
+                2, intel(r) ethernet network adapter e810-c-q2 #8|received packets/sec|0
+                0, intel(r) ethernet network adapter e810-c-q2 #8|sent packets/sec|700
+                2, intel(r) ethernet network adapter e810-c-q2 #8|sent packets/sec|30
+                """
+            ),
+            stderr="",
+            return_code=0,
+        )
+        sample = interface.queue.get_queue_stats()
+        assert sample.queues == [0, 2]
+        assert sample.counters == ["rx_packets", "tx_packets"]
+        assert sample.values == [[1500, 700], [0, 30]]
+        assert sample.get_imbalance("rx_packets").idle_queues == [2]
@@ -11,6 +11,7 @@ from mfd_ethtool import Ethtool
 from mfd_network_adapter.data_structures import State
 from mfd_network_adapter.network_interface.exceptions import RSSException
 from mfd_network_adapter.network_interface.feature.link.linux import LinuxLink
+from mfd_network_adapter.network_interface.feature.rss.data_structures import RSSIndirectionTable
 from mfd_network_adapter.network_interface.feature.rss.linux import LinuxRSS, FlowType
 from mfd_network_adapter.network_interface.feature.stats.linux import LinuxStats
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
@@ -712,3 +713,102 @@ class TestLinuxNetworkInterface:
             interface_100g.stats.get_per_queue_stat_string.assert_called()
             interface_100g.rss.get_queues.assert_called_once()
             interface_100g.stats.get_stats.assert_called()
+
+    indirection_output = dedent(
+        """\
+        RX flow hash indirection table for eno1 with 4 RX ring(s):
+            0:      0     1     2     3     0     1     2     3
+            8:      0     1     2     3     0     1     2     3
+        RSS hash key:
+        6D:5a:56:da:25:5b:0e:c2
+        RSS hash function:
+            toeplitz: on
+            xor: off
+            crc32: off
+        RSS input transformation:
+            symmetric-xor: off"""
+    )
+
+    def test_indirection_table_from_ethtool_output(self):
+        table = RSSIndirectionTable.from_ethtool_output(self.indirection_output)
+        assert list(table.entries) == [0, 1, 2, 3] * 4
+        assert table.rings == 4
+        assert table.hash_key == "6d:5a:56:da:25:5b:0e:c2"
+        assert table.hash_function == "toeplitz"
+        assert table.hash_functions == {"toeplitz": True, "xor": False, "crc32": False}
+        assert table.get_queue_weights() == {0: 4, 1: 4, 2: 4, 3: 4}
+
+    def test_indirection_table_from_weights(self):
+        assert list(RSSIndirectionTable.from_weights(8, [1, 0, 3]).entries) == [0, 0, 2, 2, 2, 2, 2, 2]
+        assert list(RSSIndirectionTable.from_equal(6, 4).entries) == [0, 1, 2, 3, 0, 1]
+        assert RSSIndirectionTable.from_weights(8, [1, 0, 3]).get_queue_weights() == {0: 2, 1: 0, 2: 6}
+
+    def test_set_indirection_table(self, linuxrss, mocker):
+        interface_10g = linuxrss[0]
+        changed_output = self.indirection_output.replace("0     1     2     3", "0     1     0     1").replace(
+            "6D:5a", "aa:bb"
+        )
+        mocker.patch(
+            "mfd_ethtool.Ethtool.get_rss_indirection_table",
+            mocker.create_autospec(
+                Ethtool.get_rss_indirection_table, side_effect=[self.indirection_output, changed_output]
+            ),
+        )
+        mocker.patch(
+            "mfd_ethtool.Ethtool.set_rss_indirection_table",
+            mocker.create_autospec(Ethtool.set_rss_indirection_table, return_value=""),
+        )
+        assert interface_10g.rss.set_indirection_table(
+            equal=2, hash_key="AA:BB:56:da:25:5b:0e:c2", hash_function="toeplitz"
+        )
+        Ethtool.set_rss_indirection_table.assert_called_once_with(
+            interface_10g.rss._ethtool, device_name="eno1", param_name="equal 2 hkey aa:bb:56:da:25:5b:0e:c2"
+        )
+
+    def test_set_indirection_table_no_change(self, linuxrss, mocker):
+        interface_10g = linuxrss[0]
+        mocker.patch(
+            "mfd_ethtool.Ethtool.set_rss_indirection_table",
+            mocker.create_autospec(Ethtool.set_rss_indirection_table, return_value=""),
+        )
+        current = RSSIndirectionTable.from_ethtool_output(self.indirection_output)
+        assert not interface_10g.rss.set_indirection_table(equal=4, hash_function="toeplitz", current=current)
+        Ethtool.set_rss_indirection_table.assert_not_called()
+
+    def test_set_indirection_table_not_applied(self, linuxrss, mocker):
+        interface_10g = linuxrss[0]
+        mocker.patch(
+            "mfd_ethtool.Ethtool.get_rss_indirection_table",
+            mocker.create_autospec(Ethtool.get_rss_indirection_table, return_value=self.indirection_output),
+        )
+        mocker.patch(
+            "mfd_ethtool.Ethtool.set_rss_indirection_table",
+            mocker.create_autospec(Ethtool.set_rss_indirection_table, return_value=""),
+        )
+        with pytest.raises(RSSException, match="Indirection table not set"):
+            interface_10g.rss.set_indirection_table(equal=2)
+        with pytest.raises(RSSException, match="Only one of"):
+            interface_10g.rss.set_indirection_table(equal=2, weights=[1, 1])
+
+    def test_analyze_queue_balance(self, linuxrss, mocker):
+        interface_10g = linuxrss[0]
+        mocker.patch(
+            "mfd_network_adapter.network_interface.feature.queue.linux.LinuxQueue.get_per_queue_packet_stats",
+            return_value={
+                "rx_queue_0_packets": 1100,
+                "rx_queue_1_packets": 600,
+                "rx_queue_2_packets": 100,
+                "rx_queue_4_packets": 50,
+                "tx_queue_0_packets": 999,
+            },
+        )
+        table = RSSIndirectionTable.from_weights(8, [1, 1, 1, 1])
+        balance = interface_10g.rss.analyze_queue_balance(
+            baseline={"rx_queue_0_packets": 100, "rx_queue_1_packets": 100, "rx_queue_2_packets": 100}, table=table
+        )
+        assert balance.packets == {0: 1000, 1: 500, 2: 0, 4: 50}
+        assert balance.expected_share == {0: 0.25, 1: 0.25, 2: 0.25, 3: 0.25}
+        assert balance.idle_queues == [2, 3]
+        assert balance.unexpected_queues == [4]
+        assert balance.max_skew == pytest.approx(1000 / 1550 - 0.25)
+        assert balance.coefficient_of_variation > 1
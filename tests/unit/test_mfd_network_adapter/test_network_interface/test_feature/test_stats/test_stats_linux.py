@@ -1,5 +1,6 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
 from dataclasses import make_dataclass
 import pytest
 from textwrap import dedent
@@ -9,7 +10,7 @@ from unittest.mock import call
 from mfd_connect import RPyCConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_ethtool import Ethtool
-from mfd_network_adapter.network_interface.exceptions import StatisticNotFoundException
+from mfd_network_adapter.network_interface.exceptions import ReadStatisticException, StatisticNotFoundException
 from mfd_network_adapter.network_interface.feature.driver import LinuxDriver
 from mfd_network_adapter.network_interface.feature.stats.data_structures import Direction, Protocol
 from mfd_network_adapter.network_interface.feature.stats.linux import LinuxStats
@@ -141,6 +142,56 @@ class TestWindowsNetworkInterface:
         for key, value in expected_dict.items():
             assert value == actual_dict[key]
 
+    def test_get_netdev_stats_json(self, mocker, stats):
+        mocker.patch("mfd_network_adapter.network_interface.feature.stats.linux.is_json_supported", return_value=True)
+        output = json.dumps(
+            [
+                {
+                    "ifname": "eth0",
+                    "stats64": {
+                        "rx": {
+                            "bytes": 5173170,
+                            "packets": 78336,
+                            "errors": 1,
+                            "dropped": 2,
+                            "over_errors": 3,
+                            "multicast": 4,
+                        },
+                        "tx": {
+                            "bytes": 13981778556,
+                            "packets": 9235106,
+                            "errors": 5,
+                            "dropped": 6,
+                            "carrier_errors": 7,
+                            "collisions": 8,
+                        },
+                    },
+                }
+            ]
+        )
+        stats._connection.execute_command.return_value = mocker.Mock(stdout=output)
+        assert stats.get_netdev_stats() == {
+            "rx_bytes": 5173170,
+            "rx_packets": 78336,
+            "rx_errors": 1,
+            "rx_dropped": 2,
+            "overrun": 3,
+            "mcast": 4,
+            "tx_bytes": 13981778556,
+            "tx_packets": 9235106,
+            "tx_errors": 5,
+            "tx_dropped": 6,
+            "carrier": 7,
+            "collisions": 8,
+        }
+        stats._connection.execute_command.assert_called_once_with("ip -j -s link show eth0")
+
+    def test_get_netdev_stats_json_error(self, mocker, stats):
+        mocker.patch("mfd_network_adapter.network_interface.feature.stats.linux.is_json_supported", return_value=True)
+        stats._connection.execute_command.return_value = mocker.Mock(stdout='[{"ifname": "eth0"}]')
+        with pytest.raises(ReadStatisticException):
+            stats.get_netdev_stats()
+
     def test_get_system_stats(self, mocker, stats):
         cmd_out = dedent(
             """\
@@ -29,7 +29,7 @@ class TestIPLinux:
 
     @pytest.fixture
     def utils(self, interface, mocker):
-        mocker.patch("mfd_ethtool.Ethtool")
+        mocker.patch("mfd_network_adapter.network_interface.ethtool_cache.CachedEthtool")
         yield interface.utils
 
     def test_is_speed_eq(self, interface):
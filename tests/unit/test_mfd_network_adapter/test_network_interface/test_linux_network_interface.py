@@ -11,8 +11,9 @@ from mfd_ethtool import Ethtool
 from mfd_typing import PCIAddress, OSName, OSBitness
 from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceInfo
 
-from mfd_network_adapter.network_interface.data_structures import RingBufferSettings, RingBuffer
+from mfd_network_adapter.network_interface.data_structures import InterfaceSnapshot, RingBufferSettings, RingBuffer
 from mfd_network_adapter.network_interface.exceptions import (
+    InterfaceSnapshotException,
     BrandingStringException,
     DeviceStringException,
     NetworkQueuesException,
@@ -311,3 +312,198 @@ class TestLinuxNetworkInterface:
             NetworkInterfaceIncomparableObject, match="Incorrect object passed for comparison with PCIAddress"
         ):
             interfaces[0].__gt__("IncorrectObject")
+
+    snapshot_output = dedent(
+        """\
+        ### sysfs
+        /sys/class/net/eth0/mtu:1500
+        /sys/class/net/eth0/tx_queue_len:1000
+        /sys/class/net/eth0/flags:0x1003
+        ### rings
+        Ring parameters for eth0:
+        Pre-set maximums:
+        RX:\t\t8160
+        RX Mini:\tn/a
+        RX Jumbo:\tn/a
+        TX:\t\t8160
+        Current hardware settings:
+        RX:\t\t512
+        RX Mini:\tn/a
+        RX Jumbo:\tn/a
+        TX:\t\t512
+        RX Buf Len:\tn/a
+        ### channels
+        Channel parameters for eth0:
+        Pre-set maximums:
+        RX:\t\tn/a
+        TX:\t\tn/a
+        Other:\t\t1
+        Combined:\t64
+        Current hardware settings:
+        RX:\t\tn/a
+        TX:\t\tn/a
+        Other:\t\t1
+        Combined:\t4
+        ### coalesce
+        Coalesce parameters for eth0:
+        Adaptive RX: on  TX: on
+        stats-block-usecs: n/a
+        rx-usecs: 50
+        rx-frames: n/a
+        tx-usecs: 50
+        ### pause
+        Pause parameters for eth0:
+        Autonegotiate:\ton
+        RX:\t\toff
+        TX:\t\toff
+        RX negotiated: on
+        ### features
+        Features for eth0:
+        rx-checksumming: on
+        tx-checksumming: on
+        \ttx-checksum-ipv4: on
+        \ttx-checksum-fcoe-crc: off [fixed]
+        generic-receive-offload: on
+        ### private_flags
+        Private flags for eth0:
+        link-down-on-close     : off
+        legacy-rx              : off
+        ### wol
+        Settings for eth0:
+        \tSupports Wake-on: g
+        \tWake-on: d
+        ### rss
+        RX flow hash indirection table for eth0 with 4 RX ring(s):
+            0:      0     1     2     3     0     1     2     3
+        RSS hash key:
+        6d:5a:56:da
+        RSS hash function:
+            toeplitz: on
+            xor: off
+        """
+    )
+
+    def test_snapshot(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.snapshot_output, return_code=0
+        )
+        snapshot = interface.snapshot()
+        interface._connection.execute_command.assert_called_once()
+        assert (snapshot.mtu, snapshot.tx_queue_len, snapshot.up, snapshot.wol) == (1500, 1000, True, "d")
+        assert snapshot.rings == {"rx": 512, "tx": 512}
+        assert snapshot.channels == {"other": 1, "combined": 4}
+        assert snapshot.coalesce == {"adaptive-rx": "on", "adaptive-tx": "on", "rx-usecs": "50", "tx-usecs": "50"}
+        assert snapshot.pause == {"autoneg": "on", "rx": "off", "tx": "off"}
+        assert snapshot.features == {
+            "rx-checksumming": "on",
+            "tx-checksumming": "on",
+            "tx-checksum-ipv4": "on",
+            "generic-receive-offload": "on",
+        }
+        assert snapshot.private_flags == {"link-down-on-close": "off", "legacy-rx": "off"}
+        assert list(snapshot.rss.entries) == [0, 1, 2, 3] * 2
+        assert snapshot.rss.hash_function == "toeplitz"
+
+    @pytest.mark.parametrize("interface", [{"namespace": "ns1"}], indirect=True)
+    def test_snapshot_namespace(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="", return_code=0
+        )
+        assert interface.snapshot() == InterfaceSnapshot()
+        assert interface._connection.execute_command.call_args.args[0].startswith("ip netns exec ns1 sh -c ")
+
+    def test_restore_commands_order(self, interface):
+        snapshot = LinuxNetworkInterface._parse_snapshot(self.snapshot_output)
+        changed_output = (
+            self.snapshot_output.replace("mtu:1500", "mtu:9000")
+            .replace("Combined:\t4", "Combined:\t8")
+            .replace("rx-usecs: 50", "rx-usecs: 10")
+            .replace("generic-receive-offload: on", "generic-receive-offload: off")
+            .replace("6d:5a:56:da", "00:11:22:33")
+        )
+        current = LinuxNetworkInterface._parse_snapshot(changed_output)
+        diff = snapshot.diff(current)
+        assert set(diff) == {
+            "mtu",
+            "channels.combined",
+            "coalesce.rx-usecs",
+            "features.generic-receive-offload",
+            "rss.hash_key",
+        }
+        assert interface._get_restore_commands(snapshot, current, diff) == [
+            "ip link set dev eth0 down",
+            "ethtool -L eth0 combined 4",
+            "ip link set dev eth0 mtu 1500",
+            "ethtool -K eth0 generic-receive-offload on",
+            "ethtool -C eth0 rx-usecs 50",
+            "ethtool -X eth0 equal 4 hkey 6d:5a:56:da",
+            "ip link set dev eth0 up",
+        ]
+
+    def test_restore_without_flap(self, interface):
+        snapshot = LinuxNetworkInterface._parse_snapshot(self.snapshot_output)
+        current = LinuxNetworkInterface._parse_snapshot(self.snapshot_output.replace("Wake-on: d", "Wake-on: g"))
+        diff = snapshot.diff(current)
+        assert interface._get_restore_commands(snapshot, current, diff) == ["ethtool -s eth0 wol d"]
+
+    def test_restore(self, interface):
+        changed_output = self.snapshot_output.replace("RX:\t\t512", "RX:\t\t4096")
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=changed_output, return_code=0),
+            ConnectionCompletedProcess(
+                args="",
+                stdout=f"@@MFD_BATCH@@ 0-0 0\n@@MFD_BATCH@@ 1 0\n@@MFD_BATCH@@ 2-2 0\n"
+                f"{self.snapshot_output}@@MFD_BATCH@@ 3 0\n",
+                return_code=0,
+            ),
+        ]
+        diff = interface.restore(LinuxNetworkInterface._parse_snapshot(self.snapshot_output))
+        assert diff == {"rings.rx": (512, 4096)}
+        script = interface._connection.execute_command.call_args.args[0]
+        assert script.count("link set dev eth0 down") == 1 and script.count("link set dev eth0 up") == 1
+        assert "{ ethtool -G eth0 rx 512\n" in script
+        assert interface._connection.execute_command.call_count == 2
+
+    def test_restore_not_applied(self, interface):
+        changed_output = self.snapshot_output.replace("Wake-on: d", "Wake-on: g")
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=changed_output, return_code=0),
+            ConnectionCompletedProcess(
+                args="", stdout=f"@@MFD_BATCH@@ 0 0\n{changed_output}@@MFD_BATCH@@ 1 0\n", return_code=0
+            ),
+        ]
+        with pytest.raises(InterfaceSnapshotException, match="not restored: {'wol': \\('d', 'g'\\)}"):
+            interface.restore(LinuxNetworkInterface._parse_snapshot(self.snapshot_output))
+
+    @pytest.mark.parametrize("interface", [{"namespace": "ns1"}], indirect=True)
+    def test_restore_ip_batch_not_started(self, interface):
+        changed_output = self.snapshot_output.replace("mtu:1500", "mtu:9000")
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=changed_output, return_code=0),
+            ConnectionCompletedProcess(
+                args="",
+                stdout='Cannot open network namespace "ns1": No such file or directory\n'
+                f"@@MFD_BATCH@@ 0-2 255\n{changed_output}@@MFD_BATCH@@ 3 0\n",
+                return_code=0,
+            ),
+        ]
+        message = "'ip netns exec ns1 ip link set dev eth0 down' returned 255"
+        with pytest.raises(InterfaceSnapshotException, match=message):
+            interface.restore(LinuxNetworkInterface._parse_snapshot(self.snapshot_output))
+        assert "ip -n ns1 -force -batch -" in interface._connection.execute_command.call_args.args[0]
+
+    def test_restore_snapshot_not_executed(self, interface):
+        changed_output = self.snapshot_output.replace("Wake-on: d", "Wake-on: g")
+        interface._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout=changed_output, return_code=0),
+            ConnectionCompletedProcess(args="", stdout="@@MFD_BATCH@@ 0 0\n", return_code=0),
+        ]
+        with pytest.raises(InterfaceSnapshotException, match="was not executed"):
+            interface.restore(LinuxNetworkInterface._parse_snapshot(self.snapshot_output))
+
+    def test_restore_no_difference(self, interface):
+        interface._connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=self.snapshot_output, return_code=0
+        )
+        assert interface.restore(LinuxNetworkInterface._parse_snapshot(self.snapshot_output)) == {}
+        interface._connection.execute_command.assert_called_once()
@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test command profiling of remote calls."""
+
+import json
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_package_manager import LinuxPackageManager
+from mfd_typing import OSName
+
+from mfd_network_adapter import profiling as profiling_module
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.profiling import CommandProfiler
+
+
+class TestCommandProfiler:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="output", return_code=0)
+        connection.execute_powershell.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=0)
+        return connection
+
+    @pytest.fixture
+    def owner(self, mocker, connection):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.feature.vlan.linux.LinuxPackageManager",
+            mocker.create_autospec(LinuxPackageManager),
+        )
+        yield LinuxNetworkAdapterOwner(connection=connection)
+        mocker.stopall()
+
+    def test_records_feature_method(self, owner, mocker):
+        original = owner._connection.execute_command
+        with owner.profile() as profiler:
+            assert profiler.active
+            interface = mocker.Mock()
+            interface.name = "eth1"
+            owner.arp.flush_arp_table(interface)
+            owner.execute_command("cat /etc/hostname", shell=True)
+
+        assert not profiler.active
+        assert owner._connection.execute_command is original
+        original.assert_any_call("ip neigh flush dev eth1")
+        original.assert_called_with("cat /etc/hostname", shell=True)
+        first, second = profiler.records
+        assert (first.feature, first.method, first.command) == (
+            "LinuxARPFeature",
+            "flush_arp_table",
+            "ip neigh flush dev eth1",
+        )
+        assert first.api == "execute_command"
+        assert first.stdout_size == len("output")
+        assert first.return_code == 0
+        assert first.stack[-1] == "LinuxARPFeature.flush_arp_table"
+        assert (second.feature, second.method) == ("LinuxNetworkAdapterOwner", "execute_command")
+
+    def test_not_installed_when_stopped(self, connection):
+        original = connection.execute_command
+        profiler = CommandProfiler(connection)
+        profiler.start()
+        profiler.start()
+        assert connection.execute_command is not original
+        profiler.stop()
+        assert connection.execute_command is original
+        connection.execute_command("ls")
+        assert profiler.records == []
+
+    def test_failed_command_recorded(self, connection):
+        connection.execute_command.side_effect = ConnectionCalledProcessError(returncode=2, cmd="ls", output="error")
+        with CommandProfiler(connection) as profiler:
+            with pytest.raises(ConnectionCalledProcessError):
+                connection.execute_command("ls")
+        assert profiler.records[0].return_code == 2
+        assert profiler.records[0].stdout_size == len("error")
+        assert profiler.to_spans()[0]["status"] == {"code": "ERROR"}
+
+    def test_parse_time(self, connection, mocker):
+        mocker.patch.object(profiling_module.time, "perf_counter", side_effect=[0.0, 1.0, 3.0, 3.5, 9.5])
+        with CommandProfiler(connection) as profiler:
+            connection.execute_command("ls")
+            connection.execute_command("ls")
+        assert [record.latency for record in profiler.records] == [1.0, 0.5]
+        assert [record.parse_time for record in profiler.records] == [2.0, 6.0]
+
+    def test_summary_and_exports(self, connection, mocker):
+        mocker.patch.object(profiling_module.time, "perf_counter", side_effect=[0.0, 1.0, 1.0, 3.0, 3.0, 3.5, 3.5])
+        with CommandProfiler(connection) as profiler:
+            connection.execute_command("ls")
+            connection.execute_command("ls")
+            connection.execute_powershell("Get-NetAdapter")
+
+        summary = profiler.get_summary()
+        assert [(stats.command, stats.calls, stats.latency) for stats in summary] == [
+            ("ls", 2, 3.0),
+            ("Get-NetAdapter", 1, 0.5),
+        ]
+        assert profiler.to_flame().splitlines() == ["ls 3000000", "Get-NetAdapter 500000"]
+
+        exported = json.loads(profiler.to_json())
+        assert len(exported["records"]) == 3
+        assert exported["summary"][0]["calls"] == 2
+
+        spans = profiler.to_spans()
+        assert spans[2]["name"] == "execute_powershell"
+        assert spans[2]["attributes"]["mfd.command"] == "Get-NetAdapter"
+        assert {span["trace_id"] for span in spans} == {profiler.trace_id}
+        assert spans[0]["end_time_unix_nano"] - spans[0]["start_time_unix_nano"] == 1_000_000_000
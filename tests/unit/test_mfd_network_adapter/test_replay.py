@@ -0,0 +1,110 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Test recording and replaying of remote calls."""
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSName, OSType
+
+from mfd_network_adapter import replay as replay_module
+from mfd_network_adapter.exceptions import CommandNotRecordedException
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_interface.exceptions import VirtualizationFeatureException
+from mfd_network_adapter.replay import RecordingConnection, ReplayConnection, TranscriptEntry, load_transcript
+
+
+class TestRecordingConnection:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        return connection
+
+    def test_record_and_save(self, connection, tmp_path):
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="eth0", return_code=0)
+        connection.execute_powershell.side_effect = ConnectionCalledProcessError(
+            returncode=1, cmd="Get-NetAdapter", output="", stderr="error"
+        )
+        recording = RecordingConnection(connection)
+        assert recording.execute_command("ls /sys/class/net", shell=True).stdout == "eth0"
+        with pytest.raises(ConnectionCalledProcessError):
+            recording.execute_powershell(command="Get-NetAdapter")
+        assert recording.get_os_name() == OSName.LINUX
+        connection.execute_command.assert_called_once_with("ls /sys/class/net", shell=True)
+
+        assert recording.entries == [
+            TranscriptEntry("execute_command", "ls /sys/class/net", "eth0", "", 0),
+            TranscriptEntry("execute_powershell", "Get-NetAdapter", "", "error", 1),
+        ]
+        recording.save(tmp_path / "transcript.json")
+        assert load_transcript(tmp_path / "transcript.json") == (OSName.LINUX, recording.entries)
+
+
+class TestReplayConnection:
+    @pytest.fixture
+    def replay(self):
+        return ReplayConnection(
+            [
+                TranscriptEntry("execute_command", "cat /sys/class/net/eth0/mtu", "1500"),
+                TranscriptEntry("execute_command", "cat /sys/class/net/eth0/mtu", "9000"),
+                TranscriptEntry("execute_command", "ls /proc/net/vlan", "", "No such file", 2),
+                TranscriptEntry("execute_powershell", "Get-NetAdapter", "Ethernet"),
+            ],
+            os_name=OSName.LINUX,
+        )
+
+    def test_results_served_in_order(self, replay):
+        assert replay.execute_command("cat /sys/class/net/eth0/mtu").stdout == "1500"
+        assert replay.execute_command("cat /sys/class/net/eth0/mtu", shell=True).stdout == "9000"
+        assert replay.execute_command(command="cat /sys/class/net/eth0/mtu").stdout == "9000"
+        assert replay.execute_powershell("Get-NetAdapter").stdout == "Ethernet"
+        assert replay.rpc_count == 4
+        replay.rewind()
+        assert replay.rpc_count == 0
+        assert replay.execute_command("cat /sys/class/net/eth0/mtu").stdout == "1500"
+
+    def test_return_codes(self, replay):
+        assert replay.execute_command("ls /proc/net/vlan", expected_return_codes={0, 2}).return_code == 2
+        assert replay.execute_command("ls /proc/net/vlan", expected_return_codes=None).stderr == "No such file"
+        with pytest.raises(ConnectionCalledProcessError):
+            replay.execute_command("ls /proc/net/vlan")
+        with pytest.raises(VirtualizationFeatureException):
+            replay.execute_command("ls /proc/net/vlan", custom_exception=VirtualizationFeatureException)
+
+    def test_command_not_recorded(self, replay):
+        with pytest.raises(CommandNotRecordedException, match="execute_powershell"):
+            replay.execute_powershell("cat /sys/class/net/eth0/mtu")
+        assert replay.rpc_count == 1
+
+    def test_latency(self, replay, mocker):
+        sleep = mocker.patch.object(replay_module.time, "sleep")
+        replay.latency = 0.01
+        replay.execute_powershell("Get-NetAdapter")
+        sleep.assert_called_once_with(0.01)
+
+    def test_load_and_add_entries(self, tmp_path):
+        path = tmp_path / "transcript.json"
+        replay_module.save_transcript(path, OSName.LINUX, [TranscriptEntry("execute_command", "ip netns list", "")])
+        replay = ReplayConnection.load(path, ip="10.10.10.10")
+        replay.add_entries([TranscriptEntry("execute_command", "cat /sys/class/net/bonding_masters", "", "", 1)])
+        assert replay.get_os_name() == OSName.LINUX
+        assert replay.get_os_type() == OSType.POSIX
+        assert replay._ip == "10.10.10.10"
+        assert str(replay.path("/sys/class/net", "eth0")) == "/sys/class/net/eth0"
+        assert replay.execute_command("ip netns list").stdout == ""
+        assert replay.execute_command("cat /sys/class/net/bonding_masters", expected_return_codes=None).return_code == 1
+
+    def test_owner_on_replay(self, mocker):
+        replay = ReplayConnection(
+            [
+                TranscriptEntry("execute_command", "ip -j link show dev lo", '[{"ifname": "lo"}]'),
+                TranscriptEntry("execute_command", "ip netns list", "ns1 (id: 0)\n"),
+            ],
+            os_name=OSName.LINUX,
+        )
+        owner = LinuxNetworkAdapterOwner(connection=replay)
+        assert owner._get_network_namespaces() == ["ns1"]
+        assert "ip netns exec ns1 ip -j link show" in owner._get_discovery_commands([None, "ns1"])
+        assert replay.rpc_count == 2